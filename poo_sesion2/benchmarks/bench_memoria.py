@@ -0,0 +1,59 @@
+# benchmarks/bench_memoria.py
+"""
+Memoria por cuenta (tracemalloc) para CuentaBancaria.
+
+Se compara la clase (con __slots__) contra una subclase trivial que
+recupera el __dict__. El titular y el saldo se comparten entre instancias:
+se mide el objeto, no sus datos.
+
+Uso (desde poo_sesion2/):
+    python -m benchmarks.bench_memoria
+    python -m benchmarks.bench_memoria --n 1000000 --max-bytes 100
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tracemalloc
+from typing import Callable
+
+from models.cuenta import CuentaBancaria
+
+
+class _CuentaConDict(CuentaBancaria):
+    pass
+
+
+def bytes_por_cuenta(crear: Callable[[], object], n: int) -> float:
+    tracemalloc.start()
+    inicio, _ = tracemalloc.get_traced_memory()
+    cuentas = [crear() for _ in range(n)]
+    fin, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Se descuenta la lista que guarda las referencias (8 bytes por puntero)
+    total = fin - inicio - sys.getsizeof(cuentas)
+    del cuentas
+    return total / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=1_000_000)
+    parser.add_argument("--max-bytes", type=float, default=None)
+    args = parser.parse_args()
+
+    titular = "Titular"
+    con_slots = bytes_por_cuenta(lambda: CuentaBancaria(titular, 1000.0), args.n)
+    con_dict = bytes_por_cuenta(lambda: _CuentaConDict(titular, 1000.0), args.n)
+
+    print(f"{'tipo':<32} {'bytes/cuenta':>12}")
+    print(f"{'CuentaBancaria':<32} {con_slots:>12.1f}")
+    print(f"{'CuentaBancaria (con __dict__)':<32} {con_dict:>12.1f}")
+
+    if args.max_bytes is not None and con_slots > args.max_bytes:
+        print(f"  -> supera el máximo de {args.max_bytes:.1f} bytes")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 # models/cuenta.py
 from __future__ import annotations
 
+from models.dinero import a_centavos, a_unidades, formatear
+
 
 class CuentaBancaria:
     """
@@ -10,8 +12,13 @@ class CuentaBancaria:
     - saldo >= 0
     - titular no vacío
     - si la cuenta está cerrada, no se puede consignar/retirar
+
+    __slots__ evita un __dict__ por instancia (menos memoria por cuenta).
+    El saldo se guarda en centavos enteros (ver models/dinero.py).
     """
 
+    __slots__ = ("_id", "_titular", "_saldo", "_activa")
+
     _next_id: int = 1  # contador didáctico para IDs
 
     def __init__(self, titular: str, saldo_inicial: float = 0.0) -> None:
@@ -23,7 +30,7 @@ class CuentaBancaria:
         self.titular = titular
 
         # saldo interno; se valida al asignar el saldo inicial
-        self._saldo: float = 0.0
+        self._saldo: int = 0  # centavos
         self._set_saldo_inicial(saldo_inicial)
 
         self._activa: bool = True
@@ -57,6 +64,11 @@ class CuentaBancaria:
         Saldo (solo lectura desde fuera).
         La modificación debe pasar por consignar/retirar para proteger invariantes.
         """
+        return a_unidades(self._saldo)
+
+    @property
+    def saldo_centavos(self) -> int:
+        """Saldo exacto en centavos."""
         return self._saldo
 
     @property
@@ -90,13 +102,14 @@ class CuentaBancaria:
     # Internos (detalle)
     # -------------------------
     def _set_saldo_inicial(self, saldo_inicial: float) -> None:
-        saldo_inicial = float(saldo_inicial)
+        saldo_inicial = a_centavos(saldo_inicial)
         if saldo_inicial < 0:
             raise ValueError("El saldo inicial no puede ser negativo.")
         self._saldo = saldo_inicial
 
-    def _normalizar_monto(self, monto: float) -> float:
-        monto = float(monto)
+    def _normalizar_monto(self, monto: float) -> int:
+        """Monto en unidades -> centavos (> 0)."""
+        monto = a_centavos(monto)
         if monto <= 0:
             raise ValueError("El monto debe ser mayor que 0.")
         return monto
@@ -109,5 +122,5 @@ class CuentaBancaria:
         estado = "activa" if self._activa else "cerrada"
         return (
             f"CuentaBancaria(id={self._id}, titular='{self._titular}', "
-            f"saldo={self._saldo:.2f}, estado={estado})"
+            f"saldo={formatear(self._saldo)}, estado={estado})"
         )
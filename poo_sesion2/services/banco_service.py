@@ -1,7 +1,7 @@
 # services/banco_service.py
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from models.cuenta import CuentaBancaria
 
 
@@ -11,31 +11,34 @@ class BancoService:
     - Mantiene colecciones de objetos (cuentas)
     - Orquesta operaciones de aplicación (búsqueda, CRUD, movimientos)
     - Evita que la UI manipule listas o reglas directamente
+
+    Las cuentas se guardan en un dict id -> cuenta: conserva el orden de
+    inserción y permite buscar/eliminar por id en O(1).
     """
 
     def __init__(self) -> None:
-        self._cuentas: List[CuentaBancaria] = []
+        self._cuentas: Dict[int, CuentaBancaria] = {}
 
     # -------------------------
     # CRUD / Consultas
     # -------------------------
     def abrir_cuenta(self, titular: str, saldo_inicial: float = 0.0) -> CuentaBancaria:
         cuenta = CuentaBancaria(titular=titular, saldo_inicial=saldo_inicial)
-        self._cuentas.append(cuenta)
+        self._cuentas[cuenta.id] = cuenta
         return cuenta
 
     def listar_cuentas(self) -> List[CuentaBancaria]:
         """Devuelve una copia para no exponer la lista interna."""
-        return list(self._cuentas)
+        return list(self._cuentas.values())
 
     def buscar_por_id(self, cuenta_id: int) -> Optional[CuentaBancaria]:
-        return next((c for c in self._cuentas if c.id == cuenta_id), None)
+        return self._cuentas.get(cuenta_id)
 
     def buscar_por_titular(self, texto: str) -> List[CuentaBancaria]:
         texto = str(texto).strip().lower()
         if not texto:
             return []
-        return [c for c in self._cuentas if texto in c.titular.lower()]
+        return [c for c in self._cuentas.values() if texto in c.titular.lower()]
 
     def cambiar_titular(self, cuenta_id: int, nuevo_titular: str) -> None:
         cuenta = self._obtener_o_fallar(cuenta_id)
@@ -47,7 +50,7 @@ class BancoService:
 
     def eliminar_cuenta(self, cuenta_id: int) -> None:
         cuenta = self._obtener_o_fallar(cuenta_id)
-        self._cuentas.remove(cuenta)
+        del self._cuentas[cuenta.id]
 
     # -------------------------
     # Movimientos
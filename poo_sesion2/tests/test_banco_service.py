@@ -0,0 +1,46 @@
+# tests/test_banco_service.py
+from __future__ import annotations
+
+import pytest
+
+from services.banco_service import BancoService
+
+
+def test_registro_por_id_conserva_el_orden():
+    banco = BancoService()
+    cuentas = [banco.abrir_cuenta(f"T{i}", 10.0) for i in range(5)]
+    banco.eliminar_cuenta(cuentas[1].id)
+    otra = banco.abrir_cuenta("Nueva", 1.0)
+
+    assert banco.listar_cuentas() == [cuentas[0], *cuentas[2:], otra]
+    assert banco.buscar_por_id(cuentas[3].id) is cuentas[3]
+    assert banco.buscar_por_id(cuentas[1].id) is None
+    assert banco.buscar_por_titular("t") == [cuentas[0], *cuentas[2:]]
+
+
+def test_listar_devuelve_una_copia():
+    banco = BancoService()
+    banco.abrir_cuenta("Ana")
+    banco.listar_cuentas().clear()
+    assert len(banco.listar_cuentas()) == 1
+
+
+@pytest.mark.parametrize("operacion", ["eliminar_cuenta", "cerrar_cuenta"])
+def test_id_inexistente(operacion):
+    banco = BancoService()
+    with pytest.raises(ValueError, match="id=42"):
+        getattr(banco, operacion)(42)
+
+
+def test_movimientos_con_errores():
+    banco = BancoService()
+    cuenta = banco.abrir_cuenta("Ana", 10.0)
+    with pytest.raises(ValueError, match="id=999"):
+        banco.consignar(999, 1.0)
+    with pytest.raises(ValueError):
+        banco.retirar(cuenta.id, 10.01)
+    banco.eliminar_cuenta(cuenta.id)
+    with pytest.raises(ValueError):
+        banco.consignar(cuenta.id, 1.0)
+    with pytest.raises(ValueError):
+        banco.eliminar_cuenta(cuenta.id)
@@ -0,0 +1,20 @@
+# tests/test_cuenta.py
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.bench_memoria import _CuentaConDict, bytes_por_cuenta
+from models.cuenta import CuentaBancaria
+
+
+def test_sin_dict_por_instancia():
+    cuenta = CuentaBancaria("Ana", 1.0)
+    assert not hasattr(cuenta, "__dict__")
+    with pytest.raises(AttributeError):
+        cuenta.atributo_nuevo = 1
+
+
+def test_slots_ocupan_menos_que_dict():
+    con_slots = bytes_por_cuenta(lambda: CuentaBancaria("T", 1.0), 2000)
+    con_dict = bytes_por_cuenta(lambda: _CuentaConDict("T", 1.0), 2000)
+    assert con_slots < con_dict
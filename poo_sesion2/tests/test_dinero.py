@@ -0,0 +1,50 @@
+# tests/test_dinero.py
+from __future__ import annotations
+
+import pytest
+
+from models.cuenta import CuentaBancaria
+from models.dinero import a_centavos, formatear
+
+
+@pytest.mark.parametrize("monto, centavos", [(3, 300), (0.1, 10), ("2.50", 250), (0.125, 12), (0.135, 14)])
+def test_a_centavos(monto, centavos):
+    assert a_centavos(monto) == centavos
+
+
+@pytest.mark.parametrize("monto", [float("inf"), float("nan"), "abc"])
+def test_a_centavos_invalido(monto):
+    with pytest.raises(ValueError):
+        a_centavos(monto)
+
+
+def test_formatear():
+    assert [formatear(c) for c in (0, 5, -5, 123456)] == ["0.00", "0.05", "-0.05", "1234.56"]
+
+
+def test_sumas_exactas():
+    cuenta = CuentaBancaria("Ana")
+    for _ in range(10_000):
+        cuenta.consignar(0.1)
+    for _ in range(5_000):
+        cuenta.retirar(0.2)
+    assert cuenta.saldo_centavos == 0 and cuenta.saldo == 0.0
+
+
+@pytest.mark.parametrize("monto", [0, 0.004, -1.0, float("nan")])
+def test_montos_invalidos(monto):
+    cuenta = CuentaBancaria("Ana", 1.0)
+    with pytest.raises(ValueError):
+        cuenta.consignar(monto)
+    with pytest.raises(ValueError):
+        cuenta.retirar(monto)
+    assert cuenta.saldo_centavos == 100
+
+
+def test_no_retira_mas_que_el_saldo():
+    cuenta = CuentaBancaria("Ana", 1.0)
+    with pytest.raises(ValueError):
+        cuenta.retirar(1.01)
+    cuenta.cerrar()
+    with pytest.raises(ValueError):
+        cuenta.consignar(1.0)
@@ -0,0 +1,76 @@
+# benchmarks/bench_agregados.py
+"""
+Benchmark de los agregados de cartera: resumen_cartera() recorriendo
+todas las cuentas vs mantenido incrementalmente (agregados=True), y el
+costo que agrega a consignar/retirar mantenerlo al día.
+
+Al final verifica los agregados contra un recálculo completo.
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_agregados --tamanos 10000 100000 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from services.banco_service import BancoService
+
+
+def _poblar(n: int, agregados: bool) -> BancoService:
+    banco = BancoService(agregados=agregados)
+    for i in range(n):
+        if i % 2 == 0:
+            banco.abrir_ahorros(f"Titular {i}", 1000.0, 0.01)
+        else:
+            banco.abrir_corriente(f"Titular {i}", 100.0, 500.0, 10.0)
+    return banco
+
+
+def _movimientos(banco: BancoService, operaciones: int) -> float:
+    rnd = random.Random(1)
+    ids = [c.id for c in banco.listar_cuentas()]
+    lote = [(rnd.random() < 0.5, rnd.choice(ids), rnd.randint(1, 30_000) / 100) for _ in range(operaciones)]
+    inicio = time.perf_counter()
+    for consigna, cuenta_id, monto in lote:
+        try:
+            if consigna:
+                banco.consignar(cuenta_id, monto)
+            else:
+                banco.retirar(cuenta_id, monto)
+        except ValueError:
+            pass
+    return (time.perf_counter() - inicio) / operaciones
+
+
+def _resumen(banco: BancoService, repeticiones: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        banco.resumen_cartera()
+    return (time.perf_counter() - inicio) / repeticiones
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10**4, 10**5, 10**6])
+    parser.add_argument("--operaciones", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'n':>9} {'resumen (recorrido)':>20} {'resumen (O(1))':>15} {'mov. sin':>10} {'mov. con':>10}")
+    for n in args.tamanos:
+        sin = _poblar(n, agregados=False)
+        con = _poblar(n, agregados=True)
+        mov_sin = _movimientos(sin, args.operaciones)
+        mov_con = _movimientos(con, args.operaciones)
+        recorrido = _resumen(sin, 3)
+        incremental = _resumen(con, 10_000)
+        con.verificar_agregados()
+        print(
+            f"{n:>9} {recorrido * 1e3:>17.2f} ms {incremental * 1e6:>12.2f} us"
+            f" {mov_sin * 1e9:>7.0f} ns {mov_con * 1e9:>7.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
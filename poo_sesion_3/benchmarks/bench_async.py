@@ -0,0 +1,122 @@
+# benchmarks/bench_async.py
+"""
+Benchmark de AsyncBancoService con muchas tareas concurrentes.
+
+Compara la fachada (movimientos coalescidos por tick, compensados por
+cuenta o uno a uno) con lo que se haría a mano: un run_in_executor por
+llamada. Reporta throughput y latencias, y termina con código 1 si los
+saldos finales no coinciden entre las variantes. --rechazos agrega retiros
+que no caben, para ejercitar el camino uno a uno.
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_async --tareas 10000 --cuentas 100
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from services.banco_async import AsyncBancoService
+from services.banco_service import BancoService
+
+
+def _poblar(cuentas: int, saldo: float) -> BancoService:
+    banco = BancoService()
+    for i in range(cuentas):
+        banco.abrir_ahorros(f"Titular {i}", saldo, 0.01)
+    return banco
+
+
+def _movimientos(banco: BancoService, tareas: int) -> list:
+    ids = [c.id for c in banco.listar_cuentas()]
+    rnd = random.Random(5)
+    return [(rnd.choice(ids), round(rnd.uniform(1, 100), 2), rnd.random() < 0.5) for _ in range(tareas)]
+
+
+def _saldos(banco: BancoService) -> list:
+    return [cuenta.saldo_centavos for cuenta in banco.listar_cuentas()]
+
+
+def _resumen(nombre: str, latencias: list, segundos: float) -> None:
+    latencias.sort()
+    p50 = latencias[len(latencias) // 2] * 1e3
+    p99 = latencias[int(len(latencias) * 0.99)] * 1e3
+    print(
+        f"{nombre:<28} {len(latencias) / segundos:>10.0f} ops/s "
+        f"p50={p50:>7.2f} ms p99={p99:>7.2f} ms media={statistics.mean(latencias) * 1e3:>7.2f} ms"
+    )
+
+
+async def _con_fachada(nombre: str, args: argparse.Namespace, compensar: bool) -> list:
+    banco = _poblar(args.cuentas, args.saldo)
+    fachada = AsyncBancoService(banco, compensar=compensar)
+    latencias = []
+
+    async def tarea(cuenta_id: int, monto: float, consignar: bool) -> None:
+        inicio = time.perf_counter()
+        try:
+            if consignar:
+                await fachada.consignar(cuenta_id, monto)
+            else:
+                await fachada.retirar(cuenta_id, monto)
+        except ValueError:
+            pass
+        latencias.append(time.perf_counter() - inicio)
+
+    movimientos = _movimientos(banco, args.tareas)
+    inicio = time.perf_counter()
+    await asyncio.gather(*(tarea(*movimiento) for movimiento in movimientos))
+    _resumen(nombre, latencias, time.perf_counter() - inicio)
+    fachada.cerrar()
+    return _saldos(banco)
+
+
+async def _executor_por_llamada(args: argparse.Namespace) -> list:
+    banco = _poblar(args.cuentas, args.saldo)
+    ejecutor = ThreadPoolExecutor(max_workers=1)
+    loop = asyncio.get_running_loop()
+    latencias = []
+
+    async def tarea(cuenta_id: int, monto: float, consignar: bool) -> None:
+        inicio = time.perf_counter()
+        operacion = banco.consignar if consignar else banco.retirar
+        try:
+            await loop.run_in_executor(ejecutor, operacion, cuenta_id, monto)
+        except ValueError:
+            pass
+        latencias.append(time.perf_counter() - inicio)
+
+    movimientos = _movimientos(banco, args.tareas)
+    inicio = time.perf_counter()
+    await asyncio.gather(*(tarea(*movimiento) for movimiento in movimientos))
+    _resumen("run_in_executor por llamada", latencias, time.perf_counter() - inicio)
+    ejecutor.shutdown()
+    return _saldos(banco)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tareas", type=int, default=10_000)
+    parser.add_argument("--cuentas", type=int, default=100)
+    parser.add_argument("--rechazos", action="store_true", help="saldos bajos: parte de los retiros no caben")
+    args = parser.parse_args()
+    args.saldo = 500.0 if args.rechazos else 1_000_000.0
+
+    saldos = [
+        asyncio.run(_con_fachada("fachada (compensada)", args, compensar=True)),
+        asyncio.run(_con_fachada("fachada (uno a uno)", args, compensar=False)),
+        asyncio.run(_executor_por_llamada(args)),
+    ]
+    if any(s != saldos[0] for s in saldos):
+        print("FALLA: los saldos finales no coinciden entre variantes")
+        sys.exit(1)
+    print("saldos finales iguales en las tres variantes: OK")
+
+
+if __name__ == "__main__":
+    main()
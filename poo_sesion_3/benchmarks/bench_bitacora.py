@@ -0,0 +1,63 @@
+# benchmarks/bench_bitacora.py
+"""
+Benchmark de la bitácora: operaciones/s según el nivel de durabilidad.
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_bitacora --operaciones 20000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Optional
+
+from services.banco_service import BancoService
+from services.bitacora import Bitacora
+
+NIVELES = [
+    ("sin bitácora", None),
+    ("sin fsync", {}),
+    ("grupo: cada 1000 registros", {"fsync_cada": 1000}),
+    ("grupo: cada 100 registros", {"fsync_cada": 100}),
+    ("grupo: cada 10 ms", {"fsync_ms": 10}),
+    ("fsync por registro", {"fsync_cada": 1}),
+]
+
+
+def _medir(operaciones: int, opciones: Optional[dict], directorio: str) -> float:
+    bitacora = None
+    if opciones is not None:
+        bitacora = Bitacora(os.path.join(directorio, f"bitacora-{time.monotonic_ns()}.jsonl"), **opciones)
+    banco = BancoService(bitacora=bitacora)
+    ids = [banco.abrir_ahorros(f"Titular {i}", 1_000_000.0, 0.01).id for i in range(1000)]
+    rnd = random.Random(7)
+    movimientos = [(rnd.choice(ids), rnd.uniform(1, 100)) for _ in range(operaciones)]
+
+    inicio = time.perf_counter()
+    for i, (cuenta_id, monto) in enumerate(movimientos):
+        if i % 2 == 0:
+            banco.consignar(cuenta_id, monto)
+        else:
+            banco.retirar(cuenta_id, monto)
+    if bitacora is not None:
+        bitacora.cerrar()
+    return operaciones / (time.perf_counter() - inicio)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operaciones", type=int, default=20_000)
+    parser.add_argument("--directorio", default=None, help="dónde escribir (por defecto, un temporal)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.directorio) as directorio:
+        print(f"{'durabilidad':<30} {'ops/s':>12}")
+        for nombre, opciones in NIVELES:
+            print(f"{nombre:<30} {_medir(args.operaciones, opciones, directorio):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# benchmarks/bench_corte.py
+"""
+Benchmark de aplicar_corte_mensual_a_todas: recorrido polimórfico vs
+backend columnar (numpy).
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_corte --tamanos 100000 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from services.banco_service import BancoService
+
+
+def _poblar(n: int, columnar: bool) -> BancoService:
+    banco = BancoService(columnar=columnar)
+    for i in range(n):
+        if i % 2 == 0:
+            banco.abrir_ahorros(f"Titular {i}", 1000.0 + i, 0.01)
+        else:
+            banco.abrir_corriente(f"Titular {i}", 1000.0, 5000.0, 10.0)
+    return banco
+
+
+def _tiempo_corte(banco: BancoService, repeticiones: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        banco.aplicar_corte_mensual_a_todas()
+    return (time.perf_counter() - inicio) / repeticiones
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10**4, 10**5, 10**6])
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'n':>10} {'objetos':>12} {'columnar':>12} {'speedup':>8}")
+    for n in args.tamanos:
+        objetos = _poblar(n, columnar=False)
+        columnar = _poblar(n, columnar=True)
+        t_obj = _tiempo_corte(objetos, args.repeticiones)
+        t_col = _tiempo_corte(columnar, args.repeticiones)
+
+        saldos_obj = [c.saldo for c in objetos.listar_cuentas()]
+        saldos_col = [c.saldo for c in columnar.listar_cuentas()]
+        assert saldos_obj == saldos_col, "el corte columnar no coincide"
+
+        print(f"{n:>10} {t_obj * 1e3:>9.2f} ms {t_col * 1e3:>9.2f} ms {t_obj / t_col:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# benchmarks/bench_corte_con_reporte.py
+"""
+Benchmark de aplicar_corte_mensual_con_reporte (corte que no se detiene
+ante errores): recorrido cuenta por cuenta (backend de objetos) vs corte
+vectorizado sobre las columnas (columnar=True, requiere numpy), en un
+proceso y repartido en --procesos (services/corte_paralelo.py; el
+speedup de estos es contra el columnar en un proceso).
+
+Verifica que todas las variantes den los mismos saldos y el mismo reporte
+(aplicadas, interés, cuotas y rechazos); termina con código 1 si no.
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_corte_con_reporte --tamanos 10000 100000 1000000 --procesos 2 4
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+from services.banco_service import BancoService
+from services.corte_paralelo import cerrar_procesos
+
+
+def _poblar(n: int, columnar: bool) -> BancoService:
+    """Mitad ahorros y mitad corrientes; algunas cerradas y algunas cuyas cuotas exceden el cupo."""
+    banco = BancoService(columnar=columnar)
+    for i in range(n):
+        if i % 2 == 0:
+            cuenta = banco.abrir_ahorros(f"Titular {i}", 1000.0 + i % 1000, 0.01)
+        else:
+            cuenta = banco.abrir_corriente(f"Titular {i}", 0.0, 100.0 if i % 7 else 0.0, 10.0)
+        if i % 101 == 0:
+            banco.cerrar_cuenta(cuenta.id)
+    return banco
+
+
+def _resumen(reporte) -> tuple:
+    return (
+        reporte.aplicadas,
+        reporte.interes_total_centavos,
+        reporte.cuotas_total_centavos,
+        [motivo for _, motivo in reporte.rechazadas],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10**4, 10**5, 10**6])
+    parser.add_argument("--cortes", type=int, default=3, help="cortes seguidos sobre el mismo libro")
+    parser.add_argument("--procesos", type=int, nargs="*", default=[2, 4], help="variantes en varios procesos")
+    args = parser.parse_args()
+
+    variantes = [("objetos", False, 1), ("columnar", True, 1)]
+    variantes += [(f"{procesos} procesos", True, procesos) for procesos in args.procesos]
+    encabezado = "".join(f" {nombre:>12}" for nombre, _, _ in variantes)
+    print(f"{'n':>9}{encabezado} {'aplicadas':>10} {'rechazadas':>10}")
+    for n in args.tamanos:
+        tiempos = []
+        resultados = []
+        for _, columnar, procesos in variantes:
+            banco = _poblar(n, columnar)
+            if procesos > 1:
+                banco.aplicar_corte_mensual_con_reporte(procesos)  # arranca el pool fuera de la medida
+                banco = _poblar(n, columnar)
+            mejor = float("inf")
+            reportes = []
+            for _ in range(args.cortes):
+                inicio = time.perf_counter()
+                reportes.append(banco.aplicar_corte_mensual_con_reporte(procesos))
+                mejor = min(mejor, time.perf_counter() - inicio)
+            tiempos.append(mejor)
+            saldos = [cuenta.saldo_centavos for cuenta in banco.listar_cuentas()]
+            resultados.append((saldos, [_resumen(reporte) for reporte in reportes]))
+            del banco
+        if any(resultado != resultados[0] for resultado in resultados[1:]):
+            print(f"FALLA: las variantes no coinciden (n={n})")
+            sys.exit(1)
+        aplicadas, _, _, rechazos = resultados[0][1][-1]
+        celdas = [f"{tiempos[0] * 1e3:>9.2f} ms", f"{tiempos[1] * 1e3:>9.2f} ms"]
+        celdas += [f"{t * 1e3:>7.2f} ms {tiempos[1] / t:>3.1f}x" for t in tiempos[2:]]
+        print(f"{n:>9} " + " ".join(f"{celda:>12}" for celda in celdas) + f" {aplicadas:>10} {len(rechazos):>10}")
+    cerrar_procesos()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# benchmarks/bench_corte_reanudable.py
+"""
+Benchmark del corte mensual reanudable (aplicar_corte_mensual_reanudable):
+- Caída: un proceso hijo reproduce la bitácora, corre el corte y muere
+  (os._exit) tras unos tramos. El padre reproduce la bitácora, reanuda
+  y compara los saldos con un corte sin interrupciones: ninguna cuenta
+  debe quedar sin corte ni recibirlo dos veces. Termina con código 1 si
+  no coinciden.
+- Tiempo frente a aplicar_corte_mensual_con_reporte (mismo reporte,
+  pero recorre todas las cuentas) con una parte de ellas cerradas. Ambos con bitácora (el reanudable la requiere).
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_corte_reanudable --n 200000 --cerradas 0.5 --cada 1000
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from services.banco_service import BancoService
+from services.bitacora import Bitacora
+
+PERIODO = "2026-10"
+
+
+def _poblar(banco: BancoService, n: int, cerradas: float) -> None:
+    for i in range(n):
+        if i % 2 == 0:
+            cuenta = banco.abrir_ahorros(f"Titular {i}", 1000.0 + i % 1000, 0.01)
+        else:
+            cuenta = banco.abrir_corriente(f"Titular {i}", 0.0, 100.0 if i % 7 else 0.0, 10.0)
+        if (i // 2) % 100 < cerradas * 100:  # la misma proporción en ambos tipos
+            banco.cerrar_cuenta(cuenta.id)
+
+
+def _hijo(ruta: str, cada: int, tramos: int) -> None:
+    """Reproduce la bitácora, corre el corte y muere sin cerrar nada tras `tramos` tramos."""
+    banco = BancoService.desde_bitacora(Bitacora(ruta))
+
+    def caer(reporte) -> None:
+        if reporte.tramos == tramos:
+            os._exit(0)
+
+    banco.aplicar_corte_mensual_reanudable(PERIODO, cada=cada, progreso=caer)
+    os._exit(2)  # no debería llegar: el corte tenía más tramos
+
+
+def _saldos(banco: BancoService) -> list:
+    return [cuenta.saldo_centavos for cuenta in banco.listar_cuentas()]
+
+
+def _caida(args: argparse.Namespace, directorio: str) -> tuple:
+    ruta = os.path.join(directorio, "caida.log")
+    bitacora = Bitacora(ruta)
+    _poblar(BancoService(bitacora=bitacora), args.n, args.cerradas)
+    bitacora.cerrar()
+
+    hijo = multiprocessing.get_context().Process(target=_hijo, args=(ruta, args.cada, args.tramos))
+    hijo.start()
+    hijo.join()
+    if hijo.exitcode != 0:
+        print(f"FALLA: el proceso hijo terminó con código {hijo.exitcode}")
+        sys.exit(1)
+
+    bitacora = Bitacora(ruta)
+    banco = BancoService.desde_bitacora(bitacora)
+    avance = banco.progreso_corte(PERIODO)
+    antes = (avance.tramos, avance.cuentas)  # el progreso sigue avanzando al reanudar
+    reporte = banco.aplicar_corte_mensual_reanudable(PERIODO, cada=args.cada)
+    bitacora.cerrar()
+
+    bitacora = Bitacora(os.path.join(directorio, "limpio.log"))
+    limpio = BancoService(bitacora=bitacora)
+    _poblar(limpio, args.n, args.cerradas)
+    esperado = limpio.aplicar_corte_mensual_reanudable(PERIODO, cada=args.cada)
+    bitacora.cerrar()
+    if _saldos(banco) != _saldos(limpio) or antes[1] + reporte.aplicadas + len(reporte.rechazadas) != (
+        esperado.aplicadas + len(esperado.rechazadas)
+    ):
+        print("FALLA: el corte reanudado no coincide con el corte sin interrupciones")
+        sys.exit(1)
+    return antes, reporte
+
+
+def _tiempo(args: argparse.Namespace, directorio: str, modo: str) -> float:
+    bitacora = Bitacora(os.path.join(directorio, f"{modo}.log"))
+    banco = BancoService(bitacora=bitacora)
+    _poblar(banco, args.n, args.cerradas)
+    inicio = time.perf_counter()
+    if modo == "completo":
+        banco.aplicar_corte_mensual_con_reporte()
+    else:
+        banco.aplicar_corte_mensual_reanudable(PERIODO, cada=args.cada)
+    segundos = time.perf_counter() - inicio
+    bitacora.cerrar()
+    return segundos
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=200_000)
+    parser.add_argument("--cerradas", type=float, default=0.5, help="proporción de cuentas cerradas")
+    parser.add_argument("--cada", type=int, default=1000, help="cuentas por tramo")
+    parser.add_argument("--tramos", type=int, default=7, help="tramos antes de la caída simulada")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        (tramos, cuentas), reporte = _caida(args, directorio)
+        print(
+            f"caída tras {tramos} tramos ({cuentas} cuentas); al reanudar: "
+            f"{reporte.tramos} tramos, {reporte.aplicadas} aplicadas, {len(reporte.rechazadas)} rechazadas"
+        )
+        print("saldos iguales al corte sin interrupciones: OK")
+
+        print(f"{'corte':<28} {'tiempo':>10}")
+        base = None
+        for modo, nombre in (("completo", "con reporte"), ("reanudable", "reanudable")):
+            segundos = _tiempo(args, directorio, modo)
+            base = base or segundos
+            print(f"{nombre:<28} {segundos:>8.2f} s {base / segundos:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# benchmarks/bench_devengo.py
+"""
+Benchmark del devengo perezoso: tiempo de un corte mensual según el
+tamaño del libro (recorrido de objetos vs devengo_perezoso=True), y
+costo de la primera lectura de saldos después de varios cortes.
+
+Antes verifica que el resultado sea idéntico centavo a centavo al corte
+cuenta por cuenta sin detenerse (aplicar_corte_mensual_con_reporte),
+con movimientos, cierres y cuotas que exceden el cupo entre
+cortes. Termina con código 1 si difieren.
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_devengo --tamanos 10000 100000 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+from services.banco_service import BancoService
+
+
+def _poblar(banco: BancoService, n: int, rnd: random.Random, cupo_maximo: int = 200) -> list:
+    ids = []
+    for i in range(n):
+        if i % 2 == 0:
+            ids.append(banco.abrir_ahorros(f"Titular {i}", rnd.randint(0, 5000), rnd.choice([0.0, 0.005, 0.013])).id)
+        else:
+            ids.append(banco.abrir_corriente(f"Titular {i}", rnd.randint(0, 300), rnd.randint(0, cupo_maximo), 35.5).id)
+    return ids
+
+
+def verificar(n: int, pasos: int) -> bool:
+    bancos = [BancoService(), BancoService(devengo_perezoso=True)]
+    ids = [_poblar(banco, n, random.Random(9)) for banco in bancos]
+    rnd = random.Random(10)
+    for _ in range(pasos):
+        x = rnd.random()
+        posicion = rnd.randrange(n)
+        monto = rnd.randint(1, 40_000) / 100
+        for banco, ids_banco in zip(bancos, ids):
+            try:
+                if x < 0.4:
+                    banco.consignar(ids_banco[posicion], monto)
+                elif x < 0.8:
+                    banco.retirar(ids_banco[posicion], monto)
+                elif x < 0.82:
+                    banco.cerrar_cuenta(ids_banco[posicion])
+                elif x < 0.85:
+                    if banco is bancos[0]:
+                        banco.aplicar_corte_mensual_con_reporte()
+                    else:
+                        banco.aplicar_corte_mensual_a_todas()
+            except ValueError:
+                pass
+    ansioso, perezoso = ([c.saldo_centavos for c in banco.listar_cuentas()] for banco in bancos)
+    return ansioso == perezoso
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10**4, 10**5, 10**6])
+    parser.add_argument("--cortes", type=int, default=12)
+    args = parser.parse_args()
+
+    if not verificar(2000, 20_000):
+        print("FALLA: el devengo perezoso no coincide con el corte cuenta por cuenta")
+        sys.exit(1)
+    print("equivalencia con el corte cuenta por cuenta: OK")
+
+    print(f"{'n':>9} {'corte (objetos)':>16} {'corte (perezoso)':>17} {'1a lectura tras cortes':>23}")
+    for n in args.tamanos:
+        tiempos = []
+        for perezoso in (False, True):
+            banco = BancoService(devengo_perezoso=perezoso)
+            # Cupos amplios: ningún corte falla, el recorrido toca todas las cuentas
+            _poblar(banco, n, random.Random(1), cupo_maximo=10**9)
+            inicio = time.perf_counter()
+            for _ in range(args.cortes):
+                banco.aplicar_corte_mensual_a_todas()
+            tiempos.append((time.perf_counter() - inicio) / args.cortes)
+        inicio = time.perf_counter()
+        for cuenta in banco.listar_cuentas():
+            cuenta.saldo
+        lectura = (time.perf_counter() - inicio) / n
+        print(f"{n:>9} {tiempos[0] * 1e3:>13.2f} ms {tiempos[1] * 1e6:>14.2f} us {lectura * 1e9:>17.0f} ns/c")
+
+
+if __name__ == "__main__":
+    main()
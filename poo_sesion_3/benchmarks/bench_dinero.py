@@ -0,0 +1,134 @@
+# benchmarks/bench_dinero.py
+"""
+Benchmark y verificación del dinero en centavos (models/dinero.py).
+
+- Velocidad: consignar/retirar con montos con centavos, vía el servicio.
+- Conservación exacta: suma de saldos (centavos) == inicial + consignado
+  - retirado, sin tolerancia; y tras cada corte, la diferencia == interés
+  - cuotas del ReporteCorte.
+- Backend columnar (si hay numpy): mismos saldos, centavo a centavo.
+- Referencia: las mismas operaciones aceptadas sumadas en float, para ver
+  cuánto se habría desviado el total.
+
+Termina con código 1 si alguna verificación falla.
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_dinero --cuentas 10000 --operaciones 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+from models.dinero import a_centavos, formatear
+from services.banco_service import BancoService
+
+
+def _poblar(n: int, columnar: bool = False) -> BancoService:
+    banco = BancoService(columnar=columnar)
+    for i in range(n):
+        if i % 2 == 0:
+            banco.abrir_ahorros(f"Titular {i}", 1000.10, 0.0125)
+        else:
+            banco.abrir_corriente(f"Titular {i}", 1000.10, 500.0, 3.33)
+    return banco
+
+
+def _total(banco: BancoService) -> int:
+    return sum(c.saldo_centavos for c in banco.listar_cuentas())
+
+
+def _mover(banco: BancoService, operaciones, saldos_float=None) -> int:
+    """Aplica las operaciones; devuelve el neto aceptado en centavos."""
+    ids = [c.id for c in banco.listar_cuentas()]
+    neto = 0
+    for consigna, posicion, monto in operaciones:
+        cuenta_id = ids[posicion]
+        try:
+            if consigna:
+                banco.consignar(cuenta_id, monto)
+            else:
+                banco.retirar(cuenta_id, monto)
+        except ValueError:
+            continue
+        neto += a_centavos(monto) if consigna else -a_centavos(monto)
+        if saldos_float is not None:
+            saldos_float[posicion] += monto if consigna else -monto
+    return neto
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cuentas", type=int, default=10_000)
+    parser.add_argument("--operaciones", type=int, default=1_000_000)
+    parser.add_argument("--cortes", type=int, default=12)
+    args = parser.parse_args()
+
+    rnd = random.Random(3)
+    operaciones = [
+        (rnd.random() < 0.5, rnd.randrange(args.cuentas), rnd.randint(1, 50_000) / 100)
+        for _ in range(args.operaciones)
+    ]
+    fallos = []
+
+    banco = _poblar(args.cuentas)
+    inicial = _total(banco)
+    saldos_float = [c.saldo for c in banco.listar_cuentas()]
+
+    inicio = time.perf_counter()
+    neto = _mover(banco, operaciones)
+    segundos = time.perf_counter() - inicio
+    print(f"movimientos: {args.operaciones} en {segundos:.2f} s ({segundos / args.operaciones * 1e9:.0f} ns/op)")
+
+    total = _total(banco)
+    print(f"total: {formatear(total)} (esperado {formatear(inicial + neto)})")
+    if total != inicial + neto:
+        fallos.append("no se conservó el dinero en los movimientos")
+
+    # Referencia en float con las mismas operaciones (otra corrida, mismo orden)
+    referencia = _poblar(args.cuentas)
+    _mover(referencia, operaciones, saldos_float)
+    desvio = abs(round(sum(saldos_float) * 100) - total)
+    max_desvio = max(abs(f * 100 - c.saldo_centavos) for f, c in zip(saldos_float, referencia.listar_cuentas()))
+    print(f"referencia float: desvío del total {desvio} centavos; máximo por cuenta {max_desvio:.2e} centavos")
+
+    for _ in range(args.cortes):
+        antes = _total(banco)
+        reporte = banco.aplicar_corte_mensual_con_reporte()
+        despues = _total(banco)
+        if despues - antes != reporte.interes_total_centavos - reporte.cuotas_total_centavos:
+            fallos.append("el corte no cuadra con su reporte")
+            break
+    print(f"tras {args.cortes} cortes: {formatear(_total(banco))}")
+
+    try:
+        columnar = _poblar(args.cuentas, columnar=True)
+    except ImportError:
+        print("columnar: omitido (sin numpy)")
+    else:
+        objetos = _poblar(args.cuentas)
+        _mover(columnar, operaciones)
+        _mover(objetos, operaciones)
+        for _ in range(args.cortes):
+            for b in (columnar, objetos):
+                try:
+                    b.aplicar_corte_mensual_a_todas()
+                except ValueError:
+                    pass
+        iguales = [c.saldo_centavos for c in columnar.listar_cuentas()] == [
+            c.saldo_centavos for c in objetos.listar_cuentas()
+        ]
+        print(f"columnar vs objetos: {'iguales' if iguales else 'DISTINTOS'}")
+        if not iguales:
+            fallos.append("el corte columnar no coincide con el de objetos")
+
+    if fallos:
+        print("FALLA: " + "; ".join(fallos))
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# benchmarks/bench_fotos.py
+"""
+Benchmark de las fotos del libro (BancoService.snapshot()):
+- Tiempo de crear una foto según el tamaño del libro (debe ser ~constante).
+- Costo por movimiento sin fotos, con una foto abierta (primera vez que
+  se toca cada cuenta y veces siguientes).
+- Cuentas copiadas tras los movimientos (memoria de la foto).
+- Consistencia: con hilos transfiriendo, la suma de saldos de la foto es
+  siempre la del instante en que se tomó. Termina con código 1 si no.
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_fotos --tamanos 10000 100000 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import threading
+import time
+
+from services.banco_service import BancoService
+
+
+def _poblar(n: int, concurrente: bool = False) -> tuple:
+    banco = BancoService(concurrente=concurrente)
+    ids = [banco.abrir_ahorros(f"Titular {i}", 1000.0, 0.01).id for i in range(n)]
+    return banco, ids
+
+
+def _movimientos(banco: BancoService, ids: list, operaciones: int) -> float:
+    rnd = random.Random(3)
+    destinos = [ids[rnd.randrange(len(ids))] for _ in range(operaciones)]
+    inicio = time.perf_counter()
+    for cuenta_id in destinos:
+        banco.consignar(cuenta_id, 1.5)
+    return (time.perf_counter() - inicio) / operaciones
+
+
+def _consistente(n: int, hilos: int, fotos: int) -> bool:
+    banco, ids = _poblar(n, concurrente=True)
+    esperado = sum(c.saldo_centavos for c in banco.listar_cuentas())
+    fin = threading.Event()
+
+    def transferir(semilla: int) -> None:
+        rnd = random.Random(semilla)
+        while not fin.is_set():
+            try:
+                banco.transferir(rnd.choice(ids), rnd.choice(ids), rnd.randint(1, 500) / 100)
+            except ValueError:
+                pass
+
+    trabajadores = [threading.Thread(target=transferir, args=(k,)) for k in range(hilos)]
+    for t in trabajadores:
+        t.start()
+    try:
+        for _ in range(fotos):
+            with banco.snapshot() as foto:
+                if sum(c.saldo_centavos for c in foto) != esperado:
+                    return False
+    finally:
+        fin.set()
+        for t in trabajadores:
+            t.join()
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10**4, 10**5, 10**6])
+    parser.add_argument("--operaciones", type=int, default=100_000)
+    args = parser.parse_args()
+
+    if not _consistente(5_000, hilos=3, fotos=20):
+        print("FALLA: una foto vio transferencias a medias o posteriores")
+        sys.exit(1)
+    print("consistencia con escritores concurrentes: OK")
+
+    print(f"{'n':>9} {'crear foto':>11} {'mov. sin foto':>14} {'con foto':>9} {'copiadas':>9}")
+    for n in args.tamanos:
+        banco, ids = _poblar(n)
+        banco.snapshot().cerrar()  # la primera arma la lista de ids (como paginar_cuentas)
+        inicio = time.perf_counter()
+        for _ in range(1000):
+            banco.snapshot().cerrar()
+        crear = (time.perf_counter() - inicio) / 1000
+        sin_foto = _movimientos(banco, ids, args.operaciones)
+        foto = banco.snapshot()
+        con_foto = _movimientos(banco, ids, args.operaciones)
+        print(
+            f"{n:>9} {crear * 1e6:>8.1f} us {sin_foto * 1e9:>11.0f} ns {con_foto * 1e9:>6.0f} ns"
+            f" {foto.cuentas_copiadas:>9}"
+        )
+        foto.cerrar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# benchmarks/bench_historial.py
+"""
+Benchmark del historial de movimientos (historial=True):
+- Costo por movimiento de consignar/retirar con y sin historial.
+- Memoria por movimiento: arreglos tipados (memoria_historial) frente a
+  guardar una tupla (tiempo, tipo, monto, saldo) por movimiento, medida
+  con tracemalloc.
+- Extracto de un rango de fechas y saldo a una fecha en una cuenta con
+  muchos movimientos.
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_historial --cuentas 1000 --operaciones 500000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from services.banco_service import BancoService
+
+
+def _mover(banco: BancoService, ids: list, operaciones: int) -> float:
+    rnd = random.Random(8)
+    lote = [
+        (rnd.random() < 0.5, ids[rnd.randrange(len(ids))], rnd.randint(1, 30_000) / 100) for _ in range(operaciones)
+    ]
+    inicio = time.perf_counter()
+    for consigna, cuenta_id, monto in lote:
+        try:
+            if consigna:
+                banco.consignar(cuenta_id, monto)
+            else:
+                banco.retirar(cuenta_id, monto)
+        except ValueError:
+            pass
+    return (time.perf_counter() - inicio) / operaciones
+
+
+def _tuplas_por_movimiento(n: int) -> float:
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    movimientos = [(time.time_ns(), 1, i * 100, i * 100) for i in range(n)]
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del movimientos
+    return (despues - antes) / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cuentas", type=int, default=1000)
+    parser.add_argument("--operaciones", type=int, default=500_000)
+    args = parser.parse_args()
+
+    tiempos = {}
+    for historial in (False, True):
+        banco = BancoService(historial=historial)
+        ids = [banco.abrir_corriente(f"Titular {i}", 1000.0, 500.0, 10.0).id for i in range(args.cuentas)]
+        tiempos[historial] = _mover(banco, ids, args.operaciones)
+    print(f"movimiento sin historial: {tiempos[False] * 1e9:.0f} ns; con historial: {tiempos[True] * 1e9:.0f} ns")
+
+    memoria = banco.memoria_historial()
+    print(
+        f"memoria: {memoria['movimientos']} movimientos en {memoria['cuentas']} cuentas, "
+        f"{memoria['bytes'] / 1e6:.1f} MB, {memoria['bytes_por_movimiento']:.1f} bytes/movimiento "
+        f"(tuplas: {_tuplas_por_movimiento(memoria['movimientos']):.1f} bytes/movimiento)"
+    )
+
+    # Una cuenta con muchos movimientos: rango del 1% central
+    cuenta_id = ids[0]
+    for _ in range(args.operaciones // 5):
+        banco.consignar(cuenta_id, 1.0)
+    extracto = banco.extracto(cuenta_id)
+    desde, hasta = extracto[len(extracto) * 495 // 1000].fecha, extracto[len(extracto) * 505 // 1000].fecha
+    repeticiones = 200
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        rango = banco.extracto(cuenta_id, desde, hasta)
+    por_rango = (time.perf_counter() - inicio) / repeticiones
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        banco.saldo_al(cuenta_id, desde)
+    por_saldo = (time.perf_counter() - inicio) / repeticiones
+    print(
+        f"cuenta con {len(extracto)} movimientos: extracto de {len(rango)} en {por_rango * 1e6:.0f} us; "
+        f"saldo_al en {por_saldo * 1e6:.1f} us"
+    )
+
+
+if __name__ == "__main__":
+    main()
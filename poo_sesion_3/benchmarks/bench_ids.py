@@ -0,0 +1,106 @@
+# benchmarks/bench_ids.py
+"""
+Benchmark del asignador de ids arrendado (models/ids.py):
+- N procesos abren cuentas a la vez con un AsignadorArrendado sobre el
+  mismo archivo SQLite; se mide ids/s según el tamaño del bloque
+  (bloque=1 equivale a ir al coordinador en cada id).
+- Verifica que los ids sean únicos y que no se pierda ninguno: tras
+  cerrar todos, los usados más los rangos libres (colas devueltas, que
+  se arriendan primero en el siguiente arranque) cubren 1..contador sin
+  huecos, también después de un segundo arranque. Termina con código 1
+  si no.
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_ids --procesos 1 2 4 --bloques 1 100 1000
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from typing import List
+
+from models.cuentas import CuentaAhorros, CuentaBase
+from models.ids import AsignadorArrendado
+
+
+def _trabajador(ruta: str, bloque: int, cantidad: int, inicio, salida) -> None:
+    asignador = AsignadorArrendado(ruta, bloque)
+    CuentaBase.usar_asignador(asignador)
+    inicio.wait()
+    ids = [CuentaAhorros(f"Titular {i}", 0.0, 0.01).id for i in range(cantidad)]
+    CuentaBase.usar_asignador(None)
+    asignador.cerrar()
+    salida.put(ids)
+
+
+def _correr(ruta: str, procesos: int, bloque: int, cantidad: int) -> tuple:
+    """(segundos, ids de todos los procesos)."""
+    contexto = multiprocessing.get_context()
+    inicio = contexto.Event()
+    salida = contexto.Queue()
+    hijos = [
+        contexto.Process(target=_trabajador, args=(ruta, bloque, cantidad, inicio, salida)) for _ in range(procesos)
+    ]
+    for hijo in hijos:
+        hijo.start()
+    time.sleep(0.2)  # que todos abran la conexión antes de medir
+    t0 = time.perf_counter()
+    inicio.set()
+    ids: List[int] = []
+    for _ in hijos:
+        ids.extend(salida.get())
+    segundos = time.perf_counter() - t0
+    for hijo in hijos:
+        hijo.join()
+    return segundos, ids
+
+
+def _denso(ruta: str, ids: List[int], esperado: int) -> bool:
+    """Únicos y, junto con los rangos libres del coordinador, sin huecos desde 1."""
+    if len(set(ids)) != len(ids) or len(ids) != esperado:
+        return False
+    with sqlite3.connect(ruta) as conexion:
+        contador = conexion.execute("SELECT siguiente FROM contador").fetchone()[0]
+        libres = conexion.execute("SELECT inicio, fin FROM libres").fetchall()
+    cubiertos = list(ids)
+    for inicio, fin in libres:
+        cubiertos.extend(range(inicio, fin))
+    return sorted(cubiertos) == list(range(1, contador))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--procesos", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--bloques", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--cantidad", type=int, default=20_000, help="cuentas por proceso")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        print(f"{'procesos':>8} {'bloque':>7} {'ids/s':>11}")
+        for procesos in args.procesos:
+            for bloque in args.bloques:
+                ruta = os.path.join(carpeta, f"ids_{procesos}_{bloque}.db")
+                cantidad = min(args.cantidad, 2_000) if bloque == 1 else args.cantidad
+                segundos, ids = _correr(ruta, procesos, bloque, cantidad)
+                if not _denso(ruta, ids, procesos * cantidad):
+                    print(f"FALLA: ids repetidos o perdidos ({procesos} procesos, bloque {bloque})")
+                    sys.exit(1)
+                print(f"{procesos:>8} {bloque:>7} {len(ids) / segundos:>11,.0f}")
+
+        # Reinicio: el segundo arranque reusa las colas devueltas por el primero
+        ruta = os.path.join(carpeta, "reinicio.db")
+        _, primeros = _correr(ruta, 3, 1000, 1_234)
+        _, segundos_ids = _correr(ruta, 2, 1000, 777)
+        if not _denso(ruta, primeros + segundos_ids, 3 * 1_234 + 2 * 777):
+            print("FALLA: el segundo arranque repitió o perdió ids")
+            sys.exit(1)
+        print("únicos y sin pérdidas entre procesos y reinicios: OK")
+
+
+if __name__ == "__main__":
+    main()
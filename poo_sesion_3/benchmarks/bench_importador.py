@@ -0,0 +1,92 @@
+# benchmarks/bench_importador.py
+"""
+Benchmark de la importación masiva (services/importador.py): genera un
+archivo con aperturas, movimientos y algunas filas inválidas, lo importa y
+reporta filas por segundo según el formato y el tamaño de bloque.
+
+Verifica que cada fila termine aplicada o en el archivo de rechazos
+(cuentas + movimientos + rechazadas == filas). Termina con código 1 si no.
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_importador --filas 200000 --bloques 1000 10000
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import tempfile
+
+from services.banco_service import BancoService
+
+_COLUMNAS = ["operacion", "titular", "saldo_inicial", "tasa_interes", "cupo_sobregiro", "cuota_manejo"]
+_COLUMNAS += ["cuenta", "monto", "clave"]
+
+
+def _filas(n: int, rnd: random.Random):
+    abiertas = 0
+    for i in range(n):
+        x = rnd.random()
+        if abiertas == 0 or x < 0.3:
+            if i % 2 == 0:
+                fila = {"operacion": "abrir_ahorros", "titular": f"Titular {i}", "saldo_inicial": rnd.randint(0, 5000)}
+            else:
+                fila = {"operacion": "abrir_corriente", "titular": f"Titular {i}", "cupo_sobregiro": 500}
+            fila["clave"] = f"k{abiertas}"
+            abiertas += 1
+        elif x < 0.99:
+            operacion = "consignar" if x < 0.65 else "retirar"
+            monto = rnd.randint(1, 80_000) / 100
+            fila = {"operacion": operacion, "cuenta": f"k{rnd.randrange(abiertas)}", "monto": monto}
+        else:
+            fila = {"operacion": "consignar", "cuenta": "no-existe", "monto": "x"}
+        yield fila
+
+
+def _escribir(ruta: str, formato: str, n: int) -> None:
+    with open(ruta, "w", newline="", encoding="utf-8") as f:
+        if formato == "csv":
+            escritor = csv.DictWriter(f, fieldnames=_COLUMNAS)
+            escritor.writeheader()
+            escritor.writerows(_filas(n, random.Random(5)))
+        else:
+            for fila in _filas(n, random.Random(5)):
+                f.write(json.dumps(fila) + "\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=200_000)
+    parser.add_argument("--bloques", type=int, nargs="+", default=[1_000, 10_000])
+    args = parser.parse_args()
+
+    fallos = []
+    with tempfile.TemporaryDirectory() as carpeta:
+        rechazos = os.path.join(carpeta, "rechazos.jsonl")
+        print(f"{'formato':>8} {'bloque':>8} {'filas/s':>10} {'cuentas':>9} {'movim.':>9} {'rechaz.':>8}")
+        for formato in ("csv", "jsonl"):
+            ruta = os.path.join(carpeta, f"datos.{formato}")
+            _escribir(ruta, formato, args.filas)
+            for bloque in args.bloques:
+                reporte = BancoService().importar(ruta, rechazos, bloque=bloque)
+                with open(rechazos, encoding="utf-8") as f:
+                    escritos = sum(1 for _ in f)
+                contadas = reporte.cuentas + reporte.movimientos + reporte.rechazadas
+                if contadas != args.filas or escritos != reporte.rechazadas:
+                    fallos.append(f"{formato}/{bloque}: filas sin contabilizar")
+                print(
+                    f"{formato:>8} {bloque:>8} {reporte.filas_por_segundo:>10.0f} {reporte.cuentas:>9}"
+                    f" {reporte.movimientos:>9} {reporte.rechazadas:>8}"
+                )
+
+    if fallos:
+        print("FALLA: " + "; ".join(fallos))
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# benchmarks/bench_indice_saldos.py
+"""
+Benchmark del índice de saldos (BancoService(indice_saldos=True)):
+- Consultas de riesgo: 100 mayores saldos, cuentas en un rango de saldo
+  y corrientes en sobregiro, con el índice frente a ordenar/filtrar la
+  copia de listar_cuentas().
+- Costo por movimiento de mantener el índice.
+
+Verifica que el índice dé lo mismo que el recálculo. Termina con código 1
+si no.
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_indice_saldos --tamanos 10000 100000 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+from models.cuentas import CuentaCorriente
+from services.banco_service import BancoService
+
+
+def _poblar(n: int, indice_saldos: bool) -> tuple:
+    rnd = random.Random(5)
+    banco = BancoService(indice_saldos=indice_saldos)
+    ids = []
+    for i in range(n):
+        if i % 2 == 0:
+            ids.append(banco.abrir_ahorros(f"Titular {i}", rnd.randint(0, 100_000) / 100, 0.01).id)
+        else:
+            ids.append(banco.abrir_corriente(f"Titular {i}", rnd.randint(0, 1_000) / 100, 100.0, 1.0).id)
+    # Alrededor del 10% de las corrientes, en sobregiro
+    for cuenta_id in ids[1::20]:
+        banco.retirar(cuenta_id, rnd.randint(1_001, 10_000) / 100)
+    return banco, ids
+
+
+def _movimientos(banco: BancoService, ids: list, operaciones: int) -> float:
+    rnd = random.Random(9)
+    plan = [(ids[rnd.randrange(len(ids))], rnd.randint(1, 500) / 100) for _ in range(operaciones)]
+    inicio = time.perf_counter()
+    for cuenta_id, monto in plan:
+        banco.consignar(cuenta_id, monto)
+    return (time.perf_counter() - inicio) / operaciones
+
+
+def _medir(funcion, repeticiones: int) -> tuple:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion()
+    return (time.perf_counter() - inicio) / repeticiones, resultado
+
+
+def _sin_indice(banco: BancoService) -> tuple:
+    """Lo que se hacía antes: sobre la copia de listar_cuentas()."""
+
+    def mayores():
+        return sorted(banco.listar_cuentas(), key=lambda c: (c.saldo_centavos, c.id), reverse=True)[:100]
+
+    def rango():
+        cuentas = [c for c in banco.listar_cuentas() if 10_000 <= c.saldo_centavos <= 20_000]
+        return sorted(cuentas, key=lambda c: (c.saldo_centavos, c.id))
+
+    def sobregiro():
+        cuentas = [c for c in banco.listar_cuentas() if isinstance(c, CuentaCorriente) and c.saldo_centavos < 0]
+        # Mismo orden que el índice: utilización (en milmillonésimas), luego id
+        return sorted(cuentas, key=lambda c: (-c.saldo_centavos * 10**9 // c.cupo_sobregiro_centavos, c.id))[::-1]
+
+    return mayores, rango, sobregiro
+
+
+def _con_indice(banco: BancoService) -> tuple:
+    return (
+        lambda: banco.mayores_saldos(100),
+        lambda: banco.cuentas_por_saldo(100.0, 200.0),
+        lambda: [uso.cuenta for uso in banco.uso_sobregiro()],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10**4, 10**5, 10**6])
+    parser.add_argument("--operaciones", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(
+        f"{'n':>9} {'consulta':<10} {'sin índice':>12} {'con índice':>12} {'resultado':>10}"
+        f" {'mov. sin':>9} {'mov. con':>9}"
+    )
+    for n in args.tamanos:
+        banco, ids = _poblar(n, indice_saldos=True)
+        repeticiones = max(1, 200_000 // n)
+        mov_con = _movimientos(banco, ids, args.operaciones)
+        resultados = []
+        for nombre, antes, ahora in zip(("top 100", "rango", "sobregiro"), _sin_indice(banco), _con_indice(banco)):
+            t_antes, esperado = _medir(antes, repeticiones)
+            t_ahora, obtenido = _medir(ahora, repeticiones * 10)
+            if [c.id for c in esperado] != [c.id for c in obtenido]:
+                print(f"FALLA: {nombre} con índice no coincide con el recálculo (n={n})")
+                sys.exit(1)
+            resultados.append((nombre, t_antes, t_ahora, len(obtenido)))
+        del banco
+
+        banco, ids = _poblar(n, indice_saldos=False)
+        mov_sin = _movimientos(banco, ids, args.operaciones)
+        del banco
+        for i, (nombre, t_antes, t_ahora, cantidad) in enumerate(resultados):
+            movimientos = f" {mov_sin * 1e9:>6.0f} ns {mov_con * 1e9:>6.0f} ns" if i == 0 else ""
+            print(
+                f"{n if i == 0 else '':>9} {nombre:<10} {t_antes * 1e3:>9.2f} ms {t_ahora * 1e3:>9.3f} ms"
+                f" {cantidad:>10}{movimientos}"
+            )
+
+
+if __name__ == "__main__":
+    main()
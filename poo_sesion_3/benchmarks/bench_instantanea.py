@@ -0,0 +1,81 @@
+# benchmarks/bench_instantanea.py
+"""
+Benchmark de instantáneas: tiempo de escritura, de apertura (mmap) y de
+primer acceso, frente a reconstruir el libro con abrir_ahorros/abrir_corriente.
+También verifica que todos los campos sobrevivan el viaje de ida y vuelta.
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_instantanea --n 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from services.banco_service import BancoService
+
+
+def _campos(cuenta) -> tuple:
+    return (
+        cuenta.id,
+        cuenta.tipo(),
+        cuenta.titular,
+        cuenta.saldo,
+        cuenta.activa,
+        getattr(cuenta, "tasa_interes", None),
+        getattr(cuenta, "cupo_sobregiro", None),
+        getattr(cuenta, "cuota_manejo", None),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rnd = random.Random(11)
+    inicio = time.perf_counter()
+    banco = BancoService()
+    for i in range(args.n):
+        if i % 2 == 0:
+            cuenta = banco.abrir_ahorros(f"Titular ñ {i}", rnd.uniform(0, 1e6), rnd.uniform(0, 0.05))
+        else:
+            cuenta = banco.abrir_corriente(f"Titular {i}", rnd.uniform(0, 1e6), rnd.uniform(0, 1e5), rnd.uniform(0, 100))
+        if i % 97 == 0:
+            banco.cerrar_cuenta(cuenta.id)
+    t_construir = time.perf_counter() - inicio
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "libro.bin")
+
+        inicio = time.perf_counter()
+        banco.guardar_instantanea(ruta)
+        t_escribir = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        cargado = BancoService.desde_instantanea(ruta)
+        t_abrir = time.perf_counter() - inicio
+
+        ids = [c.id for c in banco.listar_cuentas()]
+        muestra = [rnd.choice(ids) for _ in range(10_000)]
+        inicio = time.perf_counter()
+        for cuenta_id in muestra:
+            cargado.buscar_por_id(cuenta_id)
+        t_acceso = (time.perf_counter() - inicio) / len(muestra)
+
+        assert [_campos(c) for c in cargado.listar_cuentas()] == [_campos(c) for c in banco.listar_cuentas()]
+
+        print(f"cuentas:                {args.n}")
+        print(f"tamaño:                 {os.path.getsize(ruta) / 1e6:.1f} MB")
+        print(f"reconstruir con abrir_*: {t_construir:.2f} s")
+        print(f"escribir instantánea:   {t_escribir:.2f} s")
+        print(f"abrir instantánea:      {t_abrir * 1e3:.3f} ms")
+        print(f"primer acceso por id:   {t_acceso * 1e6:.1f} us")
+        print("ida y vuelta:           OK")
+
+
+if __name__ == "__main__":
+    main()
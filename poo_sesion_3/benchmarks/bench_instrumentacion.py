@@ -0,0 +1,90 @@
+# benchmarks/bench_instrumentacion.py
+"""
+Benchmark del costo de la instrumentación: la misma mezcla de
+consignar/retirar/buscar_por_id (con algunos rechazos) sin instrumentar,
+midiendo el tiempo de cada operación y midiendo una de cada --muestreo
+(los contadores de _anotar van en las dos). Las repeticiones se
+intercalan y se toma la mejor de cada variante.
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_instrumentacion --cuentas 10000 --operaciones 300000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from services.banco_service import BancoService
+from services.instrumentacion import Instrumentacion
+
+
+def _poblar(n: int, instrumentacion=None) -> BancoService:
+    banco = BancoService(instrumentacion=instrumentacion)
+    for i in range(n):
+        if i % 2 == 0:
+            banco.abrir_ahorros(f"Titular {i}", 1_000.0, 0.01)
+        else:
+            banco.abrir_corriente(f"Titular {i}", 1_000.0, 500.0, 10.0)
+    return banco
+
+
+def _correr(banco: BancoService, operaciones) -> float:
+    # Los ids dependen del contador global: se traducen desde posiciones
+    ids = [c.id for c in banco.listar_cuentas()] + [-1]
+    operaciones = [(tipo, ids[posicion], monto) for tipo, posicion, monto in operaciones]
+    inicio = time.perf_counter()
+    for tipo, cuenta_id, monto in operaciones:
+        try:
+            if tipo == 0:
+                banco.consignar(cuenta_id, monto)
+            elif tipo == 1:
+                banco.retirar(cuenta_id, monto)
+            else:
+                banco.buscar_por_id(cuenta_id)
+        except ValueError:
+            pass
+    return time.perf_counter() - inicio
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cuentas", type=int, default=10_000)
+    parser.add_argument("--operaciones", type=int, default=300_000)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--muestreo", type=int, default=16, help="medir una de cada N operaciones")
+    parser.add_argument("--exposicion", action="store_true", help="imprime las métricas al final")
+    args = parser.parse_args()
+
+    rnd = random.Random(7)
+    # Posición -1 (~1%) es un id inexistente: ejercita los rechazos del servicio
+    operaciones = [
+        (rnd.randrange(3), -1 if rnd.random() < 0.01 else rnd.randrange(args.cuentas), float(rnd.randint(1, 1500)))
+        for _ in range(args.operaciones)
+    ]
+
+    inst = Instrumentacion()
+    variantes = [
+        ("sin instrumentar", None),
+        ("midiendo todas", inst),
+        (f"midiendo 1 de {args.muestreo}", Instrumentacion(muestreo=args.muestreo)),
+    ]
+    mejores = {nombre: float("inf") for nombre, _ in variantes}
+    for _ in range(args.repeticiones):
+        for nombre, instrumentacion in variantes:
+            banco = _poblar(args.cuentas, instrumentacion)
+            mejores[nombre] = min(mejores[nombre], _correr(banco, operaciones))
+            del banco
+
+    base = mejores["sin instrumentar"]
+    for nombre, segundos in mejores.items():
+        ns = segundos / args.operaciones * 1e9
+        print(f"{nombre:<24} {ns:9.0f} ns/op   {segundos / base - 1:+7.1%}")
+
+    if args.exposicion:
+        print()
+        print(inst.exposicion(), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# benchmarks/bench_intentar.py
+"""
+Benchmark de intentar_retirar/intentar_consignar frente a retirar/consignar
+con try/except, con una proporción alta de rechazos (por defecto 90%):
+fondos insuficientes, cupo excedido, cuenta cerrada, monto inválido y
+cuenta inexistente, mezclados con movimientos válidos.
+
+Se mide en el servicio y directamente sobre las cuentas. Verifica que
+ambos caminos den el mismo resultado por operación y los mismos saldos
+finales; termina con código 1 si no.
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_intentar --operaciones 200000 --rechazo 0.9
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+from models.resultados import CUENTA_INEXISTENTE, MENSAJES, NOMBRES, OK
+from services.banco_service import BancoService
+
+# Mensaje del ValueError -> código (el de cuenta inexistente lleva el id)
+_CODIGOS = {mensaje: codigo for codigo, mensaje in MENSAJES.items()}
+
+
+def _banco(cuentas: int) -> tuple:
+    """Mitad ahorros y mitad corrientes; una de cada diez, cerrada."""
+    banco = BancoService()
+    ids = []
+    for i in range(cuentas):
+        if i % 2 == 0:
+            cuenta = banco.abrir_ahorros(f"Titular {i}", 100.0, 0.01)
+        else:
+            cuenta = banco.abrir_corriente(f"Titular {i}", 100.0, 50.0, 0.0)
+        if i % 10 == 9:
+            banco.cerrar_cuenta(cuenta.id)
+        ids.append(cuenta.id)
+    return banco, ids
+
+
+def _operaciones(ids: list, n: int, rechazo: float) -> list:
+    """(operación, cuenta_id, monto); una proporción `rechazo` falla por uno de cinco motivos."""
+    rnd = random.Random(11)
+    abiertas = [cuenta_id for i, cuenta_id in enumerate(ids) if i % 10 != 9]
+    cerradas = [cuenta_id for i, cuenta_id in enumerate(ids) if i % 10 == 9]
+    inexistente = max(ids) + 1
+    operaciones = []
+    for _ in range(n):
+        if rnd.random() >= rechazo:
+            operacion = rnd.choice(("consignar", "retirar"))
+            operaciones.append((operacion, rnd.choice(abiertas), 0.01))
+            continue
+        motivo = rnd.randrange(4)
+        if motivo == 0:  # fondos insuficientes o cupo excedido, según el tipo
+            operaciones.append(("retirar", rnd.choice(abiertas), 1_000_000.0))
+        elif motivo == 1:
+            operaciones.append((rnd.choice(("consignar", "retirar")), rnd.choice(cerradas), 5.0))
+        elif motivo == 2:
+            operaciones.append((rnd.choice(("consignar", "retirar")), rnd.choice(abiertas), rnd.choice((0, -3.0))))
+        else:
+            operaciones.append((rnd.choice(("consignar", "retirar")), inexistente, 5.0))
+    return operaciones
+
+
+def _con_excepciones(banco: BancoService, operaciones: list) -> tuple:
+    metodos = {"consignar": banco.consignar, "retirar": banco.retirar}
+    codigos = []
+    anotar = codigos.append
+    inicio = time.perf_counter()
+    for operacion, cuenta_id, monto in operaciones:
+        try:
+            metodos[operacion](cuenta_id, monto)
+        except ValueError as e:
+            anotar(_CODIGOS.get(str(e), CUENTA_INEXISTENTE))
+        else:
+            anotar(OK)
+    return time.perf_counter() - inicio, codigos
+
+
+def _con_codigos(banco: BancoService, operaciones: list) -> tuple:
+    metodos = {"consignar": banco.intentar_consignar, "retirar": banco.intentar_retirar}
+    codigos = []
+    anotar = codigos.append
+    inicio = time.perf_counter()
+    for operacion, cuenta_id, monto in operaciones:
+        anotar(metodos[operacion](cuenta_id, monto))
+    return time.perf_counter() - inicio, codigos
+
+
+def _metodos_de_cuenta(banco: BancoService, operaciones: list, prefijo: str) -> list:
+    """(método ligado de la cuenta, monto) de las operaciones sobre cuentas que existen."""
+    metodos = []
+    for operacion, cuenta_id, monto in operaciones:
+        cuenta = banco.buscar_por_id(cuenta_id)
+        if cuenta is not None:
+            metodos.append((getattr(cuenta, prefijo + operacion), monto))
+    return metodos
+
+
+def _cuentas_con_excepciones(banco: BancoService, operaciones: list) -> float:
+    cuentas = _metodos_de_cuenta(banco, operaciones, "")
+    inicio = time.perf_counter()
+    for metodo, monto in cuentas:
+        try:
+            metodo(monto)
+        except ValueError:
+            pass
+    return (time.perf_counter() - inicio) / len(cuentas)
+
+
+def _cuentas_con_codigos(banco: BancoService, operaciones: list) -> float:
+    cuentas = _metodos_de_cuenta(banco, operaciones, "intentar_")
+    inicio = time.perf_counter()
+    for metodo, monto in cuentas:
+        metodo(monto)
+    return (time.perf_counter() - inicio) / len(cuentas)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cuentas", type=int, default=10_000)
+    parser.add_argument("--operaciones", type=int, default=200_000)
+    parser.add_argument("--rechazo", type=float, default=0.9, help="proporción de operaciones rechazadas")
+    args = parser.parse_args()
+
+    banco_a, ids = _banco(args.cuentas)
+    banco_b, ids_b = _banco(args.cuentas)
+    operaciones = _operaciones(ids, args.operaciones, args.rechazo)
+    # Mismas operaciones en el segundo banco: sus ids son los del primero desplazados
+    desplazamiento = ids_b[0] - ids[0]
+    operaciones_b = [(operacion, cuenta_id + desplazamiento, monto) for operacion, cuenta_id, monto in operaciones]
+
+    segundos_a, codigos_a = _con_excepciones(banco_a, operaciones)
+    segundos_b, codigos_b = _con_codigos(banco_b, operaciones_b)
+    saldos_a = [c.saldo_centavos for c in banco_a.listar_cuentas()]
+    saldos_b = [c.saldo_centavos for c in banco_b.listar_cuentas()]
+    if codigos_a != codigos_b or saldos_a != saldos_b:
+        print("FALLA: intentar_* no coincide con el camino que lanza")
+        sys.exit(1)
+
+    rechazadas = sum(1 for codigo in codigos_a if codigo != OK)
+    por_motivo = {}
+    for codigo in codigos_a:
+        por_motivo[NOMBRES[codigo]] = por_motivo.get(NOMBRES[codigo], 0) + 1
+    print(f"operaciones: {len(operaciones):,}  rechazadas: {rechazadas / len(operaciones):.0%}  {por_motivo}")
+    print(f"{'':<22} {'try/except':>11} {'intentar_*':>11} {'aceleración':>12}")
+    n = len(operaciones)
+    print(
+        f"{'servicio (ns/op)':<22} {segundos_a / n * 1e9:>11.0f} {segundos_b / n * 1e9:>11.0f}"
+        f" {segundos_a / segundos_b:>11.1f}x"
+    )
+    por_cuenta_a = _cuentas_con_excepciones(banco_a, operaciones)
+    por_cuenta_b = _cuentas_con_codigos(banco_a, operaciones)
+    print(
+        f"{'cuenta (ns/op)':<22} {por_cuenta_a * 1e9:>11.0f} {por_cuenta_b * 1e9:>11.0f}"
+        f" {por_cuenta_a / por_cuenta_b:>11.1f}x"
+    )
+    print("mismos resultados y saldos: OK")
+
+
+if __name__ == "__main__":
+    main()
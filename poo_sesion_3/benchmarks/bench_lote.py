@@ -0,0 +1,63 @@
+# benchmarks/bench_lote.py
+"""
+Benchmark del modo lote de la consola: comandos por segundo de
+ConsolaBanco.ejecutar_lote (con salida normal y solo resumen) frente a
+llamar directamente al servicio con las mismas operaciones.
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_lote --cuentas 1000 --comandos 200000
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import random
+import time
+
+from services.banco_service import BancoService
+from ui.consola import ConsolaBanco
+
+
+def _comandos(ids: list, n: int) -> list:
+    rnd = random.Random(4)
+    lineas = []
+    for _ in range(n):
+        comando = "consignar" if rnd.random() < 0.5 else "retirar"
+        lineas.append(f"{comando} {ids[rnd.randrange(len(ids))]} {rnd.randint(1, 50_000) / 100}")
+    return lineas
+
+
+def _banco(cuentas: int) -> BancoService:
+    banco = BancoService()
+    for i in range(cuentas):
+        banco.abrir_corriente(f"Titular {i}", 1000.0, 500.0, 10.0)
+    return banco
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cuentas", type=int, default=1000)
+    parser.add_argument("--comandos", type=int, default=200_000)
+    args = parser.parse_args()
+
+    # Misma semilla: cada banco recibe la misma secuencia sobre sus propios ids
+    for nombre, solo_resumen in (("lote", False), ("lote (solo resumen)", True)):
+        banco = _banco(args.cuentas)
+        lineas = _comandos([c.id for c in banco.listar_cuentas()], args.comandos)
+        resumen = ConsolaBanco(banco).ejecutar_lote(lineas, io.StringIO(), solo_resumen=solo_resumen)
+        print(f"{nombre:>20}: {resumen.comandos / resumen.segundos:>9.0f} comandos/s ({resumen.errores} rechazados)")
+
+    banco = _banco(args.cuentas)
+    operaciones = [linea.split() for linea in _comandos([c.id for c in banco.listar_cuentas()], args.comandos)]
+    inicio = time.perf_counter()
+    for comando, cuenta_id, monto in operaciones:
+        try:
+            getattr(banco, comando)(int(cuenta_id), float(monto))
+        except ValueError:
+            pass
+    segundos = time.perf_counter() - inicio
+    print(f"{'servicio directo':>20}: {args.comandos / segundos:>9.0f} comandos/s")
+
+
+if __name__ == "__main__":
+    main()
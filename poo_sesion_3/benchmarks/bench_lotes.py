@@ -0,0 +1,94 @@
+# benchmarks/bench_lotes.py
+"""
+Benchmark de movimientos en lote: bucle de consignar/retirar (con
+try/except) vs consignar_lote/retirar_lote (atómico y mejor esfuerzo),
+sin rechazos y con una parte de retiros rechazados.
+
+Las repeticiones de todos los casos se intercalan y se toma la mejor de
+cada uno (la máquina puede variar entre un caso y otro); la última
+columna es la velocidad relativa al bucle de la misma operación. El
+atómico convierte cada monto una vez y llama a cada cuenta una sola vez
+con su total; el mejor esfuerzo llama a la cuenta por movimiento, pero
+con rechazos evita crear una excepción por cada uno.
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_lotes --cuentas 100000 --movimientos 500000 --rechazo 0.5
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from services.banco_service import BancoService
+
+
+def _poblar(n: int) -> BancoService:
+    banco = BancoService()
+    for i in range(n):
+        if i % 2 == 0:
+            banco.abrir_ahorros(f"Titular {i}", 1_000_000.0, 0.01)
+        else:
+            banco.abrir_corriente(f"Titular {i}", 1_000_000.0, 5000.0, 10.0)
+    return banco
+
+
+def _kops(movimientos: int, segundos: float) -> float:
+    return movimientos / segundos / 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cuentas", type=int, default=100_000)
+    parser.add_argument("--movimientos", type=int, default=500_000)
+    parser.add_argument("--rechazo", type=float, default=0.5, help="proporción de retiros que exceden el saldo")
+    parser.add_argument("--repeticiones", type=int, default=7)
+    args = parser.parse_args()
+
+    banco = _poblar(args.cuentas)
+    ids = [c.id for c in banco.listar_cuentas()]
+    rnd = random.Random(42)
+    lote = [(rnd.choice(ids), rnd.uniform(1, 100)) for _ in range(args.movimientos)]
+    # Mismo lote, pero una parte de los retiros excede cualquier saldo y cupo
+    con_rechazos = [
+        (cuenta_id, 1e9 if rnd.random() < args.rechazo else monto) for cuenta_id, monto in lote
+    ]
+
+    def bucle(operacion, movimientos):
+        for cuenta_id, monto in movimientos:
+            try:
+                operacion(cuenta_id, monto)
+            except ValueError:
+                pass
+
+    # (nombre, función, caso de referencia)
+    casos = [
+        ("consignar (bucle)", lambda: bucle(banco.consignar, lote), None),
+        ("consignar_lote atómico", lambda: banco.consignar_lote(lote), "consignar (bucle)"),
+        ("consignar_lote mejor esfuerzo", lambda: banco.consignar_lote(lote, atomico=False), "consignar (bucle)"),
+        ("retirar (bucle)", lambda: bucle(banco.retirar, lote), None),
+        ("retirar_lote atómico", lambda: banco.retirar_lote(lote), "retirar (bucle)"),
+        ("retirar_lote mejor esfuerzo", lambda: banco.retirar_lote(lote, atomico=False), "retirar (bucle)"),
+        (f"retirar {args.rechazo:.0%} rechazos (bucle)", lambda: bucle(banco.retirar, con_rechazos), None),
+        (
+            f"retirar_lote {args.rechazo:.0%} rechazos",
+            lambda: banco.retirar_lote(con_rechazos, atomico=False),
+            f"retirar {args.rechazo:.0%} rechazos (bucle)",
+        ),
+    ]
+
+    mejores = {nombre: float("inf") for nombre, _, _ in casos}
+    for _ in range(args.repeticiones):
+        for nombre, funcion, _ in casos:
+            inicio = time.perf_counter()
+            funcion()
+            mejores[nombre] = min(mejores[nombre], time.perf_counter() - inicio)
+
+    print(f"{'caso':<36} {'kops/s':>10} {'vs bucle':>9}")
+    for nombre, _, referencia in casos:
+        relativo = f"{mejores[referencia] / mejores[nombre]:>8.2f}x" if referencia else ""
+        print(f"{nombre:<36} {_kops(len(lote), mejores[nombre]):>10.1f} {relativo:>9}")
+
+
+if __name__ == "__main__":
+    main()
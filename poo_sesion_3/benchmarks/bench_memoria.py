@@ -0,0 +1,74 @@
+# benchmarks/bench_memoria.py
+"""
+Memoria por cuenta (tracemalloc) para CuentaAhorros y CuentaCorriente.
+
+Se compara cada clase (con __slots__) contra una subclase trivial que
+recupera el __dict__, para ver cuánto ahorran los slots. El titular y los
+montos se comparten entre instancias: se mide el objeto, no sus datos.
+
+--max-bytes hace que el script termine con error si alguna clase con
+slots supera ese tamaño (útil para detectar regresiones).
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_memoria
+    python -m benchmarks.bench_memoria --n 1000000 --max-bytes 120
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tracemalloc
+from typing import Callable
+
+from models.cuentas import CuentaAhorros, CuentaCorriente
+
+
+class _AhorrosConDict(CuentaAhorros):
+    pass
+
+
+class _CorrienteConDict(CuentaCorriente):
+    pass
+
+
+def bytes_por_cuenta(crear: Callable[[], object], n: int) -> float:
+    tracemalloc.start()
+    inicio, _ = tracemalloc.get_traced_memory()
+    cuentas = [crear() for _ in range(n)]
+    fin, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Se descuenta la lista que guarda las referencias (8 bytes por puntero)
+    total = fin - inicio - sys.getsizeof(cuentas)
+    del cuentas
+    return total / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=1_000_000)
+    parser.add_argument("--max-bytes", type=float, default=None)
+    args = parser.parse_args()
+
+    titular = "Titular"
+    casos = [
+        ("CuentaAhorros", lambda: CuentaAhorros(titular, 1000.0, 0.01), True),
+        ("CuentaAhorros (con __dict__)", lambda: _AhorrosConDict(titular, 1000.0, 0.01), False),
+        ("CuentaCorriente", lambda: CuentaCorriente(titular, 1000.0, 500.0, 10.0), True),
+        ("CuentaCorriente (con __dict__)", lambda: _CorrienteConDict(titular, 1000.0, 500.0, 10.0), False),
+    ]
+
+    fallo = False
+    print(f"{'tipo':<32} {'bytes/cuenta':>12}")
+    for nombre, crear, con_slots in casos:
+        medido = bytes_por_cuenta(crear, args.n)
+        print(f"{nombre:<32} {medido:>12.1f}")
+        if con_slots and args.max_bytes is not None and medido > args.max_bytes:
+            print(f"  -> supera el máximo de {args.max_bytes:.1f} bytes")
+            fallo = True
+
+    if fallo:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/bench_paginacion.py
+"""
+Benchmark del listado paginado: listar_cuentas() (copia completa) vs
+paginar_cuentas() por id al inicio y a mitad del libro (cursor), con un
+filtro, ordenado por saldo sin índice (una pasada, keyset) y con
+indice_saldos=True, y ordenado por titular (lista ordenada ya armada).
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_paginacion --tamanos 10000 100000 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from services.banco_service import BancoService
+
+
+def _poblar(n: int, indice_saldos: bool = False) -> BancoService:
+    banco = BancoService(indice_saldos=indice_saldos)
+    rnd = random.Random(2)
+    for i in range(n):
+        if i % 2 == 0:
+            banco.abrir_ahorros(f"Titular {i}", rnd.randint(0, 100_000), 0.01)
+        else:
+            banco.abrir_corriente(f"Titular {i}", rnd.randint(0, 100_000), 500.0, 10.0)
+    return banco
+
+
+def _medir(funcion, repeticiones: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10**4, 10**5, 10**6])
+    parser.add_argument("--limite", type=int, default=50)
+    args = parser.parse_args()
+
+    print(
+        f"{'n':>9} {'listar (copia)':>15} {'página 1':>10} {'página mitad':>13} {'filtrada':>10} {'por saldo':>11}"
+        f" {'saldo (índice)':>15} {'por titular':>12}"
+    )
+    for n in args.tamanos:
+        banco = _poblar(n)
+        centro = banco.paginar_cuentas(limite=1).cuentas[0].id + n // 2
+        mitad = (centro, centro)
+        listar = _medir(banco.listar_cuentas, 5)
+        primera = _medir(lambda: banco.paginar_cuentas(limite=args.limite), 1000)
+        en_mitad = _medir(lambda: banco.paginar_cuentas(mitad, args.limite), 1000)
+        filtrada = _medir(lambda: banco.paginar_cuentas(mitad, args.limite, tipo="CuentaAhorros", saldo_min=500), 200)
+        por_saldo = _medir(lambda: banco.paginar_cuentas(limite=args.limite, orden="saldo"), 3)
+        banco.paginar_cuentas(orden="titular")  # arma la lista ordenada fuera de la medida
+        por_titular = _medir(lambda: banco.paginar_cuentas(limite=args.limite, orden="titular"), 1000)
+        del banco
+        banco = _poblar(n, indice_saldos=True)
+        cursor = banco.paginar_cuentas(limite=n // 2, orden="saldo").cursor
+        con_indice = _medir(lambda: banco.paginar_cuentas(cursor, args.limite, orden="saldo"), 1000)
+        print(
+            f"{n:>9} {listar * 1e3:>12.2f} ms {primera * 1e6:>7.1f} us {en_mitad * 1e6:>10.1f} us"
+            f" {filtrada * 1e6:>7.1f} us {por_saldo * 1e3:>8.1f} ms {con_indice * 1e6:>12.1f} us"
+            f" {por_titular * 1e6:>9.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# benchmarks/bench_registro.py
+"""
+Benchmark del registro de cuentas de BancoService.
+
+Compara la búsqueda por id actual (dict, O(1)) con el recorrido lineal
+que se usaba antes (next(...) sobre una lista, O(n)).
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_registro
+    python -m benchmarks.bench_registro --tamanos 1000 10000 100000 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import List, Optional
+
+from models.cuentas import CuentaBase
+from services.banco_service import BancoService
+
+
+def _buscar_lineal(cuentas: List[CuentaBase], cuenta_id: int) -> Optional[CuentaBase]:
+    """Réplica de la búsqueda anterior, solo como referencia."""
+    return next((c for c in cuentas if c.id == cuenta_id), None)
+
+
+def _poblar(n: int) -> BancoService:
+    banco = BancoService()
+    for i in range(n):
+        if i % 2 == 0:
+            banco.abrir_ahorros(f"Titular {i}", 1000.0, 0.01)
+        else:
+            banco.abrir_corriente(f"Titular {i}", 1000.0, 500.0, 10.0)
+    return banco
+
+
+def _us_por_op(segundos: float, ops: int) -> float:
+    return segundos / ops * 1e6
+
+
+def medir(n: int, consultas: int, consultas_lineales: int) -> dict:
+    banco = _poblar(n)
+    cuentas = banco.listar_cuentas()
+    ids = [c.id for c in cuentas]
+    rnd = random.Random(n)
+    muestra = [rnd.choice(ids) for _ in range(consultas)]
+
+    inicio = time.perf_counter()
+    for cuenta_id in muestra:
+        banco.consignar(cuenta_id, 1.0)
+    t_dict = time.perf_counter() - inicio
+
+    muestra_lineal = muestra[:consultas_lineales]
+    inicio = time.perf_counter()
+    for cuenta_id in muestra_lineal:
+        _buscar_lineal(cuentas, cuenta_id)
+    t_lineal = time.perf_counter() - inicio
+
+    a_eliminar = muestra[: min(1000, len(muestra))]
+    inicio = time.perf_counter()
+    for cuenta_id in set(a_eliminar):
+        banco.eliminar_cuenta(cuenta_id)
+    t_eliminar = time.perf_counter() - inicio
+
+    return {
+        "n": n,
+        "consignar_dict_us": _us_por_op(t_dict, len(muestra)),
+        "buscar_lineal_us": _us_por_op(t_lineal, len(muestra_lineal)),
+        "eliminar_dict_us": _us_por_op(t_eliminar, len(set(a_eliminar))),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10**3, 10**4, 10**5, 10**6])
+    parser.add_argument("--consultas", type=int, default=100_000)
+    parser.add_argument("--consultas-lineales", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'n':>10} {'consignar (dict)':>18} {'buscar (lineal)':>18} {'eliminar (dict)':>18}")
+    for n in args.tamanos:
+        r = medir(n, args.consultas, args.consultas_lineales)
+        print(
+            f"{r['n']:>10} {r['consignar_dict_us']:>15.3f} us "
+            f"{r['buscar_lineal_us']:>15.3f} us {r['eliminar_dict_us']:>15.3f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# benchmarks/bench_titulares.py
+"""
+Benchmark de buscar_por_titular: índice de trigramas vs recorrido completo,
+y lo que el índice le suma a abrir/eliminar (agregar/quitar por cuenta).
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_titulares --tamanos 10000 100000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import List
+
+from models.cuentas import CuentaBase
+from services.banco_service import BancoService
+from services.indice_titulares import IndiceTitulares
+
+NOMBRES = ["Ana", "Carlos", "Juliana", "David", "María", "José", "Lucía", "Andrés", "Sofía", "Tomás"]
+APELLIDOS = ["Gómez", "Pérez", "Rodríguez", "López", "Martínez", "García", "Díaz", "Ruiz", "Torres", "Ramírez"]
+CONSULTAS = ["a", "an", "jos", "gómez", "maría ló", "z", "xyz", "tomás ram"]
+
+
+def _buscar_lineal(cuentas: List[CuentaBase], texto: str) -> List[CuentaBase]:
+    """Réplica de la búsqueda anterior, solo como referencia."""
+    texto = str(texto).strip().lower()
+    if not texto:
+        return []
+    return [c for c in cuentas if texto in c.titular.lower()]
+
+
+def _poblar(n: int) -> BancoService:
+    rnd = random.Random(n)
+    banco = BancoService()
+    for i in range(n):
+        titular = f"{rnd.choice(NOMBRES)} {rnd.choice(APELLIDOS)} {i}"
+        banco.abrir_ahorros(titular, 1000.0, 0.01)
+    return banco
+
+
+def _tiempo_ms(funcion, repeticiones: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1e3
+
+
+def _mantenimiento_us(titulares: List[str]) -> tuple:
+    """µs por cuenta de agregar y de quitar en un índice nuevo."""
+    indice = IndiceTitulares()
+    inicio = time.perf_counter()
+    for i, titular in enumerate(titulares):
+        indice.agregar(i, titular)
+    agregar = (time.perf_counter() - inicio) / len(titulares) * 1e6
+    inicio = time.perf_counter()
+    for i in range(len(titulares)):
+        indice.quitar(i)
+    return agregar, (time.perf_counter() - inicio) / len(titulares) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10**3, 10**4, 10**5])
+    parser.add_argument("--repeticiones", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'n':>8} {'consulta':>12} {'resultados':>10} {'índice':>12} {'lineal':>12}")
+    for n in args.tamanos:
+        banco = _poblar(n)
+        cuentas = banco.listar_cuentas()
+        for texto in CONSULTAS:
+            esperado = _buscar_lineal(cuentas, texto)
+            obtenido = banco.buscar_por_titular(texto)
+            assert obtenido == esperado, f"resultado distinto para {texto!r}"
+            t_indice = _tiempo_ms(lambda: banco.buscar_por_titular(texto), args.repeticiones)
+            t_lineal = _tiempo_ms(lambda: _buscar_lineal(cuentas, texto), max(1, args.repeticiones // 4))
+            print(f"{n:>8} {texto!r:>12} {len(esperado):>10} {t_indice:>9.3f} ms {t_lineal:>9.3f} ms")
+        agregar, quitar = _mantenimiento_us([cuenta.titular for cuenta in cuentas])
+        print(f"{n:>8} índice: agregar {agregar:.2f} µs/cuenta, quitar {quitar:.2f} µs/cuenta")
+
+
+if __name__ == "__main__":
+    main()
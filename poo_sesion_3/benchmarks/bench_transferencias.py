@@ -0,0 +1,100 @@
+# benchmarks/bench_transferencias.py
+"""
+Benchmark de transferencias: retirar + consignar por separado (lo que se
+hacía antes), transferir() una por una y liquidar_transferencias() por
+lotes con compensación multilateral.
+
+Verifica que el dinero total se conserve centavo a centavo. Termina con
+código 1 si no.
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.bench_transferencias --cuentas 1000 --transferencias 200000 --lote 10000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+from services.banco_service import BancoService
+
+
+def _banco(cuentas: int) -> tuple:
+    banco = BancoService()
+    ids = []
+    for i in range(cuentas):
+        if i % 2 == 0:
+            ids.append(banco.abrir_ahorros(f"Titular {i}", 10_000.0, 0.01).id)
+        else:
+            ids.append(banco.abrir_corriente(f"Titular {i}", 10_000.0, 5_000.0, 10.0).id)
+    return banco, ids
+
+
+def _transferencias(ids: list, n: int) -> list:
+    rnd = random.Random(6)
+    transferencias = []
+    while len(transferencias) < n:
+        origen, destino = rnd.randrange(len(ids)), rnd.randrange(len(ids))
+        if origen != destino:
+            transferencias.append((ids[origen], ids[destino], rnd.randint(1, 20_000) / 100))
+    return transferencias
+
+
+def _total(banco: BancoService) -> int:
+    return sum(c.saldo_centavos for c in banco.listar_cuentas())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cuentas", type=int, default=1000)
+    parser.add_argument("--transferencias", type=int, default=200_000)
+    parser.add_argument("--lote", type=int, default=10_000)
+    args = parser.parse_args()
+    fallos = []
+
+    def separado(banco, transferencias):
+        for origen, destino, monto in transferencias:
+            try:
+                banco.retirar(origen, monto)
+            except ValueError:
+                continue
+            banco.consignar(destino, monto)
+
+    def una_por_una(banco, transferencias):
+        for origen, destino, monto in transferencias:
+            try:
+                banco.transferir(origen, destino, monto)
+            except ValueError:
+                pass
+
+    def por_lotes(banco, transferencias):
+        for i in range(0, len(transferencias), args.lote):
+            try:
+                banco.liquidar_transferencias(transferencias[i : i + args.lote])
+            except ValueError:
+                pass
+
+    for nombre, aplicar in (
+        ("retirar + consignar", separado),
+        ("transferir", una_por_una),
+        (f"liquidar (lote {args.lote})", por_lotes),
+    ):
+        banco, ids = _banco(args.cuentas)
+        transferencias = _transferencias(ids, args.transferencias)
+        inicial = _total(banco)
+        inicio = time.perf_counter()
+        aplicar(banco, transferencias)
+        segundos = time.perf_counter() - inicio
+        if _total(banco) != inicial:
+            fallos.append(f"{nombre}: no se conservó el dinero")
+        print(f"{nombre:>24}: {args.transferencias / segundos:>9.0f} transferencias/s")
+
+    if fallos:
+        print("FALLA: " + "; ".join(fallos))
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# benchmarks/casos.py
+"""
+Casos de la suite de benchmarks. Se ejecuta DENTRO de una sesión
+(poo_sesion2 o poo_sesion_3 en PYTHONPATH); suite.py lo lanza una vez por
+sesión y lee el JSON que imprime en stdout.
+
+Cada caso mide ns por operación: se repite --repeticiones veces un bloque
+de operaciones fijo (semillas fijas) y se reporta el mínimo (lo que
+compara suite.py), la mediana y el ruido: (mediana - mínimo) / mínimo.
+El script queda en poo_sesion_3/benchmarks, pero solo importa la sesión
+que esté en PYTHONPATH.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from services.banco_service import BancoService
+
+SESION_3 = hasattr(BancoService, "abrir_ahorros")
+CONSULTAS_TITULAR = ["a", "an", "tit", "ular 12", "zz"]
+
+
+def _abrir(banco: BancoService, i: int):
+    if not SESION_3:
+        return banco.abrir_cuenta(f"Titular {i}", 1_000_000.0)
+    if i % 2 == 0:
+        return banco.abrir_ahorros(f"Titular {i}", 1_000_000.0, 0.001)
+    return banco.abrir_corriente(f"Titular {i}", 1_000_000.0, 5000.0, 1.0)
+
+
+def _medir(bloque: Callable[[], int], repeticiones: int) -> Dict[str, float]:
+    muestras: List[float] = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter_ns()
+        operaciones = bloque()
+        muestras.append((time.perf_counter_ns() - inicio) / operaciones)
+    minimo = min(muestras)
+    mediana = statistics.median(muestras)
+    return {"ns_por_op": mediana, "ns_por_op_min": minimo, "ruido": (mediana - minimo) / minimo}
+
+
+def ejecutar(n: int, repeticiones: int) -> List[dict]:
+    rnd = random.Random(n)
+    resultados = []
+
+    def anotar(caso: str, medida: Dict[str, float]) -> None:
+        resultados.append({"caso": caso, "n": n, **medida})
+
+    # abrir: se mide la construcción del libro completo; el último queda
+    # para los demás casos
+    libros: List[BancoService] = []
+
+    def abrir() -> int:
+        libros[:] = [BancoService()]
+        for i in range(n):
+            _abrir(libros[0], i)
+        return n
+
+    anotar("abrir", _medir(abrir, repeticiones))
+    banco = libros[0]
+
+    ids = [c.id for c in banco.listar_cuentas()]
+    muestra = [rnd.choice(ids) for _ in range(10_000)]
+
+    def buscar_por_id() -> int:
+        for cuenta_id in muestra:
+            banco.buscar_por_id(cuenta_id)
+        return len(muestra)
+
+    def buscar_por_titular() -> int:
+        for texto in CONSULTAS_TITULAR:
+            banco.buscar_por_titular(texto)
+        return len(CONSULTAS_TITULAR)
+
+    def movimientos() -> int:
+        for i, cuenta_id in enumerate(muestra):
+            if i % 2 == 0:
+                banco.consignar(cuenta_id, 10.0)
+            else:
+                banco.retirar(cuenta_id, 10.0)
+        return len(muestra)
+
+    llamadas_listar = max(1, 1_000_000 // n)
+
+    def listar_cuentas() -> int:
+        for _ in range(llamadas_listar):
+            banco.listar_cuentas()
+        return llamadas_listar
+
+    anotar("buscar_por_id", _medir(buscar_por_id, repeticiones))
+    anotar("buscar_por_titular", _medir(buscar_por_titular, repeticiones))
+    anotar("consignar_retirar", _medir(movimientos, repeticiones))
+    anotar("listar_cuentas", _medir(listar_cuentas, repeticiones))
+
+    if SESION_3:
+        llamadas_corte = max(1, 1_000_000 // n)
+
+        def corte() -> int:
+            for _ in range(llamadas_corte):
+                banco.aplicar_corte_mensual_a_todas()
+            return llamadas_corte
+
+        anotar("aplicar_corte_mensual_a_todas", _medir(corte, repeticiones))
+
+    # eliminar: va al final; cada repetición borra cuentas distintas
+    a_borrar = min(1000, n // (repeticiones + 1))
+    orden = ids[:]
+    rnd.shuffle(orden)
+
+    def eliminar() -> int:
+        lote = [orden.pop() for _ in range(a_borrar)]
+        for cuenta_id in lote:
+            banco.eliminar_cuenta(cuenta_id)
+        return len(lote)
+
+    if a_borrar:
+        anotar("eliminar_cuenta", _medir(eliminar, repeticiones))
+    return resultados
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=int, nargs="+", required=True)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    resultados = []
+    for n in args.tamanos:
+        resultados.extend(ejecutar(n, args.repeticiones))
+    print(json.dumps(resultados))
+
+
+if __name__ == "__main__":
+    main()
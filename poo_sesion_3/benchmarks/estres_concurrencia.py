@@ -0,0 +1,130 @@
+# benchmarks/estres_concurrencia.py
+"""
+Prueba de estrés del modo concurrente de BancoService.
+
+Varios hilos hacen consignaciones, retiros y lotes atómicos al azar sobre
+las mismas cuentas (mientras otro hilo abre cuentas nuevas y se aplican
+cortes sin cuota ni interés). Al final se verifica:
+- Conservación: saldo total = saldo inicial + lo consignado - lo retirado
+  (montos enteros, así la suma en float es exacta).
+- Ninguna CuentaCorriente quedó por debajo de -cupo_sobregiro, tampoco
+  en las muestras tomadas durante la corrida.
+- Los ids asignados son únicos.
+
+Termina con código 1 si algo falla. --sin-bloqueo corre lo mismo sin
+modo concurrente, para ver que la prueba sí detecta las carreras.
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.estres_concurrencia --hilos 16 --operaciones 20000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import threading
+import time
+
+from models.cuentas import CuentaCorriente
+from services.banco_service import BancoService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hilos", type=int, default=16)
+    parser.add_argument("--operaciones", type=int, default=20_000, help="por hilo")
+    parser.add_argument("--cuentas", type=int, default=32)
+    parser.add_argument("--sin-bloqueo", action="store_true")
+    args = parser.parse_args()
+
+    # Cambios de hilo muy frecuentes para provocar intercalados
+    sys.setswitchinterval(1e-6)
+
+    banco = BancoService(concurrente=not args.sin_bloqueo, franjas=8)
+    ids = []
+    for i in range(args.cuentas):
+        if i % 2 == 0:
+            ids.append(banco.abrir_ahorros(f"A{i}", 1000, 0.0).id)
+        else:
+            ids.append(banco.abrir_corriente(f"C{i}", 1000, 500, 0).id)
+    inicial = sum(c.saldo for c in banco.listar_cuentas())
+
+    netos = [0] * args.hilos
+    nuevos_ids = []
+    violaciones = []
+    terminar = threading.Event()
+
+    def trabajador(n: int) -> None:
+        rnd = random.Random(n)
+        neto = 0
+        for _ in range(args.operaciones):
+            cuenta_id = rnd.choice(ids)
+            monto = rnd.randint(1, 400)
+            r = rnd.random()
+            try:
+                if r < 0.45:
+                    banco.consignar(cuenta_id, monto)
+                    neto += monto
+                elif r < 0.9:
+                    banco.retirar(cuenta_id, monto)
+                    neto -= monto
+                else:
+                    lote = [(rnd.choice(ids), rnd.randint(1, 200)) for _ in range(4)]
+                    banco.retirar_lote(lote)
+                    neto -= sum(m for _, m in lote)
+            except ValueError:
+                pass
+        netos[n] = neto
+
+    def apertor() -> None:
+        while not terminar.is_set():
+            nuevos_ids.append(banco.abrir_ahorros("nuevo", 0, 0.0).id)
+
+    def vigilante() -> None:
+        while not terminar.is_set():
+            for cuenta in banco.listar_cuentas():
+                if isinstance(cuenta, CuentaCorriente) and cuenta.saldo < -cuenta.cupo_sobregiro:
+                    violaciones.append((cuenta.id, cuenta.saldo))
+            banco.aplicar_corte_mensual_a_todas()  # sin tasa ni cuota: no cambia saldos
+            time.sleep(0.001)
+
+    hilos = [threading.Thread(target=trabajador, args=(n,)) for n in range(args.hilos)]
+    auxiliares = [threading.Thread(target=apertor), threading.Thread(target=vigilante)]
+    inicio = time.perf_counter()
+    for h in hilos + auxiliares:
+        h.start()
+    for h in hilos:
+        h.join()
+    terminar.set()
+    for h in auxiliares:
+        h.join()
+    segundos = time.perf_counter() - inicio
+
+    cuentas = banco.listar_cuentas()
+    final = sum(c.saldo for c in cuentas)
+    esperado = inicial + sum(netos)
+    for cuenta in cuentas:
+        if isinstance(cuenta, CuentaCorriente) and cuenta.saldo < -cuenta.cupo_sobregiro:
+            violaciones.append((cuenta.id, cuenta.saldo))
+    todos_ids = [c.id for c in cuentas]
+
+    total_ops = args.hilos * args.operaciones
+    print(f"operaciones: {total_ops} en {segundos:.2f} s ({total_ops / segundos:.0f} ops/s)")
+    print(f"saldo total: {final:.2f} (esperado {esperado:.2f})")
+    print(f"cuentas abiertas durante la prueba: {len(nuevos_ids)}")
+
+    fallos = []
+    if final != esperado:
+        fallos.append("no se conservó el dinero")
+    if violaciones:
+        fallos.append(f"{len(violaciones)} violaciones del cupo de sobregiro")
+    if len(set(todos_ids)) != len(todos_ids):
+        fallos.append("ids repetidos")
+    if fallos:
+        print("FALLA: " + "; ".join(fallos))
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
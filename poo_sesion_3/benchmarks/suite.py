@@ -0,0 +1,160 @@
+# benchmarks/suite.py
+"""
+Suite de benchmarks de BancoService (poo_sesion2 y poo_sesion_3).
+
+Cubre abrir, buscar_por_id, buscar_por_titular, consignar/retirar,
+eliminar_cuenta, listar_cuentas y aplicar_corte_mensual_a_todas (solo
+sesión 3) a varios tamaños. Cada sesión corre en su propio proceso (las
+dos usan los mismos nombres de paquete: models, services).
+
+Vive con los benchmarks de la sesión 3, pero mide también la sesión 2
+(casos.py se lanza con cada sesión en PYTHONPATH).
+
+Uso (desde poo_sesion_3/):
+    python -m benchmarks.suite --salida resultados.json
+    python -m benchmarks.suite --tamanos 1000 10000 100000 1000000 10000000
+    python -m benchmarks.suite --guardar-base            # fija la línea base
+    python -m benchmarks.suite --umbral 0.15             # compara con la base
+
+Con línea base (por defecto benchmarks/base.json si existe) compara el
+mínimo de las repeticiones (al menos 5) y termina con código 1 si algún
+caso es más lento que lo tolerado (ver comparar). La base es propia de
+cada máquina: genérela en el equipo donde se va a comparar.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+RAIZ = os.path.dirname(os.path.dirname(DIRECTORIO))
+CASOS = os.path.join(DIRECTORIO, "casos.py")
+BASE_POR_DEFECTO = os.path.join(DIRECTORIO, "base.json")
+SESIONES = ["poo_sesion2", "poo_sesion_3"]
+MIN_REPETICIONES = 5
+# La tolerancia de un caso es al menos este múltiplo de su ruido
+VECES_RUIDO = 3.0
+
+
+def correr_sesion(sesion: str, tamanos: List[int], repeticiones: int) -> List[dict]:
+    directorio = os.path.join(RAIZ, sesion)
+    entorno = dict(os.environ, PYTHONPATH=directorio, PYTHONHASHSEED="0")
+    salida = subprocess.run(
+        [sys.executable, CASOS, "--tamanos", *map(str, tamanos), "--repeticiones", str(repeticiones)],
+        cwd=directorio,
+        env=entorno,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    resultados = json.loads(salida.stdout)
+    for r in resultados:
+        r["sesion"] = sesion
+    return resultados
+
+
+def comparar(resultados: List[dict], base: dict, umbral: float) -> List[str]:
+    """
+    Mensajes de regresión (vacío si todo está dentro de lo tolerado).
+
+    Se compara ns_por_op_min: el mínimo de las repeticiones es lo menos
+    afectado por interrupciones del equipo. La tolerancia de cada caso es
+    el mayor entre `umbral` y VECES_RUIDO veces su ruido (el mayor entre la
+    base y esta corrida): un caso que ya varía mucho entre repeticiones
+    necesita un cambio más grande para contar como regresión.
+    """
+    de_base: Dict[Tuple[str, str, int], dict] = {(r["sesion"], r["caso"], r["n"]): r for r in base["resultados"]}
+    regresiones = []
+    for r in resultados:
+        anterior = de_base.get((r["sesion"], r["caso"], r["n"]))
+        if anterior is None or not anterior.get("ns_por_op_min"):
+            continue  # caso nuevo o base de otro formato
+        cambio = r["ns_por_op_min"] / anterior["ns_por_op_min"] - 1
+        tolerancia = max(umbral, VECES_RUIDO * max(r["ruido"], anterior.get("ruido", 0.0)))
+        r["cambio_vs_base"] = cambio
+        r["tolerancia"] = tolerancia
+        if cambio > tolerancia:
+            regresiones.append(
+                f"{r['sesion']} {r['caso']} n={r['n']}: {anterior['ns_por_op_min']:.0f} -> "
+                f"{r['ns_por_op_min']:.0f} ns/op (+{cambio:.0%}, tolerado +{tolerancia:.0%})"
+            )
+    return regresiones
+
+
+def _imprimir(resultados: List[dict]) -> None:
+    print(
+        f"{'sesión':<13} {'caso':<31} {'n':>9} {'ns/op (mín)':>14} {'ruido':>7} {'vs base':>9} {'tolerado':>9}",
+        file=sys.stderr,
+    )
+    for r in resultados:
+        cambio = r.get("cambio_vs_base")
+        texto_cambio = "" if cambio is None else f"{cambio:+.1%}"
+        texto_tolerancia = "" if cambio is None else f"+{r['tolerancia']:.0%}"
+        print(
+            f"{r['sesion']:<13} {r['caso']:<31} {r['n']:>9} {r['ns_por_op_min']:>14.1f} {r['ruido']:>7.1%} "
+            f"{texto_cambio:>9} {texto_tolerancia:>9}",
+            file=sys.stderr,
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10**3, 10**4, 10**5])
+    parser.add_argument("--sesiones", nargs="+", choices=SESIONES, default=SESIONES)
+    parser.add_argument("--repeticiones", type=int, default=MIN_REPETICIONES)
+    parser.add_argument("--salida", help="archivo JSON de resultados (por defecto, stdout)")
+    parser.add_argument("--base", default=None, help=f"línea base (por defecto {BASE_POR_DEFECTO} si existe)")
+    parser.add_argument("--umbral", type=float, default=0.10, help="regresión tolerada mínima (0.10 = 10%%)")
+    parser.add_argument("--guardar-base", action="store_true", help="escribe los resultados como nueva base")
+    args = parser.parse_args()
+    if args.repeticiones < MIN_REPETICIONES:
+        parser.error(f"--repeticiones debe ser al menos {MIN_REPETICIONES} (el mínimo de pocas muestras es ruido).")
+
+    resultados: List[dict] = []
+    for sesion in args.sesiones:
+        resultados.extend(correr_sesion(sesion, args.tamanos, args.repeticiones))
+
+    informe = {
+        "entorno": {
+            "python": platform.python_version(),
+            "implementacion": platform.python_implementation(),
+            "sistema": platform.platform(),
+            "procesador": platform.processor() or platform.machine(),
+            "nucleos": os.cpu_count(),
+        },
+        "parametros": {"tamanos": args.tamanos, "repeticiones": args.repeticiones},
+        "resultados": resultados,
+    }
+
+    ruta_base: Optional[str] = args.base or (BASE_POR_DEFECTO if os.path.exists(BASE_POR_DEFECTO) else None)
+    regresiones: List[str] = []
+    if ruta_base and not args.guardar_base:
+        with open(ruta_base, encoding="utf-8") as f:
+            regresiones = comparar(resultados, json.load(f), args.umbral)
+        informe["base"] = {"ruta": ruta_base, "umbral": args.umbral, "regresiones": regresiones}
+
+    texto = json.dumps(informe, indent=2, ensure_ascii=False)
+    if args.guardar_base:
+        with open(args.base or BASE_POR_DEFECTO, "w", encoding="utf-8") as f:
+            f.write(texto + "\n")
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            f.write(texto + "\n")
+    elif not args.guardar_base:
+        print(texto)
+
+    _imprimir(resultados)
+    if regresiones:
+        print("\nRegresiones:", file=sys.stderr)
+        for mensaje in regresiones:
+            print(f"  {mensaje}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
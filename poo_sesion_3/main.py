@@ -1,17 +1,53 @@
 # main.py
+import argparse
+import os
+import sys
+
 from services.banco_service import BancoService
 from ui.consola import ConsolaBanco
 
 
 def main() -> None:
-    banco = BancoService()
+    # Opcional: python main.py libro.bin -> abre/guarda una instantánea
+    # Modo lote: python main.py [libro.bin] --lote comandos.txt (o - para stdin)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("ruta", nargs="?")
+    parser.add_argument("--lote", help="archivo con un comando por línea; - lee de stdin")
+    parser.add_argument("--solo-resumen", action="store_true")
+    parser.add_argument("--detener-en-error", action="store_true")
+    args = parser.parse_args()
+    ruta = args.ruta
 
-    # Semilla didáctica
-    banco.abrir_ahorros("Juliana", 100000, 0.01)                 # 1% mensual
-    banco.abrir_corriente("David", 20000, 50000, 5000)      # cupo 50k, cuota 5k
+    if ruta and os.path.exists(ruta):
+        banco = BancoService.desde_instantanea(ruta)
+    else:
+        banco = BancoService()
+        # Semilla didáctica
+        banco.abrir_ahorros("Juliana", 100000, 0.01)                 # 1% mensual
+        banco.abrir_corriente("David", 20000, 50000, 5000)      # cupo 50k, cuota 5k
 
     app = ConsolaBanco(banco)
-    app.ejecutar()
+    errores = 0
+    if args.lote is None:
+        app.ejecutar()
+    else:
+        comandos = sys.stdin if args.lote == "-" else open(args.lote, encoding="utf-8")
+        try:
+            resumen = app.ejecutar_lote(
+                comandos, solo_resumen=args.solo_resumen, detener_en_error=args.detener_en_error
+            )
+        finally:
+            if comandos is not sys.stdin:
+                comandos.close()
+        errores = resumen.errores
+
+    if ruta:
+        try:
+            banco.guardar_instantanea(ruta)  # archivo nuevo + os.replace: el mmap sigue en el anterior
+        finally:
+            banco.cerrar()
+    if errores:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
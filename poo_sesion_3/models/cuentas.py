@@ -1,6 +1,23 @@
 # models/cuentas.py
 from __future__ import annotations
 
+import threading
+from typing import Optional
+
+from models.dinero import a_centavos, a_unidades, formatear, interes_centavos
+from models.ids import AsignadorIds
+from models.resultados import CUENTA_CERRADA, CUPO_EXCEDIDO, FONDOS_INSUFICIENTES, MENSAJES, MONTO_INVALIDO, OK
+
+
+class ObservadorCuenta:
+    """
+    Interfaz para quien necesite enterarse de cambios en una cuenta
+    (por ejemplo, índices del servicio). Por defecto no hace nada.
+    """
+
+    def titular_cambiado(self, cuenta: "CuentaBase", anterior: str) -> None:
+        pass
+
 
 class CuentaBase:
     """
@@ -14,22 +31,69 @@ class CuentaBase:
     Nota pedagógica:
     - Esta clase define la "interfaz" de lo que una cuenta sabe hacer.
     - Las subclases sobrescriben lo que cambie (polimorfismo).
+    - __slots__ evita un __dict__ por instancia (menos memoria por cuenta);
+      cada subclase declara solo sus atributos nuevos.
+    - El dinero se guarda en centavos enteros (ver models/dinero.py); las
+      propiedades públicas lo devuelven en unidades.
     """
 
+    __slots__ = ("_id", "_observador", "_titular", "_saldo", "_activa")
+
     _next_id: int = 1
+    _candado_ids = threading.Lock()  # leer+incrementar _next_id de forma atómica
+    _asignador: Optional[AsignadorIds] = None  # None = contador _next_id del proceso
 
     def __init__(self, titular: str, saldo_inicial: float = 0.0) -> None:
-        self._id: int = CuentaBase._next_id
-        CuentaBase._next_id += 1
+        asignador = CuentaBase._asignador
+        if asignador is not None:
+            self._id: int = asignador.siguiente()
+        else:
+            with CuentaBase._candado_ids:
+                self._id = CuentaBase._next_id
+                CuentaBase._next_id += 1
+
+        self._observador: Optional[ObservadorCuenta] = None
 
         self._titular: str = ""
         self.titular = titular
 
-        self._saldo: float = 0.0
+        self._saldo: int = 0  # centavos
         self._set_saldo_inicial(saldo_inicial)
 
         self._activa: bool = True
 
+    # -------------------------
+    # Asignación de ids
+    # -------------------------
+    @staticmethod
+    def usar_asignador(asignador: Optional[AsignadorIds]) -> None:
+        """
+        Cambia cómo se numeran las cuentas nuevas (por ejemplo, un
+        AsignadorArrendado compartido entre procesos); None vuelve al contador
+        del proceso, que sigue después del mayor id entregado.
+        """
+        anterior = CuentaBase._asignador
+        if anterior is not None:
+            with CuentaBase._candado_ids:
+                CuentaBase._next_id = max(CuentaBase._next_id, anterior.proximo())
+        if asignador is not None:
+            asignador.asegurar_mayor_que(CuentaBase._next_id - 1)
+        CuentaBase._asignador = asignador
+
+    @staticmethod
+    def proximo_id() -> int:
+        """Ningún id entregado después de esta llamada será menor."""
+        asignador = CuentaBase._asignador
+        return asignador.proximo() if asignador is not None else CuentaBase._next_id
+
+    @staticmethod
+    def asegurar_id_mayor_que(cuenta_id: int) -> None:
+        """Tras cargar cuentas con ids propios (bitácora, instantánea): no repetirlos."""
+        with CuentaBase._candado_ids:
+            CuentaBase._next_id = max(CuentaBase._next_id, cuenta_id + 1)
+        if CuentaBase._asignador is not None:
+            CuentaBase._asignador.asegurar_mayor_que(cuenta_id)
+
     # -------------------------
     # Propiedades
     # -------------------------
@@ -48,11 +112,19 @@ class CuentaBase:
         value = str(value).strip()
         if not value:
             raise ValueError("El titular no puede estar vacío.")
+        anterior = self._titular
         self._titular = value
+        if self._observador is not None:
+            self._observador.titular_cambiado(self, anterior)
 
     @property
     def saldo(self) -> float:
         # Solo lectura: se modifica por consignar/retirar/corte mensual
+        return a_unidades(self._saldo)
+
+    @property
+    def saldo_centavos(self) -> int:
+        """Saldo exacto en centavos."""
         return self._saldo
 
     @property
@@ -77,12 +149,38 @@ class CuentaBase:
         monto = self._normalizar_monto(monto)
 
         if monto > self._saldo:
-            raise ValueError("Fondos insuficientes para realizar el retiro.")
+            raise ValueError(MENSAJES[FONDOS_INSUFICIENTES])
         self._saldo -= monto
 
+    def intentar_consignar(self, monto: float) -> int:
+        """Como consignar, sin lanzar: devuelve un código de models/resultados.py (OK si se aplicó)."""
+        if not self._activa:
+            return CUENTA_CERRADA
+        monto = self._monto_valido(monto)
+        if not monto:
+            return MONTO_INVALIDO
+        self._saldo += monto
+        return OK
+
+    def intentar_retirar(self, monto: float) -> int:
+        """Como retirar, sin lanzar (mismas reglas y en el mismo orden)."""
+        if not self._activa:
+            return CUENTA_CERRADA
+        monto = self._monto_valido(monto)
+        if not monto:
+            return MONTO_INVALIDO
+        if monto > self._saldo:
+            return FONDOS_INSUFICIENTES
+        self._saldo -= monto
+        return OK
+
     def cerrar(self) -> None:
         self._activa = False
 
+    def asignar_observador(self, observador: Optional[ObservadorCuenta]) -> None:
+        """Registra (o quita, con None) quien recibe avisos de cambios."""
+        self._observador = observador
+
     def aplicar_corte_mensual(self) -> None:
         """
         Polimorfismo:
@@ -95,20 +193,51 @@ class CuentaBase:
     # Internos
     # -------------------------
     def _set_saldo_inicial(self, saldo_inicial: float) -> None:
-        saldo_inicial = float(saldo_inicial)
+        saldo_inicial = a_centavos(saldo_inicial)
         if saldo_inicial < 0:
             raise ValueError("El saldo inicial no puede ser negativo.")
         self._saldo = saldo_inicial
 
-    def _normalizar_monto(self, monto: float) -> float:
-        monto = float(monto)
+    def _restaurar_saldo(self, saldo_centavos: int) -> None:
+        """Uso interno del servicio: fija un saldo ya validado (rollback de lotes y transferencias)."""
+        self._saldo = saldo_centavos
+
+    @classmethod
+    def _desde_estado(cls, cuenta_id: int, titular: str, saldo: int, activa: bool, **atributos):
+        """
+        Reconstruye una cuenta ya validada (p. ej. desde una instantánea)
+        sin pasar por __init__: no consume ids ni repite validaciones.
+        atributos son los propios de la subclase (tasa_interes=..., etc.),
+        con el mismo valor interno: saldo, cupo y cuota en centavos.
+        """
+        cuenta = cls.__new__(cls)
+        cuenta._id = cuenta_id
+        cuenta._observador = None
+        cuenta._titular = titular
+        cuenta._saldo = saldo
+        cuenta._activa = activa
+        for nombre, valor in atributos.items():
+            setattr(cuenta, f"_{nombre}", valor)
+        return cuenta
+
+    def _normalizar_monto(self, monto: float) -> int:
+        """Monto en unidades -> centavos (> 0)."""
+        monto = a_centavos(monto)
         if monto <= 0:
-            raise ValueError("El monto debe ser mayor que 0.")
+            raise ValueError(MENSAJES[MONTO_INVALIDO])
         return monto
 
+    def _monto_valido(self, monto: float) -> int:
+        """Como _normalizar_monto, pero devuelve 0 si el monto no es válido."""
+        try:
+            monto = a_centavos(monto)
+        except (TypeError, ValueError):
+            return 0
+        return monto if monto > 0 else 0
+
     def _asegurar_activa(self) -> None:
         if not self._activa:
-            raise ValueError("No se puede operar sobre una cuenta cerrada.")
+            raise ValueError(MENSAJES[CUENTA_CERRADA])
 
     def tipo(self) -> str:
         """Nombre amigable del tipo de cuenta."""
@@ -118,7 +247,7 @@ class CuentaBase:
         estado = "activa" if self._activa else "cerrada"
         return (
             f"{self.tipo()}(id={self._id}, titular='{self._titular}', "
-            f"saldo={self._saldo:.2f}, estado={estado})"
+            f"saldo={formatear(self._saldo)}, estado={estado})"
         )
 
 class CuentaAhorros(CuentaBase):
@@ -128,6 +257,8 @@ class CuentaAhorros(CuentaBase):
     - Gana intereses en el corte mensual
     """
 
+    __slots__ = ("_tasa_interes",)
+
     def __init__(self, titular: str, saldo_inicial: float = 0.0, tasa_interes: float = 0.01) -> None:
         # super() reusa inicialización base
         super().__init__(titular=titular, saldo_inicial=saldo_inicial)
@@ -141,11 +272,12 @@ class CuentaAhorros(CuentaBase):
 
     def aplicar_corte_mensual(self) -> None:
         """
-        Interés simple: saldo += saldo * tasa
+        Interés simple: saldo += saldo * tasa, redondeado al centavo
+        (mitad al par, ver models/dinero.py).
         Nota: en sistemas reales hay más reglas, aquí es didáctico.
         """
         super().aplicar_corte_mensual()  # valida cuenta activa
-        interes = self._saldo * self._tasa_interes
+        interes = interes_centavos(self._saldo, self._tasa_interes)
         if interes > 0:
             self._saldo += interes
 
@@ -157,23 +289,33 @@ class CuentaCorriente(CuentaBase):
     - Puede cobrar cuota de manejo en el corte mensual
     """
 
+    __slots__ = ("_cupo_sobregiro", "_cuota_manejo")
+
     def __init__(self, titular: str, saldo_inicial: float = 0.0, cupo_sobregiro: float = 0.0, cuota_manejo: float = 0.0) -> None:
         super().__init__(titular=titular, saldo_inicial=saldo_inicial)
 
-        self._cupo_sobregiro: float = float(cupo_sobregiro)
+        self._cupo_sobregiro: int = a_centavos(cupo_sobregiro)
         if self._cupo_sobregiro < 0:
             raise ValueError("El cupo de sobregiro no puede ser negativo.")
 
-        self._cuota_manejo: float = float(cuota_manejo)
+        self._cuota_manejo: int = a_centavos(cuota_manejo)
         if self._cuota_manejo < 0:
             raise ValueError("La cuota de manejo no puede ser negativa.")
 
     @property
     def cupo_sobregiro(self) -> float:
+        return a_unidades(self._cupo_sobregiro)
+
+    @property
+    def cupo_sobregiro_centavos(self) -> int:
         return self._cupo_sobregiro
 
     @property
     def cuota_manejo(self) -> float:
+        return a_unidades(self._cuota_manejo)
+
+    @property
+    def cuota_manejo_centavos(self) -> int:
         return self._cuota_manejo
 
     def retirar(self, monto: float) -> None:
@@ -187,10 +329,22 @@ class CuentaCorriente(CuentaBase):
 
         nuevo_saldo = self._saldo - monto
         if nuevo_saldo < -self._cupo_sobregiro:
-            raise ValueError("Excede el cupo de sobregiro permitido.")
+            raise ValueError(MENSAJES[CUPO_EXCEDIDO])
 
         self._saldo = nuevo_saldo
 
+    def intentar_retirar(self, monto: float) -> int:
+        if not self._activa:
+            return CUENTA_CERRADA
+        monto = self._monto_valido(monto)
+        if not monto:
+            return MONTO_INVALIDO
+        nuevo_saldo = self._saldo - monto
+        if nuevo_saldo < -self._cupo_sobregiro:
+            return CUPO_EXCEDIDO
+        self._saldo = nuevo_saldo
+        return OK
+
     def aplicar_corte_mensual(self) -> None:
         """
         Cobra cuota de manejo si está activa.
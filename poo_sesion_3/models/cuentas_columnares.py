@@ -0,0 +1,91 @@
+# models/cuentas_columnares.py
+from __future__ import annotations
+
+from models.cuentas import CuentaAhorros, CuentaCorriente
+
+
+def _columna(nombre: str, convertir) -> property:
+    """Propiedad que lee/escribe la columna `nombre` en la fila de la cuenta."""
+
+    def leer(self):
+        return convertir(getattr(self._almacen, nombre)[self._fila])
+
+    def escribir(self, valor) -> None:
+        getattr(self._almacen, nombre)[self._fila] = valor
+
+    return property(leer, escribir)
+
+
+class _VistaFila:
+    """
+    Mixin: los atributos de estado de la cuenta pasan a vivir en una fila
+    del almacén columnar (services/almacen_columnar.py).
+
+    La lógica de negocio (validaciones, retirar, corte) sigue siendo la de
+    CuentaAhorros/CuentaCorriente; solo cambia dónde se guarda el dato.
+    """
+
+    # Vacío: las clases concretas declaran _almacen/_fila (dos bases con
+    # __slots__ no vacíos no se pueden combinar)
+    __slots__ = ()
+
+    _TIPO_FILA: int = 0
+
+    def __init__(self, almacen, *args, **kwargs) -> None:
+        # La fila debe existir antes de que el padre asigne _saldo/_activa
+        self._almacen = almacen
+        self._fila: int = almacen.nueva_fila(self._TIPO_FILA)
+        try:
+            super().__init__(*args, **kwargs)
+        except ValueError:
+            almacen.liberar(self._fila)
+            raise
+        almacen.cuenta_id[self._fila] = self._id
+
+    @property
+    def fila(self) -> int:
+        return self._fila
+
+    _saldo = _columna("saldo", int)  # centavos
+    _activa = _columna("activa", bool)
+
+
+class CuentaAhorrosColumnar(_VistaFila, CuentaAhorros):
+    __slots__ = ("_almacen", "_fila")
+    _TIPO_FILA = 1  # AlmacenColumnar.AHORROS
+
+    _tasa_interes = _columna("tasa_interes", float)
+
+    def __init__(self, almacen, titular: str, saldo_inicial: float = 0.0, tasa_interes: float = 0.01) -> None:
+        super().__init__(almacen, titular=titular, saldo_inicial=saldo_inicial, tasa_interes=tasa_interes)
+
+    def tipo(self) -> str:
+        # Se reporta el tipo de negocio, no el de la vista
+        return CuentaAhorros.__name__
+
+
+class CuentaCorrienteColumnar(_VistaFila, CuentaCorriente):
+    __slots__ = ("_almacen", "_fila")
+    _TIPO_FILA = 2  # AlmacenColumnar.CORRIENTE
+
+    _cupo_sobregiro = _columna("cupo_sobregiro", int)
+    _cuota_manejo = _columna("cuota_manejo", int)
+
+    def __init__(
+        self,
+        almacen,
+        titular: str,
+        saldo_inicial: float = 0.0,
+        cupo_sobregiro: float = 0.0,
+        cuota_manejo: float = 0.0,
+    ) -> None:
+        super().__init__(
+            almacen,
+            titular=titular,
+            saldo_inicial=saldo_inicial,
+            cupo_sobregiro=cupo_sobregiro,
+            cuota_manejo=cuota_manejo,
+        )
+
+    def tipo(self) -> str:
+        return CuentaCorriente.__name__
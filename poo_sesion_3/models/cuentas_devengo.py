@@ -0,0 +1,160 @@
+# models/cuentas_devengo.py
+from __future__ import annotations
+
+import threading
+
+from models.cuentas import CuentaAhorros, CuentaCorriente
+from models.dinero import a_unidades, interes_centavos
+
+
+class RelojPeriodos:
+    """
+    Contador global de cortes mensuales para el devengo perezoso.
+    avanzar() es todo lo que hace un corte: O(1) sin importar cuántas
+    cuentas haya.
+    """
+
+    def __init__(self) -> None:
+        self.periodo: int = 0
+        # Una cuenta se pone al día una sola vez aunque varios hilos la lean
+        self.candado = threading.Lock()
+
+    def avanzar(self) -> None:
+        self.periodo += 1
+
+
+class _DevengoPerezoso:
+    """
+    Mixin: la cuenta recuerda hasta qué periodo está al día y aplica los
+    cortes pendientes la primera vez que se lee su saldo o se opera sobre
+    ella (consignar, retirar, sus intentar_*, cerrar).
+
+    El resultado es el mismo que aplicar cada corte en su momento, cuenta
+    por cuenta y sin detenerse ante errores (como el corte con reporte): una
+    cuenta cerrada no cambia desde que se cierra, y una cuota que excede
+    el cupo se salta ese periodo.
+
+    Lo O(1) es el corte (RelojPeriodos.avanzar). Ponerse al día con k
+    periodos pendientes cuesta lo que diga _aplicar_periodos: O(1) en la
+    corriente y O(k) en la de ahorros.
+    """
+
+    # Vacío: las clases concretas declaran _reloj/_periodo (ver _VistaFila)
+    __slots__ = ()
+
+    def __init__(self, reloj: RelojPeriodos, *args, **kwargs) -> None:
+        self._reloj = reloj
+        self._periodo: int = reloj.periodo
+        super().__init__(*args, **kwargs)
+
+    @property
+    def saldo(self) -> float:
+        self._ponerse_al_dia()
+        return a_unidades(self._saldo)
+
+    @property
+    def saldo_centavos(self) -> int:
+        self._ponerse_al_dia()
+        return self._saldo
+
+    def consignar(self, monto: float) -> None:
+        self._ponerse_al_dia()
+        super().consignar(monto)
+
+    def retirar(self, monto: float) -> None:
+        self._ponerse_al_dia()
+        super().retirar(monto)
+
+    def intentar_consignar(self, monto: float) -> int:
+        self._ponerse_al_dia()
+        return super().intentar_consignar(monto)
+
+    def intentar_retirar(self, monto: float) -> int:
+        self._ponerse_al_dia()
+        return super().intentar_retirar(monto)
+
+    def cerrar(self) -> None:
+        # Los periodos anteriores al cierre sí se aplican
+        self._ponerse_al_dia()
+        super().cerrar()
+
+    def aplicar_corte_mensual(self) -> None:
+        self._ponerse_al_dia()
+        super().aplicar_corte_mensual()
+
+    def __str__(self) -> str:
+        self._ponerse_al_dia()
+        return super().__str__()
+
+    def _ponerse_al_dia(self) -> None:
+        reloj = self._reloj
+        if self._periodo == reloj.periodo:
+            return
+        with reloj.candado:
+            periodo = reloj.periodo
+            pendientes = periodo - self._periodo
+            if pendientes > 0 and self._activa:
+                self._aplicar_periodos(pendientes)
+            # Después del saldo: quien vea el periodo al día ve también el saldo
+            self._periodo = periodo
+
+    def _aplicar_periodos(self, pendientes: int) -> None:
+        raise NotImplementedError
+
+
+class CuentaAhorrosDevengo(_DevengoPerezoso, CuentaAhorros):
+    __slots__ = ("_reloj", "_periodo")
+
+    def __init__(self, reloj: RelojPeriodos, titular: str, saldo_inicial: float = 0.0, tasa_interes: float = 0.01) -> None:
+        super().__init__(reloj, titular=titular, saldo_inicial=saldo_inicial, tasa_interes=tasa_interes)
+
+    def tipo(self) -> str:
+        return CuentaAhorros.__name__
+
+    def _aplicar_periodos(self, pendientes: int) -> None:
+        """
+        O(k) para k periodos pendientes, a propósito: el interés se redondea
+        al centavo en cada corte, así que saldo * (1 + tasa) ** k no daría
+        los mismos centavos que k cortes uno por uno. Se corta antes si el
+        interés llega a 0 (saldo no positivo o demasiado pequeño).
+        """
+        saldo = self._saldo
+        tasa = self._tasa_interes
+        for _ in range(pendientes):
+            interes = interes_centavos(saldo, tasa)
+            if interes <= 0:
+                break  # el saldo no cambia: los periodos siguientes tampoco
+            saldo += interes
+        self._saldo = saldo
+
+
+class CuentaCorrienteDevengo(_DevengoPerezoso, CuentaCorriente):
+    __slots__ = ("_reloj", "_periodo")
+
+    def __init__(
+        self,
+        reloj: RelojPeriodos,
+        titular: str,
+        saldo_inicial: float = 0.0,
+        cupo_sobregiro: float = 0.0,
+        cuota_manejo: float = 0.0,
+    ) -> None:
+        super().__init__(
+            reloj,
+            titular=titular,
+            saldo_inicial=saldo_inicial,
+            cupo_sobregiro=cupo_sobregiro,
+            cuota_manejo=cuota_manejo,
+        )
+
+    def tipo(self) -> str:
+        return CuentaCorriente.__name__
+
+    def _aplicar_periodos(self, pendientes: int) -> None:
+        # Forma cerrada: se cobran cuotas mientras el saldo no baje de
+        # -cupo; la primera que no cabe tampoco cabrá en los siguientes.
+        cuota = self._cuota_manejo
+        if cuota <= 0:
+            return
+        caben = (self._saldo + self._cupo_sobregiro) // cuota
+        self._saldo -= min(pendientes, max(caben, 0)) * cuota
@@ -0,0 +1,43 @@
+# models/dinero.py
+"""
+Dinero como entero de centavos (unidades menores).
+
+Los saldos, montos, cupos y cuotas se guardan en centavos (int): sumar y
+restar es exacto, así millones de movimientos no acumulan error. La API
+pública sigue recibiendo y mostrando unidades (float), y solo se redondea
+en dos puntos, con reglas explícitas:
+- Entrada de un monto: al centavo más cercano, mitad al par (round()).
+- Interés: saldo_centavos * tasa, al centavo más cercano, mitad al par.
+  Es la misma regla que np.rint, así el corte vectorizado da lo mismo.
+"""
+from __future__ import annotations
+
+CENTAVOS_POR_UNIDAD = 100
+
+
+def a_centavos(monto) -> int:
+    """Monto en unidades (int, float, str numérico) -> centavos."""
+    if type(monto) is int:
+        return monto * CENTAVOS_POR_UNIDAD
+    valor = float(monto)
+    try:
+        return round(valor * CENTAVOS_POR_UNIDAD)
+    except (OverflowError, ValueError):  # inf / nan
+        raise ValueError("El monto debe ser un número finito.") from None
+
+
+def a_unidades(centavos: int) -> float:
+    """Centavos -> unidades, para mostrar o para la API en float."""
+    return centavos / CENTAVOS_POR_UNIDAD
+
+
+def interes_centavos(saldo_centavos: int, tasa: float) -> int:
+    """Interés del periodo en centavos (al centavo más cercano, mitad al par)."""
+    return round(saldo_centavos * tasa)
+
+
+def formatear(centavos: int) -> str:
+    """Texto exacto con dos decimales (sin pasar por float)."""
+    signo = "-" if centavos < 0 else ""
+    enteros, resto = divmod(abs(centavos), CENTAVOS_POR_UNIDAD)
+    return f"{signo}{enteros}.{resto:02d}"
@@ -0,0 +1,149 @@
+# models/ids.py
+from __future__ import annotations
+
+import sqlite3
+import threading
+from typing import Optional, Tuple
+
+
+class AsignadorIds:
+    """
+    Interfaz de un asignador de ids de cuentas (ver CuentaBase.usar_asignador).
+    Sin asignador, las cuentas usan el contador de clase del proceso.
+    """
+
+    def siguiente(self) -> int:
+        raise NotImplementedError
+
+    def proximo(self) -> int:
+        """Cota inferior de los ids que este asignador entregará de aquí en adelante."""
+        raise NotImplementedError
+
+    def asegurar_mayor_que(self, cuenta_id: int) -> None:
+        """Los ids que se entreguen después serán mayores que cuenta_id."""
+        raise NotImplementedError
+
+    def cerrar(self) -> None:
+        pass
+
+
+class AsignadorArrendado(AsignadorIds):
+    """
+    Asignador para varios procesos: arrienda bloques contiguos de `bloque`
+    ids a un coordinador local (archivo SQLite compartido) y los entrega
+    sin más coordinación hasta agotar el bloque. Así abrir cuentas en
+    paralelo no pasa por un candado global en cada id.
+
+    - Únicos: el contador del archivo se lee y avanza en una transacción
+      BEGIN IMMEDIATE (un proceso a la vez).
+    - Densos: cerrar() devuelve lo no usado del bloque; si nadie arrendó
+      después, el contador retrocede, y si no, el rango queda en una tabla
+      de libres que se arrienda antes que ids nuevos. Un proceso que muere
+      sin cerrar deja sin usar el resto de su bloque.
+    - Crecientes dentro del proceso: un bloque nuevo siempre empieza
+      después del anterior (BancoService depende de eso).
+    """
+
+    def __init__(self, ruta: str, bloque: int = 1000) -> None:
+        if bloque < 1:
+            raise ValueError("El bloque debe tener al menos un id.")
+        self._bloque = bloque
+        self._candado = threading.Lock()
+        self._siguiente = 1
+        self._fin = 1  # bloque vacío: se arrienda al primer uso
+        self._conexion: Optional[sqlite3.Connection] = sqlite3.connect(
+            ruta, timeout=60, isolation_level=None, check_same_thread=False
+        )
+        with self._transaccion() as cursor:
+            cursor.execute("CREATE TABLE IF NOT EXISTS contador (siguiente INTEGER NOT NULL)")
+            cursor.execute("CREATE TABLE IF NOT EXISTS libres (inicio INTEGER PRIMARY KEY, fin INTEGER NOT NULL)")
+            if cursor.execute("SELECT COUNT(*) FROM contador").fetchone()[0] == 0:
+                cursor.execute("INSERT INTO contador VALUES (1)")
+
+    def siguiente(self) -> int:
+        with self._candado:
+            if self._siguiente >= self._fin:
+                self._siguiente, self._fin = self._arrendar(self._siguiente)
+            cuenta_id = self._siguiente
+            self._siguiente += 1
+            return cuenta_id
+
+    def proximo(self) -> int:
+        return self._siguiente
+
+    def asegurar_mayor_que(self, cuenta_id: int) -> None:
+        with self._candado:
+            if self._siguiente > cuenta_id:
+                return
+            self._devolver()
+            self._siguiente = self._fin = cuenta_id + 1
+
+    def cerrar(self) -> None:
+        with self._candado:
+            if self._conexion is None:
+                return
+            self._devolver()
+            self._conexion.close()
+            self._conexion = None
+
+    def __enter__(self) -> "AsignadorArrendado":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
+
+    # -------------------------
+    # Internos (con self._candado tomado)
+    # -------------------------
+    def _transaccion(self):
+        return _Transaccion(self._conexion)
+
+    def _arrendar(self, minimo: int) -> Tuple[int, int]:
+        """Rango [inicio, fin) con inicio >= minimo: primero de los libres, si no del contador."""
+        if self._conexion is None:
+            raise ValueError("El asignador de ids está cerrado.")
+        with self._transaccion() as cursor:
+            libre = cursor.execute(
+                "SELECT inicio, fin FROM libres WHERE fin > ? ORDER BY inicio LIMIT 1", (minimo,)
+            ).fetchone()
+            if libre is not None:
+                inicio, fin = libre
+                cursor.execute("DELETE FROM libres WHERE inicio = ?", (inicio,))
+                if inicio < minimo:  # la parte anterior sigue libre para otros
+                    cursor.execute("INSERT INTO libres VALUES (?, ?)", (inicio, minimo))
+                    inicio = minimo
+                if fin - inicio > self._bloque:
+                    cursor.execute("INSERT INTO libres VALUES (?, ?)", (inicio + self._bloque, fin))
+                    fin = inicio + self._bloque
+                return inicio, fin
+            contador = cursor.execute("SELECT siguiente FROM contador").fetchone()[0]
+            inicio = max(contador, minimo)
+            cursor.execute("UPDATE contador SET siguiente = ?", (inicio + self._bloque,))
+            return inicio, inicio + self._bloque
+
+    def _devolver(self) -> None:
+        """Devuelve lo no usado del bloque actual."""
+        if self._siguiente >= self._fin or self._conexion is None:
+            return
+        with self._transaccion() as cursor:
+            contador = cursor.execute("SELECT siguiente FROM contador").fetchone()[0]
+            if contador == self._fin:
+                cursor.execute("UPDATE contador SET siguiente = ?", (self._siguiente,))
+            else:
+                cursor.execute("INSERT INTO libres VALUES (?, ?)", (self._siguiente, self._fin))
+        self._fin = self._siguiente
+
+
+class _Transaccion:
+    """BEGIN IMMEDIATE ... COMMIT (o ROLLBACK si hubo excepción)."""
+
+    def __init__(self, conexion: sqlite3.Connection) -> None:
+        self._conexion = conexion
+
+    def __enter__(self) -> sqlite3.Cursor:
+        self._cursor = self._conexion.cursor()
+        self._cursor.execute("BEGIN IMMEDIATE")
+        return self._cursor
+
+    def __exit__(self, tipo, *exc) -> None:
+        self._conexion.execute("ROLLBACK" if tipo is not None else "COMMIT")
@@ -0,0 +1,37 @@
+# models/resultados.py
+"""
+Códigos de resultado de los métodos intentar_* (cuentas y BancoService).
+
+Aplican las mismas reglas que consignar/retirar, pero un rechazo se
+devuelve como un entero en lugar de lanzar ValueError: en tráfico con
+muchos rechazos (sondeos, verificaciones de autorización) crear y
+propagar la excepción es lo más caro. OK vale 0, así `if resultado:`
+significa "rechazado".
+"""
+from __future__ import annotations
+
+OK = 0
+FONDOS_INSUFICIENTES = 1
+CUPO_EXCEDIDO = 2
+CUENTA_CERRADA = 3
+MONTO_INVALIDO = 4
+CUENTA_INEXISTENTE = 5
+
+NOMBRES = {
+    OK: "ok",
+    FONDOS_INSUFICIENTES: "fondos_insuficientes",
+    CUPO_EXCEDIDO: "cupo_excedido",
+    CUENTA_CERRADA: "cuenta_cerrada",
+    MONTO_INVALIDO: "monto_invalido",
+    CUENTA_INEXISTENTE: "cuenta_inexistente",
+}
+
+# Mismo texto que el ValueError del método que lanza (el de cuenta inexistente, sin el id)
+MENSAJES = {
+    OK: "Operación aplicada.",
+    FONDOS_INSUFICIENTES: "Fondos insuficientes para realizar el retiro.",
+    CUPO_EXCEDIDO: "Excede el cupo de sobregiro permitido.",
+    CUENTA_CERRADA: "No se puede operar sobre una cuenta cerrada.",
+    MONTO_INVALIDO: "El monto debe ser mayor que 0.",
+    CUENTA_INEXISTENTE: "No existe una cuenta con ese id.",
+}
@@ -0,0 +1,138 @@
+# services/agregados.py
+from __future__ import annotations
+
+from typing import Dict, Iterable
+
+from models.cuentas import CuentaBase
+from models.dinero import a_unidades
+
+
+class ResumenCartera:
+    """
+    Totales de la cartera, en centavos:
+    - depositos: suma de saldos positivos
+    - sobregiro: sobregiro usado (suma de -saldo de las cuentas en negativo)
+    - activas / cerradas
+    - saldo y cantidad de cuentas por tipo() ("CuentaAhorros", ...)
+
+    BancoService(agregados=True) mantiene uno al día con cada cambio
+    (agregar, quitar, saldo_cambiado, cerrada); desde_cuentas lo calcula
+    desde cero recorriendo las cuentas.
+    """
+
+    def __init__(self) -> None:
+        self.depositos_centavos: int = 0
+        self.sobregiro_centavos: int = 0
+        self.activas: int = 0
+        self.cerradas: int = 0
+        self.saldo_por_tipo_centavos: Dict[str, int] = {}
+        self.cuentas_por_tipo: Dict[str, int] = {}
+        # clase -> tipo() (las vistas columnares reportan el tipo de negocio)
+        self._tipos: Dict[type, str] = {}
+
+    @classmethod
+    def desde_cuentas(cls, cuentas: Iterable[CuentaBase]) -> "ResumenCartera":
+        resumen = cls()
+        for cuenta in cuentas:
+            resumen.agregar(cuenta)
+        return resumen
+
+    # -------------------------
+    # Consultas
+    # -------------------------
+    @property
+    def cuentas(self) -> int:
+        return self.activas + self.cerradas
+
+    @property
+    def depositos(self) -> float:
+        return a_unidades(self.depositos_centavos)
+
+    @property
+    def sobregiro_usado(self) -> float:
+        return a_unidades(self.sobregiro_centavos)
+
+    @property
+    def saldo_total(self) -> float:
+        return a_unidades(self.depositos_centavos - self.sobregiro_centavos)
+
+    def saldo_por_tipo(self) -> Dict[str, float]:
+        return {tipo: a_unidades(saldo) for tipo, saldo in self.saldo_por_tipo_centavos.items()}
+
+    def copia(self) -> "ResumenCartera":
+        otro = ResumenCartera()
+        otro.depositos_centavos = self.depositos_centavos
+        otro.sobregiro_centavos = self.sobregiro_centavos
+        otro.activas = self.activas
+        otro.cerradas = self.cerradas
+        otro.saldo_por_tipo_centavos = dict(self.saldo_por_tipo_centavos)
+        otro.cuentas_por_tipo = dict(self.cuentas_por_tipo)
+        return otro
+
+    # -------------------------
+    # Mantenimiento incremental
+    # -------------------------
+    def agregar(self, cuenta: CuentaBase) -> None:
+        self._contar(cuenta, 1)
+
+    def quitar(self, cuenta: CuentaBase) -> None:
+        self._contar(cuenta, -1)
+
+    def saldo_cambiado(self, cuenta: CuentaBase, anterior: int) -> None:
+        """`anterior` es el saldo en centavos antes del cambio."""
+        nuevo = cuenta.saldo_centavos
+        if nuevo == anterior:
+            return
+        tipo = self._tipos.get(cuenta.__class__) or self._tipo_de(cuenta)
+        self.saldo_por_tipo_centavos[tipo] += nuevo - anterior
+        if anterior >= 0 and nuevo >= 0:  # caso común: sin sobregiro antes ni después
+            self.depositos_centavos += nuevo - anterior
+        else:
+            self.depositos_centavos += max(nuevo, 0) - max(anterior, 0)
+            self.sobregiro_centavos += max(-nuevo, 0) - max(-anterior, 0)
+
+    def cerrada(self) -> None:
+        """Una cuenta activa pasó a cerrada."""
+        self.activas -= 1
+        self.cerradas += 1
+
+    # -------------------------
+    # Comparación (verificación)
+    # -------------------------
+    def _campos(self) -> tuple:
+        por_tipo = {tipo: saldo for tipo, saldo in self.saldo_por_tipo_centavos.items() if self.cuentas_por_tipo[tipo]}
+        cuentas = {tipo: n for tipo, n in self.cuentas_por_tipo.items() if n}
+        return (self.depositos_centavos, self.sobregiro_centavos, self.activas, self.cerradas, por_tipo, cuentas)
+
+    def __eq__(self, otro: object) -> bool:
+        if not isinstance(otro, ResumenCartera):
+            return NotImplemented
+        return self._campos() == otro._campos()
+
+    def __str__(self) -> str:
+        return (
+            f"ResumenCartera(cuentas={self.cuentas}, activas={self.activas}, cerradas={self.cerradas}, "
+            f"depositos={self.depositos:.2f}, sobregiro_usado={self.sobregiro_usado:.2f}, "
+            f"saldo_total={self.saldo_total:.2f})"
+        )
+
+    # -------------------------
+    # Internos
+    # -------------------------
+    def _tipo_de(self, cuenta: CuentaBase) -> str:
+        tipo = self._tipos[cuenta.__class__] = cuenta.tipo()
+        return tipo
+
+    def _contar(self, cuenta: CuentaBase, signo: int) -> None:
+        saldo = cuenta.saldo_centavos
+        tipo = self._tipos.get(cuenta.__class__) or self._tipo_de(cuenta)
+        self.saldo_por_tipo_centavos[tipo] = self.saldo_por_tipo_centavos.get(tipo, 0) + signo * saldo
+        self.cuentas_por_tipo[tipo] = self.cuentas_por_tipo.get(tipo, 0) + signo
+        if saldo > 0:
+            self.depositos_centavos += signo * saldo
+        else:
+            self.sobregiro_centavos -= signo * saldo
+        if cuenta.activa:
+            self.activas += signo
+        else:
+            self.cerradas += signo
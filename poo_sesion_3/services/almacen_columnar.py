@@ -0,0 +1,195 @@
+# services/almacen_columnar.py
+"""
+Backend columnar (opcional) para BancoService.
+
+Requiere numpy. Se activa con BancoService(columnar=True).
+"""
+from __future__ import annotations
+
+from typing import List, Tuple
+
+from models.resultados import CUENTA_CERRADA, MENSAJES
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depende del entorno
+    raise ImportError("El backend columnar requiere numpy (pip install numpy).") from e
+
+
+class AlmacenColumnar:
+    """
+    Guarda el estado de las cuentas en arreglos paralelos (una fila por cuenta):
+    saldo, tasa_interes, cupo_sobregiro, cuota_manejo, activa, tipo y
+    cuenta_id (para reportar por cuenta sin pasar por los objetos).
+    Saldo, cupo y cuota son int64 en centavos, como en models/dinero.py.
+
+    - Las filas se asignan en orden de apertura y nunca se reutilizan:
+      una cuenta eliminada solo se marca como LIBRE.
+    - Los objetos cuenta (ver models/cuentas_columnares.py) son vistas que
+      leen/escriben su fila, así la API pública no cambia.
+    - aplicar_corte_mensual hace el corte con operaciones vectoriales.
+    """
+
+    LIBRE = 0
+    AHORROS = 1
+    CORRIENTE = 2
+
+    CAPACIDAD_INICIAL = 1024
+
+    CUOTA_EXCEDE_CUPO = "La cuota de manejo excede el cupo de sobregiro."
+
+    def __init__(self) -> None:
+        self._n = 0
+        cap = self.CAPACIDAD_INICIAL
+        self.saldo = np.zeros(cap, dtype=np.int64)
+        self.tasa_interes = np.zeros(cap, dtype=np.float64)
+        self.cupo_sobregiro = np.zeros(cap, dtype=np.int64)
+        self.cuota_manejo = np.zeros(cap, dtype=np.int64)
+        self.activa = np.zeros(cap, dtype=np.bool_)
+        self.tipo = np.zeros(cap, dtype=np.int8)
+        self.cuenta_id = np.zeros(cap, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self._n
+
+    # -------------------------
+    # Filas
+    # -------------------------
+    def nueva_fila(self, tipo: int) -> int:
+        if self._n == len(self.saldo):
+            self._crecer()
+        fila = self._n
+        self._n += 1
+        self.tipo[fila] = tipo
+        self.activa[fila] = True
+        return fila
+
+    def liberar(self, fila: int) -> None:
+        """La fila deja de participar en el corte (no se reutiliza)."""
+        self.tipo[fila] = self.LIBRE
+
+    # -------------------------
+    # Corte mensual vectorizado
+    # -------------------------
+    def aplicar_corte_mensual(self) -> None:
+        """
+        Equivale a llamar aplicar_corte_mensual() fila por fila en orden:
+        - Ahorros: saldo += saldo * tasa redondeado al centavo (np.rint,
+          mitad al par como interes_centavos), si el interés es > 0
+        - Corriente: saldo -= cuota, salvo que quede por debajo de -cupo
+        Igual que el recorrido polimórfico, se detiene en la primera cuenta
+        que falla (cerrada o cuota que excede el cupo): las filas anteriores
+        quedan aplicadas y se lanza el mismo ValueError.
+        """
+        n = self._n
+        saldo = self.saldo[:n]
+        tasa = self.tasa_interes[:n]
+        cupo = self.cupo_sobregiro[:n]
+        cuota = self.cuota_manejo[:n]
+        tipo = self.tipo[:n]
+
+        es_ahorros = tipo == self.AHORROS
+        es_corriente = tipo == self.CORRIENTE
+        cerrada = (tipo != self.LIBRE) & ~self.activa[:n]
+
+        cobra = es_corriente & (cuota > 0)
+        con_cuota = saldo - cuota
+        excede = cobra & (con_cuota < -cupo)
+
+        fallas = np.flatnonzero(cerrada | excede)
+        limite = int(fallas[0]) if fallas.size else n
+
+        interes = np.rint(saldo[:limite] * tasa[:limite]).astype(np.int64)
+        abona = es_ahorros[:limite] & (interes > 0)
+        np.add(saldo[:limite], interes, out=saldo[:limite], where=abona)
+        np.copyto(saldo[:limite], con_cuota[:limite], where=cobra[:limite])
+
+        if fallas.size:
+            if cerrada[limite]:
+                raise ValueError(MENSAJES[CUENTA_CERRADA])
+            raise ValueError(self.CUOTA_EXCEDE_CUPO)
+
+    def aplicar_corte_con_reporte(self, procesos: int = 1) -> Tuple[int, int, int, List[Tuple[int, str]]]:
+        """
+        El mismo corte, pero sin detenerse: las filas que fallan quedan
+        igual. Devuelve (aplicadas, interés, cuotas, rechazos) con los
+        montos en centavos y rechazos = [(cuenta_id, motivo)] en orden de
+        fila; igual que services/corte_mensual.corte_con_reporte.
+
+        procesos > 1 reparte las filas en tramos entre procesos (ver
+        services/corte_paralelo.py); el resultado es el mismo.
+        """
+        if procesos < 1:
+            raise ValueError("Se necesita al menos un proceso.")
+        n = self._n
+        if procesos > 1:
+            from services.corte_paralelo import corte_por_tramos  # evita el import circular
+
+            aplicadas, interes_total, cuotas_total, filas, cerradas = corte_por_tramos(self, procesos)
+        else:
+            aplicadas, interes_total, cuotas_total, filas, cerradas = corte_columnas(
+                self.saldo[:n],
+                self.tasa_interes[:n],
+                self.cupo_sobregiro[:n],
+                self.cuota_manejo[:n],
+                self.tipo[:n],
+                self.activa[:n],
+            )
+        rechazos = [
+            (int(cuenta_id), MENSAJES[CUENTA_CERRADA] if cerrada else self.CUOTA_EXCEDE_CUPO)
+            for cuenta_id, cerrada in zip(self.cuenta_id[filas], cerradas)
+        ]
+        return aplicadas, interes_total, cuotas_total, rechazos
+
+    # -------------------------
+    # Totales
+    # -------------------------
+    def totales(self):
+        """
+        (depositos, sobregiro, {tipo: saldo}) en centavos, sin filas LIBRE.
+        depositos suma saldos positivos; sobregiro, -saldo de los negativos.
+        """
+        n = self._n
+        saldo = self.saldo[:n]
+        tipo = self.tipo[:n]
+        ocupada = tipo != self.LIBRE
+        depositos = int(saldo.sum(where=ocupada & (saldo > 0)))
+        sobregiro = int(-saldo.sum(where=ocupada & (saldo < 0)))
+        por_tipo = {t: int(saldo.sum(where=tipo == t)) for t in (self.AHORROS, self.CORRIENTE)}
+        return depositos, sobregiro, por_tipo
+
+    # -------------------------
+    # Internos
+    # -------------------------
+    def _crecer(self) -> None:
+        cap = len(self.saldo) * 2
+        for nombre in ("saldo", "tasa_interes", "cupo_sobregiro", "cuota_manejo", "activa", "tipo", "cuenta_id"):
+            viejo = getattr(self, nombre)
+            nuevo = np.zeros(cap, dtype=viejo.dtype)
+            nuevo[: len(viejo)] = viejo
+            setattr(self, nombre, nuevo)
+
+
+def corte_columnas(saldo, tasa, cupo, cuota, tipo, activa):
+    """
+    Corte con reporte sobre un tramo de columnas (saldo se modifica en su
+    lugar). Devuelve (aplicadas, interés, cuotas, filas rechazadas, si
+    cada rechazada estaba cerrada), con las filas relativas al tramo.
+    """
+    ocupada = tipo != AlmacenColumnar.LIBRE
+    cerrada = ocupada & ~activa
+    cobra = (tipo == AlmacenColumnar.CORRIENTE) & activa & (cuota > 0)
+    con_cuota = saldo - cuota
+    excede = cobra & (con_cuota < -cupo)
+    cobra &= ~excede
+
+    interes = np.rint(saldo * tasa).astype(np.int64)
+    abona = (tipo == AlmacenColumnar.AHORROS) & activa & (interes > 0)
+    interes_total = int(interes.sum(where=abona))
+    cuotas_total = int(cuota.sum(where=cobra))
+    np.add(saldo, interes, out=saldo, where=abona)
+    np.copyto(saldo, con_cuota, where=cobra)
+
+    filas = np.flatnonzero(cerrada | excede)
+    aplicadas = int(np.count_nonzero(ocupada)) - len(filas)
+    return aplicadas, interes_total, cuotas_total, filas, cerrada[filas]
@@ -0,0 +1,221 @@
+# services/banco_async.py
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from models.cuentas import CuentaBase
+from models.dinero import a_centavos, a_unidades
+from models.resultados import MENSAJES, OK
+from services.banco_service import BancoService
+
+_Pendiente = Tuple[str, int, float, asyncio.Future]
+
+# Estado de un movimiento cuyo resultado todavía no se conoce
+_SIN_RESULTADO = object()
+
+
+class AsyncBancoService:
+    """
+    Fachada asyncio sobre BancoService: el event loop nunca ejecuta trabajo
+    del libro, todo va a un hilo aparte (por defecto uno solo, así el
+    servicio no necesita ser concurrente).
+
+    Coalescencia: consignar/retirar no se ejecutan de inmediato; se encolan
+    y, al final del tick, todos los pendientes se aplican en un solo trabajo.
+    Mientras ese trabajo corre, los nuevos esperan al siguiente: con más
+    carga, lotes más grandes. Cada llamada recibe su propio resultado o su
+    ValueError, como si se hubieran aplicado una a una en orden de llegada.
+
+    compensar=True (por defecto) además neta los movimientos de cada
+    cuenta: si el total de retiros cabe aplicado antes que cualquier
+    consignación (el peor orden posible), ningún movimiento de esa cuenta
+    puede fallar en ningún orden, y se aplican un retiro y una consignación
+    por los totales. Si no cabe, los de esa cuenta van uno a uno en orden de
+    llegada. El saldo final y cada resultado son los mismos; la bitácora y
+    el historial ven los totales por cuenta y no cada movimiento.
+    compensar=False aplica cada movimiento por separado.
+
+    Si el trabajo falla a mitad (un error inesperado del servicio), cada
+    movimiento ya aplicado recibe su resultado y solo los que no llegaron
+    a aplicarse reciben el error. Cancelar una tarea que espera un
+    movimiento no lo retira del lote.
+    """
+
+    def __init__(self, banco: BancoService, hilos: int = 1, compensar: bool = True) -> None:
+        if hilos > 1 and not banco.concurrente:
+            raise ValueError("Con más de un hilo el servicio debe ser concurrente (BancoService(concurrente=True)).")
+        self._banco = banco
+        self._ejecutor = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="banco")
+        self._compensar = compensar
+        self._pendientes: List[_Pendiente] = []
+        self._vaciado: Optional[asyncio.Task] = None
+
+    # -------------------------
+    # Movimientos (coalescidos)
+    # -------------------------
+    async def consignar(self, cuenta_id: int, monto: float) -> None:
+        await self._encolar("consignar", cuenta_id, monto)
+
+    async def retirar(self, cuenta_id: int, monto: float) -> None:
+        await self._encolar("retirar", cuenta_id, monto)
+
+    # -------------------------
+    # Consultas / corte
+    # -------------------------
+    async def buscar_por_id(self, cuenta_id: int) -> Optional[CuentaBase]:
+        # O(1): no vale la pena ir al hilo de trabajo
+        return self._banco.buscar_por_id(cuenta_id)
+
+    async def buscar_por_titular(self, texto: str) -> List[CuentaBase]:
+        return await self._en_hilo(self._banco.buscar_por_titular, texto)
+
+    async def aplicar_corte_mensual_a_todas(self) -> None:
+        await self._en_hilo(self._banco.aplicar_corte_mensual_a_todas)
+
+    async def iterar_cuentas(self, bloque: int = 1000) -> AsyncIterator[CuentaBase]:
+        """
+        Recorre todas las cuentas por id en páginas de `bloque`: cada página
+        se pide con paginar_cuentas en el hilo de trabajo (no se copia el
+        libro) y el control se cede entre páginas.
+        """
+        cursor = None
+        while True:
+            pagina = await self._en_hilo(self._banco.paginar_cuentas, cursor, bloque)
+            for cuenta in pagina:
+                yield cuenta
+            if pagina.cursor is None:
+                return
+            cursor = pagina.cursor
+
+    def cerrar(self) -> None:
+        self._ejecutor.shutdown(wait=True)
+
+    # -------------------------
+    # Internos
+    # -------------------------
+    async def _en_hilo(self, funcion, *argumentos):
+        return await asyncio.get_running_loop().run_in_executor(self._ejecutor, funcion, *argumentos)
+
+    async def _encolar(self, operacion: str, cuenta_id: int, monto: float) -> None:
+        futuro = asyncio.get_running_loop().create_future()
+        self._pendientes.append((operacion, cuenta_id, monto, futuro))
+        if self._vaciado is None:
+            self._vaciado = asyncio.ensure_future(self._vaciar())
+        await futuro
+
+    async def _vaciar(self) -> None:
+        lote: List[_Pendiente] = []
+        estados: List[object] = []
+        try:
+            await asyncio.sleep(0)  # deja que el resto del tick encole
+            while self._pendientes:
+                lote, self._pendientes = self._pendientes, []
+                estados = [_SIN_RESULTADO] * len(lote)
+                trabajo = asyncio.get_running_loop().run_in_executor(self._ejecutor, self._aplicar, lote, estados)
+                try:
+                    await asyncio.shield(trabajo)
+                except asyncio.CancelledError:
+                    # El hilo no se interrumpe: se espera a que termine para
+                    # saber qué quedó aplicado
+                    await asyncio.wait([trabajo])
+                    raise
+                except Exception as e:
+                    # Error inesperado del servicio: solo para lo no aplicado;
+                    # el lote siguiente se intenta igual
+                    _resolver(lote, estados, e)
+                else:
+                    _resolver(lote, estados, None)
+        except BaseException as e:
+            # Que nadie quede esperando para siempre: lo aplicado recibe su
+            # resultado, el resto (y lo que no llegó al hilo) el error
+            _resolver(lote + self._pendientes, estados + [_SIN_RESULTADO] * len(self._pendientes), e)
+            self._pendientes = []
+            raise
+        finally:
+            self._vaciado = None
+
+    def _aplicar(self, lote: List[_Pendiente], estados: List[object]) -> None:
+        """
+        Corre en el hilo de trabajo. Deja en estados[i] None (aplicado) o el
+        motivo del rechazo apenas se conoce, así un error a mitad de camino
+        no borra lo ya resuelto.
+        """
+        if not self._compensar:
+            self._uno_a_uno(lote, range(len(lote)), estados)
+            return
+        por_cuenta: Dict[int, List[int]] = {}
+        for i, (_, cuenta_id, monto, _) in enumerate(lote):
+            try:
+                por_cuenta.setdefault(cuenta_id, []).append(i)
+            except TypeError:  # id no hashable
+                estados[i] = f"Movimiento mal formado: {(cuenta_id, monto)!r}."
+        for cuenta_id, indices in por_cuenta.items():
+            if len(indices) == 1 or not self._compensar_cuenta(cuenta_id, lote, indices, estados):
+                self._uno_a_uno(lote, indices, estados)
+
+    def _compensar_cuenta(
+        self, cuenta_id: int, lote: List[_Pendiente], indices: List[int], estados: List[object]
+    ) -> bool:
+        """Aplica los totales de una cuenta; False (sin tocar nada) si hay que ir uno a uno."""
+        retiros: List[int] = []
+        consignaciones: List[int] = []
+        total_retiros = total_consignaciones = 0
+        for i in indices:
+            operacion, _, monto, _ = lote[i]
+            try:
+                centavos = a_centavos(monto)
+            except (TypeError, ValueError):
+                return False  # la cuenta dará el motivo de cada uno
+            if centavos <= 0:
+                return False
+            if operacion == "consignar":
+                consignaciones.append(i)
+                total_consignaciones += centavos
+            else:
+                retiros.append(i)
+                total_retiros += centavos
+
+        if retiros:
+            if self._banco.intentar_retirar(cuenta_id, a_unidades(total_retiros)) != OK:
+                return False  # el peor orden no cabe: uno a uno, en orden de llegada
+            for i in retiros:
+                estados[i] = None
+        if consignaciones:
+            if self._banco.intentar_consignar(cuenta_id, a_unidades(total_consignaciones)) == OK:
+                for i in consignaciones:
+                    estados[i] = None
+            else:
+                self._uno_a_uno(lote, consignaciones, estados)  # cada una con su motivo
+        return True
+
+    def _uno_a_uno(self, lote: List[_Pendiente], indices: Sequence[int], estados: List[object]) -> None:
+        banco = self._banco
+        for i in indices:
+            operacion, cuenta_id, monto, _ = lote[i]
+            try:
+                hash(cuenta_id)
+            except TypeError:
+                estados[i] = f"Movimiento mal formado: {(cuenta_id, monto)!r}."
+                continue
+            if operacion == "consignar":
+                resultado = banco.intentar_consignar(cuenta_id, monto)
+            else:
+                resultado = banco.intentar_retirar(cuenta_id, monto)
+            estados[i] = None if resultado == OK else MENSAJES[resultado]
+
+
+def _resolver(lote: List[_Pendiente], estados: List[object], error: Optional[BaseException]) -> None:
+    """Entrega a cada futuro su resultado; `error` a los que no tienen uno."""
+    for (*_, futuro), estado in zip(lote, estados):
+        if futuro.done():
+            continue  # la tarea que esperaba se canceló
+        if estado is None:
+            futuro.set_result(None)
+        elif estado is not _SIN_RESULTADO:
+            futuro.set_exception(ValueError(estado))
+        elif isinstance(error, asyncio.CancelledError):
+            futuro.cancel()
+        else:
+            futuro.set_exception(error)
@@ -1,27 +1,248 @@
 # services/banco_service.py
 from __future__ import annotations
 
-from typing import List, Optional
+import operator
+import threading
+import weakref
+from bisect import insort
+from contextlib import ExitStack, nullcontext
+from time import perf_counter_ns
+from typing import Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
-from models.cuentas import CuentaBase, CuentaAhorros, CuentaCorriente
+from models.cuentas import CuentaBase, CuentaAhorros, CuentaCorriente, ObservadorCuenta
+from models.cuentas_columnares import CuentaAhorrosColumnar, CuentaCorrienteColumnar
+from models.cuentas_devengo import CuentaAhorrosDevengo, CuentaCorrienteDevengo, RelojPeriodos
+from models.dinero import a_centavos, a_unidades, formatear
+from models.resultados import CUENTA_INEXISTENTE, MENSAJES, MONTO_INVALIDO, OK
+from services.agregados import ResumenCartera
+from services.bitacora import Bitacora
+from services.corte_mensual import ReporteCorte, aplicar_con_reporte, corte_con_reporte
+from services.corte_reanudable import ProgresoCorte, ReporteCorteReanudable
+from services.fotos import FotoLibro, guardar_previos
+from services.historial import (
+    APERTURA,
+    CONSIGNACION,
+    CUOTA,
+    INTERES,
+    RETIRO,
+    TRANSFERENCIA_ENTRADA,
+    TRANSFERENCIA_SALIDA,
+    HistorialMovimientos,
+    Movimiento,
+)
+from services.importador import ReporteImportacion, importar
+from services.indice_saldos import IndiceSaldos, UsoSobregiro
+from services.indice_titulares import IndiceTitulares
+from services.instantanea import CuentasPerezosas, Instantanea, escribir_instantanea, escribir_registros
+from services.instrumentacion import Instrumentacion
+from services.paginacion import (
+    ORDENES,
+    Cursor,
+    Pagina,
+    filtro_cuentas,
+    pagina_ordenada,
+    pagina_por_claves,
+    pagina_por_id,
+    recorrer_claves,
+)
 
+_SIN_BLOQUEO = nullcontext()
 
-class BancoService:
+# Registro de la bitácora: desde aquí los montos van en centavos enteros
+_MONTOS_EN_CENTAVOS = ["montos", "centavos"]
+
+
+class BancoService(ObservadorCuenta):
     """
     Servicio de aplicación:
-    - Mantiene una colección heterogénea: List[CuentaBase]
+    - Mantiene una colección heterogénea indexada por id: Dict[int, CuentaBase]
     - Usa polimorfismo: llama métodos comunes sin preguntar el tipo
+
+    El dict conserva el orden de inserción (listar_cuentas) y permite
+    buscar/eliminar por id en O(1) en lugar de recorrer toda la colección.
+
+    buscar_por_titular usa un índice de trigramas que el servicio mantiene al
+    abrir/eliminar cuentas y, como observador, cuando cambia un titular.
+    plegar_acentos=True hace la búsqueda insensible a tildes.
+
+    columnar=True (requiere numpy) guarda saldo, tasas, cupos, estado y tipo
+    en arreglos paralelos; las cuentas son vistas sobre su fila y el corte
+    mensual se aplica con operaciones vectoriales.
+
+    bitacora=Bitacora(...) registra cada operación del servicio que modifica
+    estado; desde_bitacora reconstruye el libro al arrancar. Los montos van
+    en centavos enteros (la reproducción es exacta) tras un registro
+    ["montos", "centavos"]; las bitácoras anteriores, sin él, en unidades.
+    Con historial, cada registro lleva su hora (["hora", ns, operación, ...])
+    y al reproducirlo el historial la conserva.
+
+    paginar_cuentas/iterar_cuentas recorren el libro por páginas con cursor,
+    filtros (tipo, activa, rango de saldo) y orden, sin copiarlo.
+
+    intentar_consignar/intentar_retirar aplican las mismas reglas sin
+    lanzar: devuelven un código (models/resultados.py), para tráfico con
+    muchos rechazos.
+
+    transferir/liquidar_transferencias mueven dinero entre cuentas de forma
+    atómica; un lote se compensa y cada cuenta se toca una sola vez.
+
+    snapshot() da una foto de solo lectura del libro en O(1), con copia en
+    escritura por cuenta, para reportes consistentes sin frenar escrituras.
+
+    aplicar_corte_mensual_reanudable(periodo) aplica el corte solo a las
+    cuentas activas, por tramos anotados en la bitácora como puntos de
+    control: se reanuda donde quedó y es idempotente por periodo.
+
+    historial=True guarda cada movimiento (apertura, consignación, retiro,
+    interés, cuota, transferencias) en arreglos tipados por cuenta; ver
+    extracto() y saldo_al(). No se combina con columnar ni devengo perezoso.
+
+    importar(ruta) carga cuentas y movimientos desde CSV/JSONL por bloques;
+    las filas inválidas van a un archivo de rechazos.
+
+    guardar_instantanea/desde_instantanea guardan y abren el libro en un
+    archivo binario (mmap) cuyas cuentas se crean al primer acceso.
+
+    concurrente=True permite usar el servicio desde varios hilos:
+    - Movimientos: un candado por franja (id % franjas); cuentas de franjas
+      distintas se mueven en paralelo.
+    - Registro e índices: un candado aparte (abrir, eliminar, listar, buscar).
+    - Corte mensual: toma todas las franjas (punto consistente del libro).
+    Orden de adquisición: franjas (de menor a mayor) y luego registro.
+
+    instrumentacion=Instrumentacion() cuenta operaciones y rechazos donde el
+    servicio ya los procesa y mide con perf_counter_ns el tiempo de cada
+    operación (y del método de la cuenta que llama), una de cada `muestreo`
+    (ver stats()); no envuelve ni reemplaza métodos.
+
+    agregados=True mantiene un ResumenCartera (depósitos, sobregiro usado,
+    activas/cerradas, saldo por tipo) con cada operación del servicio, así
+    resumen_cartera() es O(1). Los cambios hechos directamente sobre una
+    cuenta, sin pasar por el servicio, no se reflejan.
+    verificar_agregados=True además lo compara con un recálculo completo en
+    cada resumen_cartera() (para pruebas; es O(n)).
+
+    indice_saldos=True mantiene las cuentas ordenadas por saldo (ver
+    services/indice_saldos.py) con cada operación y corte del servicio:
+    mayores_saldos, cuentas_por_saldo y uso_sobregiro cuestan
+    O(log n + k) en lugar de ordenar o filtrar todo el libro.
+
+    devengo_perezoso=True hace el corte mensual O(1): solo avanza un
+    contador de periodos y cada cuenta aplica sus cortes pendientes la
+    primera vez que se lee su saldo o se opera sobre ella (en ahorros, eso
+    cuesta un paso por periodo pendiente). El resultado es
+    el de aplicar el corte cuenta por cuenta sin detenerse ante errores
+    (como aplicar_corte_mensual_con_reporte): en este modo el corte no lanza.
+    No se combina con columnar, agregados, índice de saldos, instantáneas
+    ni con el modo concurrente (ponerse al día reescribe el saldo fuera de
+    la franja de la cuenta).
     """
 
-    def __init__(self) -> None:
-        self._cuentas: List[CuentaBase] = []
+    def __init__(
+        self,
+        plegar_acentos: bool = False,
+        columnar: bool = False,
+        bitacora: Optional[Bitacora] = None,
+        concurrente: bool = False,
+        franjas: int = 64,
+        instrumentacion: Optional[Instrumentacion] = None,
+        agregados: bool = False,
+        verificar_agregados: bool = False,
+        devengo_perezoso: bool = False,
+        historial: bool = False,
+        indice_saldos: bool = False,
+    ) -> None:
+        if devengo_perezoso and (columnar or agregados or verificar_agregados):
+            raise ValueError("El devengo perezoso no se combina con columnar ni con agregados.")
+        if devengo_perezoso and indice_saldos:
+            raise ValueError("El devengo perezoso no se combina con el índice de saldos.")
+        if devengo_perezoso and concurrente:
+            raise ValueError("El devengo perezoso no se combina con el modo concurrente.")
+        if historial and (columnar or devengo_perezoso):
+            raise ValueError("El historial de movimientos no se combina con columnar ni con devengo perezoso.")
+        self._cuentas: Dict[int, CuentaBase] = {}
+        self._indice_titulares = IndiceTitulares(plegar_acentos=plegar_acentos)
+        # True mientras el índice no se haya construido (carga perezosa)
+        self._indice_pendiente = False
+        # Ids abiertos por importar() que aún no están en el índice
+        self._por_indexar: List[int] = []
+        # Ids ordenados para paginar_cuentas (se arma en el primer uso); los
+        # eliminados quedan hasta compactar
+        self._ids: Optional[List[int]] = None
+        self._ids_eliminados = 0
+        # (titular.casefold(), id) ordenados para paginar por titular (se
+        # arma en el primer uso; abrir, eliminar o renombrar lo descarta)
+        self._por_titular: Optional[List[Tuple[str, int]]] = None
+        # Ids de cuentas activas por tipo para el corte reanudable (se arma
+        # en el primer uso) y avance de cada periodo
+        self._activas: Optional[Dict[str, Set[int]]] = None
+        self._cortes: Dict[str, ProgresoCorte] = {}
+        self._bitacora = bitacora
+        if bitacora is not None:
+            bitacora.registrar(_MONTOS_EN_CENTAVOS)
+
+        self._almacen = None
+        if columnar:
+            from services.almacen_columnar import AlmacenColumnar  # import opcional (numpy)
+
+            self._almacen = AlmacenColumnar()
+
+        self._reloj: Optional[RelojPeriodos] = RelojPeriodos() if devengo_perezoso else None
+
+        self._concurrente = concurrente
+        self._franjas: List[threading.Lock] = []
+        self._candado_registro: ContextManager = _SIN_BLOQUEO
+        if concurrente:
+            if franjas < 1:
+                raise ValueError("Debe haber al menos una franja de bloqueo.")
+            self._franjas = [threading.Lock() for _ in range(franjas)]
+            self._candado_registro = threading.RLock()
+
+        # None también mientras no se haya calculado (p. ej. tras desde_instantanea)
+        self._agregados: Optional[ResumenCartera] = ResumenCartera() if agregados or verificar_agregados else None
+        self._mantener_agregados = agregados or verificar_agregados
+        self._verificar_agregados = verificar_agregados
+        # Índice de saldos: como los agregados, None mientras no se haya armado
+        self._indice_saldos: Optional[IndiceSaldos] = IndiceSaldos() if indice_saldos else None
+        self._mantener_indice_saldos = indice_saldos
+        # Protege agregados e índice de saldos (se actualizan juntos)
+        self._candado_agregados: ContextManager = threading.Lock() if concurrente else _SIN_BLOQUEO
+
+        self._historial: Optional[HistorialMovimientos] = HistorialMovimientos() if historial else None
+
+        # Referencias débiles a las fotos abiertas (snapshot())
+        self._fotos: List[weakref.ref] = []
+        # True si algo sigue los cambios de saldo (agregados, historial o
+        # índice de saldos): si no, _despues_de_mutar no hace nada
+        self._seguir_saldos = self._agregados is not None or historial or indice_saldos
+
+        self._instrumentacion = instrumentacion
+        # Contadores por operación que _anotar incrementa (None sin instrumentación)
+        self._conteos: Optional[Dict[str, int]] = None
+        if instrumentacion is not None:
+            self._conteos = instrumentacion.conteos
+
+    @property
+    def concurrente(self) -> bool:
+        """True si admite llamadas desde varios hilos a la vez."""
+        return self._concurrente
 
     # -------------------------
     # Creación de cuentas
     # -------------------------
     def abrir_ahorros(self, titular: str, saldo_inicial: float = 0.0, tasa_interes: float = 0.01) -> CuentaAhorros:
-        cuenta = CuentaAhorros(titular=titular, saldo_inicial=saldo_inicial, tasa_interes=tasa_interes)
-        self._cuentas.append(cuenta)
+        inicio = self._instrumentacion.iniciar() if self._instrumentacion is not None else 0
+        try:
+            with self._candado_registro:
+                cuenta = self._nueva_ahorros(titular, saldo_inicial, tasa_interes)
+                self._registrar(cuenta)
+                self._anotar("abrir_ahorros", cuenta.id, cuenta.titular, cuenta.saldo_centavos, cuenta.tasa_interes)
+        except ValueError as e:
+            self._rechazado("abrir_ahorros", e)
+            raise
+        finally:
+            if inicio:
+                self._instrumentacion.medida("abrir_ahorros", inicio)
         return cuenta
 
     def abrir_corriente(
@@ -31,60 +252,645 @@ class BancoService:
         cupo_sobregiro: float = 0.0,
         cuota_manejo: float = 0.0,
     ) -> CuentaCorriente:
-        cuenta = CuentaCorriente(
-            titular=titular,
-            saldo_inicial=saldo_inicial,
-            cupo_sobregiro=cupo_sobregiro,
-            cuota_manejo=cuota_manejo,
-        )
-        self._cuentas.append(cuenta)
+        inicio = self._instrumentacion.iniciar() if self._instrumentacion is not None else 0
+        try:
+            with self._candado_registro:
+                cuenta = self._nueva_corriente(titular, saldo_inicial, cupo_sobregiro, cuota_manejo)
+                self._registrar(cuenta)
+                self._anotar(
+                    "abrir_corriente",
+                    cuenta.id,
+                    cuenta.titular,
+                    cuenta.saldo_centavos,
+                    cuenta.cupo_sobregiro_centavos,
+                    cuenta.cuota_manejo_centavos,
+                )
+        except ValueError as e:
+            self._rechazado("abrir_corriente", e)
+            raise
+        finally:
+            if inicio:
+                self._instrumentacion.medida("abrir_corriente", inicio)
         return cuenta
 
     # -------------------------
     # Consultas / CRUD
     # -------------------------
     def listar_cuentas(self) -> List[CuentaBase]:
-        return list(self._cuentas)
+        """Copia de todas las cuentas; para libros grandes ver paginar_cuentas/iterar_cuentas."""
+        with self._candado_registro:
+            return list(self._cuentas.values())
+
+    def paginar_cuentas(
+        self,
+        cursor: Optional[Cursor] = None,
+        limite: int = 50,
+        orden: str = "id",
+        descendente: bool = False,
+        tipo: Optional[str] = None,
+        activa: Optional[bool] = None,
+        saldo_min: Optional[float] = None,
+        saldo_max: Optional[float] = None,
+    ) -> Pagina:
+        """
+        Hasta `limite` cuentas que cumplen los filtros, en el orden pedido
+        ("id", "saldo" o "titular"), a partir de `cursor` (el de la página
+        anterior). No copia el libro:
+        - Por id: búsqueda binaria sobre los ids ordenados, O(log n) más lo
+          recorrido hasta llenar la página.
+        - Por titular: igual, sobre una lista (titular, id) ordenada que se
+          arma en la primera página y se descarta al abrir, eliminar o
+          renombrar cuentas.
+        - Por saldo: con indice_saldos=True, desde el cursor en el índice
+          (O(log n) más lo recorrido); sin índice, una pasada conservando
+          las mejores (keyset, O(n log limite)).
+        El cursor es estable: una cuenta abierta o eliminada entre páginas
+        no hace repetir ni saltar las demás.
+        """
+        if limite < 1:
+            raise ValueError("El límite debe ser de al menos una cuenta.")
+        if orden not in ORDENES:
+            raise ValueError(f"Orden no soportado: {orden!r} (use {', '.join(ORDENES)}).")
+        filtro = filtro_cuentas(tipo, activa, saldo_min, saldo_max)
+        if orden == "saldo" and self._mantener_indice_saldos:
+            if self._indice_saldos is None:
+                self._por_saldo(lambda indice: [])  # lo arma (y lo conserva) fuera del candado del registro
+            with self._candado_registro, self._candado_agregados:
+                recorrido = self._indice_saldos.recorrer(cursor, descendente)
+                return pagina_por_claves(recorrido, self._cuentas.get, limite, filtro)
+        with self._candado_registro:
+            if orden == "id":
+                return pagina_por_id(self._ids_ordenados(), self._cuentas.get, cursor, limite, filtro, descendente)
+            if orden == "titular":
+                recorrido = recorrer_claves(self._titulares_ordenados(), cursor, descendente)
+                return pagina_por_claves(recorrido, self._cuentas.get, limite, filtro)
+            return pagina_ordenada(self._cuentas.values(), orden, cursor, limite, filtro, descendente)
+
+    def iterar_cuentas(
+        self,
+        tipo: Optional[str] = None,
+        activa: Optional[bool] = None,
+        saldo_min: Optional[float] = None,
+        saldo_max: Optional[float] = None,
+        bloque: int = 1000,
+    ) -> Iterator[CuentaBase]:
+        """
+        Recorre por id las cuentas que cumplen los filtros, de a `bloque`
+        (paginar_cuentas): nunca copia el libro y se puede seguir usando el
+        servicio mientras se itera.
+        """
+        cursor = None
+        while True:
+            pagina = self.paginar_cuentas(
+                cursor, bloque, tipo=tipo, activa=activa, saldo_min=saldo_min, saldo_max=saldo_max
+            )
+            yield from pagina.cuentas
+            if pagina.cursor is None:
+                return
+            cursor = pagina.cursor
 
     def buscar_por_id(self, cuenta_id: int) -> Optional[CuentaBase]:
-        return next((c for c in self._cuentas if c.id == cuenta_id), None)
+        return self._cuentas.get(cuenta_id)
 
     def buscar_por_titular(self, texto: str) -> List[CuentaBase]:
-        texto = str(texto).strip().lower()
-        if not texto:
-            return []
-        return [c for c in self._cuentas if texto in c.titular.lower()]
+        with self._candado_registro:
+            self._asegurar_indice()
+            # Los ids crecen con el orden de apertura: mismo orden que listar_cuentas
+            return [self._cuentas[i] for i in self._indice_titulares.buscar(texto)]
 
     def cambiar_titular(self, cuenta_id: int, nuevo_titular: str) -> None:
-        cuenta = self._obtener_o_fallar(cuenta_id)
-        cuenta.titular = nuevo_titular
+        inicio = self._instrumentacion.iniciar() if self._instrumentacion is not None else 0
+        try:
+            with self._franja(cuenta_id):
+                cuenta = self._obtener_o_fallar(cuenta_id)
+                self._antes_de_mutar(cuenta)
+                cuenta.titular = nuevo_titular  # el índice se actualiza vía titular_cambiado
+                self._anotar("cambiar_titular", cuenta_id, cuenta.titular)
+        except ValueError as e:
+            self._rechazado("cambiar_titular", e)
+            raise
+        finally:
+            if inicio:
+                self._instrumentacion.medida("cambiar_titular", inicio)
 
     def cerrar_cuenta(self, cuenta_id: int) -> None:
-        cuenta = self._obtener_o_fallar(cuenta_id)
-        cuenta.cerrar()
+        inicio = self._instrumentacion.iniciar() if self._instrumentacion is not None else 0
+        try:
+            with self._franja(cuenta_id):
+                cuenta = self._obtener_o_fallar(cuenta_id)
+                self._antes_de_mutar(cuenta)
+                estaba_activa = cuenta.activa
+                cuenta.cerrar()
+                with self._candado_registro:  # el corte reanudable lee _activas con este candado
+                    self._quitar_activa(cuenta)
+                if self._agregados is not None and estaba_activa:
+                    with self._candado_agregados:
+                        self._agregados.cerrada()
+                self._anotar("cerrar_cuenta", cuenta_id)
+        except ValueError as e:
+            self._rechazado("cerrar_cuenta", e)
+            raise
+        finally:
+            if inicio:
+                self._instrumentacion.medida("cerrar_cuenta", inicio)
 
     def eliminar_cuenta(self, cuenta_id: int) -> None:
-        cuenta = self._obtener_o_fallar(cuenta_id)
-        self._cuentas.remove(cuenta)
+        inicio = self._instrumentacion.iniciar() if self._instrumentacion is not None else 0
+        try:
+            with self._franja(cuenta_id), self._candado_registro:
+                cuenta = self._obtener_o_fallar(cuenta_id)
+                self._antes_de_mutar(cuenta)
+                # Primero los índices y luego el registro: si algo falla a mitad,
+                # la cuenta sigue registrada en lugar de quedar solo en un índice
+                self._quitar_activa(cuenta)
+                if not self._indice_pendiente:
+                    self._indice_titulares.quitar(cuenta.id)
+                if self._agregados is not None or self._indice_saldos is not None:
+                    with self._candado_agregados:
+                        if self._agregados is not None:
+                            self._agregados.quitar(cuenta)
+                        if self._indice_saldos is not None:
+                            self._indice_saldos.quitar(cuenta)
+                del self._cuentas[cuenta.id]
+                if self._ids is not None:
+                    self._ids_eliminados += 1
+                self._por_titular = None
+                if self._almacen is not None:
+                    self._almacen.liberar(cuenta.fila)
+                cuenta.asignar_observador(None)
+                self._anotar("eliminar_cuenta", cuenta_id)
+        except ValueError as e:
+            self._rechazado("eliminar_cuenta", e)
+            raise
+        finally:
+            if inicio:
+                self._instrumentacion.medida("eliminar_cuenta", inicio)
 
     # -------------------------
     # Operaciones
     # -------------------------
     def consignar(self, cuenta_id: int, monto: float) -> None:
-        cuenta = self._obtener_o_fallar(cuenta_id)
-        cuenta.consignar(monto)
+        self._mover("consignar", cuenta_id, monto, CONSIGNACION)
 
     def retirar(self, cuenta_id: int, monto: float) -> None:
-        cuenta = self._obtener_o_fallar(cuenta_id)
         # Polimorfismo: si es Ahorros usa retirar base; si es Corriente usa override
-        cuenta.retirar(monto)
+        self._mover("retirar", cuenta_id, monto, RETIRO)
+
+    def intentar_consignar(self, cuenta_id: int, monto: float) -> int:
+        """
+        Como consignar, pero un rechazo no lanza: devuelve un código de
+        models/resultados.py (OK, CUENTA_INEXISTENTE, CUENTA_CERRADA,
+        MONTO_INVALIDO, ...). Solo lo aplicado se registra en la bitácora.
+        """
+        return self._intentar("consignar", cuenta_id, monto, CONSIGNACION)
+
+    def intentar_retirar(self, cuenta_id: int, monto: float) -> int:
+        """Como retirar, sin lanzar (ver intentar_consignar); suma FONDOS_INSUFICIENTES y CUPO_EXCEDIDO."""
+        return self._intentar("retirar", cuenta_id, monto, RETIRO)
+
+    # -------------------------
+    # Operaciones en lote
+    # -------------------------
+    def consignar_lote(self, movimientos: Iterable[Tuple[int, float]], atomico: bool = True):
+        """
+        Aplica muchas consignaciones (cuenta_id, monto) de una vez.
+        Ver _aplicar_lote para los modos atómico / mejor esfuerzo.
+        """
+        inicio = self._instrumentacion.iniciar() if self._instrumentacion is not None else 0
+        try:
+            return self._aplicar_lote(movimientos, "consignar", atomico)
+        finally:
+            if inicio:
+                self._instrumentacion.medida("consignar_lote", inicio)
+
+    def retirar_lote(self, movimientos: Iterable[Tuple[int, float]], atomico: bool = True):
+        """Como consignar_lote, pero con retiros (respeta reglas de cada tipo)."""
+        inicio = self._instrumentacion.iniciar() if self._instrumentacion is not None else 0
+        try:
+            return self._aplicar_lote(movimientos, "retirar", atomico)
+        finally:
+            if inicio:
+                self._instrumentacion.medida("retirar_lote", inicio)
+
+    # -------------------------
+    # Transferencias
+    # -------------------------
+    def transferir(self, origen_id: int, destino_id: int, monto: float) -> None:
+        """
+        Retira de origen y consigna en destino, todo o nada: el destino se
+        valida antes de retirar, así la consignación ya no puede fallar.
+        """
+        inicio = self._instrumentacion.iniciar() if self._instrumentacion is not None else 0
+        try:
+            if origen_id == destino_id:
+                raise ValueError("El origen y el destino son la misma cuenta.")
+            with self._franjas_de((origen_id, destino_id)):
+                origen = self._obtener_o_fallar(origen_id)
+                destino = self._obtener_o_fallar(destino_id)
+                if not destino.activa:
+                    raise ValueError(f"Cuenta id={destino_id}: no se puede operar sobre una cuenta cerrada.")
+                anteriores = (self._antes_de_mutar(origen), self._antes_de_mutar(destino))
+                origen.retirar(monto)
+                destino.consignar(monto)
+                self._despues_de_mutar(origen, anteriores[0], TRANSFERENCIA_SALIDA)
+                self._despues_de_mutar(destino, anteriores[1], TRANSFERENCIA_ENTRADA)
+                self._anotar("transferir", origen_id, destino_id, a_centavos(monto))
+        except ValueError as e:
+            self._rechazado("transferir", e)
+            raise
+        finally:
+            if inicio:
+                self._instrumentacion.medida("transferir", inicio)
+
+    def liquidar_transferencias(self, transferencias: Iterable[Tuple[int, int, float]]) -> Dict[int, int]:
+        """
+        Liquida un lote de transferencias (origen_id, destino_id, monto) con
+        compensación multilateral: se suma el neto de cada cuenta y se aplica
+        una sola vez, con las reglas de la propia cuenta (retirar si el neto
+        es negativo, consignar si es positivo).
+
+        Todo o nada: si algún neto no cabe (fondos, cupo, cuenta cerrada o
+        inexistente) se restauran los saldos ya tocados y se lanza
+        ValueError. Una transferencia mal formada (no es un trío, ids no
+        enteros, monto no numérico o no positivo) se rechaza con ValueError
+        antes de compensar. Como se valida el neto, un retiro que solo cabe gracias
+        a lo que la cuenta recibe en el mismo lote es válido.
+        Devuelve el neto aplicado a cada cuenta, en centavos.
+        """
+        inicio = self._instrumentacion.iniciar() if self._instrumentacion is not None else 0
+        try:
+            transferencias = [_transferencia_valida(i, transferencia) for i, transferencia in enumerate(transferencias)]
+            netos = self._liquidar(transferencias)
+            self._anotar("liquidar_transferencias", transferencias)
+            return netos
+        except ValueError as e:
+            self._rechazado("liquidar_transferencias", e)
+            raise
+        finally:
+            if inicio:
+                self._instrumentacion.medida("liquidar_transferencias", inicio)
 
     def aplicar_corte_mensual_a_todas(self) -> None:
         """
         Polimorfismo puro: mismo mensaje, distintas implementaciones.
+        Con backend columnar, el almacén aplica el mismo corte en bloque.
+        Con devengo perezoso solo avanza el periodo (O(1)).
+        """
+        inicio = self._instrumentacion.iniciar() if self._instrumentacion is not None else 0
+        with self._todas_las_franjas(), self._candado_registro:
+            try:
+                if self._reloj is not None:
+                    self._reloj.avanzar()
+                    return
+                if self._fotos:
+                    self._guardar_previos_todas()
+                if self._almacen is not None:
+                    try:
+                        self._almacen.aplicar_corte_mensual()
+                    finally:
+                        self._tras_corte_columnar()
+                    return
+                if not self._seguir_saldos:
+                    for cuenta in self._cuentas.values():
+                        cuenta.aplicar_corte_mensual()
+                    return
+                for cuenta in self._cuentas.values():
+                    anterior = cuenta.saldo_centavos
+                    cuenta.aplicar_corte_mensual()
+                    self._despues_de_mutar(cuenta, anterior)
+            except ValueError as e:
+                self._rechazado("aplicar_corte_mensual_a_todas", e)
+                raise
+            finally:
+                # Aun si falla a mitad, lo aplicado hasta ahí cambió el estado;
+                # al reproducir se repite el mismo corte parcial.
+                self._anotar("aplicar_corte_mensual_a_todas")
+                if inicio:
+                    self._instrumentacion.medida("aplicar_corte_mensual_a_todas", inicio)
+
+    def aplicar_corte_mensual_con_reporte(self, procesos: int = 1) -> ReporteCorte:
+        """
+        A diferencia de aplicar_corte_mensual_a_todas no se detiene: las
+        cuentas que fallan quedan igual y salen en reporte.rechazadas, con
+        el interés y las cuotas totales. Con backend columnar se hace
+        vectorizado sobre las columnas y, con procesos > 1, repartido por
+        tramos de filas entre procesos (services/corte_paralelo.py).
+        """
+        inicio = self._instrumentacion.iniciar() if self._instrumentacion is not None else 0
+        try:
+            if self._reloj is not None:
+                raise ValueError("Con devengo perezoso el corte ya es O(1): use aplicar_corte_mensual_a_todas.")
+            if procesos < 1:
+                raise ValueError("Se necesita al menos un proceso.")
+            if procesos > 1 and self._almacen is None:
+                raise ValueError("El corte en varios procesos requiere el backend columnar (columnar=True).")
+            with self._todas_las_franjas(), self._candado_registro:
+                if self._fotos:
+                    self._guardar_previos_todas()
+                if self._almacen is not None:
+                    reporte = ReporteCorte()
+                    try:
+                        (
+                            reporte.aplicadas,
+                            reporte.interes_total_centavos,
+                            reporte.cuotas_total_centavos,
+                            reporte.rechazadas,
+                        ) = self._almacen.aplicar_corte_con_reporte(procesos)
+                    finally:
+                        self._tras_corte_columnar()
+                else:
+                    al_cambiar = self._despues_de_mutar if self._seguir_saldos else None
+                    reporte = corte_con_reporte(self._cuentas.values(), al_cambiar)
+                self._anotar("aplicar_corte_mensual_con_reporte")
+            return reporte
+        finally:
+            if inicio:
+                self._instrumentacion.medida("aplicar_corte_mensual_con_reporte", inicio)
+
+    def aplicar_corte_mensual_reanudable(
+        self,
+        periodo: str,
+        cada: int = 1000,
+        progreso: Optional[Callable[[ReporteCorteReanudable], None]] = None,
+    ) -> ReporteCorteReanudable:
+        """
+        Corte mensual del `periodo` (p. ej. "2026-10") por tramos de `cada`
+        cuentas, reanudable e idempotente:
+        - Recorre solo el índice de cuentas activas, por tipo y en orden de
+          id. Una cuenta que falla (cuota que excede el cupo) queda igual y
+          se reporta; el corte sigue.
+        - Cada tramo se anota en la bitácora con sus ids y se sincroniza:
+          es el punto de control. Si el proceso muere, desde_bitacora
+          reproduce los tramos anotados y una nueva llamada con el mismo
+          periodo sigue después del último. Lo aplicado después del último
+          punto de control se perdió con el proceso, así ninguna cuenta
+          recibe el corte dos veces.
+        - Con el periodo terminado no hace nada (reporte.ya_aplicado).
+        Requiere bitácora: sin ella el avance no sobreviviría a una caída.
+        El avance no viaja en instantáneas.
+
+        Cada tramo toma todas las franjas; entre tramos el servicio sigue
+        atendiendo. progreso(reporte) se llama después de cada tramo.
+        """
+        inicio = self._instrumentacion.iniciar() if self._instrumentacion is not None else 0
+        try:
+            if self._reloj is not None:
+                raise ValueError("Con devengo perezoso el corte ya es O(1): use aplicar_corte_mensual_a_todas.")
+            if self._bitacora is None:
+                raise ValueError("El corte reanudable requiere bitácora (sus tramos son los puntos de control).")
+            if cada < 1:
+                raise ValueError("El tramo debe ser de al menos una cuenta.")
+            reporte = ReporteCorteReanudable(periodo)
+            avance = self._cortes.get(periodo)
+            if avance is not None and avance.terminado:
+                reporte.ya_aplicado = True
+                return reporte
+            reporte.reanudado = avance is not None and avance.tramos > 0
+
+            with self._candado_registro:
+                activas = self._activas_por_tipo()
+                tipos = sorted(activas)
+            for tipo in tipos:
+                with self._candado_registro:
+                    ultimo = avance.ultimo_id.get(tipo, 0) if avance is not None else 0
+                    pendientes = sorted(cuenta_id for cuenta_id in activas.get(tipo, ()) if cuenta_id > ultimo)
+                for desde in range(0, len(pendientes), cada):
+                    tramo = pendientes[desde : desde + cada]
+                    with self._todas_las_franjas(), self._candado_registro:
+                        try:
+                            self._aplicar_tramo_corte(periodo, tipo, tramo, reporte)
+                        finally:
+                            self._bitacora.sincronizar()
+                    reporte.tramos += 1
+                    if progreso is not None:
+                        progreso(reporte)
+                    avance = self._cortes.get(periodo)
+
+            with self._candado_registro:
+                self._cortes.setdefault(periodo, ProgresoCorte(periodo)).terminado = True
+                self._anotar("corte_mensual_fin", periodo)
+                self._bitacora.sincronizar()
+            return reporte
+        finally:
+            if inicio:
+                self._instrumentacion.medida("aplicar_corte_mensual_reanudable", inicio)
+
+    def progreso_corte(self, periodo: str) -> Optional[ProgresoCorte]:
+        """Avance del corte reanudable de ese periodo (None si no empezó)."""
+        return self._cortes.get(periodo)
+
+    # -------------------------
+    # Bitácora (persistencia)
+    # -------------------------
+    @classmethod
+    def desde_bitacora(cls, bitacora: Bitacora, **opciones) -> "BancoService":
+        """
+        Crea un servicio reproduciendo la bitácora (mismos ids, saldos y
+        estado) y la deja conectada para seguir registrando.
+        """
+        banco = cls(**opciones)
+        siguiente_previo = CuentaBase._next_id
+        # La bitácora trae sus ids: se reproducen con el contador del proceso
+        asignador, CuentaBase._asignador = CuentaBase._asignador, None
+        try:
+            en_centavos = False  # bitácoras sin ["montos", "centavos"]: montos en unidades
+            for registro in bitacora.leer():
+                if registro[0] == "montos":
+                    en_centavos = registro == _MONTOS_EN_CENTAVOS
+                    continue
+                if registro[0] == "hora":
+                    _, momento, *registro = registro
+                    if banco._historial is not None:
+                        with banco._historial.hora_fija(momento):
+                            banco._reproducir(registro, en_centavos)
+                        continue
+                banco._reproducir(registro, en_centavos)
+        finally:
+            CuentaBase._asignador = asignador
+        # Nunca retroceder el contador: puede haber otras cuentas en el proceso
+        CuentaBase._next_id = max(siguiente_previo, CuentaBase._next_id)
+        CuentaBase.asegurar_id_mayor_que(CuentaBase._next_id - 1)
+        banco._bitacora = bitacora
+        if not en_centavos:
+            bitacora.registrar(_MONTOS_EN_CENTAVOS)  # lo que siga va en centavos
+        return banco
+
+    # -------------------------
+    # Instantáneas (arranque rápido)
+    # -------------------------
+    def guardar_instantanea(self, ruta: str) -> int:
+        """
+        Escribe todas las cuentas en `ruta` (atómico). Devuelve cuántas.
+        Abierto con desde_instantanea, las cuentas que no se usaron se copian
+        sin materializarlas; `ruta` puede ser la misma instantánea abierta.
+        """
+        if isinstance(self._cuentas, CuentasPerezosas):
+            return escribir_registros(self._cuentas.registros(), CuentaBase.proximo_id(), ruta)
+        return escribir_instantanea(self._cuentas.values(), CuentaBase.proximo_id(), ruta)
+
+    @classmethod
+    def desde_instantanea(cls, ruta: str, **opciones) -> "BancoService":
+        """
+        Abre una instantánea en O(1): las cuentas se crean al primer acceso
+        y el índice de titulares, en la primera búsqueda por titular.
+        No se combina con el backend columnar. cerrar() libera el archivo.
+        """
+        if opciones.get("columnar"):
+            raise ValueError("Las instantáneas no se pueden abrir con el backend columnar.")
+        if opciones.get("devengo_perezoso"):
+            raise ValueError("Las instantáneas no se pueden abrir con devengo perezoso.")
+        banco = cls(**opciones)
+        instantanea = Instantanea(ruta)
+        banco._cuentas = CuentasPerezosas(instantanea, al_materializar=lambda c: c.asignar_observador(banco))
+        banco._indice_pendiente = True
+        banco._agregados = None  # se calculan en el primer resumen_cartera()
+        banco._indice_saldos = None  # se arma en la primera consulta por saldo
+        banco._seguir_saldos = banco._historial is not None
+        CuentaBase.asegurar_id_mayor_que(instantanea.siguiente_id - 1)
+        return banco
+
+    def cerrar(self) -> None:
+        """
+        Libera la instantánea abierta con desde_instantanea (mmap y archivo).
+        El servicio no se usa después; sin instantánea no hace nada.
+        """
+        if isinstance(self._cuentas, CuentasPerezosas):
+            self._cuentas.cerrar()
+
+    # -------------------------
+    # Importación masiva
+    # -------------------------
+    def importar(
+        self,
+        ruta: str,
+        rechazos: Optional[str] = None,
+        formato: Optional[str] = None,
+        bloque: int = 10_000,
+        progreso: Optional[Callable[[ReporteImportacion], None]] = None,
+    ) -> ReporteImportacion:
+        """
+        Carga cuentas y movimientos desde un CSV o JSONL por bloques, sin
+        leer el archivo entero. Las filas inválidas van a `rechazos` (JSONL)
+        en lugar de detener la carga. Ver services/importador.py.
+        """
+        inicio = self._instrumentacion.iniciar() if self._instrumentacion is not None else 0
+        try:
+            return importar(self, ruta, rechazos=rechazos, formato=formato, bloque=bloque, progreso=progreso)
+        finally:
+            if inicio:
+                self._instrumentacion.medida("importar", inicio)
+
+    # -------------------------
+    # Agregados de la cartera
+    # -------------------------
+    def resumen_cartera(self) -> ResumenCartera:
+        """
+        Copia de los agregados: O(1) con agregados=True. Sin ellos (o la
+        primera vez tras desde_instantanea) recorre todas las cuentas.
+        """
+        if self._agregados is None:
+            with self._todas_las_franjas(), self._candado_registro:
+                resumen = ResumenCartera.desde_cuentas(self._cuentas.values())
+                if not self._mantener_agregados:
+                    return resumen
+                self._agregados = resumen
+                self._seguir_saldos = True
+        elif self._verificar_agregados:
+            self.verificar_agregados()
+        with self._candado_agregados:
+            return self._agregados.copia()
+
+    def verificar_agregados(self) -> None:
+        """Compara los agregados con un recálculo completo; RuntimeError si difieren."""
+        if not self._mantener_agregados:
+            raise ValueError("El servicio no mantiene agregados (agregados=True).")
+        with self._todas_las_franjas(), self._candado_registro:
+            if self._agregados is None:
+                return  # aún no calculados: no hay nada que pueda haberse desviado
+            recalculado = ResumenCartera.desde_cuentas(self._cuentas.values())
+            with self._candado_agregados:
+                if self._agregados != recalculado:
+                    raise RuntimeError(
+                        f"Los agregados no coinciden con el recálculo: {self._agregados} != {recalculado}."
+                    )
+
+    # -------------------------
+    # Consultas por saldo
+    # -------------------------
+    def mayores_saldos(self, n: int = 100) -> List[CuentaBase]:
+        """Las n cuentas de mayor saldo, de mayor a menor (cerradas incluidas)."""
+        if n < 0:
+            raise ValueError("n no puede ser negativo.")
+        return self._por_saldo(lambda indice: indice.mayores(n))
+
+    def cuentas_por_saldo(self, minimo: Optional[float] = None, maximo: Optional[float] = None) -> List[CuentaBase]:
+        """Cuentas con minimo <= saldo <= maximo (None = sin límite), de menor a mayor saldo."""
+        minimo_c = a_centavos(minimo) if minimo is not None else None
+        maximo_c = a_centavos(maximo) if maximo is not None else None
+        return self._por_saldo(lambda indice: indice.rango(minimo_c, maximo_c))
+
+    def uso_sobregiro(self, n: Optional[int] = None) -> List[UsoSobregiro]:
+        """
+        Cuentas corrientes con saldo negativo y cuánto de su cupo usan, de
+        mayor a menor utilización (las n primeras; None = todas).
+        """
+        if n is not None and n < 0:
+            raise ValueError("n no puede ser negativo.")
+        return [UsoSobregiro(cuenta) for cuenta in self._por_saldo(lambda indice: indice.sobregiros(n))]
+
+    # -------------------------
+    # Fotos (lecturas consistentes)
+    # -------------------------
+    def snapshot(self) -> FotoLibro:
+        """
+        Foto de solo lectura del libro en este instante, en O(1): los
+        reportes la recorren sin bloquear a quien escribe y sin ver cambios
+        posteriores. Mientras esté abierta, cada cuenta que se modifica o
+        elimina guarda primero su estado previo (copia en escritura); un
+        corte mensual guarda todas. Ver services/fotos.py.
+
+        En modo concurrente toma un instante todas las franjas para que
+        ninguna operación quede a medias. No se combina con devengo
+        perezoso (los saldos cambian al leerse).
+        """
+        if self._reloj is not None:
+            raise ValueError("Las fotos no se combinan con devengo perezoso.")
+        with self._todas_las_franjas(), self._candado_registro:
+            ids = self._ids_ordenados()
+            foto = FotoLibro(ids, len(ids), CuentaBase.proximo_id(), self._cuentas.get, self._foto_cerrada)
+            self._fotos.append(foto._ref)
+        return foto
+
+    # -------------------------
+    # Historial de movimientos
+    # -------------------------
+    def extracto(
+        self, cuenta_id: int, desde: Optional[float] = None, hasta: Optional[float] = None
+    ) -> List[Movimiento]:
         """
-        for cuenta in self._cuentas:
-            cuenta.aplicar_corte_mensual()
+        Movimientos de la cuenta entre desde y hasta (segundos desde epoch,
+        inclusive; None = sin límite), con el saldo después de cada uno.
+        Requiere historial=True; se conserva aunque la cuenta se elimine.
+        """
+        return self._historial_activo().extracto(cuenta_id, desde, hasta)
+
+    def saldo_al(self, cuenta_id: int, momento: float) -> Optional[float]:
+        """Saldo de la cuenta en ese momento (None si aún no existía)."""
+        saldo = self._historial_activo().saldo_al(cuenta_id, momento)
+        return None if saldo is None else a_unidades(saldo)
+
+    def memoria_historial(self) -> Dict[str, float]:
+        """Movimientos guardados, bytes totales y bytes por movimiento."""
+        return self._historial_activo().memoria()
+
+    # -------------------------
+    # Instrumentación
+    # -------------------------
+    def stats(self) -> dict:
+        """Foto de operaciones, rechazos y tiempos (requiere instrumentacion=...)."""
+        if self._instrumentacion is None:
+            raise ValueError("El servicio no tiene instrumentación activa.")
+        return self._instrumentacion.stats()
 
     # -------------------------
     # Duck typing (demostración)
@@ -99,11 +905,628 @@ class BancoService:
             raise ValueError("El objeto no soporta retirar(monto).")
         objeto_con_retirar.retirar(monto)
 
+    # -------------------------
+    # Observador de cuentas
+    # -------------------------
+    def titular_cambiado(self, cuenta: CuentaBase, anterior: str) -> None:
+        with self._candado_registro:
+            if not self._indice_pendiente:
+                self._indice_titulares.actualizar(cuenta.id, cuenta.titular)
+            self._por_titular = None
+
     # -------------------------
     # Internos
     # -------------------------
+    def _nueva_ahorros(self, titular: str, saldo_inicial: float, tasa_interes: float) -> CuentaAhorros:
+        if self._almacen is not None:
+            return CuentaAhorrosColumnar(
+                self._almacen, titular=titular, saldo_inicial=saldo_inicial, tasa_interes=tasa_interes
+            )
+        if self._reloj is not None:
+            return CuentaAhorrosDevengo(
+                self._reloj, titular=titular, saldo_inicial=saldo_inicial, tasa_interes=tasa_interes
+            )
+        return CuentaAhorros(titular=titular, saldo_inicial=saldo_inicial, tasa_interes=tasa_interes)
+
+    def _nueva_corriente(
+        self, titular: str, saldo_inicial: float, cupo_sobregiro: float, cuota_manejo: float
+    ) -> CuentaCorriente:
+        if self._almacen is not None:
+            return CuentaCorrienteColumnar(
+                self._almacen,
+                titular=titular,
+                saldo_inicial=saldo_inicial,
+                cupo_sobregiro=cupo_sobregiro,
+                cuota_manejo=cuota_manejo,
+            )
+        if self._reloj is not None:
+            return CuentaCorrienteDevengo(
+                self._reloj,
+                titular=titular,
+                saldo_inicial=saldo_inicial,
+                cupo_sobregiro=cupo_sobregiro,
+                cuota_manejo=cuota_manejo,
+            )
+        return CuentaCorriente(
+            titular=titular,
+            saldo_inicial=saldo_inicial,
+            cupo_sobregiro=cupo_sobregiro,
+            cuota_manejo=cuota_manejo,
+        )
+
+    def _registrar(self, cuenta: CuentaBase, diferir_indice: bool = False) -> None:
+        self._cuentas[cuenta.id] = cuenta
+        if self._indice_pendiente:
+            pass
+        elif diferir_indice:
+            self._por_indexar.append(cuenta.id)
+        else:
+            self._indice_titulares.agregar(cuenta.id, cuenta.titular)
+        if self._ids is not None:
+            if self._ids and cuenta.id < self._ids[-1]:
+                insort(self._ids, cuenta.id)
+            else:
+                self._ids.append(cuenta.id)
+        self._por_titular = None
+        if self._activas is not None and cuenta.activa:
+            self._activas.setdefault(cuenta.tipo(), set()).add(cuenta.id)
+        if self._agregados is not None or self._indice_saldos is not None:
+            with self._candado_agregados:
+                if self._agregados is not None:
+                    self._agregados.agregar(cuenta)
+                if self._indice_saldos is not None:
+                    self._indice_saldos.agregar(cuenta)
+        if self._historial is not None:
+            self._historial.registrar(cuenta.id, APERTURA, cuenta.saldo_centavos, cuenta.saldo_centavos)
+        cuenta.asignar_observador(self)
+
+    def _abrir_bloque(self, aperturas: List[Tuple[str, tuple]]) -> List[Union[CuentaBase, str]]:
+        """
+        Para importar: abre un bloque de cuentas ("abrir_ahorros" o
+        "abrir_corriente", argumentos) con una sola toma del candado de
+        registro. Devuelve la cuenta o el mensaje de error de cada una.
+        Los titulares se indexan en la próxima búsqueda por titular.
+        """
+        resultados: List[Union[CuentaBase, str]] = []
+        with self._candado_registro:
+            for operacion, argumentos in aperturas:
+                try:
+                    if operacion == "abrir_ahorros":
+                        cuenta = self._nueva_ahorros(*argumentos)
+                    else:
+                        cuenta = self._nueva_corriente(*argumentos)
+                except ValueError as e:
+                    resultados.append(str(e))
+                    continue
+                self._registrar(cuenta, diferir_indice=True)
+                if operacion == "abrir_ahorros":
+                    self._anotar(operacion, cuenta.id, cuenta.titular, cuenta.saldo_centavos, cuenta.tasa_interes)
+                else:
+                    self._anotar(
+                        operacion,
+                        cuenta.id,
+                        cuenta.titular,
+                        cuenta.saldo_centavos,
+                        cuenta.cupo_sobregiro_centavos,
+                        cuenta.cuota_manejo_centavos,
+                    )
+                resultados.append(cuenta)
+        return resultados
+
+    def _mover(self, operacion: str, cuenta_id: int, monto: float, movimiento: int) -> None:
+        """consignar/retirar: la operación de la cuenta, entre los dos ganchos, y a la bitácora."""
+        inicio = self._instrumentacion.iniciar() if self._instrumentacion is not None else 0
+        try:
+            with self._franja(cuenta_id):
+                cuenta = self._obtener_o_fallar(cuenta_id)
+                anterior = self._antes_de_mutar(cuenta)
+                if inicio:
+                    self._cronometrar_cuenta(cuenta, operacion, monto)
+                else:
+                    getattr(cuenta, operacion)(monto)
+                self._despues_de_mutar(cuenta, anterior, movimiento)
+                self._anotar(operacion, cuenta_id, a_centavos(monto))
+        except ValueError as e:
+            self._rechazado(operacion, e)
+            raise
+        finally:
+            if inicio:
+                self._instrumentacion.medida(operacion, inicio)
+
+    def _intentar(self, operacion: str, cuenta_id: int, monto: float, movimiento: int) -> int:
+        """intentar_consignar/intentar_retirar: como _mover, con código en lugar de excepción."""
+        inicio = self._instrumentacion.iniciar() if self._instrumentacion is not None else 0
+        try:
+            with self._franja(cuenta_id):
+                cuenta = self._cuentas.get(cuenta_id)
+                if cuenta is None:
+                    resultado = CUENTA_INEXISTENTE
+                else:
+                    anterior = self._antes_de_mutar(cuenta)
+                    if inicio:
+                        resultado = self._cronometrar_cuenta(cuenta, "intentar_" + operacion, monto)
+                    else:
+                        resultado = getattr(cuenta, "intentar_" + operacion)(monto)
+                    if resultado == OK:
+                        self._despues_de_mutar(cuenta, anterior, movimiento)
+                        self._anotar(operacion, cuenta_id, a_centavos(monto))
+                        return OK
+                if self._instrumentacion is not None:
+                    self._instrumentacion.rechazo(operacion, MENSAJES[resultado])
+                return resultado
+        finally:
+            if inicio:
+                self._instrumentacion.medida("intentar_" + operacion, inicio)
+
+    def _cronometrar_cuenta(self, cuenta: CuentaBase, metodo: str, monto: float):
+        """Llama cuenta.metodo(monto) midiendo su tiempo como "Tipo.metodo" (solo operaciones de la muestra)."""
+        inicio = perf_counter_ns()
+        try:
+            return getattr(cuenta, metodo)(monto)
+        finally:
+            self._instrumentacion.medida(f"{type(cuenta).__name__}.{metodo}", inicio)
+
+    def _antes_de_mutar(self, cuenta: CuentaBase) -> int:
+        """
+        Gancho previo a todo cambio de una cuenta (titular, estado o saldo):
+        las fotos abiertas guardan su versión anterior. Devuelve el saldo
+        anterior para _despues_de_mutar (y para revertir lotes).
+        """
+        if self._fotos:
+            guardar_previos(self._fotos, cuenta)
+        return cuenta.saldo_centavos
+
+    def _despues_de_mutar(self, cuenta: CuentaBase, anterior: int, movimiento: Optional[int] = None) -> None:
+        """
+        Gancho tras un cambio de saldo ya aplicado: lo que sigue saldos
+        (ver _saldo_cambiado). movimiento None es el corte mensual: un saldo
+        que sube es interés y uno que baja, cuota de manejo.
+        """
+        if not self._seguir_saldos:
+            return
+        if movimiento is None:
+            movimiento = INTERES if cuenta.saldo_centavos > anterior else CUOTA
+        self._saldo_cambiado(cuenta, anterior, movimiento)
+
+    def _saldo_cambiado(self, cuenta: CuentaBase, anterior: int, movimiento: int) -> None:
+        """
+        Solo con _seguir_saldos: agregados, historial y/o índice de saldos
+        (movimiento es el tipo, ver services/historial.py). Sin modo
+        concurrente se evita el with (camino caliente).
+        """
+        if self._historial is not None:
+            saldo = cuenta.saldo_centavos
+            if saldo != anterior:
+                self._historial.registrar(cuenta.id, movimiento, saldo - anterior, saldo)
+        if self._agregados is None and self._indice_saldos is None:
+            return
+        if not self._concurrente:
+            self._ordenados_cambiados(cuenta, anterior)
+            return
+        with self._candado_agregados:
+            self._ordenados_cambiados(cuenta, anterior)
+
+    def _ordenados_cambiados(self, cuenta: CuentaBase, anterior: int) -> None:
+        """Agregados e índice de saldos (con _candado_agregados tomado)."""
+        if self._agregados is not None:
+            self._agregados.saldo_cambiado(cuenta, anterior)
+        if self._indice_saldos is not None:
+            self._indice_saldos.saldo_cambiado(cuenta, anterior)
+
+    def _por_saldo(self, consulta: Callable[[IndiceSaldos], List[int]]) -> List[CuentaBase]:
+        """
+        Cuentas de los ids que devuelve consulta(índice). Sin
+        índice mantenido (o la primera vez tras desde_instantanea) lo arma
+        recorriendo todas las cuentas.
+        """
+        indice = self._indice_saldos
+        if indice is None:
+            with self._todas_las_franjas(), self._candado_registro:
+                indice = IndiceSaldos.desde_cuentas(self._cuentas.values())
+                if self._mantener_indice_saldos:
+                    self._indice_saldos = indice
+                    self._seguir_saldos = True
+                ids = consulta(indice)
+        else:
+            with self._candado_agregados:
+                ids = consulta(indice)
+        obtener = self._cuentas.get
+        cuentas = [obtener(cuenta_id) for cuenta_id in ids]
+        return [cuenta for cuenta in cuentas if cuenta is not None]  # concurrente: pudo eliminarse entre medio
+
+    def _guardar_previos_todas(self) -> None:
+        """Antes de un corte con fotos abiertas: todas las cuentas cambian."""
+        for cuenta in self._cuentas.values():
+            guardar_previos(self._fotos, cuenta)
+
+    def _foto_cerrada(self, ref: "weakref.ref") -> None:
+        try:
+            self._fotos.remove(ref)
+        except ValueError:
+            pass  # ya se había quitado (cerrar() y luego recolección)
+
+    def _historial_activo(self) -> HistorialMovimientos:
+        if self._historial is None:
+            raise ValueError("El servicio no guarda historial de movimientos (historial=True).")
+        return self._historial
+
+    def _tras_corte_columnar(self) -> None:
+        """El corte vectorizado no pasa por las cuentas: agregados e índice, desde las columnas."""
+        if self._agregados is not None:
+            self._recalcular_saldos_columnares()
+        if self._indice_saldos is not None:
+            self._indice_saldos = IndiceSaldos.desde_cuentas(self._cuentas.values())
+
+    def _recalcular_saldos_columnares(self) -> None:
+        """Tras el corte vectorizado: saldos de los agregados desde las columnas."""
+        depositos, sobregiro, por_tipo = self._almacen.totales()
+        nombres = {self._almacen.AHORROS: CuentaAhorros.__name__, self._almacen.CORRIENTE: CuentaCorriente.__name__}
+        with self._candado_agregados:
+            self._agregados.depositos_centavos = depositos
+            self._agregados.sobregiro_centavos = sobregiro
+            for codigo, saldo in por_tipo.items():
+                self._agregados.saldo_por_tipo_centavos[nombres[codigo]] = saldo
+
+    def _activas_por_tipo(self) -> Dict[str, Set[int]]:
+        """
+        Índice de activas por tipo (con _candado_registro tomado: quien lo
+        modifica también lo toma). Sin entrada para un tipo sin activas.
+        """
+        if self._activas is None:
+            activas: Dict[str, Set[int]] = {}
+            for cuenta in self._cuentas.values():
+                if cuenta.activa:
+                    activas.setdefault(cuenta.tipo(), set()).add(cuenta.id)
+            self._activas = activas
+        return self._activas
+
+    def _quitar_activa(self, cuenta: CuentaBase) -> None:
+        if self._activas is not None:
+            activas = self._activas.get(cuenta.tipo())
+            if activas is not None:
+                activas.discard(cuenta.id)
+
+    def _aplicar_tramo_corte(self, periodo: str, tipo: str, tramo: List[int], reporte: ReporteCorte) -> None:
+        """
+        Corte de las cuentas del tramo (con todas las franjas tomadas; también
+        al reproducir). Lo procesado se anota y cuenta como avance aunque
+        algo interrumpa el tramo a mitad: así nunca se repite una cuenta.
+        """
+        activas = self._activas_por_tipo().get(tipo, set())
+        hechas = 0
+        try:
+            for cuenta_id in tramo:
+                self._corte_de_cuenta(cuenta_id, activas, reporte)
+                hechas += 1
+        finally:
+            if hechas:
+                avance = self._cortes.get(periodo)
+                if avance is None:
+                    avance = self._cortes[periodo] = ProgresoCorte(periodo)
+                avance.ultimo_id[tipo] = max(avance.ultimo_id.get(tipo, 0), tramo[hechas - 1])
+                avance.cuentas += hechas
+                avance.tramos += 1
+                self._anotar("corte_mensual_tramo", periodo, tipo, tramo[:hechas])
+
+    def _corte_de_cuenta(self, cuenta_id: int, activas: Set[int], reporte: ReporteCorte) -> None:
+        cuenta = self._cuentas.get(cuenta_id)
+        if cuenta is None or not cuenta.activa:
+            activas.discard(cuenta_id)  # cerrada sin pasar por el servicio
+            return
+        self._antes_de_mutar(cuenta)
+        anterior = aplicar_con_reporte(cuenta, reporte)
+        if anterior is not None:
+            self._despues_de_mutar(cuenta, anterior)
+
+    def _ids_ordenados(self) -> List[int]:
+        if self._ids is None or self._ids_eliminados > len(self._ids) // 2:
+            self._ids = sorted(self._cuentas.keys())
+            self._ids_eliminados = 0
+        return self._ids
+
+    def _titulares_ordenados(self) -> List[Tuple[str, int]]:
+        if self._por_titular is None:
+            if isinstance(self._cuentas, CuentasPerezosas):
+                titulares = self._cuentas.titulares()  # sin materializar las cuentas
+            else:
+                titulares = ((cuenta_id, cuenta.titular) for cuenta_id, cuenta in self._cuentas.items())
+            self._por_titular = sorted((titular.casefold(), cuenta_id) for cuenta_id, titular in titulares)
+        return self._por_titular
+
+    def _asegurar_indice(self) -> None:
+        if self._por_indexar:
+            for cuenta_id in self._por_indexar:
+                cuenta = self._cuentas.get(cuenta_id)
+                if cuenta is not None:  # pudo eliminarse antes de indexarse
+                    self._indice_titulares.agregar(cuenta_id, cuenta.titular)
+            self._por_indexar = []
+        if not self._indice_pendiente:
+            return
+        for cuenta_id, titular in self._cuentas.titulares():
+            self._indice_titulares.agregar(cuenta_id, titular)
+        self._indice_pendiente = False
+
+    def _aplicar_lote(self, movimientos: Iterable[Tuple[int, float]], operacion: str, atomico: bool):
+        """
+        - atomico=True: todo o nada. Convierte cada monto una vez, suma los
+          de cada cuenta y aplica el total con una sola llamada a la cuenta
+          (una búsqueda y una validación por cuenta; como los montos son
+          positivos, el total cabe si y solo si cabe cada movimiento en
+          orden). Ante un error (de cualquier tipo) se restauran los saldos
+          previos de las cuentas tocadas; si fue un rechazo, se repasa el
+          lote en orden (_lote_en_orden) para lanzar ValueError con el
+          número del primer movimiento que falla. Devuelve cuántos
+          movimientos se aplicaron.
+        - atomico=False: mejor esfuerzo. No lanza por un movimiento: devuelve
+          una lista con None (aplicado) o el motivo del rechazo de cada uno,
+          incluidos los mal formados. Usa intentar_* (sin excepciones por
+          rechazo) y a la bitácora van solo los aplicados.
+
+        Las validaciones son las mismas de la cuenta. Ver
+        benchmarks/bench_lotes.py para la comparación con un bucle de
+        consignar/retirar.
+        """
+        obtener = self._cuentas.get
+        movimiento = CONSIGNACION if operacion == "consignar" else RETIRO
+
+        if not atomico:
+            estados: List[Optional[str]] = []
+            anotar = estados.append
+            # Lo aplicado se anota para la bitácora y para los contadores
+            anotados = self._bitacora is not None or self._conteos is not None
+            aplicados: Optional[List[Tuple[int, int]]] = [] if anotados else None
+            intentar = "intentar_" + operacion
+            try:
+                for par in movimientos:
+                    try:
+                        cuenta_id, monto = par
+                        hash(cuenta_id)  # un id no hashable no puede buscarse ni bloquearse
+                    except (TypeError, ValueError):
+                        anotar(f"Movimiento mal formado: {par!r}.")
+                        continue
+                    with self._franja(cuenta_id):
+                        cuenta = obtener(cuenta_id)
+                        if cuenta is None:
+                            anotar(f"No existe una cuenta con id={cuenta_id}.")
+                            continue
+                        anterior = self._antes_de_mutar(cuenta)
+                        resultado = getattr(cuenta, intentar)(monto)
+                        if resultado:
+                            anotar(MENSAJES[resultado])
+                            continue
+                        anotar(None)
+                        self._despues_de_mutar(cuenta, anterior, movimiento)
+                        if aplicados is not None:
+                            aplicados.append((cuenta_id, a_centavos(monto)))
+            finally:
+                # Aun si algo interrumpe el lote, lo aplicado queda en la bitácora
+                if aplicados:
+                    self._anotar(f"{operacion}_lote", False, aplicados)
+                if self._instrumentacion is not None:
+                    for motivo in estados:
+                        if motivo is not None:
+                            self._instrumentacion.rechazo(f"{operacion}_lote", motivo)
+            return estados
+
+        # Atómico: en modo concurrente se retienen todas las franjas tocadas
+        # hasta confirmar o revertir el lote.
+        movimientos = list(movimientos)
+        totales: Optional[Dict[int, int]] = {}
+        en_centavos: List[Tuple[int, int]] = []  # para la bitácora
+        try:
+            for cuenta_id, monto in movimientos:
+                centavos = a_centavos(monto)
+                if centavos <= 0:
+                    raise ValueError(MENSAJES[MONTO_INVALIDO])
+                totales[cuenta_id] = totales.get(cuenta_id, 0) + centavos
+                en_centavos.append((cuenta_id, centavos))
+        except (TypeError, ValueError):
+            totales = None  # mal formado: _lote_en_orden dice cuál
+        ids = totales if totales is not None else (par[0] for par in movimientos)
+        with self._franjas_de(ids):
+            if totales is not None:
+                previos: List[Tuple[CuentaBase, int]] = []
+                try:
+                    for cuenta_id, total in totales.items():
+                        cuenta = obtener(cuenta_id)
+                        if cuenta is None:
+                            break
+                        previos.append((cuenta, self._antes_de_mutar(cuenta)))
+                        getattr(cuenta, operacion)(a_unidades(total))
+                    else:
+                        for tocada, saldo in previos:
+                            self._despues_de_mutar(tocada, saldo, movimiento)
+                        self._anotar(f"{operacion}_lote", True, en_centavos)
+                        return len(movimientos)
+                except ValueError:
+                    pass
+                except BaseException:
+                    for tocada, saldo in previos:
+                        tocada._restaurar_saldo(saldo)
+                    raise
+                for tocada, saldo in previos:
+                    tocada._restaurar_saldo(saldo)
+            return self._lote_en_orden(movimientos, operacion, movimiento)
+
+    def _lote_en_orden(self, movimientos: List[Tuple[int, float]], operacion: str, movimiento: int) -> int:
+        """
+        Lote atómico movimiento por movimiento (con las franjas ya tomadas):
+        el camino de _aplicar_lote cuando algo no cabe, para informar el
+        primer movimiento que falla.
+        """
+        obtener = self._cuentas.get
+        previos: Dict[int, Tuple[CuentaBase, int]] = {}
+        i = -1
+        par = None
+        try:
+            for i, par in enumerate(movimientos):
+                cuenta_id, monto = par
+                cuenta = obtener(cuenta_id)
+                if cuenta is None:
+                    raise ValueError(f"No existe una cuenta con id={cuenta_id}.")
+                if cuenta_id not in previos:
+                    previos[cuenta_id] = (cuenta, self._antes_de_mutar(cuenta))
+                getattr(cuenta, operacion)(monto)
+        except BaseException as e:
+            # Cualquier error (también TypeError o una interrupción): nada
+            # queda aplicado ni se anota, así memoria y bitácora coinciden
+            for tocada, saldo in previos.values():
+                tocada._restaurar_saldo(saldo)
+            if isinstance(e, ValueError):
+                self._rechazado(f"{operacion}_lote", e)
+                raise ValueError(f"Movimiento #{i} {par!r}: {e} Lote revertido.") from e
+            raise
+        for tocada, saldo in previos.values():
+            self._despues_de_mutar(tocada, saldo, movimiento)
+        self._anotar(f"{operacion}_lote", True, [(cuenta_id, a_centavos(monto)) for cuenta_id, monto in movimientos])
+        return i + 1
+
+    def _liquidar(self, transferencias: List[Tuple[int, int, int]]) -> Dict[int, int]:
+        """Compensa y aplica transferencias ya validadas (montos en centavos)."""
+        netos: Dict[int, int] = {}
+        for origen, destino, centavos in transferencias:
+            netos[origen] = netos.get(origen, 0) - centavos
+            netos[destino] = netos.get(destino, 0) + centavos
+
+        with self._franjas_de(netos):
+            cuentas: Dict[int, CuentaBase] = {}
+            for cuenta_id in netos:
+                cuenta = self._cuentas.get(cuenta_id)
+                if cuenta is None:
+                    raise ValueError(f"No existe una cuenta con id={cuenta_id}.")
+                if not cuenta.activa:
+                    raise ValueError(f"Cuenta id={cuenta_id}: no se puede operar sobre una cuenta cerrada.")
+                cuentas[cuenta_id] = cuenta
+
+            # Débitos primero: son los únicos que pueden no caber
+            orden = sorted(netos, key=netos.__getitem__)
+            previos: List[Tuple[CuentaBase, int]] = []
+            try:
+                for cuenta_id in orden:
+                    neto = netos[cuenta_id]
+                    if neto == 0:
+                        continue
+                    cuenta = cuentas[cuenta_id]
+                    previos.append((cuenta, self._antes_de_mutar(cuenta)))
+                    if neto < 0:
+                        cuenta.retirar(a_unidades(-neto))
+                    else:
+                        cuenta.consignar(a_unidades(neto))
+            except ValueError as e:
+                for tocada, saldo in previos:
+                    tocada._restaurar_saldo(saldo)
+                neto = formatear(netos[cuenta_id])
+                raise ValueError(f"Cuenta id={cuenta_id} (neto {neto}): {e} Lote revertido.") from e
+            for tocada, saldo in previos:
+                movimiento = TRANSFERENCIA_SALIDA if netos[tocada.id] < 0 else TRANSFERENCIA_ENTRADA
+                self._despues_de_mutar(tocada, saldo, movimiento)
+        return netos
+
+    def _franja(self, cuenta_id: int) -> ContextManager:
+        if not self._franjas:
+            return _SIN_BLOQUEO
+        return self._franjas[hash(cuenta_id) % len(self._franjas)]
+
+    def _franjas_de(self, cuenta_ids: Iterable[int]) -> ContextManager:
+        """Toma las franjas de esas cuentas en orden creciente (sin interbloqueo)."""
+        if not self._franjas:
+            return _SIN_BLOQUEO
+        pila = ExitStack()
+        for indice in sorted({hash(cuenta_id) % len(self._franjas) for cuenta_id in cuenta_ids}):
+            pila.enter_context(self._franjas[indice])
+        return pila
+
+    def _todas_las_franjas(self) -> ContextManager:
+        return self._franjas_de(range(len(self._franjas)))
+
+    def _anotar(self, operacion: str, *argumentos) -> None:
+        # Toda operación aplicada pasa por aquí: también es donde se cuenta
+        conteos = self._conteos
+        if conteos is not None:
+            conteos[operacion] = conteos.get(operacion, 0) + 1
+        if self._bitacora is not None:
+            if self._historial is not None:
+                # La hora va con el registro para que el historial la conserve al reproducir
+                self._bitacora.registrar(["hora", self._historial.ahora_ns(), operacion, *argumentos])
+            else:
+                self._bitacora.registrar([operacion, *argumentos])
+
+    def _rechazado(self, operacion: str, error: ValueError) -> None:
+        if self._instrumentacion is not None:
+            self._instrumentacion.rechazo(operacion, str(error))
+
+    def _reproducir(self, registro: list, en_centavos: bool = True) -> None:
+        """Repite un registro de la bitácora (en_centavos=False: formato anterior, montos en unidades)."""
+        operacion, *argumentos = registro
+        unidades = a_unidades if en_centavos else _mismo_monto
+        if operacion == "abrir_ahorros":
+            cuenta_id, titular, saldo, tasa = argumentos
+            CuentaBase._next_id = cuenta_id
+            self.abrir_ahorros(titular, unidades(saldo), tasa)
+        elif operacion == "abrir_corriente":
+            cuenta_id, titular, saldo, cupo, cuota = argumentos
+            CuentaBase._next_id = cuenta_id
+            self.abrir_corriente(titular, unidades(saldo), unidades(cupo), unidades(cuota))
+        elif operacion == "aplicar_corte_mensual_a_todas":
+            try:
+                self.aplicar_corte_mensual_a_todas()
+            except ValueError:
+                pass  # se registró también el corte que falló a mitad
+        elif operacion == "aplicar_corte_mensual_con_reporte":
+            self.aplicar_corte_mensual_con_reporte()
+        elif operacion == "corte_mensual_tramo":
+            periodo, tipo, tramo = argumentos
+            self._aplicar_tramo_corte(periodo, tipo, tramo, ReporteCorte())
+        elif operacion == "corte_mensual_fin":
+            self._cortes.setdefault(argumentos[0], ProgresoCorte(argumentos[0])).terminado = True
+        elif operacion in ("consignar_lote", "retirar_lote"):
+            atomico, movimientos = argumentos
+            movimientos = [(cuenta_id, unidades(monto)) for cuenta_id, monto in movimientos]
+            self._aplicar_lote(movimientos, operacion[: -len("_lote")], atomico)
+        elif operacion == "liquidar_transferencias":
+            transferencias = [(origen, destino, unidades(monto)) for origen, destino, monto in argumentos[0]]
+            self.liquidar_transferencias(transferencias)
+        elif operacion in ("consignar", "retirar", "transferir"):
+            *ids, monto = argumentos
+            getattr(self, operacion)(*ids, unidades(monto))
+        elif operacion in ("cambiar_titular", "cerrar_cuenta", "eliminar_cuenta"):
+            getattr(self, operacion)(*argumentos)
+        else:
+            raise ValueError(f"Operación desconocida en la bitácora: {operacion!r}.")
+
     def _obtener_o_fallar(self, cuenta_id: int) -> CuentaBase:
-        cuenta = self.buscar_por_id(cuenta_id)
+        # Directo al registro: no pasa por buscar_por_id
+        cuenta = self._cuentas.get(cuenta_id)
         if cuenta is None:
             raise ValueError(f"No existe una cuenta con id={cuenta_id}.")
         return cuenta
+
+
+def _transferencia_valida(i: int, transferencia) -> Tuple[int, int, int]:
+    """(origen_id, destino_id, monto) -> (origen_id, destino_id, centavos); ValueError con su número si no sirve."""
+    try:
+        origen, destino, monto = transferencia
+    except (TypeError, ValueError):
+        raise ValueError(
+            f"Transferencia #{i}: se espera (origen_id, destino_id, monto), no {transferencia!r}."
+        ) from None
+    try:
+        origen, destino = operator.index(origen), operator.index(destino)
+    except TypeError:
+        raise ValueError(
+            f"Transferencia #{i}: los ids de cuenta deben ser enteros ({origen!r}, {destino!r})."
+        ) from None
+    try:
+        centavos = a_centavos(monto)
+    except (TypeError, ValueError):
+        raise ValueError(f"Transferencia #{i}: el monto debe ser un número finito, no {monto!r}.") from None
+    if centavos <= 0:
+        raise ValueError(f"Transferencia #{i}: el monto debe ser mayor que 0.")
+    if origen == destino:
+        raise ValueError(f"Transferencia #{i}: el origen y el destino son la misma cuenta.")
+    return origen, destino, centavos
+
+
+def _mismo_monto(monto: float) -> float:
+    """Monto de una bitácora en unidades (formato anterior): se usa tal cual."""
+    return monto
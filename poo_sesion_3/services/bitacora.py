@@ -0,0 +1,133 @@
+# services/bitacora.py
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Iterator, List, Optional
+
+
+class Bitacora:
+    """
+    Bitácora (journal) de solo escritura al final, una operación por línea (JSONL).
+
+    Cada registro es una lista compacta: ["consignar", 3, 5000000] (montos en centavos).
+    BancoService la escribe tras cada operación que modifica estado y la
+    reproduce con BancoService.desde_bitacora para reconstruir el libro.
+
+    Durabilidad (group commit):
+    - fsync_cada=N: fsync cada N registros (1 = cada registro).
+    - fsync_ms=T: un hilo de fondo hace fsync cada T ms si hay pendientes,
+      así un registro no espera a la siguiente escritura (fsync_ms=0: cada
+      registro, como fsync_cada=1).
+    - Sin ninguno: solo se escribe al buffer del proceso; sincronizar() o
+      cerrar() vuelcan a disco.
+    Se pueden combinar: gana el que se cumpla primero.
+
+    Es segura entre hilos: cada registro se escribe completo.
+    """
+
+    def __init__(self, ruta: str, fsync_cada: Optional[int] = None, fsync_ms: Optional[float] = None) -> None:
+        if fsync_cada is not None and fsync_cada < 1:
+            raise ValueError("fsync_cada debe ser >= 1.")
+        if fsync_ms is not None and fsync_ms < 0:
+            raise ValueError("fsync_ms no puede ser negativo.")
+
+        self._ruta = ruta
+        self._fsync_cada = fsync_cada
+        self._fsync_s = None if fsync_ms is None else fsync_ms / 1000.0
+        self._archivo = None
+        self._pendientes = 0
+        self._candado = threading.RLock()
+        self._volcador: Optional[threading.Thread] = None
+        self._detener = threading.Event()
+
+    @property
+    def ruta(self) -> str:
+        return self._ruta
+
+    # -------------------------
+    # Escritura
+    # -------------------------
+    def registrar(self, registro: list) -> None:
+        linea = json.dumps(registro, ensure_ascii=False, separators=(",", ":"), default=str)
+        with self._candado:
+            if self._archivo is None:
+                self._abrir()
+            self._archivo.write(linea + "\n")
+            self._pendientes += 1
+
+            if self._fsync_cada is not None and self._pendientes >= self._fsync_cada:
+                self.sincronizar()
+            elif self._fsync_s == 0:
+                self.sincronizar()
+
+    def sincronizar(self) -> None:
+        """Vuelca el buffer y hace fsync de los registros pendientes."""
+        with self._candado:
+            if self._archivo is None or self._pendientes == 0:
+                return
+            self._archivo.flush()
+            os.fsync(self._archivo.fileno())
+            self._pendientes = 0
+
+    def cerrar(self) -> None:
+        # El volcador se detiene fuera del candado: puede estar esperándolo
+        volcador = self._volcador
+        if volcador is not None:
+            self._detener.set()
+            volcador.join()
+        with self._candado:
+            self._volcador = None
+            if self._archivo is None:
+                return
+            self.sincronizar()
+            self._archivo.close()
+            self._archivo = None
+
+    def _abrir(self) -> None:
+        # Si la última línea quedó a medias (caída), se descarta antes de
+        # seguir escribiendo para no pegarle el siguiente registro.
+        if os.path.exists(self._ruta):
+            with open(self._ruta, "rb+") as f:
+                fin = f.seek(0, os.SEEK_END)
+                pos = fin
+                while pos > 0:
+                    inicio = max(0, pos - 4096)
+                    f.seek(inicio)
+                    bloque = f.read(pos - inicio)
+                    corte = bloque.rfind(b"\n")
+                    if corte != -1:
+                        pos = inicio + corte + 1
+                        break
+                    pos = inicio
+                if pos != fin:
+                    f.truncate(pos)
+        self._archivo = open(self._ruta, "a", encoding="utf-8")
+        if self._fsync_s:
+            self._detener.clear()
+            self._volcador = threading.Thread(target=self._volcar_periodicamente, name="bitacora-fsync", daemon=True)
+            self._volcador.start()
+
+    def _volcar_periodicamente(self) -> None:
+        while not self._detener.wait(self._fsync_s):
+            self.sincronizar()
+
+    # -------------------------
+    # Lectura
+    # -------------------------
+    def leer(self) -> Iterator[List]:
+        """
+        Registros en orden. Una última línea incompleta (caída a mitad de
+        escritura) se ignora; una línea corrupta en medio es un error.
+        """
+        if not os.path.exists(self._ruta):
+            return
+        with open(self._ruta, "r", encoding="utf-8") as f:
+            for numero, linea in enumerate(f, start=1):
+                if not linea.endswith("\n"):
+                    return
+                try:
+                    yield json.loads(linea)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Bitácora corrupta en la línea {numero}.") from e
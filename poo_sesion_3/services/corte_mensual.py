@@ -0,0 +1,72 @@
+# services/corte_mensual.py
+from __future__ import annotations
+
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from models.cuentas import CuentaBase
+from models.dinero import a_unidades
+
+
+class ReporteCorte:
+    """Resultado consolidado de un corte mensual que no se detiene ante errores."""
+
+    def __init__(self) -> None:
+        self.aplicadas: int = 0
+        self.interes_total_centavos: int = 0
+        self.cuotas_total_centavos: int = 0
+        self.rechazadas: List[Tuple[int, str]] = []  # (cuenta_id, motivo)
+
+    @property
+    def interes_total(self) -> float:
+        return a_unidades(self.interes_total_centavos)
+
+    @property
+    def cuotas_total(self) -> float:
+        return a_unidades(self.cuotas_total_centavos)
+
+    def __str__(self) -> str:
+        return (
+            f"ReporteCorte(aplicadas={self.aplicadas}, interes_total={self.interes_total:.2f}, "
+            f"cuotas_total={self.cuotas_total:.2f}, rechazadas={len(self.rechazadas)})"
+        )
+
+
+def corte_con_reporte(
+    cuentas: Iterable[CuentaBase],
+    al_cambiar: Optional[Callable[[CuentaBase, int], None]] = None,
+) -> ReporteCorte:
+    """
+    Aplica aplicar_corte_mensual() a cada cuenta sin abortar: una cuenta que
+    falla (cerrada, cuota que excede el cupo) queda igual y se reporta.
+    al_cambiar(cuenta, saldo_anterior_centavos) se llama por cada cuenta cuyo
+    saldo cambió (p. ej. para mantener agregados).
+
+    Un solo recorrido en el proceso actual: repartir objetos cuenta en un
+    pool de procesos costaba más (empaquetar, reconstruir y copiar de vuelta
+    cada cuenta) que el corte mismo. Para libros grandes, el backend
+    columnar hace este corte vectorizado y puede repartir sus columnas
+    entre procesos (AlmacenColumnar.aplicar_corte_con_reporte).
+    """
+    reporte = ReporteCorte()
+    for cuenta in cuentas:
+        anterior = aplicar_con_reporte(cuenta, reporte)
+        if anterior is not None and al_cambiar is not None and cuenta.saldo_centavos != anterior:
+            al_cambiar(cuenta, anterior)
+    return reporte
+
+
+def aplicar_con_reporte(cuenta: CuentaBase, reporte: ReporteCorte) -> Optional[int]:
+    """Corte de una cuenta anotado en el reporte; saldo anterior si se aplicó, None si se rechazó."""
+    anterior = cuenta.saldo_centavos
+    try:
+        cuenta.aplicar_corte_mensual()
+    except ValueError as e:
+        reporte.rechazadas.append((cuenta.id, str(e)))
+        return None
+    reporte.aplicadas += 1
+    diferencia = cuenta.saldo_centavos - anterior
+    if diferencia > 0:
+        reporte.interes_total_centavos += diferencia
+    elif diferencia < 0:
+        reporte.cuotas_total_centavos -= diferencia
+    return anterior
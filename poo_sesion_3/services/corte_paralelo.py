@@ -0,0 +1,128 @@
+# services/corte_paralelo.py
+"""
+Corte mensual con reporte repartido entre procesos (backend columnar).
+
+Las columnas que usa el corte se copian a un bloque de memoria compartida
+(multiprocessing.shared_memory) y cada proceso aplica corte_columnas a un
+tramo contiguo de filas; las filas van en orden de apertura, así que con
+ids crecientes cada tramo es un rango de ids. Los procesos escriben los
+saldos en el bloque; el proceso principal los copia de vuelta y junta
+los reportes de los tramos en orden de fila.
+
+Requiere numpy (lo importa services/almacen_columnar.py).
+"""
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from services.almacen_columnar import AlmacenColumnar, corte_columnas
+
+# Columnas que se copian al bloque, en ese orden: las de 8 bytes primero
+# para que todas queden alineadas
+COLUMNAS: Tuple[Tuple[str, type], ...] = (
+    ("saldo", np.int64),
+    ("tasa_interes", np.float64),
+    ("cupo_sobregiro", np.int64),
+    ("cuota_manejo", np.int64),
+    ("tipo", np.int8),
+    ("activa", np.bool_),
+)
+
+# Un solo pool por proceso, reutilizado entre cortes: arrancar procesos
+# (que importan numpy) cuesta más que el corte de un libro mediano
+_ejecutor: Optional[ProcessPoolExecutor] = None
+_procesos_ejecutor = 0
+_candado_ejecutor = threading.Lock()
+
+
+def corte_por_tramos(almacen: AlmacenColumnar, procesos: int):
+    """
+    corte_columnas sobre todo el almacén, en `procesos` tramos de filas
+    contiguas. Devuelve lo mismo que corte_columnas, con filas absolutas.
+    """
+    n = len(almacen)
+    memoria = SharedMemory(create=True, size=max(1, n * sum(np.dtype(t).itemsize for _, t in COLUMNAS)))
+    try:
+        columnas = _columnas(memoria, n)
+        for (nombre, _), columna in zip(COLUMNAS, columnas):
+            columna[:] = getattr(almacen, nombre)[:n]
+
+        cortes = [n * i // procesos for i in range(procesos + 1)]
+        tramos = [(desde, hasta) for desde, hasta in zip(cortes, cortes[1:]) if hasta > desde]
+        ejecutor = _obtener_ejecutor(procesos)
+        futuros = [ejecutor.submit(_corte_tramo, memoria.name, n, desde, hasta) for desde, hasta in tramos]
+        # Todos terminan antes de copiar (o de liberar el bloque si alguno falló)
+        wait(futuros)
+        partes = [futuro.result() for futuro in futuros]
+        almacen.saldo[:n] = columnas[0]
+        del columnas, columna
+        memoria.close()
+    finally:
+        memoria.unlink()
+
+    aplicadas = interes = cuotas = 0
+    filas: List[np.ndarray] = []
+    cerradas: List[np.ndarray] = []
+    for (desde, _), (a, i, c, f, cerrada) in zip(tramos, partes):
+        aplicadas += a
+        interes += i
+        cuotas += c
+        filas.append(f + desde)
+        cerradas.append(cerrada)
+    if not filas:
+        return 0, 0, 0, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.bool_)
+    return aplicadas, interes, cuotas, np.concatenate(filas), np.concatenate(cerradas)
+
+
+def cerrar_procesos() -> None:
+    """Termina los procesos del pool (se vuelven a crear en el próximo corte)."""
+    global _ejecutor, _procesos_ejecutor
+    with _candado_ejecutor:
+        if _ejecutor is not None:
+            _ejecutor.shutdown()
+        _ejecutor = None
+        _procesos_ejecutor = 0
+
+
+# -------------------------
+# Internos
+# -------------------------
+def _columnas(memoria: SharedMemory, n: int) -> List[np.ndarray]:
+    """Vistas de las columnas dentro del bloque (n filas cada una)."""
+    columnas = []
+    desplazamiento = 0
+    for _, tipo in COLUMNAS:
+        columnas.append(np.ndarray((n,), dtype=tipo, buffer=memoria.buf, offset=desplazamiento))
+        desplazamiento += n * np.dtype(tipo).itemsize
+    return columnas
+
+
+def _corte_tramo(nombre: str, n: int, desde: int, hasta: int):
+    """En el proceso hijo: corte de las filas [desde, hasta) del bloque."""
+    memoria = SharedMemory(name=nombre)
+    try:
+        columnas = _columnas(memoria, n)
+        resultado = corte_columnas(*(columna[desde:hasta] for columna in columnas))
+        del columnas
+        return resultado
+    finally:
+        memoria.close()
+
+
+def _obtener_ejecutor(procesos: int) -> ProcessPoolExecutor:
+    """El pool compartido, recreado si cambia la cantidad de procesos."""
+    global _ejecutor, _procesos_ejecutor
+    with _candado_ejecutor:
+        if _ejecutor is None or _procesos_ejecutor != procesos:
+            if _ejecutor is not None:
+                _ejecutor.shutdown()
+            # spawn y no fork: el servicio puede tener hilos con candados tomados
+            _ejecutor = ProcessPoolExecutor(procesos, mp_context=multiprocessing.get_context("spawn"))
+            _procesos_ejecutor = procesos
+        return _ejecutor
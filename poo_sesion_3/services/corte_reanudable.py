@@ -0,0 +1,47 @@
+# services/corte_reanudable.py
+from __future__ import annotations
+
+from typing import Dict
+
+from services.corte_mensual import ReporteCorte
+
+
+class ProgresoCorte:
+    """
+    Avance del corte reanudable de un periodo: hasta qué id llegó en cada
+    tipo de cuenta y si terminó. Vive en el servicio y se reconstruye al
+    reproducir la bitácora (cada tramo anotado es un punto de control).
+    """
+
+    def __init__(self, periodo: str) -> None:
+        self.periodo = periodo
+        self.ultimo_id: Dict[str, int] = {}  # tipo -> último id procesado
+        self.cuentas: int = 0  # recorridas: aplicadas, rechazadas o ya cerradas
+        self.tramos: int = 0
+        self.terminado: bool = False
+
+    def __str__(self) -> str:
+        estado = "terminado" if self.terminado else "en curso"
+        return f"ProgresoCorte(periodo={self.periodo!r}, cuentas={self.cuentas}, tramos={self.tramos}, {estado})"
+
+
+class ReporteCorteReanudable(ReporteCorte):
+    """
+    Lo hecho en UNA llamada a aplicar_corte_mensual_reanudable (al reanudar
+    no incluye los tramos de la ejecución anterior; ver ProgresoCorte).
+    """
+
+    def __init__(self, periodo: str) -> None:
+        super().__init__()
+        self.periodo = periodo
+        self.tramos: int = 0
+        self.reanudado: bool = False  # el periodo ya tenía tramos aplicados
+        self.ya_aplicado: bool = False  # el periodo ya estaba terminado: no se hizo nada
+
+    def __str__(self) -> str:
+        return (
+            f"ReporteCorteReanudable(periodo={self.periodo!r}, aplicadas={self.aplicadas}, "
+            f"interes_total={self.interes_total:.2f}, cuotas_total={self.cuotas_total:.2f}, "
+            f"rechazadas={len(self.rechazadas)}, tramos={self.tramos}, reanudado={self.reanudado}, "
+            f"ya_aplicado={self.ya_aplicado})"
+        )
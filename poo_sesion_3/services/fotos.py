@@ -0,0 +1,139 @@
+# services/fotos.py
+from __future__ import annotations
+
+import weakref
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from models.cuentas import CuentaBase
+from models.dinero import a_unidades, formatear
+
+# Estado de una cuenta guardado antes de modificarla: (tipo, titular, saldo en centavos, activa)
+_Estado = Tuple[str, str, int, bool]
+
+
+class CuentaFoto:
+    """Cuenta tal como estaba al tomar la foto (solo lectura)."""
+
+    __slots__ = ("id", "tipo", "titular", "saldo_centavos", "activa")
+
+    def __init__(self, cuenta_id: int, tipo: str, titular: str, saldo_centavos: int, activa: bool) -> None:
+        self.id = cuenta_id
+        self.tipo = tipo
+        self.titular = titular
+        self.saldo_centavos = saldo_centavos
+        self.activa = activa
+
+    @property
+    def saldo(self) -> float:
+        return a_unidades(self.saldo_centavos)
+
+    def __str__(self) -> str:
+        estado = "activa" if self.activa else "cerrada"
+        return (
+            f"{self.tipo}(id={self.id}, titular='{self.titular}', "
+            f"saldo={formatear(self.saldo_centavos)}, estado={estado})"
+        )
+
+
+class FotoLibro:
+    """
+    Vista de solo lectura del libro en un instante (BancoService.snapshot()).
+
+    Copia en escritura por cuenta: crearla es O(1) (guarda el límite de ids
+    y la lista ordenada de ids del servicio) y, mientras está abierta, el
+    servicio guarda el estado previo de cada cuenta la primera vez que la
+    modifica o la elimina. La memoria crece solo con las cuentas tocadas.
+
+    Leer no toma candados: una cuenta se lee viva y, si ya tiene estado
+    previo guardado, se usa ese (el servicio lo guarda antes de modificar).
+    Las cuentas abiertas después de la foto no aparecen.
+
+    cerrar() (o usarla en un with) deja de copiar; si se pierde la
+    referencia, se cierra sola al recolectarse.
+    """
+
+    def __init__(
+        self,
+        ids: List[int],
+        cantidad: int,
+        limite_id: int,
+        obtener: Callable[[int], Optional[CuentaBase]],
+        al_cerrar: Callable[["weakref.ref"], None],
+    ) -> None:
+        self._ids = ids  # solo se leen las primeras `cantidad` posiciones
+        self._cantidad = cantidad
+        self._limite_id = limite_id
+        self._obtener = obtener
+        self._previos: Dict[int, _Estado] = {}
+        self._ref = weakref.ref(self, al_cerrar)
+        self._al_cerrar = al_cerrar
+        self._abierta = True
+
+    # -------------------------
+    # Consultas
+    # -------------------------
+    def buscar_por_id(self, cuenta_id: int) -> Optional[CuentaFoto]:
+        if cuenta_id >= self._limite_id:
+            return None
+        return self._leer(cuenta_id)
+
+    def __iter__(self) -> Iterator[CuentaFoto]:
+        """Cuentas por id (las eliminadas después de la foto incluidas)."""
+        ids = self._ids
+        for posicion in range(self._cantidad):
+            cuenta = self._leer(ids[posicion])
+            if cuenta is not None:
+                yield cuenta
+
+    @property
+    def cuentas_copiadas(self) -> int:
+        """Cuentas cuyo estado previo se guardó (memoria usada por la foto)."""
+        return len(self._previos)
+
+    # -------------------------
+    # Ciclo de vida
+    # -------------------------
+    @property
+    def abierta(self) -> bool:
+        return self._abierta
+
+    def cerrar(self) -> None:
+        if self._abierta:
+            self._abierta = False
+            self._al_cerrar(self._ref)
+
+    def __enter__(self) -> "FotoLibro":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
+
+    # -------------------------
+    # Uso del servicio
+    # -------------------------
+    def guardar_previo(self, cuenta: CuentaBase) -> None:
+        """Antes de modificar o eliminar `cuenta` (solo la primera vez cuenta)."""
+        if cuenta.id < self._limite_id and cuenta.id not in self._previos:
+            self._previos[cuenta.id] = _estado(cuenta)
+
+    def _leer(self, cuenta_id: int) -> Optional[CuentaFoto]:
+        # Primero la cuenta viva y después el previo: si un escritor la
+        # modificó entre medio, el previo ya está guardado y gana.
+        cuenta = self._obtener(cuenta_id)
+        estado = _estado(cuenta) if cuenta is not None else None
+        estado = self._previos.get(cuenta_id, estado)
+        if estado is None:
+            return None  # eliminada antes de la foto
+        return CuentaFoto(cuenta_id, *estado)
+
+
+def guardar_previos(fotos: List["weakref.ref"], cuenta: CuentaBase) -> None:
+    """Guarda el estado de `cuenta` en cada foto abierta (fotos: referencias débiles)."""
+    for ref in tuple(fotos):
+        foto = ref()
+        if foto is not None:
+            foto.guardar_previo(cuenta)
+
+
+def _estado(cuenta: CuentaBase) -> _Estado:
+    return (cuenta.tipo(), cuenta.titular, cuenta.saldo_centavos, cuenta.activa)
@@ -0,0 +1,171 @@
+# services/historial.py
+from __future__ import annotations
+
+import sys
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from models.dinero import a_unidades, formatear
+
+# Tipos de movimiento (código en el arreglo de tipos -> nombre)
+APERTURA = 0
+CONSIGNACION = 1
+RETIRO = 2
+INTERES = 3
+CUOTA = 4
+TRANSFERENCIA_ENTRADA = 5
+TRANSFERENCIA_SALIDA = 6
+NOMBRES = {
+    APERTURA: "apertura",
+    CONSIGNACION: "consignacion",
+    RETIRO: "retiro",
+    INTERES: "interes",
+    CUOTA: "cuota",
+    TRANSFERENCIA_ENTRADA: "transferencia_entrada",
+    TRANSFERENCIA_SALIDA: "transferencia_salida",
+}
+
+
+class Movimiento:
+    """Un movimiento de un extracto (se crea solo al consultar)."""
+
+    __slots__ = ("fecha", "tipo", "monto_centavos", "saldo_centavos")
+
+    def __init__(self, fecha: float, tipo: str, monto_centavos: int, saldo_centavos: int) -> None:
+        self.fecha = fecha  # segundos desde epoch
+        self.tipo = tipo
+        self.monto_centavos = monto_centavos  # con signo: negativo = salida
+        self.saldo_centavos = saldo_centavos  # saldo después del movimiento
+
+    @property
+    def monto(self) -> float:
+        return a_unidades(self.monto_centavos)
+
+    @property
+    def saldo(self) -> float:
+        return a_unidades(self.saldo_centavos)
+
+    def __str__(self) -> str:
+        fecha = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.fecha))
+        return f"{fecha} {self.tipo:<22} {formatear(self.monto_centavos):>14} {formatear(self.saldo_centavos):>14}"
+
+
+class _Serie:
+    """Movimientos de una cuenta en arreglos tipados paralelos (25 bytes por movimiento)."""
+
+    __slots__ = ("tiempos", "tipos", "montos", "saldos")
+
+    def __init__(self) -> None:
+        self.tiempos = array("q")  # ns desde epoch, no decrecientes
+        self.tipos = array("b")
+        self.montos = array("q")  # centavos, con signo
+        self.saldos = array("q")  # centavos, saldo después del movimiento
+
+
+class HistorialMovimientos:
+    """
+    Historial de movimientos por cuenta para extractos.
+
+    Cada cuenta tiene una serie de arreglos tipados (array) con tiempo,
+    tipo, monto y saldo resultante: sin un objeto por movimiento. Los
+    tiempos de una cuenta nunca decrecen, así un rango de fechas se ubica
+    con búsqueda binaria (O(log n) + lo devuelto) y el saldo a una fecha
+    es el de la última fila anterior.
+
+    BancoService(historial=True) lo alimenta desde sus operaciones; los
+    cambios hechos directamente sobre una cuenta no se registran. Con
+    bitácora, cada operación anota la hora (ahora_ns) y desde_bitacora la
+    restaura con hora_fija: los movimientos reproducidos llevan la hora de
+    su operación (microsegundos después de la original, la misma para
+    todos los de una operación).
+    """
+
+    def __init__(self) -> None:
+        self._series: Dict[int, _Serie] = {}
+        # Reloj monotónico anclado a la hora actual: nunca retrocede (orden
+        # garantizado sin comparar en cada registro) aunque se ajuste la hora
+        # del sistema; el costo es no seguir esos ajustes.
+        self._origen_ns = time.time_ns() - time.monotonic_ns()
+        self._hora_fija_ns: Optional[int] = None
+
+    def ahora_ns(self) -> int:
+        """Hora (ns desde epoch) que llevaría un movimiento registrado ahora."""
+        if self._hora_fija_ns is not None:
+            return self._hora_fija_ns
+        return self._origen_ns + time.monotonic_ns()
+
+    @contextmanager
+    def hora_fija(self, ns: int) -> Iterator[None]:
+        """Los movimientos registrados dentro llevan la hora `ns` (al reproducir una bitácora)."""
+        self._hora_fija_ns = ns
+        try:
+            yield
+        finally:
+            self._hora_fija_ns = None
+
+    def registrar(self, cuenta_id: int, tipo: int, monto_centavos: int, saldo_centavos: int) -> None:
+        serie = self._series.get(cuenta_id)
+        if serie is None:
+            serie = self._series[cuenta_id] = _Serie()
+        momento = self._hora_fija_ns
+        if momento is None:
+            momento = self._origen_ns + time.monotonic_ns()
+        elif serie.tiempos and momento < serie.tiempos[-1]:
+            momento = serie.tiempos[-1]  # una hora anotada no rompe el orden de la serie
+        serie.tiempos.append(momento)
+        serie.tipos.append(tipo)
+        serie.montos.append(monto_centavos)
+        serie.saldos.append(saldo_centavos)
+
+    # -------------------------
+    # Consultas
+    # -------------------------
+    def cantidad(self, cuenta_id: int) -> int:
+        serie = self._series.get(cuenta_id)
+        return len(serie.tiempos) if serie is not None else 0
+
+    def extracto(
+        self, cuenta_id: int, desde: Optional[float] = None, hasta: Optional[float] = None
+    ) -> List[Movimiento]:
+        """Movimientos con desde <= fecha <= hasta (segundos desde epoch; None = sin límite)."""
+        serie = self._series.get(cuenta_id)
+        if serie is None:
+            return []
+        inicio = 0 if desde is None else bisect_left(serie.tiempos, _a_ns(desde))
+        fin = len(serie.tiempos) if hasta is None else bisect_right(serie.tiempos, _a_ns(hasta))
+        tiempos, tipos, montos, saldos = serie.tiempos, serie.tipos, serie.montos, serie.saldos
+        return [
+            Movimiento(tiempos[i] / 1e9, NOMBRES[tipos[i]], montos[i], saldos[i]) for i in range(inicio, fin)
+        ]
+
+    def saldo_al(self, cuenta_id: int, momento: float) -> Optional[int]:
+        """Saldo en centavos a esa fecha (None si la cuenta aún no tenía movimientos)."""
+        serie = self._series.get(cuenta_id)
+        if serie is None:
+            return None
+        posicion = bisect_right(serie.tiempos, _a_ns(momento))
+        return serie.saldos[posicion - 1] if posicion else None
+
+    def memoria(self) -> Dict[str, float]:
+        """Bytes usados (arreglos y estructura) y bytes por movimiento."""
+        movimientos = 0
+        arreglos = 0
+        for serie in self._series.values():
+            movimientos += len(serie.tiempos)
+            for columna in (serie.tiempos, serie.tipos, serie.montos, serie.saldos):
+                arreglos += sys.getsizeof(columna)
+        estructura = sys.getsizeof(self._series) + sys.getsizeof(_Serie()) * len(self._series)
+        total = arreglos + estructura
+        return {
+            "movimientos": movimientos,
+            "cuentas": len(self._series),
+            "bytes": total,
+            "bytes_por_movimiento": total / movimientos if movimientos else 0.0,
+        }
+
+
+def _a_ns(segundos: float) -> int:
+    return int(segundos * 1_000_000_000)
@@ -0,0 +1,259 @@
+# services/importador.py
+from __future__ import annotations
+
+import csv
+import json
+import time
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+# Columnas de cada operación: (nombre, valor por defecto); None = obligatoria
+_CAMPOS = {
+    "abrir_ahorros": (("titular", None), ("saldo_inicial", 0.0), ("tasa_interes", 0.01)),
+    "abrir_corriente": (("titular", None), ("saldo_inicial", 0.0), ("cupo_sobregiro", 0.0), ("cuota_manejo", 0.0)),
+    "consignar": (("cuenta", None), ("monto", None)),
+    "retirar": (("cuenta", None), ("monto", None)),
+}
+# Campos que no son números
+_TEXTO = {"titular", "cuenta"}
+
+# (línea, fila original, operación, argumentos); operación None = rechazada y
+# argumentos = (motivo,)
+_Fila = Tuple[int, object, Optional[str], tuple]
+
+
+class ReporteImportacion:
+    """Conteos de una importación (también se pasa a progreso() durante la carga)."""
+
+    def __init__(self) -> None:
+        self.filas: int = 0
+        self.cuentas: int = 0
+        self.movimientos: int = 0
+        self.rechazadas: int = 0
+        self.segundos: float = 0.0
+
+    @property
+    def filas_por_segundo(self) -> float:
+        return self.filas / self.segundos if self.segundos > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"ReporteImportacion(filas={self.filas}, cuentas={self.cuentas}, movimientos={self.movimientos}, "
+            f"rechazadas={self.rechazadas}, filas_por_segundo={self.filas_por_segundo:.0f})"
+        )
+
+
+def importar(
+    banco,
+    ruta: str,
+    rechazos: Optional[str] = None,
+    formato: Optional[str] = None,
+    bloque: int = 10_000,
+    progreso: Optional[Callable[[ReporteImportacion], None]] = None,
+) -> ReporteImportacion:
+    """
+    Importa cuentas y movimientos desde un CSV (con encabezado) o un JSONL
+    (un objeto por línea). formato=None lo deduce de la extensión.
+
+    Cada fila tiene `operacion` y las columnas de esa operación:
+    - abrir_ahorros: titular, saldo_inicial, tasa_interes [, clave]
+    - abrir_corriente: titular, saldo_inicial, cupo_sobregiro, cuota_manejo [, clave]
+    - consignar / retirar: cuenta, monto
+    `cuenta` es el id de una cuenta existente o la `clave` con que se abrió
+    más arriba en el mismo archivo (la clave gana si coinciden).
+
+    Es una tubería de generadores (leer -> interpretar -> bloques): en
+    memoria solo hay un bloque de filas y las claves declaradas. Las reglas
+    son las de las propias cuentas y del servicio; una fila que no las
+    cumple se escribe en `rechazos` (JSONL: linea, motivo, fila) y la carga
+    sigue. Las filas se aplican en orden, por bloques: las aperturas con
+    una sola toma del candado de registro y los movimientos con
+    consignar_lote/retirar_lote en modo mejor esfuerzo.
+
+    progreso(reporte) se llama después de cada bloque.
+    """
+    if bloque < 1:
+        raise ValueError("El bloque debe ser de al menos una fila.")
+    formato = formato or _formato_de(ruta)
+    reporte = ReporteImportacion()
+    claves: Dict[str, int] = {}
+    inicio = time.perf_counter()
+
+    salida = open(rechazos, "w", encoding="utf-8") if rechazos is not None else None
+    try:
+        with open(ruta, newline="", encoding="utf-8") as entrada:
+            for filas in en_bloques(interpretar(leer_filas(entrada, formato)), bloque):
+                _aplicar_bloque(banco, filas, claves, reporte, salida)
+                reporte.segundos = time.perf_counter() - inicio
+                if progreso is not None:
+                    progreso(reporte)
+    finally:
+        if salida is not None:
+            salida.close()
+    reporte.segundos = time.perf_counter() - inicio
+    return reporte
+
+
+# -------------------------
+# Etapas de la tubería
+# -------------------------
+def leer_filas(entrada: TextIO, formato: str) -> Iterator[Tuple[int, object]]:
+    """(número de línea, fila). En JSONL una línea que no es JSON llega como texto."""
+    if formato == "csv":
+        lector = csv.DictReader(entrada)
+        for fila in lector:
+            yield lector.line_num, fila
+    elif formato == "jsonl":
+        for numero, linea in enumerate(entrada, start=1):
+            if not linea.strip():
+                continue
+            try:
+                yield numero, json.loads(linea)
+            except ValueError:
+                yield numero, linea.rstrip("\n")
+    else:
+        raise ValueError(f"Formato no soportado: {formato!r} (use 'csv' o 'jsonl').")
+
+
+def interpretar(filas: Iterable[Tuple[int, object]]) -> Iterator[_Fila]:
+    """Valida la forma de cada fila (operación, campos, números) sin tocar el banco."""
+    for numero, fila in filas:
+        if not isinstance(fila, dict):
+            yield numero, fila, None, ("La línea no es un objeto JSON.",)
+            continue
+        try:
+            operacion, argumentos = _argumentos(fila)
+        except ValueError as e:
+            yield numero, fila, None, (str(e),)
+        else:
+            yield numero, fila, operacion, argumentos
+
+
+def en_bloques(filas: Iterable[_Fila], tamano: int) -> Iterator[List[_Fila]]:
+    iterador = iter(filas)
+    while True:
+        filas_bloque = list(islice(iterador, tamano))
+        if not filas_bloque:
+            return
+        yield filas_bloque
+
+
+# -------------------------
+# Internos
+# -------------------------
+def _formato_de(ruta: str) -> str:
+    if ruta.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    if ruta.endswith(".csv"):
+        return "csv"
+    raise ValueError(f"No se puede deducir el formato de {ruta!r}: indique formato='csv' o 'jsonl'.")
+
+
+def _argumentos(fila: dict) -> Tuple[str, tuple]:
+    operacion = fila.get("operacion")
+    campos = _CAMPOS.get(operacion) if isinstance(operacion, str) else None
+    if campos is None:
+        raise ValueError(f"Operación desconocida: {operacion!r}.")
+    argumentos = []
+    for nombre, defecto in campos:
+        valor = fila.get(nombre)
+        if valor is None or valor == "":
+            if defecto is None:
+                raise ValueError(f"Falta el campo {nombre!r}.")
+            valor = defecto
+        elif nombre in _TEXTO:
+            valor = str(valor)
+        elif isinstance(valor, str):
+            try:
+                valor = float(valor)
+            except ValueError:
+                raise ValueError(f"El campo {nombre!r} no es un número: {valor!r}.") from None
+        elif isinstance(valor, bool) or not isinstance(valor, (int, float)):
+            raise ValueError(f"El campo {nombre!r} no es un número: {valor!r}.")
+        argumentos.append(valor)
+    if operacion.startswith("abrir_"):
+        clave = fila.get("clave")
+        argumentos.append(None if clave in (None, "") else str(clave))
+    return operacion, tuple(argumentos)
+
+
+def _aplicar_bloque(
+    banco, filas: List[_Fila], claves: Dict[str, int], reporte: ReporteImportacion, salida: Optional[TextIO]
+) -> None:
+    """Aplica el bloque en orden, por tramos consecutivos del mismo tipo de operación."""
+    reporte.filas += len(filas)
+    inicio = 0
+    while inicio < len(filas):
+        operacion = filas[inicio][2]
+        apertura = operacion is not None and operacion.startswith("abrir_")
+        fin = inicio + 1
+        while fin < len(filas) and _mismo_tramo(filas[fin][2], operacion, apertura):
+            fin += 1
+        tramo = filas[inicio:fin]
+        if operacion is None:
+            for numero, fila, _, (motivo,) in tramo:
+                _rechazar(reporte, salida, numero, fila, motivo)
+        elif apertura:
+            _abrir(banco, tramo, claves, reporte, salida)
+        else:
+            _mover(banco, tramo, operacion, claves, reporte, salida)
+        inicio = fin
+
+
+def _mismo_tramo(operacion: Optional[str], del_tramo: Optional[str], apertura: bool) -> bool:
+    if apertura:
+        return operacion is not None and operacion.startswith("abrir_")
+    return operacion == del_tramo
+
+
+def _abrir(banco, tramo: List[_Fila], claves: Dict[str, int], reporte, salida) -> None:
+    aceptadas = []
+    nuevas = set()
+    for numero, fila, operacion, argumentos in tramo:
+        clave = argumentos[-1]
+        if clave is not None and (clave in claves or clave in nuevas):
+            _rechazar(reporte, salida, numero, fila, f"La clave {clave!r} ya fue declarada.")
+            continue
+        nuevas.add(clave)
+        aceptadas.append((numero, fila, operacion, argumentos))
+
+    resultados = banco._abrir_bloque([(operacion, argumentos[:-1]) for _, _, operacion, argumentos in aceptadas])
+    for (numero, fila, _, argumentos), resultado in zip(aceptadas, resultados):
+        if isinstance(resultado, str):
+            _rechazar(reporte, salida, numero, fila, resultado)
+            continue
+        reporte.cuentas += 1
+        if argumentos[-1] is not None:
+            claves[argumentos[-1]] = resultado.id
+
+
+def _mover(banco, tramo: List[_Fila], operacion: str, claves: Dict[str, int], reporte, salida) -> None:
+    aceptadas = []
+    movimientos = []
+    for numero, fila, _, (referencia, monto) in tramo:
+        cuenta_id = claves.get(referencia)
+        if cuenta_id is None:
+            try:
+                cuenta_id = int(referencia)
+            except ValueError:
+                _rechazar(reporte, salida, numero, fila, f"Cuenta desconocida: {referencia!r}.")
+                continue
+        aceptadas.append((numero, fila))
+        movimientos.append((cuenta_id, monto))
+    if not movimientos:
+        return
+
+    aplicar_lote = banco.consignar_lote if operacion == "consignar" else banco.retirar_lote
+    estados = aplicar_lote(movimientos, atomico=False)
+    for (numero, fila), motivo in zip(aceptadas, estados):
+        if motivo is None:
+            reporte.movimientos += 1
+        else:
+            _rechazar(reporte, salida, numero, fila, motivo)
+
+
+def _rechazar(reporte: ReporteImportacion, salida: Optional[TextIO], numero: int, fila: object, motivo: str) -> None:
+    reporte.rechazadas += 1
+    if salida is not None:
+        registro = {"linea": numero, "motivo": motivo, "fila": fila}
+        salida.write(json.dumps(registro, ensure_ascii=False, default=str) + "\n")
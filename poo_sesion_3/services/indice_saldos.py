@@ -0,0 +1,268 @@
+# services/indice_saldos.py
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from models.cuentas import CuentaBase, CuentaCorriente
+from models.dinero import a_unidades, formatear
+
+# Clave de orden = valor << _BITS_ID | id: un solo int (comparar ints es
+# mucho más barato que comparar tuplas) y el id desempata valores iguales.
+_BITS_ID = 40
+_MASCARA_ID = (1 << _BITS_ID) - 1
+
+# Utilización del cupo en la clave: fracción * _ESCALA (entero)
+_ESCALA = 10**9
+
+# Tamaño de referencia de cada bloque: se parte al doble
+_CARGA = 512
+
+
+def _clave(valor: int, cuenta_id: int) -> int:
+    return (valor << _BITS_ID) | cuenta_id
+
+
+def _utilizacion(saldo: int, cupo: int) -> int:
+    return -saldo * _ESCALA // cupo  # saldo < 0 implica cupo > 0
+
+
+class _ListaOrdenada:
+    """
+    Ints ordenados en bloques: una lista de bloques ordenados de a lo sumo
+    2 * _CARGA elementos y, aparte, el último de cada bloque. Ubicar un
+    valor es una búsqueda binaria sobre esos máximos y otra dentro del
+    bloque; insertar o quitar mueve solo ese bloque. Así actualizar cuesta
+    O(log n + _CARGA) (un memmove pequeño) y recorrer k elementos desde
+    cualquier punto, O(log n + k).
+    """
+
+    def __init__(self, valores: Iterable[int] = ()) -> None:
+        ordenados = sorted(valores)
+        self._bloques: List[List[int]] = [ordenados[i : i + _CARGA] for i in range(0, len(ordenados), _CARGA)]
+        self._maximos: List[int] = [bloque[-1] for bloque in self._bloques]
+        self._cantidad = len(ordenados)
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    def agregar(self, valor: int) -> None:
+        self._cantidad += 1
+        if not self._bloques:
+            self._bloques.append([valor])
+            self._maximos.append(valor)
+            return
+        posicion = bisect_left(self._maximos, valor)
+        if posicion == len(self._bloques):
+            posicion -= 1  # mayor que todos: va al final del último bloque
+        bloque = self._bloques[posicion]
+        insort(bloque, valor)
+        self._maximos[posicion] = bloque[-1]
+        if len(bloque) > 2 * _CARGA:
+            self._bloques.insert(posicion + 1, bloque[_CARGA:])
+            del bloque[_CARGA:]
+            self._maximos[posicion] = bloque[-1]
+            self._maximos.insert(posicion + 1, self._bloques[posicion + 1][-1])
+
+    def quitar(self, valor: int) -> None:
+        posicion, indice = self._ubicar(valor)
+        bloque = self._bloques[posicion]
+        del bloque[indice]
+        self._cantidad -= 1
+        if bloque:
+            self._maximos[posicion] = bloque[-1]
+        else:
+            del self._bloques[posicion]
+            del self._maximos[posicion]
+
+    def reemplazar(self, anterior: int, valor: int) -> None:
+        """
+        quitar(anterior) + agregar(valor). Un movimiento pequeño suele dejar
+        el valor en el mismo bloque: entonces basta una búsqueda entre
+        bloques y se reacomoda solo ese.
+        """
+        posicion, indice = self._ubicar(anterior)
+        maximos = self._maximos
+        if (posicion == 0 or maximos[posicion - 1] < valor) and (
+            valor <= maximos[posicion] or posicion == len(maximos) - 1
+        ):
+            bloque = self._bloques[posicion]
+            del bloque[indice]
+            insort(bloque, valor)
+            maximos[posicion] = bloque[-1]
+            return
+        self.quitar(anterior)
+        self.agregar(valor)
+
+    def mayores(self, n: Optional[int] = None) -> Iterator[int]:
+        """Los n mayores (None = todos), de mayor a menor."""
+        restantes = self._cantidad if n is None else n
+        for bloque in reversed(self._bloques):
+            if restantes <= 0:
+                return
+            tramo = bloque[::-1] if restantes >= len(bloque) else bloque[: -restantes - 1 : -1]
+            restantes -= len(tramo)
+            yield from tramo
+
+    def menores(self, hasta: Optional[int]) -> Iterator[int]:
+        """Valores <= hasta (None = sin límite), de mayor a menor."""
+        bloques = self._bloques
+        posicion = len(bloques) - 1
+        fin = None
+        if hasta is not None and bloques:
+            posicion = min(bisect_left(self._maximos, hasta), posicion)
+            fin = bisect_right(bloques[posicion], hasta)
+        for bloque in bloques[posicion::-1] if bloques else ():
+            yield from (bloque if fin is None else bloque[:fin])[::-1]
+            fin = None
+
+    def rango(self, desde: Optional[int], hasta: Optional[int]) -> Iterator[int]:
+        """Valores con desde <= valor <= hasta (None = sin límite), de menor a mayor."""
+        posicion = indice = 0
+        if desde is not None:
+            posicion = bisect_left(self._maximos, desde)
+            if posicion < len(self._bloques):
+                indice = bisect_left(self._bloques[posicion], desde)
+        for bloque in self._bloques[posicion:]:
+            if hasta is not None and bloque[-1] > hasta:
+                yield from bloque[indice : bisect_right(bloque, hasta)]
+                return
+            yield from bloque[indice:]
+            indice = 0
+
+    def _ubicar(self, valor: int) -> Tuple[int, int]:
+        """(bloque, posición en el bloque) de un valor presente; KeyError si no está."""
+        posicion = bisect_left(self._maximos, valor)
+        if posicion < len(self._bloques):
+            bloque = self._bloques[posicion]
+            indice = bisect_left(bloque, valor)
+            if indice < len(bloque) and bloque[indice] == valor:
+                return posicion, indice
+        raise KeyError(valor)
+
+
+class IndiceSaldos:
+    """
+    Cuentas ordenadas por saldo y, aparte, las que están en sobregiro
+    ordenadas por la fracción de su cupo que usan. Las consultas devuelven
+    ids; ver _ListaOrdenada para los costos.
+
+    Solo una cuenta corriente puede tener saldo negativo, así el segundo
+    orden se mantiene sin preguntar el tipo: basta mirar el signo.
+
+    BancoService(indice_saldos=True) lo alimenta desde sus operaciones,
+    igual que los agregados; los ids deben caber en _BITS_ID bits.
+    """
+
+    def __init__(self) -> None:
+        self._saldos = _ListaOrdenada()
+        self._sobregiros = _ListaOrdenada()
+
+    @classmethod
+    def desde_cuentas(cls, cuentas: Iterable[CuentaBase]) -> "IndiceSaldos":
+        indice = cls()
+        saldos: List[int] = []
+        sobregiros: List[int] = []
+        for cuenta in cuentas:
+            saldo = cuenta.saldo_centavos
+            saldos.append(_clave(saldo, cuenta.id))
+            if saldo < 0:
+                sobregiros.append(_clave(_utilizacion(saldo, cuenta.cupo_sobregiro_centavos), cuenta.id))
+        indice._saldos = _ListaOrdenada(saldos)
+        indice._sobregiros = _ListaOrdenada(sobregiros)
+        return indice
+
+    def __len__(self) -> int:
+        return len(self._saldos)
+
+    # -------------------------
+    # Actualización
+    # -------------------------
+    def agregar(self, cuenta: CuentaBase) -> None:
+        saldo = cuenta.saldo_centavos
+        self._saldos.agregar(_clave(saldo, cuenta.id))
+        if saldo < 0:
+            self._sobregiros.agregar(_clave(_utilizacion(saldo, cuenta.cupo_sobregiro_centavos), cuenta.id))
+
+    def quitar(self, cuenta: CuentaBase) -> None:
+        saldo = cuenta.saldo_centavos
+        self._saldos.quitar(_clave(saldo, cuenta.id))
+        if saldo < 0:
+            self._sobregiros.quitar(_clave(_utilizacion(saldo, cuenta.cupo_sobregiro_centavos), cuenta.id))
+
+    def saldo_cambiado(self, cuenta: CuentaBase, anterior: int) -> None:
+        saldo = cuenta.saldo_centavos
+        if saldo == anterior:
+            return
+        cuenta_id = cuenta.id
+        self._saldos.reemplazar((anterior << _BITS_ID) | cuenta_id, (saldo << _BITS_ID) | cuenta_id)
+        if anterior < 0 or saldo < 0:
+            cupo = cuenta.cupo_sobregiro_centavos
+            if anterior >= 0:
+                self._sobregiros.agregar(_clave(_utilizacion(saldo, cupo), cuenta_id))
+            elif saldo >= 0:
+                self._sobregiros.quitar(_clave(_utilizacion(anterior, cupo), cuenta_id))
+            else:
+                self._sobregiros.reemplazar(
+                    _clave(_utilizacion(anterior, cupo), cuenta_id), _clave(_utilizacion(saldo, cupo), cuenta_id)
+                )
+
+    # -------------------------
+    # Consultas (ids)
+    # -------------------------
+    def mayores(self, n: int) -> List[int]:
+        """Ids de los n mayores saldos, de mayor a menor (a igual saldo, mayor id primero)."""
+        return [clave & _MASCARA_ID for clave in self._saldos.mayores(n)]
+
+    def rango(self, minimo: Optional[int] = None, maximo: Optional[int] = None) -> List[int]:
+        """Ids con minimo <= saldo <= maximo en centavos (None = sin límite), de menor a mayor saldo."""
+        desde = None if minimo is None else _clave(minimo, 0)
+        hasta = None if maximo is None else _clave(maximo, _MASCARA_ID)
+        return [clave & _MASCARA_ID for clave in self._saldos.rango(desde, hasta)]
+
+    def recorrer(
+        self, cursor: Optional[Tuple[int, int]] = None, descendente: bool = False
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Pares (saldo en centavos, id) en orden, a partir del cursor (sin
+        incluirlo): O(log n) hasta el cursor y O(1) por par recorrido.
+        """
+        if descendente:
+            claves = self._saldos.menores(None if cursor is None else _clave(*cursor) - 1)
+        else:
+            claves = self._saldos.rango(None if cursor is None else _clave(*cursor) + 1, None)
+        return ((clave >> _BITS_ID, clave & _MASCARA_ID) for clave in claves)
+
+    def sobregiros(self, n: Optional[int] = None) -> List[int]:
+        """Ids de las cuentas en sobregiro, de mayor a menor utilización del cupo (None = todas)."""
+        return [clave & _MASCARA_ID for clave in self._sobregiros.mayores(n)]
+
+
+class UsoSobregiro:
+    """Una cuenta corriente en sobregiro y cuánto de su cupo usa."""
+
+    __slots__ = ("cuenta", "usado_centavos", "cupo_centavos")
+
+    def __init__(self, cuenta: CuentaCorriente) -> None:
+        self.cuenta = cuenta
+        self.usado_centavos = max(-cuenta.saldo_centavos, 0)
+        self.cupo_centavos = cuenta.cupo_sobregiro_centavos
+
+    @property
+    def usado(self) -> float:
+        return a_unidades(self.usado_centavos)
+
+    @property
+    def cupo(self) -> float:
+        return a_unidades(self.cupo_centavos)
+
+    @property
+    def utilizacion(self) -> float:
+        """Fracción del cupo usada (0..1; 1 = cupo agotado)."""
+        return self.usado_centavos / self.cupo_centavos if self.cupo_centavos else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"id={self.cuenta.id} titular='{self.cuenta.titular}' usado={formatear(self.usado_centavos)} "
+            f"cupo={formatear(self.cupo_centavos)} ({self.utilizacion:.0%})"
+        )
@@ -0,0 +1,116 @@
+# services/indice_titulares.py
+from __future__ import annotations
+
+import unicodedata
+from typing import Dict, List, Set
+
+
+class IndiceTitulares:
+    """
+    Índice invertido de trigramas sobre titulares.
+
+    - Cada titular normalizado aporta solo sus trigramas (un titular de
+      menos de 3 caracteres se guarda entero como clave). Guardar también
+      1- y 2-gramas multiplicaba por ~3 las claves que tocan agregar/quitar.
+    - Una consulta de 3 caracteres es una sola lista de ids.
+    - Una de 1 o 2 caracteres está en un titular si y solo si está en
+      alguna de sus claves: se recorren las claves (del orden de miles,
+      no de cuentas) y se unen las listas de las que la contienen, o se
+      recorren los titulares si esas listas suman más que el libro.
+    - Consultas más largas intersectan los trigramas y verifican con "in",
+      así el resultado es idéntico al recorrido completo.
+
+    Normalización:
+    - Por defecto .lower(), igual que BancoService.buscar_por_titular.
+    - plegar_acentos=True además quita tildes y usa casefold()
+      ("José" coincide con "jose").
+    """
+
+    N: int = 3
+
+    def __init__(self, plegar_acentos: bool = False) -> None:
+        self._plegar_acentos = plegar_acentos
+        self._trigramas: Dict[str, Set[int]] = {}
+        self._normalizados: Dict[int, str] = {}
+
+    # -------------------------
+    # Mantenimiento
+    # -------------------------
+    def agregar(self, cuenta_id: int, titular: str) -> None:
+        texto = self.normalizar(titular)
+        self._normalizados[cuenta_id] = texto
+        trigramas = self._trigramas
+        for gram in self._trigramas_de(texto):
+            ids = trigramas.get(gram)
+            if ids is None:
+                trigramas[gram] = {cuenta_id}
+            else:
+                ids.add(cuenta_id)
+
+    def quitar(self, cuenta_id: int) -> None:
+        texto = self._normalizados.pop(cuenta_id, None)
+        if texto is None:
+            return
+        trigramas = self._trigramas
+        for gram in self._trigramas_de(texto):
+            ids = trigramas.get(gram)
+            if ids is None:
+                continue
+            ids.discard(cuenta_id)
+            if not ids:
+                del trigramas[gram]
+
+    def actualizar(self, cuenta_id: int, titular: str) -> None:
+        self.quitar(cuenta_id)
+        self.agregar(cuenta_id, titular)
+
+    # -------------------------
+    # Consultas
+    # -------------------------
+    def buscar(self, texto: str) -> List[int]:
+        """Ids (ordenados) cuyo titular normalizado contiene el texto."""
+        consulta = self.normalizar(str(texto).strip())
+        if not consulta:
+            return []
+
+        if len(consulta) < self.N:
+            return self._buscar_corta(consulta)
+        if len(consulta) == self.N:
+            return sorted(self._trigramas.get(consulta, ()))
+
+        listas = []
+        for gram in self._trigramas_de(consulta):
+            ids = self._trigramas.get(gram)
+            if not ids:
+                return []
+            listas.append(ids)
+        listas.sort(key=len)
+
+        candidatos = set(listas[0])
+        for ids in listas[1:]:
+            candidatos &= ids
+            if not candidatos:
+                return []
+        return sorted(i for i in candidatos if consulta in self._normalizados[i])
+
+    # -------------------------
+    # Internos
+    # -------------------------
+    def normalizar(self, texto: str) -> str:
+        if not self._plegar_acentos:
+            return texto.lower()
+        descompuesto = unicodedata.normalize("NFKD", texto)
+        sin_tildes = "".join(ch for ch in descompuesto if not unicodedata.combining(ch))
+        return sin_tildes.casefold()
+
+    def _buscar_corta(self, consulta: str) -> List[int]:
+        listas = [ids for gram, ids in self._trigramas.items() if consulta in gram]
+        if sum(map(len, listas)) > len(self._normalizados):
+            # Letras frecuentes: unir listas que se repiten cuesta más que mirar cada titular una vez
+            return sorted(i for i, texto in self._normalizados.items() if consulta in texto)
+        return sorted(set().union(*listas))
+
+    def _trigramas_de(self, texto: str) -> Set[str]:
+        if len(texto) < self.N:
+            return {texto}
+        return {texto[i:i + self.N] for i in range(len(texto) - self.N + 1)}
@@ -0,0 +1,293 @@
+# services/instantanea.py
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+from typing import Callable, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from models.cuentas import CuentaAhorros, CuentaBase, CuentaCorriente
+
+# Formato (little-endian):
+#   cabecera: magia, versión, cantidad de cuentas, siguiente id, offset de textos
+#   registros de ancho fijo, en orden de apertura (ids crecientes)
+#   tabla de textos: titulares UTF-8 concatenados (offset/largo en el registro)
+# Versión 2: saldo, cupo y cuota en centavos (int64) en lugar de double.
+_MAGIA = b"BNCSNAP1"
+_VERSION = 2
+_CABECERA = struct.Struct("<8sIQQQ")
+_REGISTRO = struct.Struct("<qBBqdqqQI")  # id, tipo, activa, saldo, tasa, cupo, cuota, off, largo
+_ID = struct.Struct("<q")
+
+_AHORROS = 1
+_CORRIENTE = 2
+
+
+# Un registro ya decodificado: id, tipo, activa, saldo, tasa, cupo, cuota, titular (UTF-8)
+Registro = Tuple[int, int, bool, int, float, int, int, bytes]
+
+
+def escribir_instantanea(cuentas: Iterable[CuentaBase], siguiente_id: int, ruta: str) -> int:
+    """
+    Escribe la instantánea de forma atómica: archivo temporal + fsync +
+    os.replace. Un lector nunca ve un archivo a medio escribir, y uno que
+    ya tenía abierta `ruta` sigue leyendo el archivo anterior.
+    Devuelve cuántas cuentas se escribieron.
+    """
+    return escribir_registros((registro_de(cuenta) for cuenta in cuentas), siguiente_id, ruta)
+
+
+def registro_de(cuenta: CuentaBase) -> Registro:
+    titular = cuenta.titular.encode("utf-8")
+    if isinstance(cuenta, CuentaAhorros):
+        return cuenta.id, _AHORROS, cuenta.activa, cuenta.saldo_centavos, cuenta.tasa_interes, 0, 0, titular
+    if isinstance(cuenta, CuentaCorriente):
+        return (
+            cuenta.id,
+            _CORRIENTE,
+            cuenta.activa,
+            cuenta.saldo_centavos,
+            0.0,
+            cuenta.cupo_sobregiro_centavos,
+            cuenta.cuota_manejo_centavos,
+            titular,
+        )
+    raise ValueError(f"Tipo de cuenta no soportado en instantáneas: {cuenta.tipo()}.")
+
+
+def escribir_registros(registros: Iterable[Registro], siguiente_id: int, ruta: str) -> int:
+    """Como escribir_instantanea, a partir de registros (ver CuentasPerezosas.registros)."""
+    temporal = f"{ruta}.tmp"
+    textos = bytearray()
+    cantidad = 0
+    with open(temporal, "wb") as f:
+        f.write(b"\0" * _CABECERA.size)
+        for cuenta_id, tipo, activa, saldo, tasa, cupo, cuota, titular in registros:
+            f.write(_REGISTRO.pack(cuenta_id, tipo, activa, saldo, tasa, cupo, cuota, len(textos), len(titular)))
+            textos += titular
+            cantidad += 1
+
+        offset_textos = f.tell()
+        f.write(textos)
+        f.seek(0)
+        f.write(_CABECERA.pack(_MAGIA, _VERSION, cantidad, siguiente_id, offset_textos))
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(temporal, ruta)
+    _fsync_directorio(os.path.dirname(os.path.abspath(ruta)))
+    return cantidad
+
+
+class Instantanea:
+    """
+    Lector de instantáneas con mmap: abrir no lee los registros, solo la
+    cabecera. Cada registro se decodifica cuando se pide.
+    """
+
+    def __init__(self, ruta: str) -> None:
+        self._archivo = open(ruta, "rb")
+        try:
+            self._mm = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # archivo vacío
+            self._archivo.close()
+            raise ValueError("La instantánea está vacía o incompleta.")
+
+        if len(self._mm) < _CABECERA.size:
+            self.cerrar()
+            raise ValueError("La instantánea está vacía o incompleta.")
+        magia, version, cantidad, siguiente_id, offset_textos = _CABECERA.unpack_from(self._mm, 0)
+        if magia != _MAGIA:
+            self.cerrar()
+            raise ValueError("El archivo no es una instantánea válida.")
+        if version != _VERSION:
+            self.cerrar()
+            raise ValueError(f"Versión de instantánea no soportada: {version} (se espera {_VERSION}).")
+        # O(1): los textos van al final y el último registro apunta al último titular
+        completa = offset_textos == _CABECERA.size + cantidad * _REGISTRO.size and len(self._mm) >= offset_textos
+        if completa and cantidad:
+            *_, offset, largo = _REGISTRO.unpack_from(self._mm, offset_textos - _REGISTRO.size)
+            completa = offset_textos + offset + largo == len(self._mm)
+        if not completa:
+            self.cerrar()
+            raise ValueError("La instantánea está vacía o incompleta.")
+        self._cantidad = cantidad
+        self._siguiente_id = siguiente_id
+        self._offset_textos = offset_textos
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    @property
+    def siguiente_id(self) -> int:
+        return self._siguiente_id
+
+    def cerrar(self) -> None:
+        """Libera el mmap y el archivo; las filas ya no se pueden leer."""
+        self._mm.close()
+        self._archivo.close()
+
+    # -------------------------
+    # Acceso por fila
+    # -------------------------
+    def id_en(self, fila: int) -> int:
+        return _ID.unpack_from(self._mm, _CABECERA.size + fila * _REGISTRO.size)[0]
+
+    def buscar_fila(self, cuenta_id: int) -> Optional[int]:
+        """Búsqueda binaria por id (los registros están ordenados por id)."""
+        bajo, alto = 0, self._cantidad
+        while bajo < alto:
+            medio = (bajo + alto) // 2
+            if self.id_en(medio) < cuenta_id:
+                bajo = medio + 1
+            else:
+                alto = medio
+        if bajo < self._cantidad and self.id_en(bajo) == cuenta_id:
+            return bajo
+        return None
+
+    def titular_en(self, fila: int) -> str:
+        *_, offset, largo = _REGISTRO.unpack_from(self._mm, _CABECERA.size + fila * _REGISTRO.size)
+        inicio = self._offset_textos + offset
+        return self._mm[inicio:inicio + largo].decode("utf-8")
+
+    def registro_en(self, fila: int) -> Registro:
+        """La fila tal como está en el archivo, sin crear la cuenta."""
+        cuenta_id, tipo, activa, saldo, tasa, cupo, cuota, offset, largo = _REGISTRO.unpack_from(
+            self._mm, _CABECERA.size + fila * _REGISTRO.size
+        )
+        inicio = self._offset_textos + offset
+        return cuenta_id, tipo, bool(activa), saldo, tasa, cupo, cuota, self._mm[inicio:inicio + largo]
+
+    def cuenta_en(self, fila: int) -> CuentaBase:
+        cuenta_id, tipo, activa, saldo, tasa, cupo, cuota, offset, largo = _REGISTRO.unpack_from(
+            self._mm, _CABECERA.size + fila * _REGISTRO.size
+        )
+        inicio = self._offset_textos + offset
+        titular = self._mm[inicio:inicio + largo].decode("utf-8")
+        if tipo == _AHORROS:
+            return CuentaAhorros._desde_estado(cuenta_id, titular, saldo, bool(activa), tasa_interes=tasa)
+        return CuentaCorriente._desde_estado(
+            cuenta_id, titular, saldo, bool(activa), cupo_sobregiro=cupo, cuota_manejo=cuota
+        )
+
+
+class CuentasPerezosas:
+    """
+    Sustituto del dict id -> cuenta de BancoService respaldado por una
+    instantánea: las cuentas se crean la primera vez que se piden.
+
+    - Cuentas de la instantánea: se materializan y se guardan en caché.
+    - Cuentas nuevas (ids mayores): van a un dict aparte, después en el orden.
+    - Eliminadas de la instantánea: se recuerdan en un set.
+    """
+
+    def __init__(self, instantanea: Instantanea, al_materializar: Callable[[CuentaBase], None]) -> None:
+        self._inst = instantanea
+        self._al_materializar = al_materializar
+        self._materializadas: Dict[int, CuentaBase] = {}
+        self._nuevas: Dict[int, CuentaBase] = {}
+        self._eliminadas: Set[int] = set()
+        self._candado = threading.Lock()  # una sola materialización por cuenta
+
+    def __len__(self) -> int:
+        return len(self._inst) - len(self._eliminadas) + len(self._nuevas)
+
+    def __contains__(self, cuenta_id: int) -> bool:
+        return self.get(cuenta_id) is not None
+
+    def __getitem__(self, cuenta_id: int) -> CuentaBase:
+        cuenta = self.get(cuenta_id)
+        if cuenta is None:
+            raise KeyError(cuenta_id)
+        return cuenta
+
+    def __setitem__(self, cuenta_id: int, cuenta: CuentaBase) -> None:
+        self._nuevas[cuenta_id] = cuenta
+
+    def __delitem__(self, cuenta_id: int) -> None:
+        if self._nuevas.pop(cuenta_id, None) is not None:
+            return
+        if self.get(cuenta_id) is None:
+            raise KeyError(cuenta_id)
+        self._materializadas.pop(cuenta_id, None)
+        self._eliminadas.add(cuenta_id)
+
+    def get(self, cuenta_id: int, default: Optional[CuentaBase] = None) -> Optional[CuentaBase]:
+        cuenta = self._materializadas.get(cuenta_id) or self._nuevas.get(cuenta_id)
+        if cuenta is not None:
+            return cuenta
+        if cuenta_id in self._eliminadas:
+            return default
+        fila = self._inst.buscar_fila(cuenta_id)
+        if fila is None:
+            return default
+        return self._materializar(fila, cuenta_id)
+
+    def values(self) -> Iterator[CuentaBase]:
+        for fila in range(len(self._inst)):
+            cuenta_id = self._inst.id_en(fila)
+            if cuenta_id in self._eliminadas:
+                continue
+            cuenta = self._materializadas.get(cuenta_id)
+            yield cuenta if cuenta is not None else self._materializar(fila, cuenta_id)
+        yield from list(self._nuevas.values())
+
+    def keys(self) -> Iterator[int]:
+        """Ids en orden, sin materializar las cuentas."""
+        for fila in range(len(self._inst)):
+            cuenta_id = self._inst.id_en(fila)
+            if cuenta_id not in self._eliminadas:
+                yield cuenta_id
+        yield from list(self._nuevas)
+
+    def titulares(self) -> Iterator[Tuple[int, str]]:
+        """(id, titular) sin materializar las cuentas que aún no se usaron."""
+        for fila in range(len(self._inst)):
+            cuenta_id = self._inst.id_en(fila)
+            if cuenta_id in self._eliminadas:
+                continue
+            cuenta = self._materializadas.get(cuenta_id)
+            yield cuenta_id, cuenta.titular if cuenta is not None else self._inst.titular_en(fila)
+        for cuenta_id, cuenta in list(self._nuevas.items()):
+            yield cuenta_id, cuenta.titular
+
+    def registros(self) -> Iterator[Registro]:
+        """
+        Registros para guardar una instantánea: las cuentas que aún no se
+        usaron se copian del archivo tal cual, sin materializarlas.
+        """
+        for fila in range(len(self._inst)):
+            cuenta_id = self._inst.id_en(fila)
+            if cuenta_id in self._eliminadas:
+                continue
+            cuenta = self._materializadas.get(cuenta_id)
+            yield registro_de(cuenta) if cuenta is not None else self._inst.registro_en(fila)
+        for cuenta in list(self._nuevas.values()):
+            yield registro_de(cuenta)
+
+    def cerrar(self) -> None:
+        """Cierra la instantánea de respaldo (mmap y archivo)."""
+        self._inst.cerrar()
+
+    def _materializar(self, fila: int, cuenta_id: int) -> CuentaBase:
+        with self._candado:
+            cuenta = self._materializadas.get(cuenta_id)
+            if cuenta is None:
+                cuenta = self._inst.cuenta_en(fila)
+                self._al_materializar(cuenta)
+                self._materializadas[cuenta_id] = cuenta
+        return cuenta
+
+
+def _fsync_directorio(directorio: str) -> None:
+    # Persiste el rename; no todos los sistemas permiten abrir directorios
+    try:
+        fd = os.open(directorio, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
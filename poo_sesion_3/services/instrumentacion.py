@@ -0,0 +1,197 @@
+# services/instrumentacion.py
+from __future__ import annotations
+
+import re
+import threading
+from time import perf_counter_ns
+from typing import Dict, List, Optional
+
+# Cubetas de latencia fijas en escala logarítmica: 256 ns, 512 ns, ... ~1 s
+LIMITES_NS: List[int] = [2**k for k in range(8, 31)]
+_PRIMER_EXPONENTE = 8
+_ULTIMA_CUBETA = len(LIMITES_NS)  # +Inf
+
+_NUMEROS = re.compile(r"-?\d+(?:\.\d+)?")
+
+# [llamadas_medidas, suma_ns, cubeta_0, ..., cubeta_+Inf]
+_CAMPOS = 2
+
+
+class Instrumentacion:
+    """
+    Contadores, rechazos y latencias de BancoService sin envolver ni
+    reemplazar ningún método (ni del servicio ni de las clases de cuenta).
+
+    - Llamadas: el servicio suma una por operación aplicada en el mismo
+      punto en que la anota en la bitácora (_anotar), con el nombre de la
+      bitácora: intentar_consignar cuenta como "consignar". Las consultas
+      no se cuentan ni se miden.
+    - Rechazos: el servicio los informa donde ya los detecta (ValueError de
+      una operación, código distinto de OK en intentar_*, movimiento
+      fallido de un lote), por motivo: los números del mensaje se
+      reemplazan por N, así "id=7" e "id=9" son el mismo motivo.
+    - Latencias: el servicio toma time.perf_counter_ns() al entrar a una
+      operación y al salir (aplicada o rechazada) y suma la duración al
+      histograma (LIMITES_NS) de esa operación. En consignar/retirar y sus
+      intentar_* mide además la llamada a la cuenta, como "Tipo.metodo"
+      (p. ej. "CuentaAhorros.retirar"). Con muestreo=N se mide una de
+      cada N operaciones; los contadores siguen siendo exactos.
+
+    Costo: sin instrumentación, una comparación con None por operación;
+    con ella, un incremento en un diccionario por operación y, en las
+    medidas, dos lecturas del reloj y la cubeta. Nada toma candados en el
+    camino de las operaciones: con varios hilos se puede perder alguna
+    actualización.
+
+    stats() devuelve una foto de todo; exposicion() la misma información en
+    texto plano (formato de exposición de Prometheus).
+    """
+
+    def __init__(self, muestreo: int = 1) -> None:
+        if muestreo < 1:
+            raise ValueError("El muestreo debe ser de al menos 1 (medir una de cada N operaciones).")
+        self._muestreo = muestreo
+        # Operaciones que faltan para la próxima medida
+        self._faltan = 1
+        # operación -> llamadas (el servicio lo incrementa en _anotar)
+        self.conteos: Dict[str, int] = {}
+        # operación -> motivo -> cantidad
+        self._rechazos: Dict[str, Dict[str, int]] = {}
+        # mensaje original -> motivo sin números (evita el regex en cada rechazo)
+        self._motivos: Dict[str, str] = {}
+        self._tiempos: Dict[str, List[int]] = {}
+        self._candado = threading.Lock()
+
+    # -------------------------
+    # Uso del servicio
+    # -------------------------
+    def iniciar(self) -> int:
+        """Al entrar a una operación: el reloj en ns si se mide, 0 si queda fuera de la muestra."""
+        faltan = self._faltan - 1
+        if faltan > 0:
+            self._faltan = faltan
+            return 0
+        self._faltan = self._muestreo
+        return perf_counter_ns()
+
+    def medida(self, nombre: str, inicio: int) -> None:
+        """Al salir de una operación medida (inicio es lo que devolvió iniciar())."""
+        duracion = perf_counter_ns() - inicio
+        tiempo = self._tiempos.get(nombre)
+        if tiempo is None:
+            tiempo = self._tiempos.setdefault(nombre, [0] * (_CAMPOS + _ULTIMA_CUBETA + 1))
+        cubeta = (duracion - 1).bit_length() - _PRIMER_EXPONENTE
+        if cubeta < 0:
+            cubeta = 0
+        elif cubeta > _ULTIMA_CUBETA:
+            cubeta = _ULTIMA_CUBETA
+        tiempo[0] += 1
+        tiempo[1] += duracion
+        tiempo[_CAMPOS + cubeta] += 1
+
+    def rechazo(self, operacion: str, mensaje: str) -> None:
+        """El servicio informa un rechazo de `operacion` con su mensaje."""
+        motivo = self._motivos.get(mensaje)
+        if motivo is None:
+            motivo = _NUMEROS.sub("N", mensaje)
+            if len(self._motivos) < 10_000:
+                self._motivos[mensaje] = motivo
+        # Sin candado, como los contadores (stats() copia cada dict de una vez)
+        motivos = self._rechazos.get(operacion)
+        if motivos is None:
+            motivos = self._rechazos.setdefault(operacion, {})
+        motivos[motivo] = motivos.get(motivo, 0) + 1
+
+    # -------------------------
+    # Lectura
+    # -------------------------
+    def stats(self) -> dict:
+        """Foto de las métricas (solo nombres con llamadas, rechazos o medidas)."""
+        with self._candado:
+            conteos = dict(self.conteos)
+            # list(...) copia de una vez: rechazo() puede agregar claves sin candado
+            rechazos = {nombre: dict(motivos) for nombre, motivos in list(self._rechazos.items())}
+            tiempos = {nombre: list(valores) for nombre, valores in list(self._tiempos.items())}
+
+        vacio = [0] * (_CAMPOS + len(LIMITES_NS) + 1)
+        metodos = {}
+        for nombre in sorted(set(conteos) | set(rechazos) | set(tiempos)):
+            llamadas = conteos.get(nombre, 0)
+            motivos = rechazos.get(nombre, {})
+            observadas, suma, *cubetas = tiempos.get(nombre, vacio)
+            metodos[nombre] = {
+                "llamadas": llamadas,
+                "rechazos": sum(motivos.values()),
+                "motivos": motivos,
+                "latencia_ns": {
+                    "observadas": observadas,
+                    "media": suma / observadas if observadas else None,
+                    "suma": suma,
+                    "p50": _percentil(cubetas, observadas, 0.50),
+                    "p99": _percentil(cubetas, observadas, 0.99),
+                    "cubetas": dict(zip([str(l) for l in LIMITES_NS] + ["+Inf"], cubetas)),
+                },
+            }
+        return metodos
+
+    def exposicion(self, prefijo: str = "banco") -> str:
+        """stats() en formato de texto de Prometheus (contadores e histogramas)."""
+        foto = self.stats()
+        lineas = [
+            f"# HELP {prefijo}_llamadas_total Operaciones aplicadas por nombre.",
+            f"# TYPE {prefijo}_llamadas_total counter",
+        ]
+        for nombre, datos in foto.items():
+            if datos["llamadas"]:
+                lineas.append(f'{prefijo}_llamadas_total{{metodo="{_escapar(nombre)}"}} {datos["llamadas"]}')
+
+        lineas += [
+            f"# HELP {prefijo}_rechazos_total Errores de validación por método y motivo.",
+            f"# TYPE {prefijo}_rechazos_total counter",
+        ]
+        for nombre, datos in foto.items():
+            for motivo, cantidad in sorted(datos["motivos"].items()):
+                lineas.append(
+                    f'{prefijo}_rechazos_total{{metodo="{_escapar(nombre)}",motivo="{_escapar(motivo)}"}} {cantidad}'
+                )
+
+        lineas += [
+            f"# HELP {prefijo}_latencia_ns Duración de las operaciones medidas en nanosegundos.",
+            f"# TYPE {prefijo}_latencia_ns histogram",
+        ]
+        for nombre, datos in foto.items():
+            latencia = datos["latencia_ns"]
+            if not latencia["observadas"]:
+                continue
+            etiqueta = f'metodo="{_escapar(nombre)}"'
+            acumulado = 0
+            for limite, cantidad in latencia["cubetas"].items():
+                acumulado += cantidad
+                lineas.append(f'{prefijo}_latencia_ns_bucket{{{etiqueta},le="{limite}"}} {acumulado}')
+            lineas.append(f"{prefijo}_latencia_ns_sum{{{etiqueta}}} {latencia['suma']}")
+            lineas.append(f"{prefijo}_latencia_ns_count{{{etiqueta}}} {latencia['observadas']}")
+        return "\n".join(lineas) + "\n"
+
+    def reiniciar(self) -> None:
+        """Pone todo en cero."""
+        with self._candado:
+            self.conteos.clear()  # mismo diccionario que usa el servicio
+            self._rechazos.clear()
+            self._tiempos.clear()
+
+
+def _percentil(cubetas: List[int], total: int, fraccion: float) -> Optional[int]:
+    """Cota superior (límite de la cubeta) del percentil; None si cae en +Inf."""
+    if not total:
+        return None
+    objetivo = fraccion * total
+    acumulado = 0
+    for limite, cantidad in zip(LIMITES_NS, cubetas):
+        acumulado += cantidad
+        if acumulado >= objetivo:
+            return limite
+    return None
+
+
+def _escapar(texto: str) -> str:
+    return texto.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
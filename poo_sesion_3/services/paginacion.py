@@ -0,0 +1,158 @@
+# services/paginacion.py
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left, bisect_right
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from models.cuentas import CuentaBase
+from models.dinero import a_centavos
+
+# Criterios de orden: clave de cada cuenta (el id desempata)
+ORDENES = {
+    "id": lambda cuenta: cuenta.id,
+    "saldo": lambda cuenta: cuenta.saldo_centavos,
+    "titular": lambda cuenta: cuenta.titular.casefold(),
+}
+
+# Cursor: (clave, id) de la última cuenta entregada
+Cursor = Tuple[object, int]
+
+
+class Pagina:
+    """
+    Una página de cuentas. `cursor` se pasa tal cual a la siguiente llamada
+    (paginar_cuentas(cursor=...)); None si no hay más.
+    """
+
+    def __init__(self, cuentas: List[CuentaBase], cursor: Optional[Cursor]) -> None:
+        self.cuentas = cuentas
+        self.cursor = cursor
+
+    def __iter__(self):
+        return iter(self.cuentas)
+
+    def __len__(self) -> int:
+        return len(self.cuentas)
+
+
+def filtro_cuentas(
+    tipo: Optional[str] = None,
+    activa: Optional[bool] = None,
+    saldo_min: Optional[float] = None,
+    saldo_max: Optional[float] = None,
+) -> Optional[Callable[[CuentaBase], bool]]:
+    """
+    Predicado con los filtros dados (None = sin filtros). `tipo` es el de
+    tipo() ("CuentaAhorros", "CuentaCorriente"); el rango de saldo es
+    cerrado y se compara en centavos.
+    """
+    condiciones: List[Callable[[CuentaBase], bool]] = []
+    if tipo is not None:
+        condiciones.append(lambda cuenta: cuenta.tipo() == tipo)
+    if activa is not None:
+        condiciones.append(lambda cuenta: cuenta.activa == activa)
+    if saldo_min is not None:
+        minimo = a_centavos(saldo_min)
+        condiciones.append(lambda cuenta: cuenta.saldo_centavos >= minimo)
+    if saldo_max is not None:
+        maximo = a_centavos(saldo_max)
+        condiciones.append(lambda cuenta: cuenta.saldo_centavos <= maximo)
+    if not condiciones:
+        return None
+    if len(condiciones) == 1:
+        return condiciones[0]
+    return lambda cuenta: all(condicion(cuenta) for condicion in condiciones)
+
+
+def pagina_por_id(
+    ids: List[int],
+    obtener: Callable[[int], Optional[CuentaBase]],
+    cursor: Optional[Cursor],
+    limite: int,
+    filtro: Optional[Callable[[CuentaBase], bool]],
+    descendente: bool = False,
+) -> Pagina:
+    """
+    Recorre `ids` (ordenados; puede tener ids ya eliminados) desde el
+    cursor con bisect: cada página cuesta O(log n + lo recorrido), sin
+    importar en qué parte del libro esté.
+    """
+    if descendente:
+        posicion = len(ids) if cursor is None else bisect_left(ids, cursor[1])
+        recorrido = ((ids[i], ids[i]) for i in range(posicion - 1, -1, -1))
+    else:
+        posicion = 0 if cursor is None else bisect_right(ids, cursor[1])
+        recorrido = ((ids[i], ids[i]) for i in range(posicion, len(ids)))
+    return pagina_por_claves(recorrido, obtener, limite, filtro)
+
+
+def recorrer_claves(claves: List[Cursor], cursor: Optional[Cursor], descendente: bool = False) -> Iterator[Cursor]:
+    """Pares (clave, id) de una lista ordenada, a partir del cursor (sin incluirlo), con bisect."""
+    if descendente:
+        posicion = len(claves) if cursor is None else bisect_left(claves, tuple(cursor))
+        return (claves[i] for i in range(posicion - 1, -1, -1))
+    posicion = 0 if cursor is None else bisect_right(claves, tuple(cursor))
+    return (claves[i] for i in range(posicion, len(claves)))
+
+
+def pagina_por_claves(
+    recorrido: Iterable[Cursor],
+    obtener: Callable[[int], Optional[CuentaBase]],
+    limite: int,
+    filtro: Optional[Callable[[CuentaBase], bool]],
+) -> Pagina:
+    """
+    Llena una página recorriendo pares (clave, id) ya en orden y
+    posteriores al cursor (una lista ordenada, un índice): O(lo recorrido).
+    El cursor de la página es el par de la última cuenta entregada.
+    """
+    cuentas: List[CuentaBase] = []
+    ultimo: Optional[Cursor] = None
+    for par in recorrido:
+        cuenta = obtener(par[1])
+        if cuenta is None or (filtro is not None and not filtro(cuenta)):
+            continue
+        if len(cuentas) == limite:
+            # Hay al menos una más: el cursor apunta a la última entregada
+            return Pagina(cuentas, ultimo)
+        cuentas.append(cuenta)
+        ultimo = par
+    return Pagina(cuentas, None)
+
+
+def pagina_ordenada(
+    cuentas: Iterable[CuentaBase],
+    orden: str,
+    cursor: Optional[Cursor],
+    limite: int,
+    filtro: Optional[Callable[[CuentaBase], bool]],
+    descendente: bool = False,
+) -> Pagina:
+    """
+    Paginación por clave (keyset) sin una lista ordenada a mano: una
+    pasada por las cuentas conservando solo las `limite + 1` mejores
+    posteriores al cursor (O(n log limite), sin copiar la colección).
+    El cursor (clave, id) sigue siendo válido si el libro cambia.
+    """
+    clave_de = ORDENES[orden]
+    candidatas = []
+    for cuenta in cuentas:
+        if filtro is not None and not filtro(cuenta):
+            continue
+        clave = (clave_de(cuenta), cuenta.id)
+        if cursor is not None and (clave >= cursor if descendente else clave <= cursor):
+            continue
+        candidatas.append((clave, cuenta))
+        if len(candidatas) > 4 * (limite + 1):
+            candidatas = _mejores(candidatas, limite + 1, descendente)
+    mejores = _mejores(candidatas, limite + 1, descendente)
+
+    pagina = [cuenta for _, cuenta in mejores[:limite]]
+    siguiente = mejores[limite - 1][0] if len(mejores) > limite else None
+    return Pagina(pagina, siguiente)
+
+
+def _mejores(candidatas: list, cuantas: int, descendente: bool) -> list:
+    elegir = heapq.nlargest if descendente else heapq.nsmallest
+    return elegir(cuantas, candidatas, key=lambda par: par[0])
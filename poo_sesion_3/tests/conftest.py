@@ -0,0 +1,12 @@
+# tests/conftest.py
+"""
+Pruebas de poo_sesion_3. Se corren desde esta sesión:
+    cd poo_sesion_3 && python -m pytest -q
+(poo_sesion2 tiene paquetes con los mismos nombres: cada sesión, aparte).
+"""
+from __future__ import annotations
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
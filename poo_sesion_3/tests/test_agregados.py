@@ -0,0 +1,63 @@
+# tests/test_agregados.py
+from __future__ import annotations
+
+import pytest
+
+from services.agregados import ResumenCartera
+from services.banco_service import BancoService
+
+
+def _operar(banco: BancoService) -> None:
+    ana = banco.abrir_ahorros("Ana", 100.0).id
+    beto = banco.abrir_corriente("Beto", 10.0, 50.0, 1.0).id
+    cata = banco.abrir_corriente("Cata", 0.0, 20.0).id
+    banco.retirar(beto, 40.0)  # de +10 a -30
+    banco.transferir(ana, cata, 5.0)
+    banco.consignar(beto, 35.0)  # de -30 a +5
+    banco.retirar(cata, 15.0)  # de +5 a -10
+    banco.cerrar_cuenta(banco.abrir_ahorros("Dario", 7.0).id)
+    banco.eliminar_cuenta(banco.abrir_ahorros("Eva", 3.0).id)
+    banco.aplicar_corte_mensual_con_reporte()
+
+
+@pytest.mark.parametrize("opciones", [{"agregados": True}, {"verificar_agregados": True}, {}])
+def test_resumen(opciones):
+    banco = BancoService(**opciones)
+    _operar(banco)
+    resumen = banco.resumen_cartera()
+    assert resumen == ResumenCartera.desde_cuentas(banco.listar_cuentas())
+    assert (resumen.activas, resumen.cerradas, resumen.cuentas) == (3, 1, 4)
+    assert resumen.depositos_centavos == 9_595 + 400 + 700  # Ana con interés, Beto tras la cuota, Dario
+    assert resumen.sobregiro_centavos == 1_000
+    assert resumen.saldo_total == 96.95
+    assert resumen.cuentas_por_tipo == {"CuentaAhorros": 2, "CuentaCorriente": 2}
+    assert resumen.saldo_por_tipo() == {"CuentaAhorros": 102.95, "CuentaCorriente": -6.0}
+
+
+def test_resumen_es_una_copia():
+    banco = BancoService(agregados=True)
+    banco.abrir_ahorros("Ana", 1.0)
+    copia = banco.resumen_cartera()
+    copia.activas = 99
+    copia.cuentas_por_tipo["CuentaAhorros"] = 99
+    assert banco.resumen_cartera().activas == 1
+    assert banco.resumen_cartera().cuentas_por_tipo == {"CuentaAhorros": 1}
+
+
+def test_detecta_cambios_por_fuera_del_servicio():
+    banco = BancoService(agregados=True)
+    cuenta = banco.abrir_ahorros("Ana", 1.0)
+    banco.verificar_agregados()
+    cuenta.consignar(5.0)  # directo sobre la cuenta: los agregados no se enteran
+    with pytest.raises(RuntimeError, match="no coinciden"):
+        banco.verificar_agregados()
+
+    verificado = BancoService(verificar_agregados=True)
+    verificado.abrir_ahorros("Beto", 1.0).cerrar()
+    with pytest.raises(RuntimeError):
+        verificado.resumen_cartera()
+
+
+def test_verificar_sin_agregados():
+    with pytest.raises(ValueError, match="agregados"):
+        BancoService().verificar_agregados()
@@ -0,0 +1,181 @@
+# tests/test_banco_async.py
+from __future__ import annotations
+
+import asyncio
+import random
+
+import pytest
+
+from models.resultados import MENSAJES, OK
+from services.banco_async import AsyncBancoService
+from services.banco_service import BancoService
+from services.bitacora import Bitacora
+
+
+async def _en_paralelo(fachada: AsyncBancoService, movimientos: list) -> list:
+    """Lanza todos los movimientos en el mismo tick; devuelve None o el mensaje de cada uno."""
+
+    async def uno(operacion: str, cuenta_id, monto):
+        try:
+            await getattr(fachada, operacion)(cuenta_id, monto)
+        except ValueError as e:
+            return str(e)
+        return None
+
+    return await asyncio.gather(*(uno(*movimiento) for movimiento in movimientos))
+
+
+def _secuencial(banco: BancoService, movimientos: list) -> list:
+    estados = []
+    for operacion, cuenta_id, monto in movimientos:
+        intentar = banco.intentar_consignar if operacion == "consignar" else banco.intentar_retirar
+        estados.append(intentar(cuenta_id, monto))
+    return estados
+
+
+def _poblar() -> BancoService:
+    banco = BancoService()
+    banco.abrir_ahorros("Ana", 50.0)
+    banco.abrir_corriente("Beto", 0.0, 30.0)
+    banco.cerrar_cuenta(banco.abrir_ahorros("Cata", 10.0).id)
+    return banco
+
+
+@pytest.mark.parametrize("compensar", [True, False])
+@pytest.mark.parametrize("semilla", range(8))
+def test_mismos_resultados_que_uno_a_uno(compensar, semilla):
+    rnd = random.Random(semilla)
+    esperado, banco = _poblar(), _poblar()
+    # Posiciones (cada libro tiene sus ids); la 3 es una cuenta inexistente
+    posiciones = [
+        (rnd.choice(("consignar", "retirar")), rnd.randrange(4), rnd.choice((1.0, 5.5, 20.0, 40.0, 0.0)))
+        for _ in range(60)
+    ]
+
+    def con_ids(libro: BancoService) -> list:
+        ids = [cuenta.id for cuenta in libro.listar_cuentas()] + [-1]
+        return [(operacion, ids[posicion], monto) for operacion, posicion, monto in posiciones]
+
+    async def correr():
+        fachada = AsyncBancoService(banco, compensar=compensar)
+        try:
+            return await _en_paralelo(fachada, con_ids(banco))
+        finally:
+            fachada.cerrar()
+
+    obtenidos = asyncio.run(correr())
+    codigos = _secuencial(esperado, con_ids(esperado))
+    assert obtenidos == [None if codigo == OK else MENSAJES[codigo] for codigo in codigos]
+    assert [c.saldo_centavos for c in banco.listar_cuentas()] == [c.saldo_centavos for c in esperado.listar_cuentas()]
+
+
+def test_compensa_por_cuenta_en_la_bitacora(tmp_path):
+    bitacora = Bitacora(str(tmp_path / "bitacora.log"))
+    banco = BancoService(bitacora=bitacora)
+    cuenta = banco.abrir_ahorros("Ana", 100.0)
+    movimientos = [("consignar", cuenta.id, 1.0)] * 50 + [("retirar", cuenta.id, 2.0)] * 30
+
+    async def correr():
+        fachada = AsyncBancoService(banco)
+        try:
+            return await _en_paralelo(fachada, movimientos)
+        finally:
+            fachada.cerrar()
+
+    assert asyncio.run(correr()) == [None] * 80
+    bitacora.cerrar()
+    registros = list(Bitacora(bitacora.ruta).leer())
+    assert [registro[0] for registro in registros] == ["montos", "abrir_ahorros", "retirar", "consignar"]
+    reproducido = BancoService.desde_bitacora(Bitacora(bitacora.ruta))
+    assert reproducido.buscar_por_id(cuenta.id).saldo_centavos == cuenta.saldo_centavos == 9_000
+
+
+def test_error_a_mitad_solo_falla_lo_no_aplicado():
+    banco = BancoService()
+    cuentas = [banco.abrir_ahorros(f"T{i}", 10.0) for i in range(4)]
+    original = banco.intentar_consignar
+    llamadas = []
+
+    def falla_en_la_tercera(cuenta_id, monto):
+        llamadas.append(cuenta_id)
+        if len(llamadas) == 3:
+            raise RuntimeError("disco lleno")
+        return original(cuenta_id, monto)
+
+    banco.intentar_consignar = falla_en_la_tercera
+
+    async def correr():
+        fachada = AsyncBancoService(banco, compensar=False)
+        resultados = await asyncio.gather(
+            *(fachada.consignar(cuenta.id, 1.0) for cuenta in cuentas), return_exceptions=True
+        )
+        siguiente = await fachada.consignar(cuentas[0].id, 1.0)  # la fachada sigue atendiendo
+        fachada.cerrar()
+        return resultados, siguiente
+
+    resultados, siguiente = asyncio.run(correr())
+    assert resultados[:2] == [None, None]
+    assert all(isinstance(r, RuntimeError) for r in resultados[2:])
+    assert siguiente is None
+    assert [c.saldo_centavos for c in cuentas] == [1_200, 1_100, 1_000, 1_000]
+
+
+def test_id_no_hashable_y_monto_invalido():
+    banco = BancoService()
+    cuenta = banco.abrir_ahorros("Ana", 10.0)
+
+    async def correr():
+        fachada = AsyncBancoService(banco)
+        try:
+            return await _en_paralelo(
+                fachada,
+                [("consignar", [1], 1.0), ("consignar", cuenta.id, "x"), ("consignar", cuenta.id, 2.0)],
+            )
+        finally:
+            fachada.cerrar()
+
+    estados = asyncio.run(correr())
+    assert "mal formado" in estados[0]
+    assert estados[1] is not None and estados[2] is None
+    assert cuenta.saldo_centavos == 1_200
+
+
+def test_cancelar_una_tarea_no_retira_el_movimiento():
+    banco = BancoService()
+    cuenta = banco.abrir_ahorros("Ana", 10.0)
+
+    async def correr():
+        fachada = AsyncBancoService(banco)
+        tarea = asyncio.ensure_future(fachada.consignar(cuenta.id, 5.0))
+        otra = asyncio.ensure_future(fachada.consignar(cuenta.id, 1.0))
+        await asyncio.sleep(0)
+        tarea.cancel()
+        await otra
+        fachada.cerrar()
+        return tarea
+
+    tarea = asyncio.run(correr())
+    assert tarea.cancelled()
+    assert cuenta.saldo_centavos == 1_600
+
+
+def test_iterar_cuentas_pagina_sin_copiar_el_libro(monkeypatch):
+    banco = BancoService()
+    ids = [banco.abrir_ahorros(f"T{i}").id for i in range(7)]
+    banco.eliminar_cuenta(ids[3])
+    monkeypatch.setattr(banco, "listar_cuentas", None)  # no se usa
+
+    async def correr():
+        fachada = AsyncBancoService(banco)
+        try:
+            return [cuenta.id async for cuenta in fachada.iterar_cuentas(bloque=2)]
+        finally:
+            fachada.cerrar()
+
+    assert asyncio.run(correr()) == ids[:3] + ids[4:]
+
+
+def test_varios_hilos_exigen_servicio_concurrente():
+    with pytest.raises(ValueError, match="concurrente"):
+        AsyncBancoService(BancoService(), hilos=2)
+    AsyncBancoService(BancoService(concurrente=True), hilos=2).cerrar()
@@ -0,0 +1,139 @@
+# tests/test_bitacora.py
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from services.banco_service import BancoService
+from services.bitacora import Bitacora
+
+
+def _estado(banco: BancoService) -> list:
+    return [(c.id, c.tipo(), c.titular, c.saldo_centavos, c.activa) for c in banco.listar_cuentas()]
+
+
+def _operar(banco: BancoService) -> None:
+    a = banco.abrir_ahorros("Ana", 100.0, 0.01).id
+    b = banco.abrir_corriente("Beto", 0.0, 50.0, 2.0).id
+    c = banco.abrir_ahorros("Carla", 10.0).id
+    d = banco.abrir_corriente("Dario", 0.0, 0.0, 5.0).id  # su cuota nunca cabe
+    banco.consignar(a, 5.5)
+    banco.retirar(b, 20.0)
+    banco.intentar_consignar(c, 1.0)
+    banco.intentar_retirar(c, 1000.0)  # rechazado: no se anota
+    with pytest.raises(ValueError):
+        banco.retirar(a, 1000.0)
+    banco.transferir(a, c, 7.0)
+    banco.consignar_lote([(a, 1.0), (b, 2.0)])
+    with pytest.raises(ValueError):
+        banco.retirar_lote([(a, 1.0), (c, 1000.0)])
+    banco.retirar_lote([(a, 1.0), (c, 1000.0), (-1, 1.0)], atomico=False)
+    banco.liquidar_transferencias([(a, b, 10.0), (b, c, 4.0)])
+    banco.aplicar_corte_mensual_con_reporte()
+    with pytest.raises(ValueError):
+        banco.aplicar_corte_mensual_a_todas()  # se detiene en Dario: el corte parcial también se reproduce
+    banco.cambiar_titular(c, "Carla Nueva")
+    banco.cerrar_cuenta(c)
+    banco.eliminar_cuenta(d)
+
+
+@pytest.mark.parametrize("opciones", [{}, {"concurrente": True}, {"agregados": True, "indice_saldos": True}])
+def test_reproducir_da_el_mismo_libro(tmp_path, opciones):
+    ruta = str(tmp_path / "bitacora.log")
+    bitacora = Bitacora(ruta, fsync_cada=3)
+    banco = BancoService(bitacora=bitacora, **opciones)
+    _operar(banco)
+    bitacora.cerrar()
+
+    bitacora = Bitacora(ruta)
+    reproducido = BancoService.desde_bitacora(bitacora, **opciones)
+    assert _estado(reproducido) == _estado(banco)
+    nueva = reproducido.abrir_ahorros("Eva")  # sigue conectada y no repite ids
+    assert nueva.id > max(cuenta.id for cuenta in banco.listar_cuentas())
+    bitacora.cerrar()
+    assert list(Bitacora(ruta).leer())[-1][0] == "abrir_ahorros"
+
+
+def test_ultima_linea_a_medias_se_ignora_y_se_descarta(tmp_path):
+    ruta = tmp_path / "bitacora.log"
+    ruta.write_text('["consignar",1,1.0]\n["retirar",1,', encoding="utf-8")
+    bitacora = Bitacora(str(ruta))
+    assert list(bitacora.leer()) == [["consignar", 1, 1.0]]
+    bitacora.registrar(["retirar", 1, 2.0])
+    bitacora.cerrar()
+    assert list(Bitacora(str(ruta)).leer()) == [["consignar", 1, 1.0], ["retirar", 1, 2.0]]
+
+
+def test_linea_corrupta_en_medio(tmp_path):
+    ruta = tmp_path / "bitacora.log"
+    ruta.write_text('["consignar",1,1.0]\n{roto\n["retirar",1,2.0]\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="línea 2"):
+        list(Bitacora(str(ruta)).leer())
+
+
+def test_fsync_cada_registro_deja_todo_en_disco(tmp_path):
+    ruta = tmp_path / "bitacora.log"
+    bitacora = Bitacora(str(ruta), fsync_cada=1)
+    bitacora.registrar(["consignar", 1, 1.0])
+    assert ruta.read_text(encoding="utf-8") == '["consignar",1,1.0]\n'  # sin cerrar
+    bitacora.cerrar()
+    bitacora.cerrar()  # cerrar dos veces no falla
+
+
+def test_inexistente_se_lee_vacia(tmp_path):
+    assert list(Bitacora(str(tmp_path / "no_existe.log")).leer()) == []
+
+
+@pytest.mark.parametrize("opciones", [{"fsync_cada": 0}, {"fsync_ms": -1}])
+def test_parametros_invalidos(tmp_path, opciones):
+    with pytest.raises(ValueError):
+        Bitacora(str(tmp_path / "b.log"), **opciones)
+
+
+def test_fsync_ms_vuelca_sin_esperar_otra_escritura(tmp_path):
+    ruta = tmp_path / "bitacora.log"
+    bitacora = Bitacora(str(ruta), fsync_ms=10)
+    bitacora.registrar(["consignar", 1, 100])
+    limite = time.monotonic() + 5
+    while ruta.read_text(encoding="utf-8") == "" and time.monotonic() < limite:
+        time.sleep(0.01)
+    assert ruta.read_text(encoding="utf-8") == '["consignar",1,100]\n'  # sin cerrar ni escribir otra vez
+    bitacora.cerrar()
+    assert not any(hilo.name == "bitacora-fsync" for hilo in threading.enumerate())
+
+
+def test_montos_en_centavos_se_reproducen_exactos(tmp_path):
+    ruta = str(tmp_path / "bitacora.log")
+    bitacora = Bitacora(ruta)
+    banco = BancoService(bitacora=bitacora)
+    cuenta = banco.abrir_ahorros("Ana", 0.1)
+    for _ in range(1000):
+        banco.consignar(cuenta.id, 0.07)
+    bitacora.cerrar()
+
+    registros = list(Bitacora(ruta).leer())
+    assert registros[:3] == [
+        ["montos", "centavos"],
+        ["abrir_ahorros", cuenta.id, "Ana", 10, 0.01],
+        ["consignar", cuenta.id, 7],
+    ]
+    reproducido = BancoService.desde_bitacora(Bitacora(ruta))
+    assert reproducido.buscar_por_id(cuenta.id).saldo_centavos == cuenta.saldo_centavos == 7_010
+
+
+def test_bitacora_anterior_en_unidades(tmp_path):
+    ruta = tmp_path / "bitacora.log"
+    ruta.write_text(
+        '["abrir_corriente",7,"Ana",10.5,50.0,2.0]\n["retirar",7,20.25]\n'
+        '["consignar_lote",true,[[7,1.0]]]\n',
+        encoding="utf-8",
+    )
+    bitacora = Bitacora(str(ruta))
+    banco = BancoService.desde_bitacora(bitacora)
+    assert banco.buscar_por_id(7).saldo_centavos == -875
+    banco.consignar(7, 1.0)  # lo nuevo va en centavos, tras la marca
+    bitacora.cerrar()
+    assert list(Bitacora(str(ruta)).leer())[-2:] == [["montos", "centavos"], ["consignar", 7, 100]]
+    assert BancoService.desde_bitacora(Bitacora(str(ruta))).buscar_por_id(7).saldo_centavos == -775
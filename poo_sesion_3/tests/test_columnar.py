@@ -0,0 +1,80 @@
+# tests/test_columnar.py
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from services.almacen_columnar import AlmacenColumnar  # noqa: E402
+from services.banco_service import BancoService  # noqa: E402
+
+
+def _poblar(banco: BancoService, n: int) -> list:
+    ids = []
+    for i in range(n):
+        if i % 3:
+            cuenta = banco.abrir_ahorros(f"A{i}", 10.0 + i, 0.01 * (i % 4))
+        else:
+            cuenta = banco.abrir_corriente(f"C{i}", float(i % 5), 3.0 * (i % 2), 1.25)
+        ids.append(cuenta.id)
+    return ids
+
+
+def _saldos(banco: BancoService) -> list:
+    return [cuenta.saldo_centavos for cuenta in banco.listar_cuentas()]
+
+
+def test_igual_al_recorrido_de_objetos_y_crece():
+    n = AlmacenColumnar.CAPACIDAD_INICIAL + 50
+    columnar, objetos = BancoService(columnar=True), BancoService()
+    for banco in (columnar, objetos):
+        ids = _poblar(banco, n)
+        for cuenta_id in ids[::7]:
+            banco.eliminar_cuenta(cuenta_id)
+        banco.consignar(ids[1], 0.33)
+        for _ in range(3):
+            banco.aplicar_corte_mensual_con_reporte()  # las de cuota sin cupo se rechazan
+    assert _saldos(columnar) == _saldos(objetos)
+
+
+@pytest.mark.parametrize("falla", ["cerrada", "cuota"])
+def test_se_detiene_en_la_misma_cuenta_con_el_mismo_error(falla):
+    columnar, objetos = BancoService(columnar=True), BancoService()
+    errores = []
+    for banco in (columnar, objetos):
+        banco.abrir_ahorros("Ana", 100.0, 0.05)
+        if falla == "cerrada":
+            banco.cerrar_cuenta(banco.abrir_ahorros("Beto", 10.0).id)
+        else:
+            banco.abrir_corriente("Beto", 0.0, 0.0, 5.0)
+        banco.abrir_ahorros("Cata", 100.0, 0.05)
+        with pytest.raises(ValueError) as error:
+            banco.aplicar_corte_mensual_a_todas()
+        errores.append(str(error.value))
+    assert errores[0] == errores[1]
+    assert _saldos(columnar) == _saldos(objetos)
+    assert _saldos(columnar)[0] == 10_500 and _saldos(columnar)[2] == 10_000  # lo anterior quedó aplicado
+
+
+def test_agregados_se_recalculan_tras_el_corte_vectorizado():
+    banco = BancoService(columnar=True, verificar_agregados=True)
+    _poblar(banco, 30)
+    banco.aplicar_corte_mensual_con_reporte()
+    banco.verificar_agregados()
+    resumen = banco.resumen_cartera()
+    assert resumen.cuentas == 30
+
+
+@pytest.mark.parametrize("opciones", [{"devengo_perezoso": True}, {"historial": True}])
+def test_combinaciones_no_admitidas(opciones):
+    with pytest.raises(ValueError, match="columnar"):
+        BancoService(columnar=True, **opciones)
+
+
+def test_instantanea_no_abre_columnar(tmp_path):
+    banco = BancoService()
+    banco.abrir_ahorros("Ana", 1.0)
+    ruta = str(tmp_path / "libro.bin")
+    banco.guardar_instantanea(ruta)
+    with pytest.raises(ValueError, match="columnar"):
+        BancoService.desde_instantanea(ruta, columnar=True)
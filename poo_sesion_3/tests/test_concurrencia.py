@@ -0,0 +1,91 @@
+# tests/test_concurrencia.py
+from __future__ import annotations
+
+import random
+import threading
+
+import pytest
+
+from services.banco_service import BancoService
+
+
+def _en_hilos(n: int, trabajo) -> None:
+    errores = []
+
+    def correr(semilla: int) -> None:
+        try:
+            trabajo(random.Random(semilla))
+        except BaseException as e:  # pragma: no cover - solo si falla
+            errores.append(e)
+
+    hilos = [threading.Thread(target=correr, args=(i,)) for i in range(n)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join(timeout=60)
+    assert not any(hilo.is_alive() for hilo in hilos), "bloqueo mutuo"
+    assert not errores, errores
+
+
+@pytest.mark.parametrize("opciones", [{"franjas": 1}, {"franjas": 8, "agregados": True, "indice_saldos": True}])
+def test_transferencias_cruzadas_conservan_el_total(opciones):
+    banco = BancoService(concurrente=True, **opciones)
+    ids = [banco.abrir_corriente(f"T{i}", 100.0, 20.0).id for i in range(12)]
+
+    def trabajo(rnd: random.Random) -> None:
+        for _ in range(400):
+            origen, destino = rnd.sample(ids, 2)  # sentidos opuestos entre hilos: orden de candados
+            operacion = rnd.random()
+            try:
+                if operacion < 0.5:
+                    banco.transferir(origen, destino, rnd.choice((1.0, 7.5, 500.0)))
+                elif operacion < 0.7:
+                    banco.liquidar_transferencias([(origen, destino, 3.0), (destino, origen, 1.0)])
+                else:
+                    banco.consignar_lote([(origen, 1.0), (destino, 1.0)])
+                    banco.retirar_lote([(origen, 1.0), (destino, 1.0)], atomico=False)
+            except ValueError:
+                pass  # rechazos por fondos: no cambian el total
+
+    _en_hilos(6, trabajo)
+    assert sum(banco.buscar_por_id(i).saldo_centavos for i in ids) == 12 * 10_000
+    if opciones.get("agregados"):
+        banco.verificar_agregados()
+        assert [c.saldo_centavos for c in banco.mayores_saldos(12)] == sorted(
+            (banco.buscar_por_id(i).saldo_centavos for i in ids), reverse=True
+        )
+
+
+def test_abrir_y_eliminar_mientras_se_opera():
+    banco = BancoService(concurrente=True, franjas=4)
+    fija = banco.abrir_ahorros("Fija", 0.0).id
+
+    def trabajo(rnd: random.Random) -> None:
+        for i in range(200):
+            cuenta = banco.abrir_ahorros(f"Temporal {rnd.random()}", 1.0)
+            banco.consignar(fija, 1.0)
+            banco.buscar_por_titular("temp")
+            banco.eliminar_cuenta(cuenta.id)
+            if i % 50 == 0:
+                banco.aplicar_corte_mensual_a_todas()
+
+    _en_hilos(4, trabajo)
+    assert [c.id for c in banco.listar_cuentas()] == [fija]
+    assert banco.buscar_por_titular("temp") == []
+    assert banco.buscar_por_id(fija).saldo_centavos >= 4 * 200 * 100
+
+
+def test_ids_unicos_entre_hilos():
+    banco = BancoService(concurrente=True)
+    abiertas = []
+
+    def trabajo(rnd: random.Random) -> None:
+        abiertas.extend(banco.abrir_ahorros("T").id for _ in range(300))
+
+    _en_hilos(4, trabajo)
+    assert len(set(abiertas)) == 1200 == len(banco.listar_cuentas())
+
+
+def test_franjas_invalidas():
+    with pytest.raises(ValueError, match="franja"):
+        BancoService(concurrente=True, franjas=0)
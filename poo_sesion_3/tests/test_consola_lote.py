@@ -0,0 +1,144 @@
+# tests/test_consola_lote.py
+from __future__ import annotations
+
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+from models.cuentas import CuentaBase
+from services.banco_service import BancoService
+from ui.consola import ConsolaBanco
+
+SESION = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOTE = [
+    "# comentario",
+    'abrir_ahorros "Ana Pérez" 100 0.01',
+    "",
+    "abrir_corriente Beto 0 50 5",
+    "consignar {ahorros} 10",
+    "retirar {corriente} 80",  # excede el cupo
+    "volar {ahorros}",  # comando desconocido
+    "consignar {ahorros}",  # faltan argumentos
+    "consignar {ahorros} diez",  # monto mal formado
+    "cambiar_titular {corriente} Bea",
+    "corte",
+    "listar",
+]
+
+
+def _correr(lineas: list, **opciones) -> tuple:
+    """Ejecuta el lote sobre un libro nuevo; {ahorros} y {corriente} son las dos cuentas que abre."""
+    ahorros = CuentaBase.proximo_id()
+    lineas = [linea.format(ahorros=ahorros, corriente=ahorros + 1) for linea in lineas]
+    banco = BancoService()
+    salida = io.StringIO()
+    resumen = ConsolaBanco(banco).ejecutar_lote(lineas, salida=salida, **opciones)
+    return banco, resumen, salida.getvalue()
+
+
+def test_sigue_tras_los_errores_y_los_cuenta():
+    banco, resumen, texto = _correr(LOTE)
+    assert resumen.comandos == 10 and resumen.errores == 4
+    assert resumen.detenido_en is None
+    assert resumen.por_comando == {
+        "abrir_ahorros": 1,
+        "abrir_corriente": 1,
+        "consignar": 3,
+        "retirar": 1,
+        "volar": 1,
+        "cambiar_titular": 1,
+        "corte": 1,
+        "listar": 1,
+    }
+    assert "Línea 6: Error: " in texto
+    assert "Línea 7: Error: Comando desconocido: 'volar'." in texto
+    assert "Línea 8: Error: consignar espera 2 argumento(s) y recibió 1." in texto
+    assert "Línea 9: Error: " in texto
+
+    ahorros, corriente = banco.listar_cuentas()
+    assert ahorros.titular == "Ana Pérez" and corriente.titular == "Bea"
+    assert ahorros.saldo_centavos == 11_110  # 110 + 1 % de interés
+    assert corriente.saldo_centavos == -500  # solo la cuota: el retiro se rechazó
+    assert texto.count("Cuenta") >= 4 and str(corriente) in texto
+    assert texto.rstrip().endswith(str(resumen).splitlines()[-1])
+
+
+def test_detener_en_error():
+    banco, resumen, texto = _correr(LOTE, detener_en_error=True)
+    assert resumen.detenido_en == 6
+    assert resumen.comandos == 4 and resumen.errores == 1
+    assert "Detenido por el error de la línea 6." in texto
+    assert "Línea 7" not in texto
+    assert [c.saldo_centavos for c in banco.listar_cuentas()] == [11_000, 0]
+
+
+@pytest.mark.parametrize("detener_en_error", [False, True])
+def test_solo_resumen(detener_en_error):
+    _, resumen, texto = _correr(LOTE, solo_resumen=True, detener_en_error=detener_en_error)
+    assert texto == f"{resumen}\n"
+    assert "Línea" not in texto and "Cuenta creada" not in texto
+
+
+@pytest.mark.parametrize(
+    "linea, mensaje",
+    [
+        ("cerrar", "cerrar espera 1 argumento(s) y recibió 0."),
+        ("corte ya", "corte espera 0 argumento(s) y recibió 1."),
+        ("consignar 999999 1", "No existe una cuenta con id=999999."),
+        ("abrir_ahorros '   ' 1 0.01", "El titular no puede estar vacío."),
+        ("abrir_ahorros Ana -1 0.01", "El saldo inicial no puede ser negativo."),
+        ("buscar 'sin cerrar", "No closing quotation"),
+    ],
+)
+def test_errores_de_una_linea(linea, mensaje):
+    _, resumen, texto = _correr([linea])
+    assert resumen.comandos == 1 and resumen.errores == 1
+    assert f"Línea 1: Error: {mensaje}" in texto
+
+
+def test_lineas_vacias_y_comentarios_no_cuentan():
+    _, resumen, texto = _correr(["", "   ", "# nada", "  # tampoco"])
+    assert resumen.comandos == 0 and resumen.errores == 0 and resumen.por_comando == {}
+    assert texto.startswith("Lote: 0 comandos, 0 errores")
+
+
+def _main(*argumentos: str, entrada: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "main.py", *argumentos],
+        input=entrada,
+        capture_output=True,
+        text=True,
+        cwd=SESION,
+        timeout=60,
+    )
+
+
+def test_main_desde_stdin_sale_con_1_si_hubo_errores():
+    bien = _main("--lote", "-", entrada="listar\nbuscar Juli\n")
+    assert bien.returncode == 0
+    assert "Juliana" in bien.stdout and "Lote: 2 comandos, 0 errores" in bien.stdout
+
+    mal = _main("--lote", "-", "--solo-resumen", entrada="volar\nlistar\n")
+    assert mal.returncode == 1
+    assert mal.stdout.startswith("Lote: 2 comandos, 1 errores")
+    assert "Juliana" not in mal.stdout
+
+
+def test_main_desde_archivo_con_instantanea(tmp_path):
+    comandos = tmp_path / "comandos.txt"
+    comandos.write_text('abrir_ahorros "Ana Pérez" 5 0\nvolar\ncerrar 1\n', encoding="utf-8")
+    libro = tmp_path / "libro.bin"
+
+    detenido = _main(str(libro), "--lote", str(comandos), "--detener-en-error", entrada="")
+    assert detenido.returncode == 1
+    assert "Detenido por el error de la línea 2." in detenido.stdout
+    assert libro.exists()  # se guarda aunque el lote falle
+
+    listado = _main(str(libro), "--lote", "-", entrada="buscar Ana\n")
+    assert listado.returncode == 0
+    (ana,) = [linea for linea in listado.stdout.splitlines() if "Ana Pérez" in linea]
+    assert "estado=activa" in ana
@@ -0,0 +1,126 @@
+# tests/test_corte_con_reporte.py
+from __future__ import annotations
+
+import pytest
+
+from services.banco_service import BancoService
+from services.bitacora import Bitacora
+
+
+def _poblar(banco):
+    banco.abrir_ahorros("Ana", 1000.0, 0.01)
+    cerrada = banco.abrir_ahorros("Beto", 50.0, 0.01)
+    banco.cerrar_cuenta(cerrada.id)
+    banco.abrir_corriente("Carla", 0.0, 100.0, 10.0)
+    excede = banco.abrir_corriente("Dario", 0.0, 0.0, 10.0)  # sin cupo: la cuota no cabe
+    banco.abrir_corriente("Elena", 20.0, 0.0, 0.0)
+    return cerrada.id, excede.id
+
+
+def _resumen(reporte):
+    return (reporte.aplicadas, reporte.interes_total_centavos, reporte.cuotas_total_centavos, reporte.rechazadas)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_no_se_detiene_y_reporta(columnar):
+    if columnar:
+        pytest.importorskip("numpy")
+    banco = BancoService(columnar=columnar)
+    cerrada, excede = _poblar(banco)
+
+    reporte = banco.aplicar_corte_mensual_con_reporte()
+
+    assert reporte.aplicadas == 3
+    assert reporte.interes_total_centavos == 1_000
+    assert reporte.cuotas_total_centavos == 1_000
+    assert reporte.rechazadas == [
+        (cerrada, "No se puede operar sobre una cuenta cerrada."),
+        (excede, "La cuota de manejo excede el cupo de sobregiro."),
+    ]
+    assert [c.saldo_centavos for c in banco.listar_cuentas()] == [101_000, 5_000, -1_000, 0, 2_000]
+
+
+def test_columnar_igual_a_objetos_con_indices_al_dia():
+    pytest.importorskip("numpy")
+    opciones = {"agregados": True, "verificar_agregados": True, "indice_saldos": True}
+    objetos = BancoService(**opciones)
+    columnar = BancoService(columnar=True, **opciones)
+    for banco in (objetos, columnar):
+        _poblar(banco)
+        eliminada = banco.abrir_ahorros("Fabio", 10.0)
+        banco.eliminar_cuenta(eliminada.id)  # fila LIBRE en el almacén
+
+    reportes = [_resumen(banco.aplicar_corte_mensual_con_reporte()) for banco in (objetos, columnar)]
+
+    assert reportes[0][:3] == reportes[1][:3]
+    assert [motivo for _, motivo in reportes[0][3]] == [motivo for _, motivo in reportes[1][3]]
+    assert [c.saldo_centavos for c in objetos.listar_cuentas()] == [c.saldo_centavos for c in columnar.listar_cuentas()]
+    for banco in (objetos, columnar):
+        banco.resumen_cartera()  # verificar_agregados lanza si se desviaron
+        assert [c.titular for c in banco.mayores_saldos(3)] == ["Ana", "Beto", "Elena"]  # cerradas incluidas
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_se_reproduce_desde_la_bitacora(tmp_path, columnar):
+    if columnar:
+        pytest.importorskip("numpy")
+    bitacora = Bitacora(str(tmp_path / "bitacora.log"))
+    banco = BancoService(bitacora=bitacora, columnar=columnar)
+    _poblar(banco)
+    banco.aplicar_corte_mensual_con_reporte()
+    banco.aplicar_corte_mensual_con_reporte()
+    bitacora.cerrar()
+
+    reproducido = BancoService.desde_bitacora(Bitacora(bitacora.ruta), columnar=columnar)
+    assert [c.saldo_centavos for c in reproducido.listar_cuentas()] == [
+        c.saldo_centavos for c in banco.listar_cuentas()
+    ]
+
+
+def test_foto_abierta_no_ve_el_corte():
+    banco = BancoService()
+    _poblar(banco)
+    foto = banco.snapshot()
+    banco.aplicar_corte_mensual_con_reporte()
+    assert [c.saldo_centavos for c in foto] == [100_000, 5_000, 0, 0, 2_000]
+
+
+def test_devengo_perezoso_no_lo_admite():
+    with pytest.raises(ValueError, match="devengo"):
+        BancoService(devengo_perezoso=True).aplicar_corte_mensual_con_reporte()
+
+
+@pytest.mark.parametrize("procesos", [2, 3])
+def test_por_procesos_igual_que_en_uno(procesos):
+    pytest.importorskip("numpy")
+    from services.corte_paralelo import cerrar_procesos
+
+    bancos = [BancoService(columnar=True, agregados=True, verificar_agregados=True) for _ in range(2)]
+    for banco in bancos:
+        for _ in range(3):
+            _poblar(banco)
+        eliminada = banco.abrir_ahorros("Fabio", 10.0)
+        banco.eliminar_cuenta(eliminada.id)
+    try:
+        reportes = [
+            _resumen(bancos[0].aplicar_corte_mensual_con_reporte()),
+            _resumen(bancos[1].aplicar_corte_mensual_con_reporte(procesos=procesos)),
+        ]
+    finally:
+        cerrar_procesos()
+
+    assert reportes[0][:3] == reportes[1][:3] == (9, 3_000, 3_000)
+    assert [motivo for _, motivo in reportes[0][3]] == [motivo for _, motivo in reportes[1][3]]
+    saldos = [[c.saldo_centavos for c in banco.listar_cuentas()] for banco in bancos]
+    assert saldos[0] == saldos[1]
+    bancos[1].resumen_cartera()  # los agregados se recalculan desde las columnas copiadas de vuelta
+
+
+def test_por_procesos_requiere_columnar():
+    banco = BancoService()
+    _poblar(banco)
+    with pytest.raises(ValueError, match="columnar"):
+        banco.aplicar_corte_mensual_con_reporte(procesos=2)
+    with pytest.raises(ValueError, match="proceso"):
+        banco.aplicar_corte_mensual_con_reporte(procesos=0)
+    assert [c.saldo_centavos for c in banco.listar_cuentas()] == [100_000, 5_000, 0, 0, 2_000]
@@ -0,0 +1,153 @@
+# tests/test_corte_reanudable.py
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from services.banco_service import BancoService
+from services.bitacora import Bitacora
+
+
+class _Interrumpir(Exception):
+    pass
+
+
+def _banco(tmp_path, **opciones):
+    bitacora = Bitacora(str(tmp_path / "bitacora.log"))
+    return BancoService(bitacora=bitacora, **opciones), bitacora
+
+
+def _poblar(banco):
+    ids = []
+    for i in range(60):
+        if i % 3 == 0:
+            ids.append(banco.abrir_ahorros(f"Titular {i}", 100.0 + i, 0.02).id)
+        else:
+            ids.append(banco.abrir_corriente(f"Titular {i}", 10.0, 50.0 if i % 4 else 0.0, 20.0).id)
+    return ids
+
+
+def test_requiere_bitacora():
+    with pytest.raises(ValueError, match="bitácora"):
+        BancoService().aplicar_corte_mensual_reanudable("2026-10")
+
+
+def test_rechaza_tramo_vacio_y_devengo(tmp_path):
+    banco, _ = _banco(tmp_path)
+    with pytest.raises(ValueError):
+        banco.aplicar_corte_mensual_reanudable("2026-10", cada=0)
+    perezoso = BancoService(bitacora=Bitacora(str(tmp_path / "otra.log")), devengo_perezoso=True)
+    with pytest.raises(ValueError, match="devengo"):
+        perezoso.aplicar_corte_mensual_reanudable("2026-10")
+
+
+@pytest.mark.parametrize("operacion", ["cerrar_cuenta", "eliminar_cuenta"])
+def test_tipo_sin_activas_tras_el_corte(tmp_path, operacion):
+    banco, _ = _banco(tmp_path)
+    banco.abrir_ahorros("Ana", 100.0)
+    corriente = banco.abrir_corriente("Beto", 0.0)
+    banco.cerrar_cuenta(corriente.id)
+    banco.aplicar_corte_mensual_reanudable("2026-10")
+
+    getattr(banco, operacion)(corriente.id)
+
+    if operacion == "eliminar_cuenta":
+        assert banco.buscar_por_id(corriente.id) is None
+        assert banco.buscar_por_titular("Beto") == []
+
+
+def test_eliminar_que_falla_deja_la_cuenta_registrada(tmp_path, monkeypatch):
+    banco, _ = _banco(tmp_path)
+    cuenta = banco.abrir_ahorros("Carla", 10.0)
+
+    def fallar(cuenta_id):
+        raise RuntimeError("índice roto")
+
+    monkeypatch.setattr(banco._indice_titulares, "quitar", fallar)
+    with pytest.raises(RuntimeError):
+        banco.eliminar_cuenta(cuenta.id)
+    assert banco.buscar_por_id(cuenta.id) is cuenta
+    assert banco.buscar_por_titular("Carla") == [cuenta]
+
+
+@pytest.mark.parametrize(
+    "opciones",
+    [{}, {"columnar": True}, {"concurrente": True, "agregados": True, "historial": True, "indice_saldos": True}],
+)
+def test_reanuda_sin_repetir_y_reproduce(tmp_path, opciones):
+    if opciones.get("columnar"):
+        pytest.importorskip("numpy")
+    banco, bitacora = _banco(tmp_path, **opciones)
+    _poblar(banco)
+    limpio = BancoService(bitacora=Bitacora(str(tmp_path / "limpio.log")), **opciones)
+    _poblar(limpio)
+    limpio.aplicar_corte_mensual_reanudable("2026-10", cada=7)
+
+    def interrumpir(reporte):
+        if reporte.tramos == 3:
+            raise _Interrumpir
+
+    with pytest.raises(_Interrumpir):
+        banco.aplicar_corte_mensual_reanudable("2026-10", cada=7, progreso=interrumpir)
+    assert banco.progreso_corte("2026-10").tramos == 3
+
+    reporte = banco.aplicar_corte_mensual_reanudable("2026-10", cada=7)
+    assert reporte.reanudado and not reporte.ya_aplicado
+    assert banco.aplicar_corte_mensual_reanudable("2026-10").ya_aplicado
+
+    saldos = [c.saldo_centavos for c in banco.listar_cuentas()]
+    assert saldos == [c.saldo_centavos for c in limpio.listar_cuentas()]
+
+    bitacora.cerrar()
+    reproducido = BancoService.desde_bitacora(Bitacora(bitacora.ruta), **opciones)
+    assert [c.saldo_centavos for c in reproducido.listar_cuentas()] == saldos
+    assert reproducido.aplicar_corte_mensual_reanudable("2026-10").ya_aplicado
+
+
+def test_excepcion_a_mitad_de_tramo_no_repite_cuentas(tmp_path, monkeypatch):
+    banco, _ = _banco(tmp_path)
+    ids = [banco.abrir_ahorros(f"T{i}", 100.0, 0.05).id for i in range(10)]
+    clase = type(banco.buscar_por_id(ids[0]))
+    original = clase.aplicar_corte_mensual
+
+    def fallar_en_la_quinta(cuenta):
+        if cuenta.id == ids[4]:
+            raise RuntimeError("interrupción")
+        original(cuenta)
+
+    monkeypatch.setattr(clase, "aplicar_corte_mensual", fallar_en_la_quinta)
+    with pytest.raises(RuntimeError):
+        banco.aplicar_corte_mensual_reanudable("2026-10", cada=10)
+    assert banco.progreso_corte("2026-10").cuentas == 4
+
+    monkeypatch.setattr(clase, "aplicar_corte_mensual", original)
+    banco.aplicar_corte_mensual_reanudable("2026-10", cada=10)
+    assert {banco.buscar_por_id(i).saldo_centavos for i in ids} == {10_500}
+
+
+def test_cierres_concurrentes_durante_el_corte(tmp_path):
+    banco, _ = _banco(tmp_path, concurrente=True, franjas=8)
+    ids = [banco.abrir_ahorros(f"T{i}", 100.0, 0.01).id for i in range(3000)]
+    errores = []
+
+    def cerrar():
+        try:
+            for cuenta_id in ids[::3]:
+                banco.cerrar_cuenta(cuenta_id)
+        except Exception as e:  # pragma: no cover - solo si hay carrera
+            errores.append(e)
+
+    hilo = threading.Thread(target=cerrar)
+    hilo.start()
+    reporte = banco.aplicar_corte_mensual_reanudable("2026-10", cada=50)
+    hilo.join()
+
+    assert not errores
+    assert banco.progreso_corte("2026-10").terminado
+    cerradas = set(ids[::3])
+    saldos = {i: banco.buscar_por_id(i).saldo_centavos for i in ids}
+    assert all(saldos[i] == 10_100 for i in ids if i not in cerradas)
+    # Una cerrada antes de su tramo se salta; después, ya tenía el corte
+    assert all(saldos[i] in (10_000, 10_100) for i in cerradas)
+    assert reporte.aplicadas == sum(1 for saldo in saldos.values() if saldo == 10_100)
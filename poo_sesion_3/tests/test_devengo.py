@@ -0,0 +1,78 @@
+# tests/test_devengo.py
+from __future__ import annotations
+
+import pytest
+
+from models.cuentas import CuentaAhorros, CuentaCorriente
+from models.cuentas_devengo import CuentaAhorrosDevengo, CuentaCorrienteDevengo, RelojPeriodos
+from services.banco_service import BancoService
+
+
+@pytest.mark.parametrize("saldo, tasa", [(1234.56, 0.001), (0.5, 0.01), (0.01, 0.3), (0.0, 0.05), (999.99, 0.0)])
+def test_ahorros_perezosa_igual_a_k_cortes(saldo, tasa):
+    k = 3000
+    reloj = RelojPeriodos()
+    perezosa = CuentaAhorrosDevengo(reloj, "Ana", saldo, tasa)
+    inmediata = CuentaAhorros("Ana", saldo, tasa)
+    for _ in range(k):
+        reloj.avanzar()
+        inmediata.aplicar_corte_mensual()
+    assert perezosa.saldo_centavos == inmediata.saldo_centavos
+
+
+@pytest.mark.parametrize("saldo, cupo, cuota", [(100.0, 50.0, 0.7), (0.0, 0.0, 1.0), (5.0, 0.0, 0.0), (3.0, 2.0, 10.0)])
+def test_corriente_perezosa_igual_a_k_cortes(saldo, cupo, cuota):
+    k = 3000
+    reloj = RelojPeriodos()
+    perezosa = CuentaCorrienteDevengo(reloj, "Beto", saldo, cupo, cuota)
+    inmediata = CuentaCorriente("Beto", saldo, cupo, cuota)
+    for _ in range(k):
+        reloj.avanzar()
+        try:
+            inmediata.aplicar_corte_mensual()
+        except ValueError:
+            pass  # la cuota no cabe: el corte perezoso salta ese periodo
+    assert perezosa.saldo_centavos == inmediata.saldo_centavos
+
+
+def test_servicio_perezoso_igual_al_corte_con_reporte():
+    perezoso, inmediato = BancoService(devengo_perezoso=True), BancoService()
+    for banco in (perezoso, inmediato):
+        banco.abrir_ahorros("Ana", 1000.0, 0.002)
+        banco.abrir_corriente("Beto", 20.0, 30.0, 1.5)
+        banco.abrir_ahorros("Cata", 10.0, 0.5)
+    for periodo in range(400):
+        perezoso.aplicar_corte_mensual_a_todas()
+        inmediato.aplicar_corte_mensual_con_reporte()
+        if periodo == 150:
+            for banco in (perezoso, inmediato):
+                _, corriente, cerrada = banco.listar_cuentas()
+                banco.cerrar_cuenta(cerrada.id)
+                banco.consignar(corriente.id, 100.0)
+    assert [c.saldo_centavos for c in perezoso.listar_cuentas()] == [
+        c.saldo_centavos for c in inmediato.listar_cuentas()
+    ]
+
+
+@pytest.mark.parametrize(
+    "opciones",
+    [
+        {"columnar": True},
+        {"agregados": True},
+        {"verificar_agregados": True},
+        {"indice_saldos": True},
+        {"historial": True},
+        {"concurrente": True},
+    ],
+)
+def test_combinaciones_no_admitidas(opciones):
+    with pytest.raises(ValueError, match="devengo"):
+        BancoService(devengo_perezoso=True, **opciones)
+
+
+def test_cortes_con_reporte_y_reanudable_no_lo_admiten():
+    banco = BancoService(devengo_perezoso=True)
+    with pytest.raises(ValueError, match="O\\(1\\)"):
+        banco.aplicar_corte_mensual_con_reporte()
+    with pytest.raises(ValueError):
+        banco.aplicar_corte_mensual_reanudable("2026-10")
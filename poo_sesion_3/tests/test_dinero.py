@@ -0,0 +1,67 @@
+# tests/test_dinero.py
+from __future__ import annotations
+
+import pytest
+
+from models.dinero import a_centavos, a_unidades, formatear, interes_centavos
+from models.resultados import MONTO_INVALIDO
+from services.banco_service import BancoService
+
+
+@pytest.mark.parametrize(
+    "monto, centavos",
+    [(3, 300), (0.1, 10), ("2.50", 250), (0.125, 12), (0.135, 14), (-1.5, -150), (1e12, 100_000_000_000_000)],
+)
+def test_a_centavos(monto, centavos):
+    assert a_centavos(monto) == centavos  # mitad al par: 12.5 -> 12, 13.5 -> 14
+
+
+@pytest.mark.parametrize("monto", [float("inf"), float("-inf"), float("nan"), "abc", ""])
+def test_a_centavos_invalido(monto):
+    with pytest.raises(ValueError):
+        a_centavos(monto)
+
+
+def test_a_centavos_sin_numero():
+    with pytest.raises(TypeError):
+        a_centavos(None)
+
+
+def test_interes_mitad_al_par():
+    assert interes_centavos(250, 0.01) == 2
+    assert interes_centavos(350, 0.01) == 4
+    assert interes_centavos(-1000, 0.01) == -10  # la cuenta solo abona si es > 0
+
+
+@pytest.mark.parametrize("centavos, texto", [(0, "0.00"), (5, "0.05"), (-5, "-0.05"), (123456, "1234.56")])
+def test_formatear(centavos, texto):
+    assert formatear(centavos) == texto
+    assert a_unidades(centavos) == float(texto)
+
+
+def test_sumas_exactas():
+    banco = BancoService()
+    cuenta = banco.abrir_ahorros("Ana")
+    for _ in range(10_000):
+        banco.consignar(cuenta.id, 0.1)
+    for _ in range(5_000):
+        banco.retirar(cuenta.id, 0.2)
+    assert cuenta.saldo_centavos == 0 and cuenta.saldo == 0.0
+
+
+@pytest.mark.parametrize("monto", [0, 0.004, -1.0, float("nan"), "x"])
+def test_montos_que_no_llegan_a_un_centavo_o_no_son_numeros(monto):
+    banco = BancoService()
+    cuenta = banco.abrir_ahorros("Ana", 1.0)
+    with pytest.raises(ValueError):
+        banco.consignar(cuenta.id, monto)
+    assert banco.intentar_retirar(cuenta.id, monto) == MONTO_INVALIDO
+    assert cuenta.saldo_centavos == 100
+
+
+def test_corte_redondea_el_interes_al_centavo():
+    banco = BancoService()
+    cuenta = banco.abrir_ahorros("Ana", 2.50, 0.01)
+    banco.aplicar_corte_mensual_a_todas()
+    assert cuenta.saldo_centavos == 252
+    assert str(cuenta).endswith("saldo=2.52, estado=activa)")
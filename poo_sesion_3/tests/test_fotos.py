@@ -0,0 +1,145 @@
+# tests/test_fotos.py
+from __future__ import annotations
+
+import gc
+import threading
+
+import pytest
+
+from services.banco_service import BancoService
+
+
+def _estado(foto) -> list:
+    return [(c.id, c.tipo, c.titular, c.saldo_centavos, c.activa) for c in foto]
+
+
+def _poblar(banco: BancoService) -> list:
+    return [
+        banco.abrir_ahorros("Ana", 100.0, 0.01).id,
+        banco.abrir_corriente("Beto", 0.0, 50.0, 2.0).id,
+        banco.abrir_ahorros("Carla", 10.0).id,
+        banco.abrir_corriente("Dario", 5.0).id,
+    ]
+
+
+@pytest.mark.parametrize("opciones", [{}, {"concurrente": True}, {"columnar": True}, {"agregados": True}])
+def test_no_ve_cambios_posteriores(opciones):
+    banco = BancoService(**opciones)
+    a, b, c, d = _poblar(banco)
+    banco.eliminar_cuenta(d)  # eliminada antes: no aparece
+    foto = banco.snapshot()
+    esperado = _estado(foto)
+    assert [fila[0] for fila in esperado] == [a, b, c]
+    assert foto.cuentas_copiadas == 0
+
+    banco.consignar(a, 5.0)
+    banco.transferir(a, b, 1.0)
+    banco.cambiar_titular(c, "Carla Nueva")
+    banco.cerrar_cuenta(c)
+    banco.eliminar_cuenta(b)
+    nueva = banco.abrir_ahorros("Eva", 1.0).id
+
+    assert _estado(foto) == esperado
+    assert foto.cuentas_copiadas == 3
+    assert foto.buscar_por_id(b).saldo_centavos == 0
+    assert foto.buscar_por_id(d) is None and foto.buscar_por_id(nueva) is None
+    assert str(foto.buscar_por_id(c)) == f"CuentaAhorros(id={c}, titular='Carla', saldo=10.00, estado=activa)"
+    assert foto.buscar_por_id(a).saldo == 100.0
+
+
+@pytest.mark.parametrize("corte", ["aplicar_corte_mensual_a_todas", "aplicar_corte_mensual_con_reporte"])
+def test_el_corte_copia_todas(corte):
+    banco = BancoService()
+    _poblar(banco)
+    foto = banco.snapshot()
+    esperado = _estado(foto)
+    getattr(banco, corte)()
+    assert foto.cuentas_copiadas == 4
+    assert _estado(foto) == esperado
+    assert [c.saldo_centavos for c in banco.listar_cuentas()] != [fila[3] for fila in esperado]
+
+
+def test_rechazos_no_cambian_lo_visto():
+    banco = BancoService()
+    a, b, _, _ = _poblar(banco)
+    foto = banco.snapshot()
+    with pytest.raises(ValueError):
+        banco.retirar(a, 1000.0)
+    with pytest.raises(ValueError):
+        banco.consignar(999_999, 1.0)
+    banco.intentar_consignar(a, -1.0)
+    assert foto.cuentas_copiadas == 1  # la cuenta tocada se copia aunque se rechace
+    assert foto.buscar_por_id(a).saldo_centavos == 10_000
+    with pytest.raises(ValueError, match="Lote revertido"):
+        banco.retirar_lote([(b, 1.0), (a, 1000.0)])
+    assert foto.buscar_por_id(b).saldo_centavos == 0
+
+
+def test_varias_fotos_y_cierre():
+    banco = BancoService()
+    a, _, _, _ = _poblar(banco)
+    primera = banco.snapshot()
+    banco.consignar(a, 1.0)
+    with banco.snapshot() as segunda:
+        banco.consignar(a, 1.0)
+        assert primera.buscar_por_id(a).saldo_centavos == 10_000
+        assert segunda.buscar_por_id(a).saldo_centavos == 10_100
+    assert not segunda.abierta and primera.abierta
+
+    primera.cerrar()
+    primera.cerrar()  # cerrar dos veces no falla
+    banco.consignar(a, 1.0)
+    assert primera.cuentas_copiadas == 1 and segunda.cuentas_copiadas == 1  # ya no copian
+    assert banco._fotos == []
+
+
+def test_se_cierra_al_recolectarse():
+    banco = BancoService()
+    a, _, _, _ = _poblar(banco)
+    banco.snapshot()  # sin referencia
+    gc.collect()
+    assert banco._fotos == []
+    banco.consignar(a, 1.0)
+
+
+def test_rechazada_con_devengo_perezoso():
+    with pytest.raises(ValueError, match="fotos no se combinan"):
+        BancoService(devengo_perezoso=True).snapshot()
+
+
+def test_desde_instantanea(tmp_path):
+    ruta = str(tmp_path / "libro.bin")
+    origen = BancoService()
+    a, b, _, _ = _poblar(origen)
+    origen.guardar_instantanea(ruta)
+
+    banco = BancoService.desde_instantanea(ruta)
+    foto = banco.snapshot()
+    banco.transferir(a, b, 10.0)
+    banco.eliminar_cuenta(a)
+    assert _estado(foto) == [(c.id, c.tipo(), c.titular, c.saldo_centavos, c.activa) for c in origen.listar_cuentas()]
+
+
+def test_lectura_consistente_con_escritores_concurrentes():
+    banco = BancoService(concurrente=True, franjas=8)
+    ids = [banco.abrir_ahorros(f"T{i}", 100.0).id for i in range(200)]
+    total = sum(banco.buscar_por_id(i).saldo_centavos for i in ids)
+    fin = threading.Event()
+
+    def transferir() -> None:
+        n = 0
+        while not fin.is_set():
+            banco.transferir(ids[n % len(ids)], ids[(n * 7 + 1) % len(ids)], 0.5)
+            n += 1
+
+    hilos = [threading.Thread(target=transferir) for _ in range(2)]
+    for hilo in hilos:
+        hilo.start()
+    try:
+        for _ in range(20):
+            with banco.snapshot() as foto:
+                assert sum(c.saldo_centavos for c in foto) == total
+    finally:
+        fin.set()
+        for hilo in hilos:
+            hilo.join()
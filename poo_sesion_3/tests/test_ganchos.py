@@ -0,0 +1,81 @@
+# tests/test_ganchos.py
+"""
+Todo cambio pasa por _antes_de_mutar/_despues_de_mutar: fotos, agregados,
+historial e índice de saldos deben quedar al día con cualquier mezcla de
+opciones y también cuando una operación se rechaza o un lote se revierte.
+"""
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from models.resultados import CUENTA_INEXISTENTE, FONDOS_INSUFICIENTES, OK
+from services.banco_service import BancoService
+
+OPCIONES = ["agregados", "historial", "indice_saldos", "concurrente"]
+
+
+def _operar(banco: BancoService, a: int, b: int, c: int, d: int) -> None:
+    banco.consignar(a, 5.0)
+    banco.retirar(b, 20.0)
+    assert banco.intentar_retirar(a, 1000.0) == FONDOS_INSUFICIENTES
+    assert banco.intentar_consignar(b, 3.0) == OK
+    assert banco.intentar_consignar(-1, 3.0) == CUENTA_INEXISTENTE
+    with pytest.raises(ValueError):
+        banco.retirar(c, 1000.0)
+    banco.transferir(a, c, 7.0)
+    with pytest.raises(ValueError):
+        banco.transferir(c, b, 1000.0)
+    banco.consignar_lote([(a, 1.0), (b, 2.0), (a, 3.0)])
+    with pytest.raises(ValueError, match="Lote revertido"):
+        banco.retirar_lote([(a, 1.0), (c, 1000.0)])
+    banco.retirar_lote([(a, 1.0), (c, 1000.0), (-1, 1.0)], atomico=False)
+    banco.liquidar_transferencias([(a, b, 10.0), (b, c, 4.0)])
+    with pytest.raises(ValueError, match="Lote revertido"):
+        banco.liquidar_transferencias([(c, a, 1000.0)])
+    banco.aplicar_corte_mensual_a_todas()
+    banco.aplicar_corte_mensual_con_reporte()
+    banco.cambiar_titular(c, "Carla Nueva")
+    banco.cerrar_cuenta(c)
+    banco.eliminar_cuenta(d)
+
+
+def _poblar(banco: BancoService) -> tuple:
+    a = banco.abrir_ahorros("Ana", 100.0, 0.01).id
+    b = banco.abrir_corriente("Beto", 0.0, 50.0, 2.0).id
+    c = banco.abrir_ahorros("Carla", 10.0, 0.02).id
+    d = banco.abrir_corriente("Dario", 5.0, 0.0, 0.0).id
+    return a, b, c, d
+
+
+@pytest.mark.parametrize("fotos", [False, True])
+@pytest.mark.parametrize("activas", list(itertools.product([False, True], repeat=len(OPCIONES))))
+def test_ganchos_con_cualquier_combinacion(activas, fotos):
+    opciones = dict(zip(OPCIONES, activas))
+    banco = BancoService(**opciones)
+    ids = _poblar(banco)
+    antes = {cuenta.id: (cuenta.titular, cuenta.saldo_centavos) for cuenta in banco.listar_cuentas()}
+    foto = banco.snapshot() if fotos else None
+
+    _operar(banco, *ids)
+
+    referencia = BancoService()
+    _operar(referencia, *_poblar(referencia))
+    saldos = [cuenta.saldo_centavos for cuenta in banco.listar_cuentas()]
+    assert saldos == [cuenta.saldo_centavos for cuenta in referencia.listar_cuentas()]
+
+    if foto is not None:
+        for cuenta_id, (titular, saldo) in antes.items():
+            vista = foto.buscar_por_id(cuenta_id)
+            assert (vista.titular, vista.saldo_centavos, vista.activa) == (titular, saldo, True)
+    if opciones["agregados"]:
+        banco.verificar_agregados()
+    if opciones["indice_saldos"]:
+        assert [c.saldo_centavos for c in banco.mayores_saldos(10)] == sorted(saldos, reverse=True)
+    if opciones["historial"]:
+        for cuenta in banco.listar_cuentas():
+            movimientos = banco.extracto(cuenta.id)
+            assert sum(m.monto_centavos for m in movimientos) == cuenta.saldo_centavos
+            assert movimientos[-1].saldo_centavos == cuenta.saldo_centavos
+        assert banco.extracto(ids[3])  # se conserva aunque la cuenta se elimine
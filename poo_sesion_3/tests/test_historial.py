@@ -0,0 +1,162 @@
+# tests/test_historial.py
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from models.resultados import CUENTA_CERRADA, FONDOS_INSUFICIENTES, MONTO_INVALIDO
+from services.banco_service import BancoService
+from services.bitacora import Bitacora
+
+
+def _tipos(banco: BancoService, cuenta_id: int) -> list:
+    return [(m.tipo, m.monto_centavos, m.saldo_centavos) for m in banco.extracto(cuenta_id)]
+
+
+@pytest.mark.parametrize("concurrente", [False, True])
+def test_tipos_de_movimiento_y_saldos(concurrente):
+    banco = BancoService(historial=True, concurrente=concurrente)
+    ahorros = banco.abrir_ahorros("Ana", 100.0, 0.01)
+    corriente = banco.abrir_corriente("Beto", 0.0, 50.0, 2.0)
+    banco.consignar(ahorros.id, 10.0)
+    banco.retirar(ahorros.id, 5.0)
+    banco.transferir(ahorros.id, corriente.id, 5.0)
+    banco.aplicar_corte_mensual_a_todas()
+
+    assert _tipos(banco, ahorros.id) == [
+        ("apertura", 10_000, 10_000),
+        ("consignacion", 1_000, 11_000),
+        ("retiro", -500, 10_500),
+        ("transferencia_salida", -500, 10_000),
+        ("interes", 100, 10_100),
+    ]
+    assert _tipos(banco, corriente.id) == [
+        ("apertura", 0, 0),
+        ("transferencia_entrada", 500, 500),
+        ("cuota", -200, 300),
+    ]
+    movimiento = banco.extracto(ahorros.id)[-1]
+    assert (movimiento.monto, movimiento.saldo) == (1.0, 101.0)
+    assert "interes" in str(movimiento)
+
+
+def test_rechazos_y_cambios_nulos_no_dejan_movimientos():
+    banco = BancoService(historial=True)
+    cuenta = banco.abrir_ahorros("Ana", 10.0, 0.0)
+    otra = banco.abrir_ahorros("Beto", 0.0)
+    with pytest.raises(ValueError):
+        banco.retirar(cuenta.id, 50.0)
+    with pytest.raises(ValueError):
+        banco.consignar(cuenta.id, -1.0)
+    assert banco.intentar_retirar(cuenta.id, 50.0) == FONDOS_INSUFICIENTES
+    assert banco.intentar_consignar(cuenta.id, "x") == MONTO_INVALIDO
+    with pytest.raises(ValueError, match="Lote revertido"):
+        banco.retirar_lote([(cuenta.id, 1.0), (cuenta.id, 50.0)])
+    with pytest.raises(ValueError):
+        banco.transferir(cuenta.id, otra.id, 50.0)
+    banco.aplicar_corte_mensual_a_todas()  # tasa 0: sin interés
+    banco.cerrar_cuenta(otra.id)
+    assert banco.intentar_consignar(otra.id, 1.0) == CUENTA_CERRADA
+
+    assert _tipos(banco, cuenta.id) == [("apertura", 1_000, 1_000)]
+    assert _tipos(banco, otra.id) == [("apertura", 0, 0)]
+
+
+def test_rangos_de_fechas_y_saldo_al():
+    banco = BancoService(historial=True)
+    antes = time.time() - 60
+    cuenta = banco.abrir_ahorros("Ana", 10.0)
+    for monto in (1.0, 2.0, 3.0):
+        time.sleep(0.005)  # fechas bien separadas: los cortes caen entre movimientos
+        banco.consignar(cuenta.id, monto)
+    fechas = [m.fecha for m in banco.extracto(cuenta.id)]
+    entre = [(a + b) / 2 for a, b in zip(fechas, fechas[1:])]
+
+    assert [m.monto for m in banco.extracto(cuenta.id, desde=entre[0])] == [1.0, 2.0, 3.0]
+    assert [m.monto for m in banco.extracto(cuenta.id, hasta=entre[1])] == [10.0, 1.0]
+    assert [m.monto for m in banco.extracto(cuenta.id, entre[0], entre[2])] == [1.0, 2.0]
+    assert banco.extracto(cuenta.id, entre[2], entre[0]) == []
+    assert banco.extracto(cuenta.id, desde=fechas[-1] + 60) == []
+
+    assert banco.saldo_al(cuenta.id, antes) is None
+    assert [banco.saldo_al(cuenta.id, momento) for momento in entre] == [10.0, 11.0, 13.0]
+    assert banco.saldo_al(cuenta.id, fechas[-1] + 60) == 16.0
+
+
+def test_cuenta_inexistente_y_eliminada():
+    banco = BancoService(historial=True)
+    cuenta = banco.abrir_ahorros("Ana", 10.0)
+    assert banco.extracto(999_999) == []
+    assert banco.saldo_al(999_999, time.time()) is None
+    banco.eliminar_cuenta(cuenta.id)
+    assert _tipos(banco, cuenta.id) == [("apertura", 1_000, 1_000)]
+
+
+def test_memoria():
+    banco = BancoService(historial=True)
+    vacia = banco.memoria_historial()
+    assert (vacia["movimientos"], vacia["cuentas"], vacia["bytes_por_movimiento"]) == (0, 0, 0.0)
+    cuentas = [banco.abrir_ahorros(f"T{i}", 1.0) for i in range(3)]
+    for cuenta in cuentas:
+        banco.consignar(cuenta.id, 1.0)
+    memoria = banco.memoria_historial()
+    assert (memoria["movimientos"], memoria["cuentas"]) == (6, 3)
+    assert memoria["bytes_por_movimiento"] == memoria["bytes"] / 6
+
+
+@pytest.mark.parametrize("consulta", ["extracto", "saldo_al", "memoria_historial"])
+def test_sin_historial(consulta):
+    banco = BancoService()
+    cuenta = banco.abrir_ahorros("Ana", 10.0)
+    argumentos = {"extracto": (cuenta.id,), "saldo_al": (cuenta.id, time.time()), "memoria_historial": ()}
+    with pytest.raises(ValueError, match="historial=True"):
+        getattr(banco, consulta)(*argumentos[consulta])
+
+
+@pytest.mark.parametrize("opcion", ["columnar", "devengo_perezoso"])
+def test_combinaciones_rechazadas(opcion):
+    with pytest.raises(ValueError, match="historial de movimientos no se combina"):
+        BancoService(historial=True, **{opcion: True})
+
+
+def test_desde_instantanea_registra_desde_la_carga(tmp_path):
+    ruta = str(tmp_path / "libro.bin")
+    origen = BancoService()
+    cuenta = origen.abrir_ahorros("Ana", 10.0)
+    origen.guardar_instantanea(ruta)
+
+    banco = BancoService.desde_instantanea(ruta, historial=True)
+    assert banco.extracto(cuenta.id) == []
+    banco.consignar(cuenta.id, 2.0)
+    assert _tipos(banco, cuenta.id) == [("consignacion", 200, 1_200)]
+
+
+def test_bitacora_conserva_las_fechas(tmp_path):
+    ruta = str(tmp_path / "bitacora.log")
+    bitacora = Bitacora(ruta)
+    banco = BancoService(historial=True, bitacora=bitacora)
+    cuenta = banco.abrir_ahorros("Ana", 10.0)
+    otra = banco.abrir_ahorros("Beto")
+    for monto in (1.0, 2.0):
+        time.sleep(0.05)
+        banco.consignar(cuenta.id, monto)
+    time.sleep(0.05)
+    banco.transferir(cuenta.id, otra.id, 4.0)
+    bitacora.cerrar()
+    assert [registro[0] for registro in Bitacora(ruta).leer()][1:] == ["hora"] * 5
+
+    time.sleep(0.1)  # reproducir más tarde no cambia las fechas
+    reproducido = BancoService.desde_bitacora(Bitacora(ruta), historial=True)
+    for cuenta_id in (cuenta.id, otra.id):
+        originales = banco.extracto(cuenta_id)
+        reproducidos = reproducido.extracto(cuenta_id)
+        assert [m.saldo_centavos for m in reproducidos] == [m.saldo_centavos for m in originales]
+        # La hora anotada es la del registro en la bitácora, justo después del movimiento
+        assert all(0 <= r.fecha - o.fecha < 0.02 for o, r in zip(originales, reproducidos))
+    fechas = [m.fecha for m in banco.extracto(cuenta.id)]
+    entre = [(a + b) / 2 for a, b in zip(fechas, fechas[1:])]
+    assert [reproducido.saldo_al(cuenta.id, m) for m in entre] == [banco.saldo_al(cuenta.id, m) for m in entre]
+
+    sin_historial = BancoService.desde_bitacora(Bitacora(ruta))
+    assert sin_historial.buscar_por_id(cuenta.id).saldo_centavos == 900
@@ -0,0 +1,168 @@
+# tests/test_ids.py
+from __future__ import annotations
+
+import multiprocessing
+import sqlite3
+import threading
+
+import pytest
+
+from models.cuentas import CuentaBase
+from models.ids import AsignadorArrendado, AsignadorIds
+from services.banco_service import BancoService
+from services.bitacora import Bitacora
+
+
+@pytest.fixture
+def ruta(tmp_path):
+    return str(tmp_path / "ids.sqlite")
+
+
+@pytest.fixture
+def contador_del_proceso():
+    """Deja CuentaBase con el contador del proceso aunque la prueba falle."""
+    yield
+    CuentaBase.usar_asignador(None)
+
+
+def _estado(ruta: str) -> tuple:
+    conexion = sqlite3.connect(ruta)
+    try:
+        contador = conexion.execute("SELECT siguiente FROM contador").fetchone()[0]
+        libres = conexion.execute("SELECT inicio, fin FROM libres ORDER BY inicio").fetchall()
+    finally:
+        conexion.close()
+    return contador, libres
+
+
+def _tomar(asignador: AsignadorIds, n: int) -> list:
+    return [asignador.siguiente() for _ in range(n)]
+
+
+def test_interfaz_base():
+    asignador = AsignadorIds()
+    for metodo, argumentos in (("siguiente", ()), ("proximo", ()), ("asegurar_mayor_que", (1,))):
+        with pytest.raises(NotImplementedError):
+            getattr(asignador, metodo)(*argumentos)
+    asignador.cerrar()
+
+
+@pytest.mark.parametrize("bloque", [0, -1])
+def test_bloque_invalido(ruta, bloque):
+    with pytest.raises(ValueError, match="al menos un id"):
+        AsignadorArrendado(ruta, bloque)
+
+
+def test_bloques_disjuntos_y_crecientes(ruta):
+    with AsignadorArrendado(ruta, bloque=3) as a, AsignadorArrendado(ruta, bloque=3) as b:
+        assert _tomar(a, 2) == [1, 2]
+        assert _tomar(b, 4) == [4, 5, 6, 7]
+        assert _tomar(a, 3) == [3, 10, 11]
+        assert a.proximo() == 12
+    # b cierra primero: el contador ya no era su fin, lo no usado queda en
+    # libres; a sí tenía el último bloque y el contador retrocede
+    assert _estado(ruta) == (12, [(8, 10)])
+
+
+def test_cerrar_devuelve_lo_no_usado(ruta):
+    asignador = AsignadorArrendado(ruta, bloque=100)
+    assert _tomar(asignador, 5) == [1, 2, 3, 4, 5]
+    asignador.cerrar()
+    asignador.cerrar()  # cerrar dos veces no falla
+    assert _estado(ruta) == (6, [])  # nadie arrendó después: el contador retrocede
+    with pytest.raises(ValueError, match="cerrado"):
+        asignador.siguiente()
+
+    with AsignadorArrendado(ruta, bloque=100) as otro:
+        assert otro.siguiente() == 6
+
+
+def test_libres_se_arriendan_primero_y_se_parten(ruta):
+    a = AsignadorArrendado(ruta, bloque=10)
+    b = AsignadorArrendado(ruta, bloque=10)
+    assert a.siguiente() == 1
+    assert b.siguiente() == 11
+    a.cerrar()
+    assert _estado(ruta) == (21, [(2, 11)])
+
+    with AsignadorArrendado(ruta, bloque=4) as c:
+        assert _tomar(c, 5) == [2, 3, 4, 5, 6]  # del libre, en bloques de 4
+        assert _estado(ruta) == (21, [(10, 11)])
+    b.cerrar()
+    assert _estado(ruta) == (12, [(7, 10), (10, 11)])
+
+
+def test_asegurar_mayor_que(ruta):
+    with AsignadorArrendado(ruta, bloque=10) as asignador:
+        assert asignador.siguiente() == 1
+        asignador.asegurar_mayor_que(0)  # ya era mayor: no cambia nada
+        assert asignador.proximo() == 2
+        asignador.asegurar_mayor_que(50)
+        assert asignador.proximo() == 51
+        # Lo que no usó del bloque se devuelve; el siguiente bloque empieza en 51
+        assert asignador.siguiente() == 51
+        assert _estado(ruta) == (61, [])
+    assert _estado(ruta) == (52, [])
+
+
+def _proceso(ruta: str, n: int, cola) -> None:
+    with AsignadorArrendado(ruta, bloque=7) as asignador:
+        cola.put(_tomar(asignador, n))
+
+
+def test_unicos_y_densos_entre_procesos(ruta):
+    AsignadorArrendado(ruta).cerrar()  # crea las tablas antes de competir
+    cola = multiprocessing.Queue()
+    procesos = [multiprocessing.Process(target=_proceso, args=(ruta, 30 + i, cola)) for i in range(4)]
+    for proceso in procesos:
+        proceso.start()
+    ids = [cuenta_id for _ in procesos for cuenta_id in cola.get(timeout=60)]
+    for proceso in procesos:
+        proceso.join()
+        assert proceso.exitcode == 0
+
+    assert len(ids) == len(set(ids)) == 30 + 31 + 32 + 33
+    contador, libres = _estado(ruta)
+    sin_usar = {cuenta_id for inicio, fin in libres for cuenta_id in range(inicio, fin)}
+    assert set(ids) | sin_usar == set(range(1, contador))
+
+
+def test_cuentas_con_asignador(ruta, contador_del_proceso):
+    antes = BancoService().abrir_ahorros("Ana", 1.0).id
+    asignador = AsignadorArrendado(ruta, bloque=5)
+    CuentaBase.usar_asignador(asignador)
+    banco = BancoService(concurrente=True)
+    primera = banco.abrir_ahorros("Beto", 1.0).id
+    assert primera > antes  # el asignador no repite ids del contador del proceso
+
+    abiertas = []
+
+    def abrir() -> None:
+        for i in range(40):
+            abiertas.append(banco.abrir_ahorros(f"T{i}", 1.0).id)
+
+    hilos = [threading.Thread(target=abrir) for _ in range(4)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert len(set(abiertas)) == 160 and min(abiertas) > primera
+
+    CuentaBase.usar_asignador(None)  # el contador del proceso sigue después
+    assert banco.abrir_ahorros("Carla", 1.0).id == asignador.proximo() > max(abiertas)
+    asignador.cerrar()
+
+
+def test_bitacora_reproduce_sus_ids_con_asignador(ruta, tmp_path, contador_del_proceso):
+    bitacora = Bitacora(str(tmp_path / "bitacora.log"))
+    origen = BancoService(bitacora=bitacora)
+    ids = [origen.abrir_ahorros(f"T{i}", 1.0).id for i in range(3)]
+    bitacora.cerrar()
+
+    with AsignadorArrendado(ruta, bloque=5) as asignador:
+        CuentaBase.usar_asignador(asignador)
+        bitacora = Bitacora(bitacora.ruta)
+        banco = BancoService.desde_bitacora(bitacora)
+        assert [cuenta.id for cuenta in banco.listar_cuentas()] == ids
+        assert banco.abrir_ahorros("Nueva", 1.0).id > max(ids)
+        bitacora.cerrar()
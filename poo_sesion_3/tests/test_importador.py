@@ -0,0 +1,108 @@
+# tests/test_importador.py
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from services.banco_service import BancoService
+from services.bitacora import Bitacora
+
+CSV = """operacion,titular,saldo_inicial,tasa_interes,cupo_sobregiro,cuota_manejo,clave,cuenta,monto
+abrir_ahorros,Ana,100,0.02,,,a,,
+abrir_corriente,Beto,0,,50,1,b,,
+consignar,,,,,,,a,10.5
+retirar,,,,,,,b,60
+retirar,,,,,,,b,30
+abrir_ahorros,Repetida,1,,,,a,,
+abrir_ahorros,,1,,,,,,
+abrir_ahorros,Cata,-5,,,,,,
+consignar,,,,,,,zz,1
+consignar,,,,,,,a,abc
+transferir,,,,,,,a,1
+retirar,,,,,,,a,0
+"""
+
+# (línea, parte del motivo); la línea 1 es el encabezado
+MOTIVOS = [
+    (5, "cupo"),  # retirar 60 de Beto excede el cupo de 50
+    (7, "clave 'a' ya fue declarada"),
+    (8, "titular"),
+    (9, "saldo inicial"),
+    (10, "cuenta desconocida"),
+    (11, "no es un número"),
+    (12, "operación desconocida"),
+    (13, "monto"),
+]
+
+
+def _importar(tmp_path, contenido: str, nombre: str, **opciones):
+    ruta = tmp_path / nombre
+    ruta.write_text(contenido, encoding="utf-8")
+    banco = BancoService()
+    rechazos = tmp_path / "rechazos.jsonl"
+    reporte = banco.importar(str(ruta), rechazos=str(rechazos), **opciones)
+    registros = [json.loads(linea) for linea in rechazos.read_text(encoding="utf-8").splitlines()]
+    return banco, reporte, registros
+
+
+@pytest.mark.parametrize("bloque", [1, 3, 10_000])
+def test_csv_con_rechazos(tmp_path, bloque):
+    avances = []
+    banco, reporte, registros = _importar(tmp_path, CSV, "datos.csv", bloque=bloque, progreso=avances.append)
+
+    ana, beto = banco.listar_cuentas()
+    assert (ana.titular, ana.saldo_centavos, ana.tasa_interes) == ("Ana", 11_050, 0.02)
+    assert (beto.saldo_centavos, beto.cupo_sobregiro_centavos) == (-3_000, 5_000)
+    assert (reporte.filas, reporte.cuentas, reporte.movimientos, reporte.rechazadas) == (12, 2, 2, 8)
+    assert [r["linea"] for r in registros] == [linea for linea, _ in MOTIVOS]
+    for (_, texto), registro in zip(MOTIVOS, registros):
+        assert texto in registro["motivo"].lower(), registro
+    assert len(avances) == -(-12 // bloque)
+
+
+def test_jsonl_con_ids_existentes_y_lineas_rotas(tmp_path):
+    lineas = [
+        {"operacion": "abrir_corriente", "titular": "Ana", "cupo_sobregiro": 10, "clave": "x"},
+        "esto no es json",
+        {"operacion": "retirar", "cuenta": "x", "monto": 5},
+        {"operacion": "consignar", "cuenta": "x", "monto": True},
+        [1, 2],
+    ]
+    contenido = "\n".join(l if isinstance(l, str) else json.dumps(l) for l in lineas) + "\n\n"
+    banco, reporte, registros = _importar(tmp_path, contenido, "datos.jsonl")
+    (cuenta,) = banco.listar_cuentas()
+    assert cuenta.saldo_centavos == -500
+    assert [r["linea"] for r in registros] == [2, 4, 5]
+    assert (reporte.filas, reporte.rechazadas) == (5, 3)
+
+    siguiente = tmp_path / "mas.ndjson"
+    siguiente.write_text(json.dumps({"operacion": "consignar", "cuenta": cuenta.id, "monto": 5}) + "\n", "utf-8")
+    assert banco.importar(str(siguiente)).movimientos == 1  # por id, sin clave
+    assert cuenta.saldo_centavos == 0
+
+
+def test_lo_importado_va_a_la_bitacora(tmp_path):
+    ruta = tmp_path / "datos.csv"
+    ruta.write_text(CSV, encoding="utf-8")
+    bitacora = Bitacora(str(tmp_path / "bitacora.log"))
+    banco = BancoService(bitacora=bitacora)
+    banco.importar(str(ruta))
+    bitacora.cerrar()
+    reproducido = BancoService.desde_bitacora(Bitacora(bitacora.ruta))
+    saldos = [c.saldo_centavos for c in banco.listar_cuentas()]
+    assert [c.saldo_centavos for c in reproducido.listar_cuentas()] == saldos
+
+
+def test_errores_de_llamada(tmp_path):
+    banco = BancoService()
+    ruta = tmp_path / "datos.txt"
+    ruta.write_text("", encoding="utf-8")
+    with pytest.raises(ValueError, match="formato"):
+        banco.importar(str(ruta))
+    with pytest.raises(ValueError, match="Formato no soportado"):
+        banco.importar(str(ruta), formato="xml")
+    with pytest.raises(ValueError, match="bloque"):
+        banco.importar(str(ruta), formato="csv", bloque=0)
+    with pytest.raises(FileNotFoundError):
+        banco.importar(str(tmp_path / "no_existe.csv"))
@@ -0,0 +1,160 @@
+# tests/test_indice_saldos.py
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from services import indice_saldos
+from services.banco_service import BancoService
+
+
+def _operar(banco: BancoService, semilla: int, n: int = 300) -> None:
+    rnd = random.Random(semilla)
+    ids = []
+    for i in range(n):
+        if i % 3 == 0:
+            cupo = float(rnd.choice((0, 10, 40)))
+            ids.append(banco.abrir_corriente(f"C{i}", float(rnd.randrange(20)), cupo, 1.0).id)
+        else:
+            ids.append(banco.abrir_ahorros(f"A{i}", float(rnd.randrange(20)), 0.01).id)
+    for _ in range(4 * n):
+        cuenta_id, monto = rnd.choice(ids), float(rnd.randrange(1, 30))
+        accion = rnd.random()
+        if accion < 0.4:
+            banco.intentar_retirar(cuenta_id, monto)
+        elif accion < 0.8:
+            banco.intentar_consignar(cuenta_id, monto)
+        elif accion < 0.9:
+            try:
+                banco.transferir(cuenta_id, rnd.choice(ids), monto)
+            except ValueError:
+                pass
+        elif accion < 0.95 and cuenta_id in (c.id for c in banco.listar_cuentas()):
+            banco.eliminar_cuenta(cuenta_id)
+            ids.remove(cuenta_id)
+        else:
+            banco.cerrar_cuenta(cuenta_id)
+    banco.aplicar_corte_mensual_con_reporte()
+
+
+def _esperado(banco: BancoService) -> dict:
+    cuentas = banco.listar_cuentas()
+    por_saldo = sorted(cuentas, key=lambda c: (c.saldo_centavos, c.id))
+    sobregiros = [c for c in cuentas if c.saldo_centavos < 0]
+    return {
+        "mayores": [c.id for c in reversed(por_saldo)],
+        "rango": [c.id for c in por_saldo if 500 <= c.saldo_centavos <= 1_500],
+        "negativos": [c.id for c in por_saldo if c.saldo_centavos < 0],
+        "sobregiros": [
+            c.id for c in sorted(sobregiros, key=lambda c: (c.saldo_centavos / c.cupo_sobregiro_centavos, -c.id))
+        ],
+    }
+
+
+def _consultado(banco: BancoService) -> dict:
+    return {
+        "mayores": [c.id for c in banco.mayores_saldos(10**6)],
+        "rango": [c.id for c in banco.cuentas_por_saldo(5.0, 15.0)],
+        "negativos": [c.id for c in banco.cuentas_por_saldo(maximo=-0.01)],
+        "sobregiros": [uso.cuenta.id for uso in banco.uso_sobregiro()],
+    }
+
+
+@pytest.fixture
+def bloques_pequenos(monkeypatch):
+    """Bloques de 4: las pruebas parten y vacían bloques a menudo."""
+    monkeypatch.setattr(indice_saldos, "_CARGA", 4)
+
+
+@pytest.mark.parametrize("semilla", range(3))
+@pytest.mark.parametrize("opciones", [{"indice_saldos": True}, {}, {"indice_saldos": True, "concurrente": True}])
+def test_coincide_con_ordenar(bloques_pequenos, opciones, semilla):
+    banco = BancoService(**opciones)
+    _operar(banco, semilla)
+    esperado = _esperado(banco)
+    assert esperado["sobregiros"] and esperado["rango"]
+    assert _consultado(banco) == esperado
+
+
+def test_desde_instantanea_arma_el_indice_y_lo_mantiene(bloques_pequenos, tmp_path):
+    ruta = str(tmp_path / "libro.bin")
+    origen = BancoService()
+    _operar(origen, 7, n=60)
+    origen.guardar_instantanea(ruta)
+
+    banco = BancoService.desde_instantanea(ruta, indice_saldos=True)
+    assert _consultado(banco) == _esperado(origen)
+    cuenta = banco.mayores_saldos(1)[0]
+    banco.consignar(banco.cuentas_por_saldo(maximo=-0.01)[0].id, 10_000.0)  # pasa al primer lugar
+    assert banco.mayores_saldos(2)[1] is cuenta
+    assert _consultado(banco) == _esperado(banco)
+
+
+def test_empates_bordes_y_limites():
+    banco = BancoService(indice_saldos=True)
+    a = banco.abrir_ahorros("Ana", 10.0).id
+    b = banco.abrir_ahorros("Beto", 10.0).id
+    c = banco.abrir_corriente("Carla", 0.0, 100.0).id
+    d = banco.abrir_corriente("Dario", 0.0, 10.0).id
+    banco.retirar(c, 50.0)
+    banco.retirar(d, 5.0)
+
+    assert [x.id for x in banco.mayores_saldos(2)] == [b, a]  # a igual saldo, mayor id primero
+    assert banco.mayores_saldos(0) == []
+    assert [x.id for x in banco.cuentas_por_saldo(10.0, 10.0)] == [a, b]  # límites inclusivos
+    assert banco.cuentas_por_saldo(10.01) == [] and banco.cuentas_por_saldo(20.0, 5.0) == []
+    assert [x.id for x in banco.cuentas_por_saldo()] == [c, d, a, b]
+
+    usos = banco.uso_sobregiro()
+    assert [u.cuenta.id for u in usos] == [d, c]  # a igual utilización, mayor id primero
+    assert (usos[1].usado, usos[1].cupo, usos[1].utilizacion) == (50.0, 100.0, 0.5)
+    assert str(usos[1]) == f"id={c} titular='Carla' usado=50.00 cupo=100.00 (50%)"
+    assert len(banco.uso_sobregiro(1)) == 1 and banco.uso_sobregiro(0) == []
+
+    banco.consignar(c, 50.0)  # sale del sobregiro
+    banco.eliminar_cuenta(d)
+    assert banco.uso_sobregiro() == []
+    assert [x.id for x in banco.mayores_saldos()] == [b, a, c]
+
+
+@pytest.mark.parametrize("opciones", [{"indice_saldos": True}, {}])
+def test_n_negativo(opciones):
+    banco = BancoService(**opciones)
+    with pytest.raises(ValueError, match="n no puede ser negativo"):
+        banco.mayores_saldos(-1)
+    with pytest.raises(ValueError, match="n no puede ser negativo"):
+        banco.uso_sobregiro(-1)
+
+
+def test_montos_mal_formados():
+    banco = BancoService(indice_saldos=True)
+    with pytest.raises(ValueError, match="finito"):
+        banco.cuentas_por_saldo(float("nan"))
+    with pytest.raises(ValueError):
+        banco.cuentas_por_saldo(maximo="x")
+
+
+def test_rechazado_con_devengo_perezoso():
+    with pytest.raises(ValueError, match="índice de saldos"):
+        BancoService(indice_saldos=True, devengo_perezoso=True)
+
+
+
+@pytest.mark.parametrize("descendente", [False, True])
+def test_recorrer_desde_un_cursor_en_varios_bloques(descendente):
+    rnd = random.Random(5)
+    pares = sorted((rnd.randrange(-5_000, 5_000), cuenta_id) for cuenta_id in range(1, 3_000))
+    indice = indice_saldos.IndiceSaldos()
+    for saldo, cuenta_id in pares:
+        indice._saldos.agregar(indice_saldos._clave(saldo, cuenta_id))
+    esperado = pares[::-1] if descendente else pares
+
+    assert list(indice.recorrer(descendente=descendente)) == esperado
+    for posicion in (0, 511, 512, 1024, 1500, len(pares) - 1):
+        cursor = esperado[posicion]
+        assert list(indice.recorrer(cursor, descendente)) == esperado[posicion + 1 :]
+    # Un cursor que ya no está en el índice (la cuenta cambió de saldo)
+    assert list(indice.recorrer((-10**6, 1), descendente)) == ([] if descendente else pares)
+    assert list(indice.recorrer((10**6, 1), descendente)) == (esperado if descendente else [])
+
@@ -0,0 +1,72 @@
+# tests/test_indice_titulares.py
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from services.banco_service import BancoService
+from services.indice_titulares import IndiceTitulares
+
+TITULARES = ["Ana", "Al", "J", "José Pérez", "MARÍA López", "Lu", "Ñandú", "ab ab", "Tomás 99"]
+CONSULTAS = [
+    "a", "A", "l", "j", "lu", "é", "e", "ab", "b a", "ab ab", "ana", "ndú", "maría ló", "9", "99", "x", "  ", ""
+]
+
+
+def _lineal(indice: IndiceTitulares, titulares: dict, texto: str) -> list:
+    consulta = indice.normalizar(str(texto).strip())
+    if not consulta:
+        return []
+    return sorted(i for i, titular in titulares.items() if consulta in indice.normalizar(titular))
+
+
+@pytest.mark.parametrize("plegar_acentos", [False, True])
+def test_igual_al_recorrido_completo(plegar_acentos):
+    rnd = random.Random(7)
+    indice = IndiceTitulares(plegar_acentos=plegar_acentos)
+    titulares = {}
+    for paso in range(400):
+        cuenta_id = rnd.randrange(40)
+        accion = rnd.random()
+        if accion < 0.5:
+            titulares[cuenta_id] = rnd.choice(TITULARES) + rnd.choice(["", " b", "x"])
+            indice.actualizar(cuenta_id, titulares[cuenta_id])
+        elif accion < 0.7:
+            titulares.pop(cuenta_id, None)
+            indice.quitar(cuenta_id)
+        for texto in CONSULTAS:
+            assert indice.buscar(texto) == _lineal(indice, titulares, texto), (paso, texto)
+
+
+def test_solo_guarda_trigramas_o_titulares_cortos():
+    indice = IndiceTitulares()
+    indice.agregar(1, "Anita")
+    indice.agregar(2, "Al")
+    assert set(indice._trigramas) == {"ani", "nit", "ita", "al"}
+    indice.quitar(1)
+    indice.quitar(2)
+    indice.quitar(3)  # inexistente: no hace nada
+    assert indice._trigramas == {}
+
+
+def test_consulta_corta_frecuente_recorre_titulares():
+    indice = IndiceTitulares()
+    for i in range(50):
+        indice.agregar(i, f"aaa bab cac {i}")  # "a" está en muchas claves de cada titular
+    assert indice.buscar("a") == list(range(50))
+    assert indice.buscar("4") == [i for i in range(50) if "4" in str(i)]
+
+
+def test_servicio_mantiene_el_indice():
+    banco = BancoService()
+    ana = banco.abrir_ahorros("Ana", 10.0)
+    beto = banco.abrir_corriente("Beto", 0.0, 5.0)
+    banco.cambiar_titular(ana.id, "Zoe")
+    assert banco.buscar_por_titular("an") == []
+    assert banco.buscar_por_titular("z") == [ana]
+    banco.eliminar_cuenta(beto.id)
+    assert banco.buscar_por_titular("be") == []
+    with pytest.raises(ValueError):
+        banco.cambiar_titular(ana.id, "   ")
+    assert banco.buscar_por_titular("zoe") == [ana]
@@ -0,0 +1,101 @@
+# tests/test_instantanea.py
+from __future__ import annotations
+
+import pytest
+
+from services.banco_service import BancoService
+
+
+def _estado(banco: BancoService) -> list:
+    atributos = ("id", "titular", "saldo_centavos", "activa", "tasa_interes", "cupo_sobregiro_centavos", "cuota_manejo")
+    return [(c.tipo(), *(getattr(c, nombre, None) for nombre in atributos)) for c in banco.listar_cuentas()]
+
+
+@pytest.fixture
+def guardado(tmp_path):
+    banco = BancoService()
+    banco.abrir_ahorros("José Pérez", 100.25, 0.015)
+    banco.abrir_corriente("Ana", 0.0, 50.0, 1.5)
+    banco.retirar(banco.listar_cuentas()[1].id, 20.0)
+    banco.cerrar_cuenta(banco.abrir_ahorros("Cerrada", 3.0).id)
+    banco.eliminar_cuenta(banco.abrir_ahorros("Eliminada").id)
+    ruta = str(tmp_path / "libro.bin")
+    assert banco.guardar_instantanea(ruta) == 3
+    return banco, ruta
+
+
+def test_ida_y_vuelta(guardado):
+    banco, ruta = guardado
+    abierto = BancoService.desde_instantanea(ruta)
+    assert _estado(abierto) == _estado(banco)
+    cuenta = abierto.buscar_por_id(banco.listar_cuentas()[0].id)
+    assert abierto.buscar_por_id(cuenta.id) is cuenta  # se materializa una sola vez
+    assert abierto.buscar_por_titular("jos") == [cuenta]
+    assert abierto.abrir_ahorros("Nueva").id > max(c.id for c in banco.listar_cuentas())
+
+
+@pytest.mark.parametrize("opciones", [{}, {"agregados": True}, {"indice_saldos": True}, {"concurrente": True}])
+def test_opera_tras_abrir(guardado, opciones):
+    banco, ruta = guardado
+    abierto = BancoService.desde_instantanea(ruta, **opciones)
+    ahorros, corriente, cerrada = (c.id for c in banco.listar_cuentas())
+    abierto.consignar(ahorros, 1.0)
+    abierto.cambiar_titular(corriente, "Beto")
+    abierto.eliminar_cuenta(cerrada)
+    with pytest.raises(ValueError):
+        abierto.eliminar_cuenta(cerrada)
+    assert abierto.buscar_por_titular("beto")[0].id == corriente
+    assert [c.id for c in abierto.mayores_saldos(5)] == [ahorros, corriente]
+    if opciones.get("agregados"):
+        assert abierto.resumen_cartera().cuentas == 2
+        abierto.retirar(corriente, 5.0)  # ya calculados: se mantienen
+        abierto.verificar_agregados()
+
+
+@pytest.mark.parametrize("largo", [0, 5, 40, -3])
+def test_archivo_incompleto(guardado, tmp_path, largo):
+    _, ruta = guardado
+    datos = open(ruta, "rb").read()
+    truncado = tmp_path / "truncado.bin"
+    truncado.write_bytes(datos[:largo])
+    with pytest.raises(ValueError, match="incompleta"):
+        BancoService.desde_instantanea(str(truncado))
+
+
+def test_no_es_instantanea(tmp_path):
+    ruta = tmp_path / "otro.bin"
+    ruta.write_bytes(b"X" * 200)
+    with pytest.raises(ValueError, match="no es una instantánea"):
+        BancoService.desde_instantanea(str(ruta))
+
+
+@pytest.mark.parametrize("opciones", [{"columnar": True}, {"devengo_perezoso": True}])
+def test_opciones_no_admitidas(guardado, opciones):
+    _, ruta = guardado
+    with pytest.raises(ValueError):
+        BancoService.desde_instantanea(ruta, **opciones)
+
+
+def test_libro_vacio(tmp_path):
+    ruta = str(tmp_path / "vacio.bin")
+    assert BancoService().guardar_instantanea(ruta) == 0
+    assert BancoService.desde_instantanea(ruta).listar_cuentas() == []
+
+
+def test_guardar_sobre_la_misma_sin_materializar_y_cerrar(guardado):
+    banco, ruta = guardado
+    ahorros, corriente, cerrada = (c.id for c in banco.listar_cuentas())
+    abierto = BancoService.desde_instantanea(ruta)
+    abierto.consignar(corriente, 5.0)
+    abierto.eliminar_cuenta(cerrada)
+    nueva = abierto.abrir_corriente("Nueva", 1.0).id
+    assert abierto.guardar_instantanea(ruta) == 3
+    assert ahorros not in abierto._cuentas._materializadas  # copiada del archivo tal cual
+    esperado = _estado(abierto)  # el mmap sigue en el archivo anterior hasta cerrar
+    abierto.cerrar()
+    BancoService().cerrar()
+
+    reabierto = BancoService.desde_instantanea(ruta)
+    assert _estado(reabierto) == esperado
+    assert [c.id for c in reabierto.listar_cuentas()] == [ahorros, corriente, nueva]
+    reabierto.cerrar()
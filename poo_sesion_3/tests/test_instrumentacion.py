@@ -0,0 +1,180 @@
+# tests/test_instrumentacion.py
+from __future__ import annotations
+
+import pytest
+
+from models.cuentas import CuentaAhorros, CuentaBase, CuentaCorriente
+from models.resultados import CUENTA_INEXISTENTE, FONDOS_INSUFICIENTES, MENSAJES, OK
+from services.banco_service import BancoService
+from services.instrumentacion import Instrumentacion
+
+
+@pytest.fixture
+def inst():
+    return Instrumentacion()
+
+
+def _metodos(clase: type) -> dict:
+    return {nombre: valor for nombre, valor in vars(clase).items() if callable(valor)}
+
+
+def test_no_reemplaza_metodos_de_clases_ni_del_servicio(inst):
+    antes = {clase: _metodos(clase) for clase in (CuentaBase, CuentaAhorros, CuentaCorriente, BancoService)}
+    banco = BancoService(instrumentacion=inst)
+    banco.abrir_ahorros("Ana", 10.0)
+
+    assert {clase: _metodos(clase) for clase in antes} == antes
+    assert not any(callable(valor) for valor in vars(banco).values() if not isinstance(valor, Instrumentacion))
+
+
+def test_muestreo_invalido():
+    with pytest.raises(ValueError, match="muestreo"):
+        Instrumentacion(muestreo=0)
+
+
+def test_stats_sin_instrumentacion():
+    with pytest.raises(ValueError, match="instrumentación"):
+        BancoService().stats()
+
+
+@pytest.mark.parametrize("opciones", [{}, {"concurrente": True, "franjas": 4}, {"agregados": True}])
+def test_cuenta_operaciones_aplicadas(inst, opciones):
+    banco = BancoService(instrumentacion=inst, **opciones)
+    ahorros = banco.abrir_ahorros("Ana", 100.0)
+    corriente = banco.abrir_corriente("Beto", 0.0, 50.0)
+    banco.consignar(ahorros.id, 10.0)
+    assert banco.intentar_consignar(ahorros.id, 5.0) == OK
+    banco.retirar(corriente.id, 20.0)
+    banco.transferir(ahorros.id, corriente.id, 1.0)
+    banco.consignar_lote([(ahorros.id, 1.0), (corriente.id, 1.0)])
+    banco.buscar_por_id(ahorros.id)
+    banco.listar_cuentas()
+
+    stats = banco.stats()
+    llamadas = {nombre: datos["llamadas"] for nombre, datos in stats.items() if datos["llamadas"]}
+    assert llamadas == {
+        "abrir_ahorros": 1,
+        "abrir_corriente": 1,
+        "consignar": 2,  # intentar_consignar se anota (y cuenta) como consignar
+        "retirar": 1,
+        "transferir": 1,
+        "consignar_lote": 1,
+    }
+    assert all(datos["rechazos"] == 0 for datos in stats.values())
+
+
+def test_rechazos_por_motivo(inst):
+    banco = BancoService(instrumentacion=inst)
+    cuenta = banco.abrir_ahorros("Ana", 10.0)
+    for cuenta_id in (998, 999):
+        with pytest.raises(ValueError):
+            banco.consignar(cuenta_id, 1.0)
+    with pytest.raises(ValueError):
+        banco.retirar(cuenta.id, 50.0)
+    assert banco.intentar_retirar(cuenta.id, 50.0) == FONDOS_INSUFICIENTES
+    assert banco.intentar_consignar(12345, 1.0) != OK
+    with pytest.raises(ValueError):
+        banco.transferir(cuenta.id, cuenta.id, 1.0)
+    with pytest.raises(ValueError):
+        banco.abrir_ahorros("   ")
+
+    stats = banco.stats()
+    assert stats["consignar"]["motivos"] == {
+        "No existe una cuenta con id=N.": 2,
+        MENSAJES[CUENTA_INEXISTENTE]: 1,  # intentar_consignar informa el código
+    }
+    assert stats["retirar"]["rechazos"] == 2
+    assert stats["transferir"]["rechazos"] == 1
+    assert stats["abrir_ahorros"]["rechazos"] == 1
+    assert stats["consignar"]["llamadas"] == 0
+    assert cuenta.saldo_centavos == 1_000
+
+
+def test_rechazos_de_lotes(inst):
+    banco = BancoService(instrumentacion=inst)
+    cuenta = banco.abrir_ahorros("Ana", 10.0)
+
+    estados = banco.retirar_lote([(cuenta.id, 1.0), (cuenta.id, 100.0), (777, 1.0), ("mal",)], atomico=False)
+    assert estados[0] is None and all(estados[1:])
+    with pytest.raises(ValueError, match="Lote revertido"):
+        banco.retirar_lote([(cuenta.id, 1.0), (cuenta.id, 100.0)])
+
+    stats = banco.stats()
+    assert stats["retirar_lote"]["llamadas"] == 1  # solo el de mejor esfuerzo aplicó algo
+    assert stats["retirar_lote"]["rechazos"] == 4  # 3 del de mejor esfuerzo y el atómico completo
+
+
+def test_mide_cada_operacion_y_la_llamada_a_la_cuenta(inst):
+    banco = BancoService(instrumentacion=inst)
+    ahorros = banco.abrir_ahorros("Ana", 100.0)
+    corriente = banco.abrir_corriente("Beto", 0.0, 50.0)
+    for _ in range(50):
+        banco.consignar(ahorros.id, 1.0)
+    banco.retirar(corriente.id, 20.0)
+    assert banco.intentar_retirar(ahorros.id, 10_000.0) == FONDOS_INSUFICIENTES
+    with pytest.raises(ValueError):
+        banco.consignar(999, 1.0)
+    banco.aplicar_corte_mensual_a_todas()
+
+    stats = inst.stats()
+    observadas = {nombre: datos["latencia_ns"]["observadas"] for nombre, datos in stats.items()}
+    assert observadas == {
+        "abrir_ahorros": 1,
+        "abrir_corriente": 1,
+        "consignar": 51,  # los rechazos también se miden
+        "retirar": 1,
+        "intentar_retirar": 1,
+        "aplicar_corte_mensual_a_todas": 1,
+        "CuentaAhorros.consignar": 50,
+        "CuentaCorriente.retirar": 1,
+        "CuentaAhorros.intentar_retirar": 1,
+    }
+    latencia = stats["consignar"]["latencia_ns"]
+    assert sum(latencia["cubetas"].values()) == latencia["observadas"]
+    assert latencia["suma"] > 0 and latencia["media"] == latencia["suma"] / latencia["observadas"]
+    # Tiempo de la llamada, no de un tic de muestreo: consignar tarda microsegundos
+    assert latencia["p50"] is not None and latencia["p50"] <= 1_000_000
+    # La cuenta es parte de la operación del servicio
+    assert stats["CuentaAhorros.consignar"]["latencia_ns"]["suma"] <= latencia["suma"]
+
+
+def test_muestreo_mide_una_de_cada_n():
+    inst = Instrumentacion(muestreo=10)
+    banco = BancoService(instrumentacion=inst)
+    cuenta = banco.abrir_ahorros("Ana", 100.0)  # primera operación: medida
+    for _ in range(100):
+        banco.consignar(cuenta.id, 1.0)
+
+    stats = inst.stats()
+    assert stats["abrir_ahorros"]["latencia_ns"]["observadas"] == 1
+    assert stats["consignar"]["latencia_ns"]["observadas"] == 10
+    assert stats["CuentaAhorros.consignar"]["latencia_ns"]["observadas"] == 10
+    assert stats["consignar"]["llamadas"] == 100  # los contadores no se muestrean
+
+
+def test_solo_mide_servicios_instrumentados(inst):
+    otro = BancoService()
+    instrumentado = BancoService(instrumentacion=inst)
+    cuenta = otro.abrir_ahorros("Ana", 100.0)
+    otro.consignar(cuenta.id, 1.0)
+    otro.aplicar_corte_mensual_a_todas()
+    assert inst.stats() == {}
+    assert instrumentado.stats() == {}
+
+
+def test_exposicion_y_reiniciar(inst):
+    banco = BancoService(instrumentacion=inst)
+    cuenta = banco.abrir_ahorros("Ana", 10.0)
+    banco.consignar(cuenta.id, 1.0)
+    with pytest.raises(ValueError):
+        banco.consignar(cuenta.id, -1.0)
+
+    texto = inst.exposicion()
+    assert 'banco_llamadas_total{metodo="consignar"} 1' in texto
+    assert 'banco_rechazos_total{metodo="consignar",motivo=' in texto
+    assert texto.endswith("\n")
+
+    inst.reiniciar()
+    assert inst.stats() == {}
+    banco.consignar(cuenta.id, 1.0)  # sigue contando en el mismo diccionario
+    assert banco.stats()["consignar"]["llamadas"] == 1
@@ -0,0 +1,116 @@
+# tests/test_intentar.py
+from __future__ import annotations
+
+import itertools
+import math
+
+import pytest
+
+from models.cuentas import CuentaAhorros, CuentaCorriente
+from models.resultados import (
+    CUENTA_CERRADA,
+    CUENTA_INEXISTENTE,
+    CUPO_EXCEDIDO,
+    FONDOS_INSUFICIENTES,
+    MENSAJES,
+    MONTO_INVALIDO,
+    NOMBRES,
+    OK,
+)
+from services.banco_service import BancoService
+from services.bitacora import Bitacora
+
+BACKENDS = [{}, {"concurrente": True}, {"columnar": True}, {"devengo_perezoso": True}, {"historial": True}]
+MONTOS = [1.0, 10.0, 30.0, 80.0, 0.0, -1.0, 0.004, "5", "x", None, float("nan"), float("inf")]
+OPERACIONES = ["consignar", "retirar"]
+
+
+def _poblar(banco: BancoService) -> list:
+    """Posiciones: ahorros, corriente con cupo, corriente sin cupo, cerrada e inexistente."""
+    ids = [
+        banco.abrir_ahorros("Ana", 20.0).id,
+        banco.abrir_corriente("Beto", 20.0, 50.0).id,
+        banco.abrir_corriente("Carla", 20.0).id,
+        banco.abrir_ahorros("Dario", 20.0).id,
+    ]
+    banco.cerrar_cuenta(ids[3])
+    return ids + [-1]
+
+
+@pytest.mark.parametrize("opciones", BACKENDS)
+def test_mismo_resultado_que_la_version_que_lanza(opciones):
+    intentado, lanzado = BancoService(**opciones), BancoService(**opciones)
+    ids_intentado, ids_lanzado = _poblar(intentado), _poblar(lanzado)
+
+    for operacion, posicion, monto in itertools.product(OPERACIONES, range(5), MONTOS):
+        codigo = getattr(intentado, "intentar_" + operacion)(ids_intentado[posicion], monto)
+        try:
+            getattr(lanzado, operacion)(ids_lanzado[posicion], monto)
+            mensaje = None
+        except (TypeError, ValueError) as e:
+            mensaje = str(e)
+
+        caso = (operacion, posicion, monto, NOMBRES[codigo])
+        assert (codigo == OK) == (mensaje is None), caso
+        if codigo == CUENTA_INEXISTENTE:
+            assert mensaje.startswith("No existe una cuenta con id="), caso
+        elif codigo != OK and isinstance(monto, float) and math.isfinite(monto):
+            assert mensaje == MENSAJES[codigo], caso  # texto, None, nan e inf fallan al convertirse
+        saldos = [c.saldo_centavos for c in intentado.listar_cuentas()]
+        assert saldos == [c.saldo_centavos for c in lanzado.listar_cuentas()], caso
+
+
+@pytest.mark.parametrize(
+    "posicion, operacion, monto, codigo",
+    [
+        (0, "retirar", 20.0, OK),
+        (0, "retirar", 20.01, FONDOS_INSUFICIENTES),
+        (1, "retirar", 70.0, OK),
+        (1, "retirar", 70.01, CUPO_EXCEDIDO),
+        (2, "retirar", 20.01, CUPO_EXCEDIDO),
+        (3, "consignar", 1.0, CUENTA_CERRADA),
+        (3, "retirar", -1.0, CUENTA_CERRADA),  # cerrada se informa antes que el monto
+        (4, "consignar", 1.0, CUENTA_INEXISTENTE),
+        (4, "retirar", "x", CUENTA_INEXISTENTE),
+        (0, "consignar", 0.004, MONTO_INVALIDO),  # redondea a 0 centavos
+        (0, "consignar", 0.005, MONTO_INVALIDO),  # mitad al par: 0
+        (0, "consignar", 0.015, OK),
+        (0, "retirar", float("nan"), MONTO_INVALIDO),
+        (0, "consignar", [1], MONTO_INVALIDO),
+    ],
+)
+@pytest.mark.parametrize("opciones", BACKENDS)
+def test_codigos_por_tipo_de_cuenta(opciones, posicion, operacion, monto, codigo):
+    banco = BancoService(**opciones)
+    ids = _poblar(banco)
+    assert getattr(banco, "intentar_" + operacion)(ids[posicion], monto) == codigo
+
+
+@pytest.mark.parametrize("clase, argumentos", [(CuentaAhorros, ()), (CuentaCorriente, (20.0,))])
+def test_codigos_en_la_cuenta(clase, argumentos):
+    cuenta = clase("Ana", 10.0, *argumentos)
+    assert cuenta.intentar_retirar(0) == MONTO_INVALIDO
+    assert cuenta.intentar_retirar(10.0) == OK
+    excedido = FONDOS_INSUFICIENTES if clase is CuentaAhorros else CUPO_EXCEDIDO
+    assert cuenta.intentar_retirar(20.01) == excedido
+    assert cuenta.intentar_consignar(None) == MONTO_INVALIDO
+    cuenta.cerrar()
+    assert cuenta.intentar_consignar(1.0) == cuenta.intentar_retirar(1.0) == CUENTA_CERRADA
+    assert cuenta.saldo_centavos == 0
+
+
+def test_solo_lo_aplicado_va_a_la_bitacora(tmp_path):
+    bitacora = Bitacora(str(tmp_path / "bitacora.log"))
+    banco = BancoService(bitacora=bitacora)
+    ids = _poblar(banco)
+    assert banco.intentar_consignar(ids[0], 5.0) == OK
+    assert banco.intentar_retirar(ids[0], 500.0) == FONDOS_INSUFICIENTES
+    assert banco.intentar_consignar(ids[3], 5.0) == CUENTA_CERRADA
+    assert banco.intentar_retirar(ids[1], "5") == OK
+    bitacora.cerrar()
+
+    registros = [registro[0] for registro in Bitacora(bitacora.ruta).leer()]
+    assert registros[-2:] == ["consignar", "retirar"]
+    reproducido = BancoService.desde_bitacora(Bitacora(bitacora.ruta))
+    saldos = [c.saldo_centavos for c in banco.listar_cuentas()]
+    assert [c.saldo_centavos for c in reproducido.listar_cuentas()] == saldos
@@ -0,0 +1,120 @@
+# tests/test_lotes.py
+from __future__ import annotations
+
+import pytest
+
+from models.resultados import FONDOS_INSUFICIENTES, MENSAJES, MONTO_INVALIDO
+from services.banco_service import BancoService
+from services.bitacora import Bitacora
+
+OPCIONES = [
+    {},
+    {"concurrente": True, "franjas": 4},
+    {"agregados": True, "verificar_agregados": True, "historial": True},
+]
+
+
+@pytest.mark.parametrize("opciones", OPCIONES)
+@pytest.mark.parametrize("malo", [None, "abc", float("nan")])
+def test_atomico_revierte_ante_cualquier_error(tmp_path, opciones, malo):
+    bitacora = Bitacora(str(tmp_path / "bitacora.log"))
+    banco = BancoService(bitacora=bitacora, **opciones)
+    cuenta = banco.abrir_ahorros("Ana", 100.0)
+
+    with pytest.raises((TypeError, ValueError)):
+        banco.consignar_lote([(cuenta.id, 10), (cuenta.id, malo)])
+
+    assert cuenta.saldo_centavos == 10_000
+    if opciones.get("agregados"):
+        assert banco.resumen_cartera().depositos_centavos == 10_000  # verificar_agregados recalcula
+    bitacora.cerrar()
+    reproducido = BancoService.desde_bitacora(Bitacora(bitacora.ruta))
+    assert reproducido.buscar_por_id(cuenta.id).saldo_centavos == 10_000
+
+
+def test_atomico_revierte_movimiento_mal_formado():
+    banco = BancoService()
+    cuenta = banco.abrir_ahorros("Ana", 100.0)
+    with pytest.raises(ValueError, match="Movimiento #1"):
+        banco.consignar_lote([(cuenta.id, 10), (cuenta.id,)])
+    assert cuenta.saldo_centavos == 10_000
+
+
+def test_atomico_rechazo_indica_el_movimiento():
+    banco = BancoService()
+    cuenta = banco.abrir_ahorros("Ana", 100.0)
+    with pytest.raises(ValueError, match=r"Movimiento #2 .*Lote revertido"):
+        banco.retirar_lote([(cuenta.id, 10), (cuenta.id, 10), (cuenta.id, 1000)])
+    assert cuenta.saldo_centavos == 10_000
+    assert banco.retirar_lote([(cuenta.id, 10), (cuenta.id, 10)]) == 2
+    assert cuenta.saldo_centavos == 8_000
+
+
+@pytest.mark.parametrize("opciones", OPCIONES + [{"columnar": True}])
+def test_atomico_aplica_el_total_de_cada_cuenta(opciones):
+    if opciones.get("columnar"):
+        pytest.importorskip("numpy")
+    banco = BancoService(**opciones)
+    ahorros = banco.abrir_ahorros("Ana", 100.0)
+    corriente = banco.abrir_corriente("Beto", 0.0, 50.0)
+    lote = [(ahorros.id, 30.0), (corriente.id, 20.0), (ahorros.id, 70.0), (corriente.id, 30.0)]
+
+    assert banco.retirar_lote(lote) == 4
+    assert (ahorros.saldo_centavos, corriente.saldo_centavos) == (0, -5_000)
+    if opciones.get("historial"):
+        assert len(banco.extracto(ahorros.id)) == 2  # apertura y un movimiento por lote
+    # El total no cabe: se informa el primer movimiento, en orden del lote, que falla
+    with pytest.raises(ValueError, match=r"Movimiento #1 .*No existe una cuenta"):
+        banco.consignar_lote([(corriente.id, 1.0), (999_999, 1.0), (ahorros.id, -1.0)])
+    assert banco.consignar_lote([(ahorros.id, 10.0), (corriente.id, 50.0)]) == 2
+    with pytest.raises(ValueError, match=r"Movimiento #3 .*Fondos insuficientes"):
+        banco.retirar_lote([(corriente.id, 50.0), (ahorros.id, 4.0), (ahorros.id, 4.0), (ahorros.id, 4.0)])
+    assert (ahorros.saldo_centavos, corriente.saldo_centavos) == (1_000, 0)
+
+
+@pytest.mark.parametrize("opciones", OPCIONES)
+def test_mejor_esfuerzo_no_lanza(opciones):
+    banco = BancoService(**opciones)
+    cuenta = banco.abrir_ahorros("Ana", 100.0)
+    cerrada = banco.abrir_ahorros("Beto", 0.0)
+    banco.cerrar_cuenta(cerrada.id)
+
+    estados = banco.retirar_lote(
+        [
+            (cuenta.id, 10),
+            (cuenta.id, None),
+            (cuenta.id, 10_000),
+            (cerrada.id, 1),
+            (999_999_999, 1),
+            (cuenta.id,),
+            None,
+            ([1], 5),
+            (cuenta.id, 5, 5),
+            (cuenta.id, 5),
+        ],
+        atomico=False,
+    )
+
+    assert estados[0] is None and estados[-1] is None
+    assert estados[1] == MENSAJES[MONTO_INVALIDO]
+    assert estados[2] == MENSAJES[FONDOS_INSUFICIENTES]
+    assert "cerrada" in estados[3]
+    assert "No existe" in estados[4]
+    assert all(estado.startswith("Movimiento mal formado") for estado in estados[5:9])
+    assert cuenta.saldo_centavos == 8_500
+    if opciones.get("agregados"):
+        banco.verificar_agregados()
+
+
+def test_mejor_esfuerzo_anota_solo_lo_aplicado(tmp_path):
+    bitacora = Bitacora(str(tmp_path / "bitacora.log"))
+    banco = BancoService(bitacora=bitacora)
+    cuenta = banco.abrir_corriente("Ana", 0.0, 50.0)
+    banco.retirar_lote([(cuenta.id, 30), (cuenta.id, 30), (cuenta.id, None), (cuenta.id, 20)], atomico=False)
+    assert cuenta.saldo_centavos == -5_000
+    bitacora.cerrar()
+
+    registros = [r for r in Bitacora(bitacora.ruta).leer() if r[0] == "retirar_lote"]
+    assert registros == [["retirar_lote", False, [[cuenta.id, 3_000], [cuenta.id, 2_000]]]]
+    reproducido = BancoService.desde_bitacora(Bitacora(bitacora.ruta))
+    assert reproducido.buscar_por_id(cuenta.id).saldo_centavos == -5_000
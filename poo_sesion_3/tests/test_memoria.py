@@ -0,0 +1,38 @@
+# tests/test_memoria.py
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.bench_memoria import _AhorrosConDict, bytes_por_cuenta
+from models.cuentas import CuentaAhorros, CuentaCorriente
+from models.cuentas_devengo import CuentaAhorrosDevengo, CuentaCorrienteDevengo, RelojPeriodos
+
+
+def _cuentas() -> list:
+    reloj = RelojPeriodos()
+    cuentas = [
+        CuentaAhorros("Ana", 1.0),
+        CuentaCorriente("Beto", 1.0, 2.0, 0.5),
+        CuentaAhorrosDevengo(reloj, "Cata", 1.0),
+        CuentaCorrienteDevengo(reloj, "Dario", 1.0),
+    ]
+    try:
+        from models.cuentas_columnares import CuentaAhorrosColumnar, CuentaCorrienteColumnar
+        from services.almacen_columnar import AlmacenColumnar
+    except ImportError:
+        return cuentas
+    almacen = AlmacenColumnar()
+    return cuentas + [CuentaAhorrosColumnar(almacen, "Eva", 1.0), CuentaCorrienteColumnar(almacen, "Fede", 1.0)]
+
+
+@pytest.mark.parametrize("cuenta", _cuentas(), ids=lambda cuenta: type(cuenta).__name__)
+def test_ninguna_cuenta_tiene_dict(cuenta):
+    assert not hasattr(cuenta, "__dict__")
+    with pytest.raises(AttributeError):
+        cuenta.atributo_nuevo = 1
+
+
+def test_slots_ocupan_menos_que_dict():
+    con_slots = bytes_por_cuenta(lambda: CuentaAhorros("T", 1.0, 0.01), 2000)
+    con_dict = bytes_por_cuenta(lambda: _AhorrosConDict("T", 1.0, 0.01), 2000)
+    assert con_slots < con_dict
@@ -0,0 +1,184 @@
+# tests/test_paginacion.py
+from __future__ import annotations
+
+import itertools
+import random
+
+import pytest
+
+from services.banco_service import BancoService
+from services.paginacion import ORDENES
+from ui.consola import ConsolaBanco
+
+
+def _poblar(banco: BancoService, n: int = 60) -> None:
+    rnd = random.Random(3)
+    for i in range(n):
+        saldo = float(rnd.randrange(0, 20))  # saldos repetidos: el id desempata
+        if i % 2:
+            cuenta = banco.abrir_corriente(rnd.choice(["ana", "Beto", "cata"]) + str(i % 4), saldo, 30.0)
+            if i % 3 == 0:
+                banco.retirar(cuenta.id, 25.0)
+        else:
+            cuenta = banco.abrir_ahorros(rnd.choice(["Ana", "beto", "Dario"]) + str(i % 4), saldo)
+        if i % 5 == 0:
+            banco.cerrar_cuenta(cuenta.id)
+
+
+def _todas(banco: BancoService, limite: int, **opciones) -> list:
+    cuentas, cursor = [], None
+    while True:
+        pagina = banco.paginar_cuentas(cursor, limite, **opciones)
+        assert len(pagina) <= limite
+        cuentas.extend(pagina)
+        if pagina.cursor is None:
+            return cuentas
+        cursor = pagina.cursor
+
+
+FILTROS = [{}, {"tipo": "CuentaCorriente"}, {"activa": False}, {"saldo_min": 0.5, "saldo_max": 10}, {"saldo_max": -1}]
+
+
+@pytest.mark.parametrize("orden, descendente", list(itertools.product(ORDENES, [False, True])))
+@pytest.mark.parametrize("filtros", FILTROS)
+@pytest.mark.parametrize("indice_saldos", [False, True])
+def test_paginas_igual_a_ordenar_y_filtrar(orden, descendente, filtros, indice_saldos):
+    banco = BancoService(indice_saldos=indice_saldos)
+    _poblar(banco)
+    clave = ORDENES[orden]
+    esperado = sorted(
+        (c for c in banco.listar_cuentas() if all(_cumple(c, nombre, valor) for nombre, valor in filtros.items())),
+        key=lambda c: (clave(c), c.id),
+        reverse=descendente,
+    )
+    for limite in (1, 7, 100):
+        assert _todas(banco, limite, orden=orden, descendente=descendente, **filtros) == esperado
+    if orden == "id" and not descendente:
+        assert list(banco.iterar_cuentas(bloque=4, **filtros)) == esperado
+
+
+def _cumple(cuenta, nombre: str, valor) -> bool:
+    if nombre == "tipo":
+        return cuenta.tipo() == valor
+    if nombre == "activa":
+        return cuenta.activa == valor
+    if nombre == "saldo_min":
+        return cuenta.saldo >= valor
+    return cuenta.saldo <= valor
+
+
+@pytest.mark.parametrize("orden", list(ORDENES))
+@pytest.mark.parametrize("indice_saldos", [False, True])
+def test_cursor_estable_con_cambios_entre_paginas(orden, indice_saldos):
+    banco = BancoService(indice_saldos=indice_saldos)
+    _poblar(banco, 30)
+    vistas, cursor = [], None
+    eliminadas = set()
+    while True:
+        pagina = banco.paginar_cuentas(cursor, 4, orden=orden)
+        vistas.extend(c.id for c in pagina)
+        if pagina.cursor is None:
+            break
+        cursor = pagina.cursor
+        pendiente = next((c for c in banco.listar_cuentas() if c.id not in vistas), None)
+        if pendiente is not None:
+            banco.eliminar_cuenta(pendiente.id)  # aún no vista: no debe aparecer
+            eliminadas.add(pendiente.id)
+        banco.abrir_ahorros("zzz nueva", 0.0)
+    assert len(vistas) == len(set(vistas))
+    assert not eliminadas & set(vistas)
+    assert set(vistas) | eliminadas >= {c.id for c in banco.listar_cuentas() if c.titular != "zzz nueva"}
+
+
+def test_tras_instantanea_y_concurrente(tmp_path):
+    banco = BancoService()
+    _poblar(banco)
+    ruta = str(tmp_path / "libro.bin")
+    banco.guardar_instantanea(ruta)
+    for opciones in ({}, {"concurrente": True}, {"indice_saldos": True}, {"concurrente": True, "indice_saldos": True}):
+        abierto = BancoService.desde_instantanea(ruta, **opciones)
+        assert [c.id for c in _todas(abierto, 9)] == [c.id for c in banco.listar_cuentas()]
+        for orden in ("saldo", "titular"):
+            assert [c.id for c in _todas(abierto, 9, orden=orden)] == [c.id for c in _todas(banco, 9, orden=orden)]
+
+
+def test_orden_por_titular_ve_aperturas_y_cambios_de_titular():
+    banco = BancoService()
+    beto = banco.abrir_ahorros("Beto")
+    banco.abrir_ahorros("Dario")
+    pagina = banco.paginar_cuentas(limite=1, orden="titular")
+    assert [c.titular for c in pagina] == ["Beto"]
+
+    banco.cambiar_titular(beto.id, "Zoe")  # la lista ordenada se descarta
+    banco.abrir_ahorros("Carla")
+    assert [c.titular for c in _todas(banco, 1, orden="titular")] == ["Carla", "Dario", "Zoe"]
+    siguiente = banco.paginar_cuentas(pagina.cursor, 10, orden="titular")
+    assert [c.titular for c in siguiente] == ["Carla", "Dario", "Zoe"]
+
+
+def test_orden_por_saldo_con_indice_sigue_los_movimientos():
+    banco = BancoService(indice_saldos=True)
+    cuentas = [banco.abrir_ahorros(f"T{i}", float(i)) for i in range(5)]
+    pagina = banco.paginar_cuentas(limite=2, orden="saldo", descendente=True)
+    assert [c.saldo for c in pagina] == [4.0, 3.0]
+    banco.consignar(cuentas[0].id, 2.5)  # 0 -> 2.5: cae entre 3.0 y 2.0
+    banco.consignar(cuentas[4].id, 4.0)  # ya vista y sube: no se repite
+    assert [c.saldo for c in banco.paginar_cuentas(pagina.cursor, 10, orden="saldo", descendente=True)] == [
+        2.5,
+        2.0,
+        1.0,
+    ]
+
+
+@pytest.mark.parametrize("argumentos", [{"limite": 0}, {"orden": "fecha"}, {"saldo_min": "x"}])
+def test_argumentos_invalidos(argumentos):
+    with pytest.raises(ValueError):
+        BancoService().paginar_cuentas(**argumentos)
+
+
+def _consola(monkeypatch, banco: BancoService, respuestas: list) -> list:
+    """Consola con páginas de 5 que responde `respuestas` a input(); devuelve las preguntas hechas."""
+    preguntas = []
+    pendientes = iter(respuestas)
+
+    def responder(pregunta: str = "") -> str:
+        preguntas.append(pregunta)
+        return next(pendientes)
+
+    monkeypatch.setattr("builtins.input", responder)
+    consola = ConsolaBanco(banco)
+    consola.TAMANO_PAGINA = 5
+    consola.ejecutar()
+    return preguntas
+
+
+def test_consola_pagina_y_termina_con_q(monkeypatch, capsys):
+    banco = BancoService()
+    ids = [banco.abrir_ahorros(f"T{i}", float(i)).id for i in range(12)]
+
+    preguntas = _consola(monkeypatch, banco, ["3", "", "", "3", "q", "0"])
+    texto = capsys.readouterr().out
+    assert [p for p in preguntas if p.startswith("-- Página")] == [
+        "-- Página 1: Enter = siguiente, q = terminar -- ",
+        "-- Página 2: Enter = siguiente, q = terminar -- ",
+        "-- Página 1: Enter = siguiente, q = terminar -- ",
+    ]
+    assert texto.count(f"id={ids[-1]},") == 1  # la última página solo se vio la primera vez
+    assert texto.count(f"id={ids[0]},") == 2
+
+
+def test_consola_filtrado(monkeypatch, capsys):
+    banco = BancoService()
+    banco.abrir_ahorros("Ana", 5.0)
+    beto = banco.abrir_corriente("Beto", 7.0, 10.0)
+    banco.abrir_corriente("Carla", 1.0)
+
+    _consola(monkeypatch, banco, ["10", "c", "a", "2", "", "saldo", "s", "0"])
+    texto = capsys.readouterr().out
+    assert str(beto) in texto and "Ana" not in texto and "Carla" not in texto
+
+    _consola(monkeypatch, banco, ["10", "x", "", "0"])
+    assert "Error: Opción de filtro inválida." in capsys.readouterr().out
+
+    _consola(monkeypatch, banco, ["10", "", "c", "", "", "", "", "0"])
+    assert "No hay cuentas." in capsys.readouterr().out
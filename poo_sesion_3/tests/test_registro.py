@@ -0,0 +1,59 @@
+# tests/test_registro.py
+from __future__ import annotations
+
+import pytest
+
+from services.banco_service import BancoService
+
+
+@pytest.mark.parametrize("opciones", [{}, {"concurrente": True, "franjas": 2}])
+def test_registro_por_id_conserva_el_orden(opciones):
+    banco = BancoService(**opciones)
+    cuentas = [banco.abrir_ahorros(f"T{i}", 10.0) for i in range(3)] + [banco.abrir_corriente("C", 0.0, 5.0)]
+    banco.eliminar_cuenta(cuentas[1].id)
+    otra = banco.abrir_ahorros("Nueva")
+
+    assert banco.listar_cuentas() == [cuentas[0], *cuentas[2:], otra]
+    assert banco.buscar_por_id(cuentas[3].id) is cuentas[3]
+    assert banco.buscar_por_id(cuentas[1].id) is None
+    banco.listar_cuentas().clear()  # es una copia
+    assert len(banco.listar_cuentas()) == 4
+
+
+@pytest.mark.parametrize(
+    "operacion, argumentos",
+    [
+        ("eliminar_cuenta", ()),
+        ("cerrar_cuenta", ()),
+        ("cambiar_titular", ("Otro",)),
+        ("consignar", (1.0,)),
+        ("retirar", (1.0,)),
+    ],
+)
+def test_id_inexistente(operacion, argumentos):
+    banco = BancoService()
+    with pytest.raises(ValueError, match="id=42"):
+        getattr(banco, operacion)(42, *argumentos)
+
+
+def test_eliminada_deja_de_existir_para_todo():
+    banco = BancoService()
+    cuenta = banco.abrir_ahorros("Ana", 10.0)
+    banco.eliminar_cuenta(cuenta.id)
+    with pytest.raises(ValueError):
+        banco.eliminar_cuenta(cuenta.id)
+    with pytest.raises(ValueError):
+        banco.consignar(cuenta.id, 1.0)
+    assert banco.buscar_por_titular("ana") == []
+
+
+@pytest.mark.parametrize("titular", ["", "   ", None])
+def test_apertura_invalida_no_registra(titular):
+    banco = BancoService()
+    with pytest.raises(ValueError):
+        banco.abrir_ahorros(titular)
+    with pytest.raises(ValueError):
+        banco.abrir_ahorros("Ana", -1.0)
+    with pytest.raises(ValueError):
+        banco.abrir_corriente("Beto", 0.0, -5.0)
+    assert banco.listar_cuentas() == []
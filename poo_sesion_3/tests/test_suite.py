@@ -0,0 +1,30 @@
+# tests/test_suite.py
+from __future__ import annotations
+
+from benchmarks.suite import VECES_RUIDO, comparar
+
+
+def _caso(ns_min: float, ruido: float) -> dict:
+    return {"sesion": "poo_sesion_3", "caso": "consignar", "n": 1000, "ns_por_op_min": ns_min, "ruido": ruido}
+
+
+def test_cambio_dentro_del_ruido_no_es_regresion():
+    base = {"resultados": [_caso(100.0, 0.30)]}
+    actual = [_caso(180.0, 0.05)]  # +80 %, pero la base ya variaba un 30 %
+    assert comparar(actual, base, 0.10) == []
+    assert actual[0]["tolerancia"] == VECES_RUIDO * 0.30
+
+
+def test_regresion_real_se_informa():
+    base = {"resultados": [_caso(100.0, 0.01)]}
+    actual = [_caso(130.0, 0.02)]
+    regresiones = comparar(actual, base, 0.10)
+    assert len(regresiones) == 1 and "+30%" in regresiones[0]
+    assert actual[0]["tolerancia"] == 0.10  # el umbral es el piso
+
+
+def test_casos_nuevos_o_base_sin_minimo_se_ignoran():
+    base = {"resultados": [dict(_caso(100.0, 0.0), ns_por_op_min=None)]}
+    actual = [_caso(500.0, 0.0), dict(_caso(500.0, 0.0), caso="otro")]
+    assert comparar(actual, base, 0.10) == []
+    assert "cambio_vs_base" not in actual[0]
@@ -0,0 +1,144 @@
+# tests/test_transferencias.py
+from __future__ import annotations
+
+import pytest
+
+from services.banco_service import BancoService
+from services.bitacora import Bitacora
+
+BACKENDS = [{}, {"concurrente": True}, {"columnar": True}, {"historial": True, "agregados": True}]
+
+
+def _poblar(banco: BancoService) -> tuple:
+    """Ahorros con 100, corriente con 0 y cupo 50, otra ahorros con 10 y una cerrada."""
+    a = banco.abrir_ahorros("Ana", 100.0).id
+    b = banco.abrir_corriente("Beto", 0.0, 50.0).id
+    c = banco.abrir_ahorros("Carla", 10.0).id
+    d = banco.abrir_ahorros("Dario", 5.0).id
+    banco.cerrar_cuenta(d)
+    return a, b, c, d
+
+
+def _saldos(banco: BancoService) -> list:
+    return [cuenta.saldo_centavos for cuenta in banco.listar_cuentas()]
+
+
+@pytest.mark.parametrize("opciones", BACKENDS)
+def test_transferir(opciones):
+    banco = BancoService(**opciones)
+    a, b, c, _ = _poblar(banco)
+    banco.transferir(a, b, 30.0)
+    banco.transferir(b, c, 75.5)  # la corriente entra en sobregiro
+    assert _saldos(banco) == [7_000, -4_550, 8_550, 500]
+
+
+@pytest.mark.parametrize(
+    "origen, destino, monto, mensaje",
+    [
+        (0, 0, 1.0, "misma cuenta"),
+        (0, 4, 1.0, "No existe una cuenta con id="),
+        (4, 0, 1.0, "No existe una cuenta con id="),
+        (3, 0, 1.0, "cuenta cerrada"),
+        (0, 3, 1.0, "cuenta cerrada"),
+        (0, 1, 0.0, "mayor que 0"),
+        (0, 1, -5.0, "mayor que 0"),
+        (0, 1, 0.001, "mayor que 0"),
+        (0, 1, "x", "could not convert"),
+        (0, 1, float("inf"), "finito"),
+        (0, 1, 100.01, "Fondos insuficientes"),
+        (1, 0, 50.01, "cupo de sobregiro"),
+    ],
+)
+@pytest.mark.parametrize("opciones", BACKENDS)
+def test_transferir_rechazada_no_cambia_nada(opciones, origen, destino, monto, mensaje):
+    banco = BancoService(**opciones)
+    ids = _poblar(banco) + (-1,)
+    antes = _saldos(banco)
+    with pytest.raises(ValueError, match=mensaje):
+        banco.transferir(ids[origen], ids[destino], monto)
+    assert _saldos(banco) == antes
+    if opciones.get("agregados"):
+        banco.verificar_agregados()
+    if opciones.get("historial"):
+        assert all(len(banco.extracto(cuenta_id)) == 1 for cuenta_id in ids[:3])
+
+
+@pytest.mark.parametrize("opciones", BACKENDS)
+def test_liquidar_compensa_los_netos(opciones):
+    banco = BancoService(**opciones)
+    a, b, c, _ = _poblar(banco)
+    # c solo tiene 10 y envía 30, pero recibe 25 en el mismo lote: su neto (-5) cabe
+    netos = banco.liquidar_transferencias([(c, a, 30.0), (a, c, 25.0), (a, b, 10.0), (b, a, 10.0)])
+    assert netos == {c: -500, a: 500, b: 0}
+    assert _saldos(banco) == [10_500, 0, 500, 500]
+    assert banco.liquidar_transferencias([]) == {}
+
+
+@pytest.mark.parametrize(
+    "lote, mensaje",
+    [
+        ([(0, 1, 1.0), (0, 2, 0.0)], r"Transferencia #1: el monto debe ser mayor que 0"),
+        ([(0, 1, 1.0), (2, 2, 1.0)], r"Transferencia #1: el origen y el destino son la misma cuenta"),
+        ([(0, 4, 1.0)], r"No existe una cuenta con id="),
+        ([(0, 3, 1.0)], r"cuenta cerrada"),
+        ([(0, 1, 1.0), (0,)], r"Transferencia #1: se espera \(origen_id, destino_id, monto\)"),
+        ([(0, 1, "x")], r"Transferencia #0: el monto debe ser un número finito, no 'x'"),
+        ([(0, 1, None)], r"Transferencia #0: el monto debe ser un número finito, no None"),
+        ([(0, 1, float("nan"))], r"Transferencia #0: el monto debe ser un número finito"),
+        # El débito mayor (a) se aplica primero y se revierte cuando c no alcanza
+        ([(0, 1, 100.0), (2, 1, 20.0)], r"Cuenta id=\d+ \(neto -20.00\): Fondos insuficientes.* Lote revertido"),
+        ([(1, 0, 40.0), (1, 2, 10.01)], r"neto -50.01\): Excede el cupo.* Lote revertido"),
+    ],
+)
+@pytest.mark.parametrize("opciones", BACKENDS)
+def test_liquidar_rechazado_no_cambia_nada(opciones, lote, mensaje):
+    banco = BancoService(**opciones)
+    ids = _poblar(banco) + (-1,)
+    antes = _saldos(banco)
+    # Posiciones -> ids (el monto queda igual; las tuplas cortas se conservan cortas)
+    lote = [tuple(ids[x] if i < 2 else x for i, x in enumerate(t)) for t in lote]
+    with pytest.raises(ValueError, match=mensaje):
+        banco.liquidar_transferencias(lote)
+    assert _saldos(banco) == antes
+    if opciones.get("agregados"):
+        banco.verificar_agregados()
+    if opciones.get("historial"):
+        assert all(len(banco.extracto(cuenta_id)) == 1 for cuenta_id in ids[:3])
+
+
+@pytest.mark.parametrize(
+    "mala, mensaje",
+    [
+        (None, r"se espera \(origen_id, destino_id, monto\), no None"),
+        (5, r"se espera"),
+        ((1, 2, 3, 4), r"se espera"),
+        (([1], 2, 1.0), r"los ids de cuenta deben ser enteros"),
+        ((1.5, 2, 1.0), r"los ids de cuenta deben ser enteros"),
+        (("1", 2, 1.0), r"los ids de cuenta deben ser enteros"),
+    ],
+)
+def test_liquidar_rechaza_transferencias_mal_formadas(mala, mensaje):
+    banco = BancoService(concurrente=True)
+    a, b, _, _ = _poblar(banco)
+    antes = _saldos(banco)
+    with pytest.raises(ValueError, match=r"Transferencia #1: " + mensaje):
+        banco.liquidar_transferencias([(a, b, 1.0), mala])
+    assert _saldos(banco) == antes
+
+
+def test_solo_lo_aplicado_va_a_la_bitacora(tmp_path):
+    bitacora = Bitacora(str(tmp_path / "bitacora.log"))
+    banco = BancoService(bitacora=bitacora)
+    a, b, c, d = _poblar(banco)
+    banco.transferir(a, b, 10.0)
+    with pytest.raises(ValueError):
+        banco.transferir(a, d, 1.0)
+    banco.liquidar_transferencias([(b, c, 5.0), (c, a, 1.0)])
+    with pytest.raises(ValueError, match="Lote revertido"):
+        banco.liquidar_transferencias([(a, b, 1.0), (c, b, 500.0)])
+    bitacora.cerrar()
+
+    registros = [registro[0] for registro in Bitacora(bitacora.ruta).leer()]
+    assert registros.count("transferir") == 1 and registros.count("liquidar_transferencias") == 1
+    reproducido = BancoService.desde_bitacora(Bitacora(bitacora.ruta))
+    assert _saldos(reproducido) == _saldos(banco)
@@ -1,10 +1,41 @@
 # ui/consola.py
 from __future__ import annotations
 
+import shlex
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, TextIO
+
 from services.banco_service import BancoService
 
 
+class ResumenLote:
+    """Resultado de ConsolaBanco.ejecutar_lote."""
+
+    def __init__(self) -> None:
+        self.comandos: int = 0
+        self.errores: int = 0
+        self.por_comando: Dict[str, int] = {}
+        self.detenido_en: Optional[int] = None  # línea del error que detuvo el lote
+        self.segundos: float = 0.0
+
+    def __str__(self) -> str:
+        detalle = ", ".join(f"{comando}={n}" for comando, n in sorted(self.por_comando.items()))
+        texto = (
+            f"Lote: {self.comandos} comandos, {self.errores} errores en {self.segundos:.2f} s"
+            f" ({self.comandos / self.segundos if self.segundos > 0 else 0:.0f} comandos/s)"
+        )
+        if detalle:
+            texto += f"\n  {detalle}"
+        if self.detenido_en is not None:
+            texto += f"\n  Detenido por el error de la línea {self.detenido_en}."
+        return texto
+
+
 class ConsolaBanco:
+    # Cuentas por página al listar
+    TAMANO_PAGINA = 20
+
     def __init__(self, banco: BancoService) -> None:
         self._banco = banco
 
@@ -32,6 +63,8 @@ class ConsolaBanco:
                     self._cerrar()
                 elif opcion == "9":
                     self._eliminar()
+                elif opcion == "10":
+                    self._listar_filtrado()
                 elif opcion == "0":
                     print("Saliendo...")
                     break
@@ -42,6 +75,110 @@ class ConsolaBanco:
 
             print()
 
+    # -------------------------
+    # Modo lote (sin menú)
+    # -------------------------
+    def ejecutar_lote(
+        self,
+        lineas: Iterable[str],
+        salida: Optional[TextIO] = None,
+        solo_resumen: bool = False,
+        detener_en_error: bool = False,
+    ) -> ResumenLote:
+        """
+        Ejecuta un comando por línea, sin menú ni input():
+
+            abrir_ahorros TITULAR SALDO TASA
+            abrir_corriente TITULAR SALDO CUPO CUOTA
+            consignar ID MONTO
+            retirar ID MONTO
+            cambiar_titular ID TITULAR
+            cerrar ID
+            eliminar ID
+            corte
+            listar
+            buscar TEXTO
+
+        Un titular con espacios va entre comillas ("Ana Pérez"). Las líneas
+        vacías y las que empiezan con # se ignoran.
+
+        La salida se acumula y se escribe por bloques. solo_resumen=True
+        imprime únicamente el resumen final. Con detener_en_error=True el
+        lote se detiene en el primer error; si no, lo reporta y sigue.
+        """
+        salida = salida or sys.stdout
+        resumen = ResumenLote()
+        pendientes: List[str] = []
+        escribir = (lambda texto: None) if solo_resumen else pendientes.append
+        inicio = time.perf_counter()
+
+        for numero, linea in enumerate(lineas, start=1):
+            linea = linea.strip()
+            if not linea or linea.startswith("#"):
+                continue
+            resumen.comandos += 1
+            try:
+                partes = shlex.split(linea) if '"' in linea or "'" in linea else linea.split()
+                comando = partes[0]
+                resumen.por_comando[comando] = resumen.por_comando.get(comando, 0) + 1
+                self._comando_lote(comando, partes[1:], escribir)
+            except ValueError as e:
+                resumen.errores += 1
+                escribir(f"Línea {numero}: Error: {e}")
+                if detener_en_error:
+                    resumen.detenido_en = numero
+                    break
+            if len(pendientes) >= 4096:
+                salida.write("\n".join(pendientes) + "\n")
+                pendientes.clear()
+
+        if pendientes:
+            salida.write("\n".join(pendientes) + "\n")
+        resumen.segundos = time.perf_counter() - inicio
+        salida.write(f"{resumen}\n")
+        salida.flush()
+        return resumen
+
+    def _comando_lote(self, comando: str, argumentos: List[str], escribir) -> None:
+        banco = self._banco
+        esperados = _ARGUMENTOS_LOTE.get(comando)
+        if esperados is None:
+            raise ValueError(f"Comando desconocido: {comando!r}.")
+        if len(argumentos) != esperados:
+            raise ValueError(f"{comando} espera {esperados} argumento(s) y recibió {len(argumentos)}.")
+
+        if comando == "consignar":
+            banco.consignar(int(argumentos[0]), float(argumentos[1]))
+            escribir("Consignación OK.")
+        elif comando == "retirar":
+            banco.retirar(int(argumentos[0]), float(argumentos[1]))
+            escribir("Retiro OK.")
+        elif comando == "abrir_ahorros":
+            titular, saldo, tasa = argumentos
+            escribir(f"Cuenta creada: {banco.abrir_ahorros(titular, float(saldo), float(tasa))}")
+        elif comando == "abrir_corriente":
+            titular, saldo, cupo, cuota = argumentos
+            cuenta = banco.abrir_corriente(titular, float(saldo), float(cupo), float(cuota))
+            escribir(f"Cuenta creada: {cuenta}")
+        elif comando == "cambiar_titular":
+            banco.cambiar_titular(int(argumentos[0]), argumentos[1])
+            escribir("Titular actualizado.")
+        elif comando == "cerrar":
+            banco.cerrar_cuenta(int(argumentos[0]))
+            escribir("Cuenta cerrada.")
+        elif comando == "eliminar":
+            banco.eliminar_cuenta(int(argumentos[0]))
+            escribir("Cuenta eliminada.")
+        elif comando == "corte":
+            banco.aplicar_corte_mensual_a_todas()
+            escribir("Corte mensual aplicado.")
+        elif comando == "listar":
+            for c in banco.iterar_cuentas():
+                escribir(str(c))
+        elif comando == "buscar":
+            for c in banco.buscar_por_titular(argumentos[0]):
+                escribir(str(c))
+
     def _menu(self) -> None:
         print("=== Banco - POO (Sesión 3) ===")
         print("1) Abrir cuenta AHORROS")
@@ -53,6 +190,7 @@ class ConsolaBanco:
         print("7) Aplicar corte mensual a todas")
         print("8) Cerrar cuenta")
         print("9) Eliminar cuenta")
+        print("10) Listar con filtros y orden")
         print("0) Salir")
 
     def _abrir_ahorros(self) -> None:
@@ -71,12 +209,45 @@ class ConsolaBanco:
         print("Cuenta creada:", cuenta)
 
     def _listar(self) -> None:
-        cuentas = self._banco.listar_cuentas()
-        if not cuentas:
-            print("No hay cuentas.")
-            return
-        for c in cuentas:
-            print(c)
+        self._paginar()
+
+    def _listar_filtrado(self) -> None:
+        tipos = {"": None, "a": "CuentaAhorros", "c": "CuentaCorriente"}
+        estados = {"": None, "a": True, "c": False}
+        tipo = input("Tipo (a=ahorros, c=corriente, Enter=todos): ").strip().lower()
+        estado = input("Estado (a=activas, c=cerradas, Enter=todas): ").strip().lower()
+        if tipo not in tipos or estado not in estados:
+            raise ValueError("Opción de filtro inválida.")
+        saldo_min = input("Saldo mínimo (Enter=sin mínimo): ").strip()
+        saldo_max = input("Saldo máximo (Enter=sin máximo): ").strip()
+        orden = input("Orden (id/saldo/titular, Enter=id): ").strip() or "id"
+        descendente = input("¿Descendente? (s/N): ").strip().lower() == "s"
+        self._paginar(
+            orden=orden,
+            descendente=descendente,
+            tipo=tipos[tipo],
+            activa=estados[estado],
+            saldo_min=float(saldo_min) if saldo_min else None,
+            saldo_max=float(saldo_max) if saldo_max else None,
+        )
+
+    def _paginar(self, **opciones) -> None:
+        """Muestra las cuentas de a TAMANO_PAGINA; Enter sigue, q termina."""
+        cursor = None
+        numero = 1
+        while True:
+            pagina = self._banco.paginar_cuentas(cursor, self.TAMANO_PAGINA, **opciones)
+            if numero == 1 and not pagina.cuentas:
+                print("No hay cuentas.")
+                return
+            for c in pagina:
+                print(c)
+            if pagina.cursor is None:
+                return
+            if input(f"-- Página {numero}: Enter = siguiente, q = terminar -- ").strip().lower() == "q":
+                return
+            cursor = pagina.cursor
+            numero += 1
 
     def _buscar(self) -> None:
         texto = input("Texto a buscar (titular): ")
@@ -112,3 +283,18 @@ class ConsolaBanco:
         cuenta_id = int(input("ID cuenta: "))
         self._banco.eliminar_cuenta(cuenta_id)
         print("Cuenta eliminada.")
+
+
+# Comando del modo lote -> cantidad de argumentos
+_ARGUMENTOS_LOTE = {
+    "abrir_ahorros": 3,
+    "abrir_corriente": 4,
+    "consignar": 2,
+    "retirar": 2,
+    "cambiar_titular": 2,
+    "cerrar": 1,
+    "eliminar": 1,
+    "corte": 0,
+    "listar": 0,
+    "buscar": 1,
+}